@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+하이브리드 엔진 융합 가중치 오프라인 보정 도구
+완전히 독립된 분석 도구 - 배포버전에 포함되지 않음
+
+기능:
+- 결정 로그(logs/ai_decisions/*.jsonl)의 Claude/Gemini 개별 결정을 재생
+- 분봉 데이터(backtesting/data/{interval}/{종목}_{interval}.csv)로 결정 이후 실현 수익률 계산
+- 가중치 x 합의 규칙 x 투표 임계값 후보를 프로세스 병렬로 일괄 융합(fuse_batch)
+- BUY/SELL 적중률 기준 상위 후보와 Register_Key.md 권장 설정 출력
+
+적중 판정:
+- BUY: horizon 이후 수익률 >= +min_move_pct
+- SELL: horizon 이후 수익률 <= -min_move_pct
+- HOLD는 적중률 계산에서 제외 (커버리지로 별도 보고)
+
+사용법:
+    python ai_fusion_calibrator.py --since 2025-09-01 --interval 5min --horizon 30
+    python ai_fusion_calibrator.py --weight-step 0.05 --min-actions 30 --workers 4
+"""
+
+import sys
+import csv
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime, date
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    print(f"[ERROR] 필수 라이브러리 설치 필요: {e}")
+    print("설치 명령어: pip install numpy")
+    sys.exit(1)
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.decision_log import DecisionLog
+from support.decision_fusion import fuse_batch, encode_decisions, FUSION_RULES
+
+DECISION_LOG_DIR = PROJECT_ROOT / "logs" / "ai_decisions"
+BAR_DATA_DIR = PROJECT_ROOT / "backtesting" / "data"
+REPORT_DIR = PROJECT_ROOT / "logs" / "ai_calibration"
+
+DEFAULT_VOTE_THRESHOLDS = (0.2, 0.3, 0.35, 0.4, 0.5)
+
+
+class BarStore:
+    """종목별 분봉 종가 (CSV 지연 로드, 시간순 정렬)"""
+
+    def __init__(self, data_dir: Path = BAR_DATA_DIR, interval: str = "5min"):
+        self.data_dir = Path(data_dir) / interval
+        self.interval = interval
+        self._cache: Dict[str, Optional[Tuple[np.ndarray, np.ndarray]]] = {}
+
+    def load(self, symbol: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """(시각 datetime64[s] 배열, 종가 배열) - 데이터 없으면 None"""
+        if symbol in self._cache:
+            return self._cache[symbol]
+
+        path = self.data_dir / f"{symbol}_{self.interval}.csv"
+        bars = None
+        if path.exists():
+            times, closes = [], []
+            with open(path, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    try:
+                        times.append(np.datetime64(row['DateTime'].replace(' ', 'T'), 's'))
+                        closes.append(float(row['Close']))
+                    except (KeyError, ValueError):
+                        continue
+            if times:
+                times_arr = np.array(times, dtype='datetime64[s]')
+                order = np.argsort(times_arr, kind='stable')
+                bars = (times_arr[order], np.array(closes, dtype=np.float64)[order])
+
+        self._cache[symbol] = bars
+        return bars
+
+    def forward_returns(self, symbol: str, timestamps: np.ndarray, horizon_minutes: int) -> np.ndarray:
+        """
+        결정 시각 이후 첫 봉 종가 대비 horizon 경과 후 첫 봉 종가 수익률 (%)
+
+        데이터 범위를 벗어나 실현되지 않은 경우 NaN
+        """
+        result = np.full(len(timestamps), np.nan)
+        bars = self.load(symbol)
+        if bars is None:
+            return result
+
+        times, closes = bars
+        entry = np.searchsorted(times, timestamps, side='left')
+        exit_ = np.searchsorted(times, timestamps + np.timedelta64(horizon_minutes * 60, 's'), side='left')
+        valid = (entry < len(times)) & (exit_ < len(times)) & (exit_ > entry)
+
+        entry_price = closes[entry[valid]]
+        exit_price = closes[exit_[valid]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[valid] = np.where(entry_price > 0, (exit_price - entry_price) / entry_price * 100, np.nan)
+        return result
+
+
+def load_samples(log_dir: Path, bar_store: BarStore, horizon_minutes: int,
+                 since: Optional[date] = None, until: Optional[date] = None) -> Dict[str, Any]:
+    """
+    결정 로그 → 보정용 배열
+
+    두 제공자 결정이 모두 있고 실현 수익률을 계산할 수 있는 기록만 사용
+    """
+    by_symbol: Dict[str, List[Dict[str, Any]]] = {}
+    skipped_partial = 0
+    for record in DecisionLog(log_dir).iter_records(since, until):
+        if record.get('claude_decision') is None or record.get('gemini_decision') is None:
+            skipped_partial += 1
+            continue
+        by_symbol.setdefault(record['symbol'], []).append(record)
+
+    columns = {key: [] for key in ('claude_decision', 'claude_confidence', 'gemini_decision',
+                                   'gemini_confidence', 'actual_decision', 'forward_return')}
+    for symbol, records in by_symbol.items():
+        timestamps = np.array([np.datetime64(r['timestamp'][:19], 's') for r in records])
+        returns = bar_store.forward_returns(symbol, timestamps, horizon_minutes)
+        for record, ret in zip(records, returns):
+            if np.isnan(ret):
+                continue
+            columns['claude_decision'].append(record['claude_decision'])
+            columns['claude_confidence'].append(float(record.get('claude_confidence') or 0.0))
+            columns['gemini_decision'].append(record['gemini_decision'])
+            columns['gemini_confidence'].append(float(record.get('gemini_confidence') or 0.0))
+            columns['actual_decision'].append(record.get('decision'))
+            columns['forward_return'].append(float(ret))
+
+    return {
+        "claude_codes": encode_decisions(columns['claude_decision']),
+        "claude_confidence": np.array(columns['claude_confidence'], dtype=np.float64),
+        "gemini_codes": encode_decisions(columns['gemini_decision']),
+        "gemini_confidence": np.array(columns['gemini_confidence'], dtype=np.float64),
+        "actual_codes": encode_decisions(columns['actual_decision']),
+        "forward_return": np.array(columns['forward_return'], dtype=np.float64),
+        "symbols": len(by_symbol),
+        "skipped_partial": skipped_partial
+    }
+
+
+def score_decisions(decision: np.ndarray, forward_return: np.ndarray, min_move_pct: float) -> Dict[str, Any]:
+    """결정 코드 배열 적중률 계산"""
+    actions = decision != 0
+    hits = ((decision == 1) & (forward_return >= min_move_pct)) | \
+           ((decision == -1) & (forward_return <= -min_move_pct))
+    n_actions = int(actions.sum())
+    n_hits = int(hits.sum())
+    signed = np.where(actions, decision * forward_return, 0.0)
+    return {
+        "actions": n_actions,
+        "hits": n_hits,
+        "hit_rate": n_hits / n_actions if n_actions else 0.0,
+        "coverage": n_actions / len(decision) if len(decision) else 0.0,
+        "avg_return_pct": float(signed[actions].mean()) if n_actions else 0.0
+    }
+
+
+# 프로세스 풀 워커 공유 데이터 (initializer로 1회 전달)
+_worker_samples: Dict[str, Any] = {}
+
+
+def _init_worker(samples: Dict[str, Any], min_move_pct: float):
+    _worker_samples.update(samples)
+    _worker_samples['min_move_pct'] = min_move_pct
+
+
+def _evaluate_chunk(candidates: List[Tuple[float, str, float]]) -> List[Dict[str, Any]]:
+    """후보 묶음 평가 (워커 프로세스)"""
+    s = _worker_samples
+    results = []
+    for claude_weight, rule, vote_threshold in candidates:
+        gemini_weight = round(1.0 - claude_weight, 6)
+        fused = fuse_batch(s['claude_codes'], s['claude_confidence'], s['gemini_codes'], s['gemini_confidence'],
+                           claude_weight, gemini_weight, rule, vote_threshold)
+        score = score_decisions(fused['decision'], s['forward_return'], s['min_move_pct'])
+        score.update({
+            "claude_weight": claude_weight,
+            "gemini_weight": gemini_weight,
+            "fusion_rule": rule,
+            "vote_threshold": vote_threshold if rule != "conservative" else None
+        })
+        results.append(score)
+    return results
+
+
+def build_candidates(weight_step: float, vote_thresholds) -> List[Tuple[float, str, float]]:
+    """가중치 x 합의 규칙 x 투표 임계값 후보 (conservative는 임계값 무관)"""
+    steps = int(round(1.0 / weight_step))
+    weights = [round(i * weight_step, 6) for i in range(steps + 1)]
+    candidates = []
+    for weight in weights:
+        for rule in FUSION_RULES:
+            if rule == "conservative":
+                candidates.append((weight, rule, 0.0))
+            else:
+                candidates.extend((weight, rule, t) for t in vote_thresholds)
+    return candidates
+
+
+def calibrate(samples: Dict[str, Any], candidates: List[Tuple[float, str, float]],
+              min_move_pct: float, workers: int) -> List[Dict[str, Any]]:
+    """후보 병렬 평가"""
+    arrays = {key: samples[key] for key in
+              ('claude_codes', 'claude_confidence', 'gemini_codes', 'gemini_confidence', 'forward_return')}
+    chunk_size = max(1, len(candidates) // (workers * 4))
+    chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+
+    if workers <= 1:
+        _init_worker(arrays, min_move_pct)
+        return [r for chunk in chunks for r in _evaluate_chunk(chunk)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(arrays, min_move_pct)) as executor:
+        return [r for chunk_result in executor.map(_evaluate_chunk, chunks) for r in chunk_result]
+
+
+def rank_results(results: List[Dict[str, Any]], min_actions: int) -> List[Dict[str, Any]]:
+    """적중률 → 적중 건수 → 평균 수익률 순 정렬 (최소 매매 건수 미달 후보 제외)"""
+    eligible = [r for r in results if r['actions'] >= min_actions]
+    return sorted(eligible, key=lambda r: (r['hit_rate'], r['hits'], r['avg_return_pct']), reverse=True)
+
+
+def print_report(ranked: List[Dict[str, Any]], baseline: Dict[str, Any], samples: Dict[str, Any], top: int):
+    """보정 결과 출력"""
+    print("\n" + "=" * 78)
+    print("하이브리드 융합 가중치 보정 결과")
+    print("=" * 78)
+    print(f"표본: {len(samples['forward_return'])}건 / 종목 {samples['symbols']}개 "
+          f"(부분 융합 제외 {samples['skipped_partial']}건)")
+    print(f"현재 기록 결정: 매매 {baseline['actions']}건, 적중률 {baseline['hit_rate']:.1%}, "
+          f"평균 수익률 {baseline['avg_return_pct']:+.3f}%")
+    print("-" * 78)
+    print(f"{'순위':>4} {'Claude':>7} {'Gemini':>7} {'규칙':<14} {'임계값':>6} {'매매':>6} {'적중률':>7} {'커버리지':>8} {'평균수익':>9}")
+    for i, r in enumerate(ranked[:top], 1):
+        threshold = f"{r['vote_threshold']:.2f}" if r['vote_threshold'] is not None else "-"
+        print(f"{i:>4} {r['claude_weight']:>7.2f} {r['gemini_weight']:>7.2f} {r['fusion_rule']:<14} {threshold:>6} "
+              f"{r['actions']:>6} {r['hit_rate']:>7.1%} {r['coverage']:>8.1%} {r['avg_return_pct']:>+8.3f}%")
+
+    if ranked:
+        best = ranked[0]
+        print("-" * 78)
+        print("Register_Key.md 권장 설정 (AI 엔진 API 설정):")
+        print(f"    Claude Weight: [{best['claude_weight']}]")
+        print(f"    Gemini Weight: [{best['gemini_weight']}]")
+        print(f"    Fusion Rule: [{best['fusion_rule']}]")
+        if best['vote_threshold'] is not None:
+            print(f"    Fusion Vote Threshold: [{best['vote_threshold']}]")
+    else:
+        print("\n최소 매매 건수를 만족하는 후보가 없습니다 (--min-actions 조정)")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="하이브리드 엔진 융합 가중치 오프라인 보정")
+    parser.add_argument('--log-dir', default=str(DECISION_LOG_DIR), help="결정 로그 디렉토리")
+    parser.add_argument('--data-dir', default=str(BAR_DATA_DIR), help="분봉 데이터 디렉토리")
+    parser.add_argument('--interval', default='5min', help="분봉 간격 (5min / 10min / 30min)")
+    parser.add_argument('--horizon', type=int, default=30, help="실현 수익률 측정 구간 (분)")
+    parser.add_argument('--min-move-pct', type=float, default=0.0, help="적중 인정 최소 변동률 (%%)")
+    parser.add_argument('--since', default=None, help="시작 일자 (YYYY-MM-DD)")
+    parser.add_argument('--until', default=None, help="종료 일자 (YYYY-MM-DD)")
+    parser.add_argument('--weight-step', type=float, default=0.05, help="Claude 가중치 탐색 간격")
+    parser.add_argument('--vote-thresholds', default=','.join(str(t) for t in DEFAULT_VOTE_THRESHOLDS),
+                        help="투표 임계값 후보 (쉼표 구분)")
+    parser.add_argument('--min-actions', type=int, default=20, help="후보 인정 최소 매매 건수")
+    parser.add_argument('--workers', type=int, default=4, help="평가 프로세스 수")
+    parser.add_argument('--top', type=int, default=10, help="출력할 상위 후보 수")
+    args = parser.parse_args()
+
+    since = date.fromisoformat(args.since) if args.since else None
+    until = date.fromisoformat(args.until) if args.until else None
+
+    bar_store = BarStore(Path(args.data_dir), args.interval)
+    samples = load_samples(Path(args.log_dir), bar_store, args.horizon, since, until)
+    if len(samples['forward_return']) == 0:
+        print("[ERROR] 보정에 사용할 결정 기록이 없습니다 (결정 로그 / 분봉 데이터 확인)")
+        return False
+
+    thresholds = [float(t) for t in args.vote_thresholds.split(',') if t.strip()]
+    candidates = build_candidates(args.weight_step, thresholds)
+    print(f"후보 {len(candidates)}개 평가 중 (프로세스 {args.workers}개)...")
+
+    results = calibrate(samples, candidates, args.min_move_pct, args.workers)
+    ranked = rank_results(results, args.min_actions)
+    baseline = score_decisions(samples['actual_codes'], samples['forward_return'], args.min_move_pct)
+    print_report(ranked, baseline, samples, args.top)
+
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    report_path = REPORT_DIR / f"calibration_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "timestamp": datetime.now().isoformat(),
+            "settings": vars(args),
+            "samples": len(samples['forward_return']),
+            "baseline": baseline,
+            "ranked": ranked[:max(args.top, 50)]
+        }, f, indent=2, ensure_ascii=False)
+    print(f"\n보고서 저장: {report_path}")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+    except KeyboardInterrupt:
+        print("\n[중단] 사용자에 의해 중단됨")
+        success = True
+    sys.exit(0 if success else 1)
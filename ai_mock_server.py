@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Claude / Gemini API 로컬 모의 서버 (오프라인 부하 테스트용)
+완전히 독립된 테스트 도구 - 배포버전에 포함되지 않음
+
+기능:
+- Anthropic messages 형식: POST /v1/messages (stream 지원)
+- Gemini 형식: POST /v1beta/models/{model}:generateContent / :streamGenerateContent
+- 제공자별 지연 분포 (fixed / uniform / normal / lognormal / exponential)
+- 오류(500) 및 429 응답 주입
+- 고정(canned) 또는 규칙 기반 JSON 매매 결정 응답
+- GET /stats 로 요청/주입 통계 조회
+- GET /v1/models/{model}, /v1beta/models/{model}: 모델 조회 (엔진 warm_up 탐침용)
+- bench 모드: 하이브리드 엔진으로 결정 처리량/지연 측정
+
+사용법:
+    python ai_mock_server.py serve --port 8765 --latency lognormal:0.8,0.5 --error-rate 0.02 --rate-limit-rate 0.05
+    python ai_mock_server.py bench --decisions 200 --concurrency 10
+    python ai_mock_server.py bench --decisions 200 --prompt-mode verbose   # 압축 프롬프트와 비교
+
+엔진 연결 (Register_Key.md → AI 엔진 API 설정):
+    Claude Base URL: [http://127.0.0.1:8765]
+    Gemini Base URL: [http://127.0.0.1:8765]
+"""
+
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import re
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+try:
+    from aiohttp import web
+except ImportError as e:
+    print(f"[ERROR] 필수 라이브러리 설치 필요: {e}")
+    print("설치 명령어: pip install aiohttp")
+    sys.exit(1)
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_PORT = 8765
+STREAM_CHUNK_SIZE = 24  # 스트리밍 응답 조각 크기 (문자)
+
+
+class LatencyModel:
+    """응답 지연 분포 (초 단위)"""
+
+    def __init__(self, spec: str = "fixed:0"):
+        """
+        Args:
+            spec: "분포:파라미터" 형식
+                  fixed:0.5 / uniform:0.2,1.5 / normal:0.8,0.2 /
+                  lognormal:mu,sigma (초 단위 중앙값 기준) / exponential:평균
+        """
+        self.spec = spec
+        kind, _, params = spec.partition(':')
+        self.kind = kind.strip().lower()
+        self.params = [float(p) for p in params.split(',') if p.strip()]
+
+        if self.kind not in ('fixed', 'uniform', 'normal', 'lognormal', 'exponential'):
+            raise ValueError(f"지원하지 않는 지연 분포: {spec}")
+
+    def sample(self) -> float:
+        """지연 시간 샘플"""
+        p = self.params
+        if self.kind == 'fixed':
+            value = p[0] if p else 0.0
+        elif self.kind == 'uniform':
+            value = random.uniform(p[0], p[1])
+        elif self.kind == 'normal':
+            value = random.gauss(p[0], p[1])
+        elif self.kind == 'lognormal':
+            # 중앙값 p[0]초, 로그 표준편차 p[1]
+            value = p[0] * random.lognormvariate(0.0, p[1])
+        else:
+            value = random.expovariate(1.0 / p[0]) if p and p[0] > 0 else 0.0
+        return max(0.0, value)
+
+
+class MockDecisionPolicy:
+    """모의 매매 결정 생성기"""
+
+    def __init__(self, mode: str = "rule", canned: Optional[Dict[str, Any]] = None, fence_rate: float = 0.0):
+        """
+        Args:
+            mode: 'rule' (프롬프트 수치 기반) 또는 'canned' (고정 응답)
+            canned: 고정 응답 JSON
+            fence_rate: 마크다운 펜스/설명문으로 감싼 응답 비율 (파서 검증용)
+        """
+        self.mode = mode
+        self.canned = canned or {"decision": "HOLD", "confidence": 0.5, "reasoning": "모의 서버 고정 응답"}
+        self.fence_rate = fence_rate
+
+    def build(self, provider: str, prompt: str) -> str:
+        """프롬프트에 대한 JSON 텍스트 응답 생성"""
+        if self.mode == 'canned':
+            body = dict(self.canned)
+        else:
+            body = self._rule_based(provider, prompt)
+
+        text = json.dumps(body, ensure_ascii=False)
+        if self.fence_rate and random.random() < self.fence_rate:
+            text = f"분석 결과입니다.\n```json\n{text}\n```"
+        return text
+
+    @staticmethod
+    def _prompt_inputs(prompt: str) -> Dict[str, float]:
+        """프롬프트에서 등락률/RSI 추출 (압축 형식 '입력:{"chg":..,"ti":{"RSI":..}}' 우선, 상세 형식 대체)"""
+        inputs: Dict[str, float] = {}
+        compact_match = re.search(r'^입력:(\{.*\})$', prompt, re.MULTILINE)
+        if compact_match:
+            try:
+                payload = json.loads(compact_match.group(1))
+            except json.JSONDecodeError:
+                payload = {}
+            if isinstance(payload.get('chg'), (int, float)):
+                inputs['change'] = float(payload['chg'])
+            indicators = payload.get('ti') if isinstance(payload.get('ti'), dict) else {}
+            for key, value in indicators.items():
+                if key.upper() == 'RSI' and isinstance(value, (int, float)):
+                    inputs['rsi'] = float(value)
+
+        if 'change' not in inputs:
+            change_match = re.search(r'등락률:\s*([+-]?\d+(?:\.\d+)?)%', prompt)
+            if change_match:
+                inputs['change'] = float(change_match.group(1))
+        if 'rsi' not in inputs:
+            rsi_match = re.search(r'RSI=(\d+(?:\.\d+)?)', prompt, re.IGNORECASE)
+            if rsi_match:
+                inputs['rsi'] = float(rsi_match.group(1))
+        return inputs
+
+    def _rule_based(self, provider: str, prompt: str) -> Dict[str, Any]:
+        """등락률/RSI 기반 규칙 응답"""
+        inputs = self._prompt_inputs(prompt)
+        change = inputs.get('change', 0.0)
+        rsi = inputs.get('rsi', 50.0)
+
+        if change >= 2.0 and rsi < 80:
+            decision, confidence = "BUY", min(0.95, 0.6 + change / 20)
+        elif change <= -2.0 or rsi >= 85:
+            decision, confidence = "SELL", min(0.95, 0.6 + abs(change) / 20)
+        else:
+            decision, confidence = "HOLD", 0.5
+
+        body = {"decision": decision, "confidence": round(confidence, 2)}
+        if provider == 'claude':
+            body.update({
+                "fundamental_score": round(0.5 + change / 20, 2),
+                "sustainability": "MEDIUM",
+                "risk_factors": ["모의 위험요인"],
+            })
+        else:
+            body.update({
+                "technical_score": round(min(1.0, rsi / 100), 2),
+                "trend": "BULLISH" if change > 0 else "BEARISH" if change < 0 else "NEUTRAL",
+                "momentum": "STRONG" if abs(change) >= 2 else "WEAK",
+                "entry_timing": "GOOD",
+            })
+        body["reasoning"] = f"모의 {provider} 분석: 등락률 {change:+.2f}%, RSI {rsi:.1f} 기준 {decision}"
+        return body
+
+
+class AIMockServer:
+    """Anthropic / Gemini 호환 로컬 모의 서버"""
+
+    def __init__(self, latency: Dict[str, LatencyModel], policy: MockDecisionPolicy,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0):
+        self.latency = latency
+        self.policy = policy
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.stats = {
+            provider: {'requests': 0, 'ok': 0, 'errors_injected': 0, 'rate_limited': 0, 'streamed': 0}
+            for provider in ('claude', 'gemini')
+        }
+        self.started_at = datetime.now()
+
+    def create_app(self) -> web.Application:
+        """aiohttp 애플리케이션 생성"""
+        app = web.Application()
+        app.router.add_post('/v1/messages', self.handle_claude)
+        app.router.add_post('/v1beta/models/{model_action}', self.handle_gemini)
+        app.router.add_get('/stats', self.handle_stats)
+        app.router.add_get('/', self.handle_root)
+        app.router.add_get('/v1/models/{model}', self.handle_model_info)
+        app.router.add_get('/v1beta/models/{model}', self.handle_model_info)
+        return app
+
+    async def _inject(self, provider: str) -> Optional[web.Response]:
+        """지연 및 장애 주입 (장애 응답이 있으면 반환)"""
+        self.stats[provider]['requests'] += 1
+        await asyncio.sleep(self.latency[provider].sample())
+
+        roll = random.random()
+        if roll < self.rate_limit_rate:
+            self.stats[provider]['rate_limited'] += 1
+            return web.json_response(
+                {"error": {"type": "rate_limit_error", "message": "모의 429 응답"}},
+                status=429, headers={"retry-after": "1"}
+            )
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.stats[provider]['errors_injected'] += 1
+            return web.json_response(
+                {"error": {"type": "api_error", "message": "모의 서버 오류"}}, status=500
+            )
+        return None
+
+    async def handle_claude(self, request: web.Request) -> web.StreamResponse:
+        """Anthropic messages 형식 처리"""
+        payload = await request.json()
+        failure = await self._inject('claude')
+        if failure is not None:
+            return failure
+
+        prompt = payload['messages'][-1]['content']
+        text = self.policy.build('claude', prompt)
+        usage = {"input_tokens": len(prompt) // 2, "output_tokens": len(text) // 2}
+        self.stats['claude']['ok'] += 1
+
+        if not payload.get('stream'):
+            return web.json_response({
+                "id": f"msg_mock_{self.stats['claude']['requests']}",
+                "type": "message",
+                "role": "assistant",
+                "model": payload.get('model', 'mock'),
+                "content": [{"type": "text", "text": text}],
+                "stop_reason": "end_turn",
+                "usage": usage
+            })
+
+        self.stats['claude']['streamed'] += 1
+        events = [{"type": "message_start", "message": {"model": payload.get('model', 'mock'), "usage": usage}},
+                  {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}]
+        events += [{"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": chunk}}
+                   for chunk in self._chunks(text)]
+        events += [{"type": "content_block_stop", "index": 0},
+                   {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": usage},
+                   {"type": "message_stop"}]
+        return await self._write_sse(request, events, 'claude')
+
+    async def handle_gemini(self, request: web.Request) -> web.StreamResponse:
+        """Gemini generateContent / streamGenerateContent 형식 처리"""
+        model, _, action = request.match_info['model_action'].partition(':')
+        if action not in ('generateContent', 'streamGenerateContent'):
+            return web.json_response({"error": {"message": f"지원하지 않는 동작: {action}"}}, status=404)
+
+        payload = await request.json()
+        failure = await self._inject('gemini')
+        if failure is not None:
+            return failure
+
+        prompt = payload['contents'][-1]['parts'][0]['text']
+        text = self.policy.build('gemini', prompt)
+        usage = {"promptTokenCount": len(prompt) // 2, "candidatesTokenCount": len(text) // 2}
+        self.stats['gemini']['ok'] += 1
+
+        if action == 'generateContent':
+            return web.json_response({
+                "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": "STOP"}],
+                "usageMetadata": usage,
+                "modelVersion": model
+            })
+
+        self.stats['gemini']['streamed'] += 1
+        events = [{"candidates": [{"content": {"parts": [{"text": chunk}], "role": "model"}}],
+                   "usageMetadata": usage}
+                  for chunk in self._chunks(text)]
+        return await self._write_sse(request, events, 'gemini')
+
+    async def handle_root(self, request: web.Request) -> web.Response:
+        """연결 예열용 (HEAD / GET)"""
+        return web.json_response({"service": "ai_mock_server"})
+
+    async def handle_model_info(self, request: web.Request) -> web.Response:
+        """모델 조회 (엔진 warm_up 탐침용, 지연 주입 없음)"""
+        model = request.match_info['model']
+        return web.json_response({"id": model, "name": model, "type": "model"})
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        """요청/주입 통계"""
+        return web.json_response({
+            "started_at": self.started_at.isoformat(),
+            "uptime_seconds": (datetime.now() - self.started_at).total_seconds(),
+            "latency": {provider: model.spec for provider, model in self.latency.items()},
+            "error_rate": self.error_rate,
+            "rate_limit_rate": self.rate_limit_rate,
+            "providers": self.stats
+        })
+
+    @staticmethod
+    def _chunks(text: str):
+        return [text[i:i + STREAM_CHUNK_SIZE] for i in range(0, len(text), STREAM_CHUNK_SIZE)]
+
+    async def _write_sse(self, request: web.Request, events, provider: str) -> web.StreamResponse:
+        """SSE 스트림 전송 (조각 사이 짧은 지연)"""
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for event in events:
+            await response.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode('utf-8'))
+            await asyncio.sleep(0.005)
+        await response.write_eof()
+        return response
+
+
+def run_server(args) -> None:
+    """모의 서버 실행"""
+    default_latency = LatencyModel(args.latency)
+    latency = {
+        'claude': LatencyModel(args.claude_latency) if args.claude_latency else default_latency,
+        'gemini': LatencyModel(args.gemini_latency) if args.gemini_latency else default_latency,
+    }
+
+    canned = None
+    if args.canned:
+        with open(args.canned, 'r', encoding='utf-8') as f:
+            canned = json.load(f)
+
+    policy = MockDecisionPolicy(mode='canned' if canned else 'rule', canned=canned, fence_rate=args.fence_rate)
+    server = AIMockServer(latency, policy, error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate)
+
+    print(">> Claude / Gemini 로컬 모의 서버")
+    print("=" * 60)
+    print(f"주소: http://{args.host}:{args.port}")
+    print(f"지연: claude={latency['claude'].spec}, gemini={latency['gemini'].spec}")
+    print(f"오류 주입: {args.error_rate:.1%} | 429 주입: {args.rate_limit_rate:.1%}")
+    print(f"응답 모드: {policy.mode}")
+    print("=" * 60)
+
+    web.run_app(server.create_app(), host=args.host, port=args.port, print=None)
+
+
+async def run_benchmark(args) -> bool:
+    """하이브리드 엔진 결정 처리량/지연 측정 (Register_Key.md의 Base URL 사용)"""
+    from support.claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine
+    from support.gpt_interfaces import MarketContext
+
+    engine = ClaudeGeminiHybridEngine()
+    if args.prompt_mode:
+        engine.hybrid_config = {**engine.hybrid_config, 'prompt_mode': args.prompt_mode}
+    print(f"[정보] 프롬프트 모드: {engine.hybrid_config['prompt_mode']}")
+    print(f"[정보] Claude 엔드포인트: {engine.claude_config['base_url']}")
+    print(f"[정보] Gemini 엔드포인트: {engine.gemini_config['base_url']}")
+    readiness = await engine.warm_up(probe=True)
+    for provider, status in readiness.items():
+        print(f"[정보] {provider} 예열: {'준비' if status['ready'] else '실패'} "
+              f"(연결 {status['connect_seconds'] or 0:.3f}초, 탐침 {status['probe_seconds'] or 0:.3f}초)")
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    outcomes = {'fused': 0, 'partial': 0, 'safe': 0}
+
+    async def one_decision(i: int):
+        context = MarketContext(
+            symbol=f"{i % 1000:06d}",
+            current_price=random.uniform(5000, 100000),
+            price_change_pct=random.uniform(-5, 5),
+            volume=random.randint(10000, 5000000),
+            technical_indicators={"RSI": random.uniform(20, 90), "MACD": random.uniform(-2, 2)},
+            news_sentiment={"positive": 0.4, "neutral": 0.4, "negative": 0.2},
+            market_conditions={"trend": "NEUTRAL", "volatility": "MEDIUM"},
+            risk_factors=[],
+            timestamp=datetime.now()
+        )
+        async with semaphore:
+            started = time.perf_counter()
+            decision = await engine.make_decision(context)
+            latencies.append(time.perf_counter() - started)
+
+        metadata = decision.metadata or {}
+        if metadata.get('engine') == 'Safe Mode':
+            outcomes['safe'] += 1
+        elif metadata.get('partial_fusion'):
+            outcomes['partial'] += 1
+        else:
+            outcomes['fused'] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_decision(i) for i in range(args.decisions)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(q: float) -> float:
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] if latencies else 0.0
+
+    print("\n" + "=" * 60)
+    print("하이브리드 엔진 벤치마크 결과")
+    print("=" * 60)
+    print(f"결정 수: {args.decisions} (동시성 {args.concurrency})")
+    print(f"총 소요: {elapsed:.2f}초 | 처리량: {args.decisions / elapsed:.1f} 결정/초")
+    print(f"지연 p50: {percentile(0.50):.3f}초 | p95: {percentile(0.95):.3f}초 | p99: {percentile(0.99):.3f}초")
+    print(f"융합: {outcomes['fused']} | 부분 융합: {outcomes['partial']} | 안전 모드: {outcomes['safe']}")
+    providers = engine.metrics.snapshot()['providers']
+    prompt_tokens = sum(p['prompt']['avg_estimated_tokens'] for p in providers.values())
+    print(f"결정당 프롬프트 추정 토큰: {prompt_tokens:.0f} "
+          f"(Claude {providers['claude']['prompt']['avg_estimated_tokens']:.0f} / "
+          f"Gemini {providers['gemini']['prompt']['avg_estimated_tokens']:.0f})")
+    print(f"계측 스냅샷: {engine.export_metrics_snapshot()}")
+    print("=" * 60)
+    await engine.close()
+    return True
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Claude / Gemini API 로컬 모의 서버")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help="모의 서버 실행")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=DEFAULT_PORT)
+    serve.add_argument('--latency', default='fixed:0.2', help="기본 지연 분포 (예: lognormal:0.8,0.5)")
+    serve.add_argument('--claude-latency', default=None, help="Claude 전용 지연 분포")
+    serve.add_argument('--gemini-latency', default=None, help="Gemini 전용 지연 분포")
+    serve.add_argument('--error-rate', type=float, default=0.0, help="500 오류 주입 비율")
+    serve.add_argument('--rate-limit-rate', type=float, default=0.0, help="429 응답 주입 비율")
+    serve.add_argument('--canned', default=None, help="고정 응답 JSON 파일 (미지정시 규칙 기반)")
+    serve.add_argument('--fence-rate', type=float, default=0.0, help="마크다운 펜스 포함 응답 비율")
+
+    bench = sub.add_parser('bench', help="하이브리드 엔진 벤치마크")
+    bench.add_argument('--decisions', type=int, default=100)
+    bench.add_argument('--concurrency', type=int, default=10)
+    bench.add_argument('--prompt-mode', choices=['compact', 'verbose'], default=None,
+                       help="프롬프트 모드 (미지정시 Register_Key.md 설정, 두 모드 비교용)")
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        run_server(args)
+        return True
+    return asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+    except KeyboardInterrupt:
+        print("\n[중단] 사용자에 의해 중단됨")
+        success = True
+    sys.exit(0 if success else 1)
@@ -3,6 +3,8 @@
 """
 Google Drive 폴더 상태 확인 프로그램
 현재 업로드된 파일 목록과 누락된 파일들을 확인
+- 상대경로 + MD5 기준 비교 (missing / changed / extra / identical)
+- 결과는 drive_status_report.jsonl에 한 줄씩 기록 (individual_file_uploader 입력)
 """
 
 import os
@@ -21,6 +23,18 @@ except ImportError as e:
     print(f"[ERROR] Required libraries missing: {e}")
     sys.exit(1)
 
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.drive_sync_engine import BackupManifest, MANAGED_PREFIXES
+from support.drive_remote_index import DriveRemoteIndex
+from support.drive_bundler import BUNDLE_STAGING_DIR, INDEX_NAME
+from support.drive_diff import (
+    DriveDiff, DiffReportWriter,
+    STATUS_MISSING, STATUS_CHANGED, STATUS_EXTRA, STATUS_IDENTICAL
+)
+from support.file_walker import FileWalker
+
 # Configuration
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 SOURCE_DIR = r"C:\Claude_Works\Projects\GPT4wiseTide"
@@ -28,6 +42,8 @@ CREDENTIALS_FILE = r"C:\Claude_Works\Projects\GPT4wiseTide\Policy\Register_Key\c
 TOKEN_FILE = "Policy/Register_Key/token.pickle"
 PARENT_FOLDER_ID = "1D9AvLY9th8cuKthD30KHjWmmq6P4aPO8"
 BACKUP_FOLDER_NAME = "(StokAutoTrade)wiseTide_Backup"
+STATUS_REPORT_FILE = "drive_status_report.jsonl"
+MAX_LISTED = 50  # 콘솔에 상태별로 출력할 최대 파일 수 (전체는 리포트 파일)
 
 class DriveStatusChecker:
     def __init__(self):
@@ -109,134 +125,81 @@ class DriveStatusChecker:
             return False
     
     def get_uploaded_files(self):
-        """업로드된 파일 목록 가져오기"""
+        """업로드된 파일 인덱스 가져오기 (백업 트리 전체 원격 인덱스, 상대경로 기준)"""
         print("[CHECK] Getting uploaded files list...")
-        uploaded_files = {}
         
         try:
-            page_token = None
-            while True:
-                query = f"parents in '{self.backup_folder_id}'"
-                results = self.service.files().list(
-                    q=query,
-                    pageSize=1000,
-                    fields="nextPageToken, files(id, name, size, modifiedTime)",
-                    pageToken=page_token
-                ).execute()
-                
-                items = results.get('files', [])
-                for item in items:
-                    uploaded_files[item['name']] = {
-                        'id': item['id'],
-                        'size': item.get('size', 0),
-                        'modified': item.get('modifiedTime', '')
-                    }
-                
-                page_token = results.get('nextPageToken')
-                if not page_token:
-                    break
-            
-            print(f"[OK] Found {len(uploaded_files)} files in Google Drive")
-            return uploaded_files
+            index = DriveRemoteIndex(self.service, self.backup_folder_id).load()
+            print(f"[OK] Found {len(index.files)} files in Google Drive (API calls: {index.api_calls})")
+            if index.duplicates:
+                print(f"[WARNING] {len(index.duplicates)} duplicate paths in Drive (newest copy compared)")
+            return index
             
         except Exception as e:
             print(f"[ERROR] Failed to get uploaded files: {e}")
-            return {}
+            return None
     
     def get_local_files(self):
-        """로컬 파일 목록 가져오기"""
-        print("[CHECK] Getting local files list...")
-        local_files = {}
-        
+        """로컬 파일 탐색기 (비교 중 한 번만 순회)"""
+        print("[CHECK] Scanning local files...")
+        return FileWalker(SOURCE_DIR)
+    
+    def load_bundle_index(self):
+        """묶음 백업 색인 (google_drive_uploader --bundle 사용시)"""
+        index_path = os.path.join(BUNDLE_STAGING_DIR, INDEX_NAME)
+        if not os.path.exists(index_path):
+            return None
         try:
-            for root, dirs, files in os.walk(SOURCE_DIR):
-                # Skip hidden directories
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
-                
-                for file in files:
-                    if file.startswith('.') or file.endswith(('.tmp', '.pyc')):
-                        continue
-                    
-                    file_path = os.path.join(root, file)
-                    try:
-                        stat = os.stat(file_path)
-                        relative_path = os.path.relpath(file_path, SOURCE_DIR)
-                        local_files[file] = {
-                            'path': file_path,
-                            'relative_path': relative_path,
-                            'size': stat.st_size,
-                            'modified': stat.st_mtime
-                        }
-                    except OSError:
-                        pass  # Skip inaccessible files
-            
-            print(f"[OK] Found {len(local_files)} local files")
-            return local_files
-            
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
         except Exception as e:
-            print(f"[ERROR] Failed to get local files: {e}")
-            return {}
+            print(f"[WARNING] Failed to load bundle index: {e}")
+            return None
     
-    def compare_files(self, uploaded_files, local_files):
-        """파일 비교 및 상태 분석"""
+    def compare_files(self, remote_index, local_files):
+        """파일 비교 및 상태 분석 (상대경로 + MD5, 결과는 JSONL로 스트리밍 기록)"""
         print("[COMPARE] Comparing local and uploaded files...")
         
-        # 업로드된 파일들
-        uploaded_names = set(uploaded_files.keys())
-        local_names = set(local_files.keys())
+        # 백업 도구가 올린 관리 파일(묶음, 보존 원본, 해시 맵)은 extra에서 제외
+        diff = DriveDiff(remote_index, BackupManifest(self.backup_folder_id, SOURCE_DIR),
+                         bundle_index=self.load_bundle_index(), skip_prefixes=MANAGED_PREFIXES)
+        listed = {STATUS_MISSING: [], STATUS_CHANGED: [], STATUS_EXTRA: []}
         
-        # 통계
-        uploaded_count = len(uploaded_names)
-        local_count = len(local_names)
-        missing_count = len(local_names - uploaded_names)
-        extra_count = len(uploaded_names - local_names)
+        with DiffReportWriter(STATUS_REPORT_FILE) as report:
+            for record in diff.run(local_files):
+                report.write(record)
+                if record.status in listed and len(listed[record.status]) < MAX_LISTED:
+                    listed[record.status].append(record)
+            report.write_summary(diff.counts, source_dir=SOURCE_DIR, backup_folder_id=self.backup_folder_id)
         
+        counts = diff.counts
         print("\n" + "="*60)
         print("FILE COMPARISON REPORT")
         print("="*60)
-        print(f"Local files: {local_count}")
-        print(f"Uploaded files: {uploaded_count}")
-        print(f"Missing from Drive: {missing_count}")
-        print(f"Extra in Drive: {extra_count}")
+        print(f"Local files: {counts[STATUS_MISSING] + counts[STATUS_CHANGED] + counts[STATUS_IDENTICAL]}")
+        print(f"Uploaded files: {len(remote_index.files)}")
+        print(f"Identical: {counts[STATUS_IDENTICAL]}")
+        print(f"Changed (content differs): {counts[STATUS_CHANGED]}")
+        print(f"Missing from Drive: {counts[STATUS_MISSING]}")
+        print(f"Extra in Drive: {counts[STATUS_EXTRA]}")
+        print(f"Local MD5 computed: {diff.hashed} (others reused from manifest)")
         print("-"*60)
         
-        # 누락된 파일들
-        missing_files = local_names - uploaded_names
-        if missing_files:
-            print(f"\nMISSING FILES ({len(missing_files)}):")
-            for filename in sorted(missing_files):
-                local_info = local_files[filename]
-                size_mb = local_info['size'] / (1024*1024)
-                print(f"  - {filename} ({size_mb:.2f} MB) - {local_info['relative_path']}")
-        
-        # 추가로 있는 파일들
-        extra_files = uploaded_names - local_names
-        if extra_files:
-            print(f"\nEXTRA FILES IN DRIVE ({len(extra_files)}):")
-            for filename in sorted(extra_files):
-                print(f"  - {filename}")
+        for status, title in ((STATUS_MISSING, "MISSING FILES"), (STATUS_CHANGED, "CHANGED FILES"),
+                              (STATUS_EXTRA, "EXTRA FILES IN DRIVE")):
+            if not counts[status]:
+                continue
+            print(f"\n{title} ({counts[status]}):")
+            for record in listed[status]:
+                size = record.size if record.size is not None else record.remote_size
+                print(f"  - {record.path} ({(size or 0) / (1024*1024):.2f} MB)")
+            if counts[status] > len(listed[status]):
+                print(f"  ... {counts[status] - len(listed[status])} more in {STATUS_REPORT_FILE}")
         
         print("="*60)
+        print(f"[OK] Detailed report saved to: {STATUS_REPORT_FILE}")
         
-        # 결과를 JSON 파일로 저장
-        result = {
-            'timestamp': str(datetime.now()),
-            'local_count': local_count,
-            'uploaded_count': uploaded_count,
-            'missing_count': missing_count,
-            'extra_count': extra_count,
-            'missing_files': list(missing_files),
-            'extra_files': list(extra_files),
-            'uploaded_files': uploaded_files,
-            'local_files': {k: {**v, 'path': str(v['path'])} for k, v in local_files.items()}
-        }
-        
-        with open('drive_status_report.json', 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-        
-        print(f"[OK] Detailed report saved to: drive_status_report.json")
-        
-        return missing_files, extra_files
+        return counts
 
 def main():
     """메인 함수"""
@@ -264,25 +227,28 @@ def main():
         
         # Step 3: 업로드된 파일 목록 가져오기
         print("\n[STEP 3] Getting uploaded files")
-        uploaded_files = checker.get_uploaded_files()
-        if not uploaded_files:
-            print("[WARNING] No uploaded files found or failed to retrieve")
+        remote_index = checker.get_uploaded_files()
+        if remote_index is None:
+            print("[ERROR] Failed to retrieve uploaded files")
+            return False
+        if not remote_index.files:
+            print("[WARNING] No uploaded files found")
         
-        # Step 4: 로컬 파일 목록 가져오기
+        # Step 4: 로컬 파일 탐색 준비
         print("\n[STEP 4] Getting local files")
         local_files = checker.get_local_files()
-        if not local_files:
-            print("[ERROR] No local files found")
-            return False
         
-        # Step 5: 파일 비교
+        # Step 5: 파일 비교 (로컬 탐색과 동시에 진행)
         print("\n[STEP 5] Comparing files")
-        missing_files, extra_files = checker.compare_files(uploaded_files, local_files)
+        counts = checker.compare_files(remote_index, local_files)
+        if local_files.files == 0:
+            print("[ERROR] No local files found")
+            return False
         
         # 결과 요약
         print(f"\n[SUMMARY] Upload status check completed")
-        print(f"[SUMMARY] Missing files: {len(missing_files)}")
-        print(f"[SUMMARY] Report saved to: drive_status_report.json")
+        print(f"[SUMMARY] Missing files: {counts[STATUS_MISSING]}, changed files: {counts[STATUS_CHANGED]}")
+        print(f"[SUMMARY] Report saved to: {STATUS_REPORT_FILE}")
         
         return True
         
@@ -291,6 +257,5 @@ def main():
         return False
 
 if __name__ == "__main__":
-    from datetime import datetime
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -3,12 +3,14 @@
 """
 GPT4wiseTide 전체 파일 백업 프로그램 (안정화 버전)
 완전히 독립된 백업 도구 - 배포버전에 포함되지 않음
+- 증분 백업: 매니페스트 기준 신규/변경 파일만 업로드 (support/drive_sync_engine.py)
 """
 
 import os
 import sys
 import time
 from datetime import datetime
+from pathlib import Path
 import pickle
 
 try:
@@ -23,6 +25,17 @@ except ImportError as e:
     print("Install command: pip install google-api-python-client google-auth-oauthlib google-auth-httplib2")
     sys.exit(1)
 
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.drive_sync_engine import (
+    DriveSyncEngine, print_plan,
+    ACTION_NEW, ACTION_CHANGED, ACTION_UNCHANGED, ACTION_SKIPPED, ACTION_FAILED
+)
+from support.drive_remote_index import DriveRemoteIndex
+from support.drive_upload_scheduler import AdaptiveUploadScheduler
+from support.file_walker import FileWalker
+
 # Configuration
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 SOURCE_DIR = r"C:\Claude_Works\Projects\GPT4wiseTide"
@@ -35,11 +48,16 @@ MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB limit
 class FullBackup:
     def __init__(self):
         self.service = None
+        self.creds = None
         self.backup_folder_id = None
         self.uploaded = 0
+        self.updated = 0
+        self.unchanged = 0
         self.failed = 0
         self.skipped = 0
         self.total = 0
+        self.files = []
+        self.pending = 0
         self.start_time = None
         
     def authenticate(self):
@@ -71,6 +89,7 @@ class FullBackup:
                 pickle.dump(creds, token)
         
         print("[AUTH] Building service...")
+        self.creds = creds
         self.service = build('drive', 'v3', credentials=creds)
         print("[OK] Authentication successful")
         return True
@@ -105,118 +124,73 @@ class FullBackup:
             print(f"[ERROR] Failed to setup backup folder: {e}")
             return False
     
-    def count_files(self):
-        """Count total files to backup"""
-        print("[COUNT] Counting files...")
-        total = 0
-        
-        for root, dirs, files in os.walk(SOURCE_DIR):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
-            
-            for file in files:
-                if not file.startswith('.') and not file.endswith(('.tmp', '.pyc')):
-                    file_path = os.path.join(root, file)
-                    try:
-                        size = os.path.getsize(file_path)
-                        if size <= MAX_FILE_SIZE:
-                            total += 1
-                    except OSError:
-                        pass  # Skip files we can't access
-        
-        self.total = total
-        print(f"[OK] Found {total} files to backup")
-        return total
+    def create_service(self):
+        """Drive service for one upload worker thread (httplib2 is not thread-safe)"""
+        return build('drive', 'v3', credentials=self.creds, cache_discovery=False)
     
-    def upload_file(self, file_path, filename):
-        """Upload a single file"""
-        try:
-            # Check file size
-            file_size = os.path.getsize(file_path)
-            if file_size > MAX_FILE_SIZE:
-                print(f"[SKIP] File too large (>100MB): {filename}")
-                self.skipped += 1
-                return True
-            
-            # File metadata
-            file_metadata = {
-                'name': filename,
-                'parents': [self.backup_folder_id]
-            }
-            
-            # Upload file
-            media = MediaFileUpload(file_path, resumable=False)
-            result = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
-            
+    def collect_files(self):
+        """Collect files to backup in one pass (shared ignore rules, stat info kept)"""
+        print("[SCAN] Scanning files...")
+        walker = FileWalker(SOURCE_DIR, progress=lambda w: print(
+            f"[SCAN] {w.files} files, {w.bytes / (1024*1024):.1f} MB so far..."))
+        self.files = list(walker)
+        self.total = len(self.files)
+        print(f"[OK] Found {self.total} files ({walker.bytes / (1024*1024):.1f} MB, "
+              f"{walker.ignored} ignored entries)")
+        return self.total
+    
+    def on_file_done(self, item, action):
+        """Per-file result callback from the sync engine"""
+        if action == ACTION_NEW:
             self.uploaded += 1
-            
-            # Progress update
-            if self.uploaded % 50 == 0 or self.uploaded == self.total:
-                self.print_progress()
-            
-            # Rate limiting
-            time.sleep(0.1)
-            
-            return True
-            
-        except HttpError as e:
-            print(f"[ERROR] HTTP error uploading {filename}: {e}")
+        elif action == ACTION_CHANGED:
+            self.updated += 1
+        elif action == ACTION_FAILED:
             self.failed += 1
-            return False
-        except Exception as e:
-            print(f"[ERROR] Failed to upload {filename}: {e}")
-            self.failed += 1
-            return False
+        
+        done = self.uploaded + self.updated + self.failed
+        if done % 50 == 0 or done == self.pending:
+            self.print_progress()
     
     def print_progress(self):
         """Print progress information"""
-        processed = self.uploaded + self.failed + self.skipped
-        if self.total > 0:
-            progress = (processed / self.total) * 100
+        processed = self.uploaded + self.updated + self.failed
+        if self.pending > 0:
+            progress = (processed / self.pending) * 100
             
             if self.start_time:
                 elapsed = time.time() - self.start_time
                 rate = processed / elapsed if elapsed > 0 else 0
-                remaining = self.total - processed
+                remaining = self.pending - processed
                 eta = remaining / rate if rate > 0 else 0
                 
-                print(f"[PROGRESS] {processed}/{self.total} ({progress:.1f}%) - "
-                      f"Upload: {self.uploaded}, Failed: {self.failed}, Skipped: {self.skipped} - "
+                print(f"[PROGRESS] {processed}/{self.pending} ({progress:.1f}%) - "
+                      f"New: {self.uploaded}, Updated: {self.updated}, Failed: {self.failed} - "
                       f"Rate: {rate:.1f} files/sec - ETA: {eta/60:.1f} min")
     
     def backup_all_files(self):
-        """Backup all files"""
-        print(f"[BACKUP] Starting full backup...")
+        """Backup new and changed files (incremental)"""
+        print(f"[BACKUP] Starting incremental backup...")
         print(f"[BACKUP] Source: {SOURCE_DIR}")
         print(f"[BACKUP] Target: Google Drive/{BACKUP_FOLDER_NAME}")
         print(f"[BACKUP] Total files: {self.total}")
         
-        self.start_time = time.time()
+        remote_index = DriveRemoteIndex(self.service, self.backup_folder_id).load()
+        engine = DriveSyncEngine(self.service, self.backup_folder_id, SOURCE_DIR,
+                                 max_file_size=MAX_FILE_SIZE, remote_index=remote_index,
+                                 service_factory=self.create_service)
+        plan = engine.plan(self.files)
+        print_plan(plan)
+        self.unchanged = plan.counts[ACTION_UNCHANGED]
+        self.skipped = plan.counts[ACTION_SKIPPED]
+        self.pending = len(plan.pending)
         
-        for root, dirs, files in os.walk(SOURCE_DIR):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
-            
-            for file in files:
-                if file.startswith('.') or file.endswith(('.tmp', '.pyc')):
-                    continue
-                
-                file_path = os.path.join(root, file)
-                
-                # Upload file
-                self.upload_file(file_path, file)
-                
-                # Check if we should continue
-                if self.uploaded + self.failed + self.skipped >= self.total:
-                    break
-            
-            if self.uploaded + self.failed + self.skipped >= self.total:
-                break
+        if self.pending == 0:
+            print("[OK] Nothing to upload - backup is up to date")
+            return True
         
+        self.start_time = time.time()
+        AdaptiveUploadScheduler(engine).run(plan.pending, progress=self.on_file_done)
         return True
     
     def print_final_summary(self):
@@ -232,23 +206,25 @@ class FullBackup:
         print(f"Duration: {elapsed/60:.1f} minutes")
         print("-"*70)
         print(f"Total Files: {self.total}")
-        print(f"Successfully Uploaded: {self.uploaded}")
+        print(f"Uploaded (new): {self.uploaded}")
+        print(f"Updated in place: {self.updated}")
+        print(f"Unchanged: {self.unchanged}")
         print(f"Failed: {self.failed}")
         print(f"Skipped (too large): {self.skipped}")
         
         if self.total > 0:
-            success_rate = (self.uploaded / self.total) * 100
-            print(f"Success Rate: {success_rate:.1f}%")
+            success_rate = ((self.uploaded + self.updated + self.unchanged) / self.total) * 100
+            print(f"Backed Up Rate: {success_rate:.1f}%")
         
         if elapsed > 0:
-            avg_rate = (self.uploaded + self.failed + self.skipped) / elapsed
+            avg_rate = (self.uploaded + self.updated + self.failed) / elapsed
             print(f"Average Rate: {avg_rate:.1f} files/second")
         
         print("="*70)
         
         if self.failed > 0:
             print(f"[WARNING] {self.failed} files failed to upload")
-        elif self.uploaded == self.total:
+        elif self.uploaded + self.updated + self.unchanged == self.total:
             print("[SUCCESS] ALL FILES BACKED UP SUCCESSFULLY!")
         else:
             print("[INFO] Backup completed with some files skipped")
@@ -279,14 +255,13 @@ def main():
         if not backup.setup_backup_folder():
             return False
         
-        # Step 3: Count files
-        if backup.count_files() == 0:
+        # Step 3: Scan files
+        if backup.collect_files() == 0:
             print("[ERROR] No files found to backup")
             return False
         
         # Step 4: Confirm backup
-        print(f"\n[CONFIRM] About to backup {backup.total} files to Google Drive")
-        print(f"[CONFIRM] This will take approximately {backup.total * 0.5 / 60:.0f} minutes")
+        print(f"\n[CONFIRM] About to backup {backup.total} files to Google Drive (new/changed only)")
         print("[CONFIRM] Starting automatic backup in 3 seconds...")
         time.sleep(3)
         
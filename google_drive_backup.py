@@ -4,6 +4,7 @@
 - tideWise 프로젝트 백업 전용 독립 프로그램
 - credentials.json을 사용한 Google Drive API 연동
 - 지정된 Google Drive 폴더에 업로드/삭제 기능
+- 프로젝트 백업은 병렬 압축 스트리밍 ZIP을 바로 업로드 (로컬 임시 아카이브 없음)
 """
 
 import os
@@ -14,6 +15,7 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 import zipfile
 import shutil
+import time
 
 # Google Drive API 라이브러리
 try:
@@ -29,6 +31,26 @@ except ImportError:
     print("Google Drive API 라이브러리가 설치되지 않았습니다.")
     print("설치 명령: pip install google-auth google-auth-oauthlib google-auth-httplib2 google-api-python-client")
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support.streaming_archive import StreamingZipArchive, ArchiveMediaUpload
+from support.file_walker import FileWalker
+
+# 프로젝트 백업 제외 규칙 (gitignore 형식, support/file_walker.py)
+PROJECT_BACKUP_IGNORE_RULES = (
+    '__pycache__/',
+    '.git/',
+    'logs/',
+    '*.log',
+    'token.json',
+    'node_modules/',
+    '.env',
+    '*.pyc',
+    'temp/',
+    'tmp/',
+    'tideWise_backup_*.zip',  # 이전 로컬 백업 ZIP
+)
+
 
 class GoogleDriveBackupUtility:
     """Google Drive 백업 전용 독립 유틸리티"""
@@ -112,52 +134,24 @@ class GoogleDriveBackupUtility:
             print(f"❌ Google Drive 서비스 초기화 실패: {e}")
             return False
             
+    def collect_backup_files(self) -> List[Path]:
+        """백업 대상 파일 목록 (제외 규칙 적용, 1회 탐색)"""
+        return [Path(entry.path) for entry in FileWalker(str(self.project_root), PROJECT_BACKUP_IGNORE_RULES)]
+        
     def create_project_backup(self) -> Optional[str]:
-        """프로젝트 전체 백업 ZIP 파일 생성"""
+        """프로젝트 전체 백업 ZIP 파일 생성 (로컬 보관용, Drive 백업은 stream_backup_to_drive)"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_filename = f"tideWise_backup_{timestamp}.zip"
         backup_path = self.project_root / backup_filename
         
         print(f"프로젝트 백업 생성 중: {backup_filename}")
         
-        # 제외할 디렉토리/파일 목록
-        exclude_patterns = {
-            '__pycache__',
-            '.git',
-            'logs',
-            '*.log',
-            'token.json',
-            'node_modules',
-            '.env',
-            '*.pyc',
-            'temp',
-            'tmp'
-        }
-        
         try:
+            backup_files = self.collect_backup_files()
             with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(self.project_root):
-                    # 제외 디렉토리 필터링
-                    dirs[:] = [d for d in dirs if d not in exclude_patterns]
-                    
-                    for file in files:
-                        file_path = Path(root) / file
-                        
-                        # 제외 패턴 확인
-                        should_exclude = False
-                        for pattern in exclude_patterns:
-                            if pattern.startswith('*'):
-                                if file.endswith(pattern[1:]):
-                                    should_exclude = True
-                                    break
-                            elif pattern in file or pattern in str(file_path):
-                                should_exclude = True
-                                break
-                                
-                        if not should_exclude:
-                            # ZIP 내 경로 계산
-                            arcname = file_path.relative_to(self.project_root)
-                            zipf.write(file_path, arcname)
+                for file_path in backup_files:
+                    # ZIP 내 경로 계산
+                    zipf.write(file_path, file_path.relative_to(self.project_root))
                             
             print(f"✅ 백업 파일 생성 완료: {backup_path}")
             print(f"파일 크기: {backup_path.stat().st_size / (1024*1024):.1f} MB")
@@ -229,6 +223,67 @@ class GoogleDriveBackupUtility:
             print(f"❌ 업로드 중 오류: {e}")
             return False
             
+    def stream_backup_to_drive(self, workers: Optional[int] = None) -> bool:
+        """
+        프로젝트 전체 백업을 스트리밍 업로드 (병렬 압축 → 크기 제한 버퍼 → resumable 업로드)
+        
+        Args:
+            workers: 압축 프로세스 수 (None이면 CPU 수)
+        """
+        if not self.service:
+            print("❌ Google Drive 서비스가 초기화되지 않았습니다.")
+            return False
+            
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_filename = f"tideWise_backup_{timestamp}.zip"
+        
+        try:
+            entries = list(FileWalker(str(self.project_root), PROJECT_BACKUP_IGNORE_RULES))
+        except Exception as e:
+            print(f"❌ 백업 대상 수집 실패: {e}")
+            return False
+            
+        total_size = sum(entry.size for entry in entries)
+        print(f"프로젝트 백업 스트리밍 업로드: {backup_filename}")
+        print(f"대상: {len(entries)}개 파일, {total_size / (1024*1024):.1f} MB (압축 전)")
+        
+        archive = StreamingZipArchive(
+            [(entry.path, entry.relative_path) for entry in entries], workers=workers
+        ).start()
+        start_time = time.time()
+        
+        try:
+            request = self.service.files().create(
+                body={'name': backup_filename, 'parents': [self.TARGET_FOLDER_ID]},
+                media_body=ArchiveMediaUpload(archive),
+                fields='id, size'
+            )
+            
+            response = None
+            while response is None:
+                status, response = request.next_chunk(num_retries=3)
+                if status:
+                    # 전체 크기 미정 → 압축 전 기준 진행률
+                    progress = min(archive.raw_bytes / total_size * 100, 100) if total_size else 100
+                    print(f"업로드 진행: {status.resumable_progress / (1024*1024):.1f} MB "
+                          f"(압축 {progress:.0f}%)")
+            archive.join()
+            
+            elapsed = time.time() - start_time
+            size_mb = int(response.get('size', archive.offset)) / (1024*1024)
+            print(f"✅ 업로드 완료! 파일 ID: {response.get('id')}")
+            print(f"압축 크기: {size_mb:.1f} MB, 소요 시간: {elapsed:.1f}초")
+            return True
+            
+        except HttpError as error:
+            print(f"❌ Google Drive 업로드 실패: {error}")
+            return False
+        except Exception as e:
+            print(f"❌ 백업 중 오류: {e}")
+            return False
+        finally:
+            archive.cancel()
+            
     def list_backup_files(self) -> List[Dict[str, Any]]:
         """Google Drive의 백업 파일 목록 조회"""
         if not self.service:
@@ -334,14 +389,10 @@ class GoogleDriveBackupUtility:
                     break
                 elif choice == '1':
                     print("\n프로젝트 백업을 시작합니다...")
-                    backup_file = self.create_project_backup()
-                    if backup_file:
-                        if self.upload_to_drive(backup_file):
-                            print("✅ 백업 완료!")
-                        else:
-                            print("❌ 백업 업로드 실패")
+                    if self.stream_backup_to_drive():
+                        print("✅ 백업 완료!")
                     else:
-                        print("❌ 백업 생성 실패")
+                        print("❌ 백업 실패")
                         
                 elif choice == '2':
                     self.list_backup_files()
@@ -12,18 +12,27 @@
 - 대상: Google Drive 폴더 ID "1D9AvLY9th8cuKthD30KHjWmmq6P4aPO8"
 - 하위폴더: "(StokAutoTrade)wiseTide_Backup"
 - 백테스트 프로그램처럼 완전히 독립된 프로그램
+- 증분 백업: 매니페스트 기준 신규/변경 파일만 업로드, 변경 파일은 제자리 갱신
+- 묶음 모드(--bundle): 작은 파일은 디렉토리별 tar 묶음으로 업로드, --restore로 개별 파일 복원
+- 중복 제거(--dedup): 같은 내용(MD5)이 이미 원격에 있으면 업로드 대신 참조로 기록, --restore-all로 트리 복원
+
+사용법:
+    python google_drive_uploader.py                      # 파일별 증분 백업
+    python google_drive_uploader.py --bundle             # 작은 파일 묶음 백업
+    python google_drive_uploader.py --restore data/5min/001016_5min.csv --dest restored
+    python google_drive_uploader.py --dedup              # 내용 기준 중복 제거 백업
+    python google_drive_uploader.py --restore-all data/5min/ --dest restored
 """
 
 import os
 import sys
 import json
 import time
+import argparse
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import logging
 from datetime import datetime
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Windows 콘솔 UTF-8 인코딩 설정
 if sys.platform == "win32":
@@ -44,6 +53,22 @@ except ImportError as e:
     print("설치 명령어: pip install google-api-python-client google-auth-oauthlib google-auth-httplib2")
     sys.exit(1)
 
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.drive_sync_engine import (
+    DriveSyncEngine, escape_query_value,
+    ACTION_NEW, ACTION_CHANGED, ACTION_UNCHANGED, ACTION_SKIPPED, ACTION_FAILED, ACTION_DEDUPED
+)
+from support.drive_remote_index import DriveRemoteIndex
+from support.drive_upload_scheduler import AdaptiveUploadScheduler
+from support.drive_bundler import (
+    BundleBuilder, BundleRestorer, split_small_files,
+    BUNDLE_FOLDER_NAME, BUNDLE_STAGING_DIR, INDEX_NAME
+)
+from support.drive_dedup import ContentRestorer, build_content_map, upload_content_map
+from support.file_walker import FileWalker, FileEntry
+
 # Google Drive API 설정
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 SOURCE_DIR = r"C:\Claude_Works\Projects\GPT4wiseTide"
@@ -55,20 +80,30 @@ PARENT_FOLDER_ID = "1D9AvLY9th8cuKthD30KHjWmmq6P4aPO8"
 BACKUP_FOLDER_NAME = "(StokAutoTrade)wiseTide_Backup"
 
 # 업로드 설정
-MAX_WORKERS = 3  # 동시 업로드 스레드 수
+MAX_WORKERS = 8  # 최대 동시 업로드 수 (처리량/요청 한도에 따라 자동 조절)
+INITIAL_WORKERS = 3  # 시작 동시 업로드 수
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB 제한
-CHUNK_SIZE = 1024 * 1024  # 1MB 청크
 
 class GoogleDriveUploader:
     def __init__(self):
         self.service = None
+        self.creds = None
         self.backup_folder_id = None
         self.uploaded_files = 0
+        self.updated_files = 0
+        self.unchanged_files = 0
         self.failed_files = 0
         self.skipped_files = 0
+        self.bundled_files = 0
+        self.deduped_files = 0
         self.total_files = 0
-        self.upload_lock = threading.Lock()
+        self.total_bytes = 0
+        self.files: List[FileEntry] = []
         self.folder_cache = {}  # 폴더 ID 캐시
+        self.engine: Optional[DriveSyncEngine] = None
+        self.scheduler: Optional[AdaptiveUploadScheduler] = None
+        self.pending_files = 0
+        self.start_time = time.time()
         
         # 로깅 설정
         log_filename = f"drive_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
@@ -127,6 +162,7 @@ class GoogleDriveUploader:
                 self.logger.warning(f"토큰 저장 실패: {e}")
         
         try:
+            self.creds = creds
             self.service = build('drive', 'v3', credentials=creds)
             self.logger.info("✅ Google Drive API 서비스 초기화 완료")
             return True
@@ -168,148 +204,58 @@ class GoogleDriveUploader:
             self.logger.error(f"❌ 폴더 생성/찾기 실패 '{name}': {e}")
             return None
     
-    def get_or_create_folder_path(self, relative_path: str) -> Optional[str]:
-        """상대 경로에 따른 폴더 구조 생성"""
-        path_parts = Path(relative_path).parts
-        current_parent = self.backup_folder_id
-        
-        # 파일이 루트 디렉토리에 있는 경우 (폴더 없음)
-        if len(path_parts) <= 1:
-            return current_parent
-        
-        # 폴더 경로가 있는 경우
-        for part in path_parts[:-1]:  # 파일명 제외
-            if not part or part == '.' or part == '':
-                continue
-            current_parent = self.create_folder(part, current_parent)
-            if not current_parent:
-                self.logger.error(f"폴더 생성 실패: {part} (경로: {relative_path})")
-                return None
-        
-        return current_parent
-    
-    def count_total_files(self) -> int:
-        """전체 파일 개수 계산"""
-        total = 0
-        try:
-            for root, dirs, files in os.walk(SOURCE_DIR):
-                # 숨김 폴더 및 특정 폴더 제외
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in [
-                    '__pycache__', 'node_modules', '.git', '.vscode', 
-                    'dist', 'build', '.pytest_cache'
-                ]]
-                
-                for file in files:
-                    if not file.startswith('.') and not file.endswith(('.tmp', '.pyc')):
-                        total += 1
-                        
-            return total
-        except Exception as e:
-            self.logger.error(f"파일 개수 계산 실패: {e}")
-            return 0
+    def create_service(self):
+        """업로드 워커 스레드 전용 Drive 서비스 (httplib2는 스레드 간 공유 불가)"""
+        return build('drive', 'v3', credentials=self.creds, cache_discovery=False)
     
-    def upload_single_file(self, file_info: dict) -> bool:
-        """단일 파일 업로드"""
-        local_path = file_info['local_path']
-        relative_path = file_info['relative_path']
+    def on_file_done(self, item, action):
+        """파일 처리 결과 집계 (스케줄러가 순차 호출)"""
+        if action == ACTION_NEW:
+            self.uploaded_files += 1
+            self.logger.info(f"✅ 업로드 완료: {item.relative_path}")
+        elif action == ACTION_CHANGED:
+            self.updated_files += 1
+            self.logger.info(f"🔄 변경 갱신: {item.relative_path}")
+        else:
+            self.failed_files += 1
+            self.logger.error(f"❌ 업로드 실패: {item.relative_path}")
         
-        try:
-            # 파일 크기 체크
-            file_size = os.path.getsize(local_path)
-            if file_size > MAX_FILE_SIZE:
-                with self.upload_lock:
-                    self.logger.warning(f"⚠️ 파일이 너무 큽니다 (100MB 초과): {relative_path}")
-                    self.skipped_files += 1
-                return False
-            
-            # 대상 폴더 ID 가져오기
-            parent_folder_id = self.get_or_create_folder_path(relative_path)
-            if parent_folder_id is None:
-                with self.upload_lock:
-                    self.logger.error(f"❌ 폴더 생성 실패: {relative_path}")
-                    self.failed_files += 1
-                return False
+        # 진행률 출력
+        completed = self.uploaded_files + self.updated_files + self.failed_files
+        if completed % 50 == 0 or completed == self.pending_files:
+            elapsed = time.time() - self.start_time
+            progress = (completed / self.pending_files) * 100
+            rate = completed / elapsed if elapsed > 0 else 0
+            eta = (self.pending_files - completed) / rate if rate > 0 else 0
             
-            # 파일 메타데이터
-            file_metadata = {
-                'name': os.path.basename(relative_path),
-                'parents': [parent_folder_id]
-            }
-            
-            # 미디어 업로드 객체 생성
-            media = MediaFileUpload(
-                local_path,
-                resumable=file_size > 10 * 1024 * 1024,  # 10MB 이상은 resumable
-                chunksize=CHUNK_SIZE
-            )
-            
-            # 업로드 실행
-            request = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name'
-            )
-            
-            response = None
-            while response is None:
-                try:
-                    status, response = request.next_chunk()
-                    if status and file_size > 10 * 1024 * 1024:  # 큰 파일만 진행률 표시
-                        progress = int(status.progress() * 100)
-                        if progress % 25 == 0:  # 25%마다 로그
-                            with self.upload_lock:
-                                self.logger.info(f"📤 업로드 진행: {os.path.basename(relative_path)} ({progress}%)")
-                except Exception as chunk_error:
-                    with self.upload_lock:
-                        self.logger.error(f"❌ 업로드 중 오류: {relative_path} - {chunk_error}")
-                        self.failed_files += 1
-                    return False
-            
-            with self.upload_lock:
-                self.uploaded_files += 1
-                self.logger.info(f"✅ 업로드 완료 ({self.uploaded_files}/{self.total_files}): {relative_path}")
-            
-            return True
-            
-        except Exception as e:
-            with self.upload_lock:
-                self.logger.error(f"❌ 업로드 실패: {relative_path} - {e}")
-                self.failed_files += 1
-            return False
+            self.logger.info(f"📈 진행률: {completed}/{self.pending_files} ({progress:.1f}%) "
+                           f"- 속도: {rate:.1f}파일/초 - 예상 남은 시간: {eta/60:.1f}분 "
+                           f"- 동시 업로드 {self.scheduler.limit}개")
     
-    def collect_all_files(self) -> List[dict]:
-        """업로드할 모든 파일 목록 수집"""
-        files_to_upload = []
-        
+    def collect_all_files(self) -> List[FileEntry]:
+        """업로드할 모든 파일 목록 수집 (공용 제외 규칙, 1회 탐색 - 크기/mtime 포함)"""
         try:
-            for root, dirs, files in os.walk(SOURCE_DIR):
-                # 숨김 폴더 및 특정 폴더 제외
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in [
-                    '__pycache__', 'node_modules', '.git', '.vscode',
-                    'dist', 'build', '.pytest_cache'
-                ]]
-                
-                for file in files:
-                    if file.startswith('.') or file.endswith(('.tmp', '.pyc')):
-                        continue
-                    
-                    local_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(local_path, SOURCE_DIR)
-                    
-                    files_to_upload.append({
-                        'local_path': local_path,
-                        'relative_path': relative_path,
-                        'size': os.path.getsize(local_path)
-                    })
-            
-            return files_to_upload
+            walker = FileWalker(SOURCE_DIR, progress=lambda w: self.logger.info(
+                f"🔍 탐색 중: {w.files:,}개 ({w.bytes / (1024*1024):.1f} MB)"))
+            self.files = list(walker)
+            self.total_files = len(self.files)
+            self.total_bytes = walker.bytes
+            for error in walker.errors:
+                self.logger.warning(f"⚠️ 접근 불가: {error}")
+            return self.files
             
         except Exception as e:
             self.logger.error(f"❌ 파일 목록 수집 실패: {e}")
             return []
     
-    def upload_all_files(self) -> bool:
-        """모든 파일 업로드 (멀티스레드)"""
+    def upload_all_files(self, bundle: bool = False, dedup: bool = False) -> bool:
+        """
+        모든 파일 업로드 (멀티스레드)
+
+        Args:
+            bundle: 작은 파일을 묶음으로 업로드 (나머지는 파일별)
+            dedup: 같은 내용이 이미 원격에 있으면 업로드 대신 참조로 기록 (완료 후 해시 맵 업로드)
+        """
         self.logger.info(f"📁 소스 디렉토리: {SOURCE_DIR}")
         self.logger.info(f"🎯 대상 폴더: {BACKUP_FOLDER_NAME}")
         
@@ -319,58 +265,156 @@ class GoogleDriveUploader:
             self.logger.error("❌ 백업 폴더 생성 실패")
             return False
         
-        # 업로드할 파일 목록 수집
-        files_to_upload = self.collect_all_files()
-        self.total_files = len(files_to_upload)
+        # 업로드할 파일 목록 (main에서 수집했으면 재사용)
+        files_to_upload = self.files or self.collect_all_files()
         
         if self.total_files == 0:
             self.logger.warning("⚠️ 업로드할 파일이 없습니다")
             return False
         
         self.logger.info(f"📊 전체 파일 개수: {self.total_files}개")
-        total_size = sum(f['size'] for f in files_to_upload)
-        self.logger.info(f"📊 전체 파일 크기: {total_size / (1024*1024):.1f} MB")
+        self.logger.info(f"📊 전체 파일 크기: {self.total_bytes / (1024*1024):.1f} MB")
         
-        start_time = time.time()
+        # 매니페스트 비교 → 신규/변경 파일만 업로드
+        remote_index = DriveRemoteIndex(self.service, self.backup_folder_id).load()
+        self.engine = DriveSyncEngine(self.service, self.backup_folder_id, SOURCE_DIR,
+                                      max_file_size=MAX_FILE_SIZE, remote_index=remote_index,
+                                      service_factory=self.create_service, dedup=dedup)
+        if bundle:
+            small_files, files_to_upload = split_small_files(files_to_upload)
+            if small_files and not self.upload_bundles(small_files):
+                return False
+        plan = self.engine.plan(files_to_upload)
+        self.unchanged_files = plan.counts[ACTION_UNCHANGED]
+        self.skipped_files = plan.counts[ACTION_SKIPPED]
+        self.deduped_files = plan.counts[ACTION_DEDUPED]
+        pending = plan.pending
+        
+        self.logger.info(f"📋 신규 {plan.counts[ACTION_NEW]}개, 변경 {plan.counts[ACTION_CHANGED]}개, "
+                         f"변경 없음 {self.unchanged_files}개, 중복 참조 {self.deduped_files}개, "
+                         f"건너뜀(100MB 초과) {self.skipped_files}개 "
+                         f"- 업로드 {plan.pending_bytes / (1024*1024):.1f} MB")
+        if not pending:
+            self.logger.info("✅ 변경된 파일 없음 - 백업이 최신 상태입니다")
+            return self.upload_content_map() if dedup else True
+        
+        # 적응형 동시 업로드 (상위 폴더 트리 일괄 확보 후 시작, 스레드별 Drive 서비스)
+        self.pending_files = len(pending)
+        self.scheduler = AdaptiveUploadScheduler(self.engine, max_workers=MAX_WORKERS,
+                                                 initial_workers=INITIAL_WORKERS)
+        self.start_time = time.time()
         
-        # 멀티스레드로 업로드
         try:
-            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                # 업로드 작업 제출
-                future_to_file = {
-                    executor.submit(self.upload_single_file, file_info): file_info
-                    for file_info in files_to_upload
-                }
-                
-                # 결과 처리
-                for future in as_completed(future_to_file):
-                    file_info = future_to_file[future]
-                    try:
-                        success = future.result()
-                        if not success:
-                            self.logger.error(f"업로드 실패: {file_info['relative_path']}")
-                    except Exception as exc:
-                        self.logger.error(f"업로드 예외 발생: {file_info['relative_path']} - {exc}")
-                        with self.upload_lock:
-                            self.failed_files += 1
-                    
-                    # 진행률 출력
-                    completed = self.uploaded_files + self.failed_files + self.skipped_files
-                    if completed % 50 == 0 or completed == self.total_files:
-                        elapsed = time.time() - start_time
-                        progress = (completed / self.total_files) * 100
-                        rate = completed / elapsed if elapsed > 0 else 0
-                        eta = (self.total_files - completed) / rate if rate > 0 else 0
-                        
-                        self.logger.info(f"📈 진행률: {completed}/{self.total_files} ({progress:.1f}%) "
-                                       f"- 속도: {rate:.1f}파일/초 - 예상 남은 시간: {eta/60:.1f}분")
-            
-            return True
+            self.scheduler.run(pending, progress=self.on_file_done)
+            return self.upload_content_map() if dedup else True
             
         except Exception as e:
             self.logger.error(f"❌ 업로드 프로세스 실패: {e}")
             return False
     
+    def upload_content_map(self) -> bool:
+        """매니페스트 → 해시 맵(경로 → MD5 → 원격 ID) 업로드 (트리 복원용)"""
+        # 원본 업로드가 실패해 기록되지 못한 참조는 다음 실행에서 다시 처리
+        unresolved = len(self.engine.deferred_refs)
+        self.deduped_files -= unresolved
+        self.failed_files += unresolved
+        try:
+            content_map = build_content_map(self.engine.manifest)
+            upload_content_map(self.service, self.backup_folder_id, content_map)
+            self.logger.info(f"🧬 해시 맵 업로드: 경로 {len(content_map['paths']):,}개, "
+                             f"고유 내용 {len(content_map['objects']):,}개")
+            return True
+        except Exception as e:
+            self.logger.error(f"❌ 해시 맵 업로드 실패: {e}")
+            return False
+    
+    def upload_bundles(self, small_files: List[FileEntry]) -> bool:
+        """작은 파일 → 디렉토리별 묶음 생성 후 _bundles 폴더에 업로드 (묶음 먼저, 색인은 마지막)"""
+        builder = BundleBuilder()
+        index = builder.build(small_files)
+        stats = builder.stats
+        self.logger.info(f"📦 묶음 {stats['bundles']}개 (파일 {stats['files']:,}개, 디렉토리 {stats['directories']}개 중 "
+                         f"{stats['rebuilt_directories']}개 재생성, 압축 {stats['raw_bytes'] / (1024*1024):.1f} MB → "
+                         f"{stats['packed_bytes'] / (1024*1024):.1f} MB)")
+        
+        bundles_folder_id = self.engine.get_folder_id(BUNDLE_FOLDER_NAME)
+        bundle_engine = DriveSyncEngine(self.service, bundles_folder_id, BUNDLE_STAGING_DIR,
+                                        service_factory=self.create_service)
+        staged = [(os.path.join(BUNDLE_STAGING_DIR, name), name) for name in list(index['bundles']) + [INDEX_NAME]]
+        plan = bundle_engine.plan(staged)
+        index_items = [item for item in plan.pending if item.relative_path == INDEX_NAME]
+        bundle_items = [item for item in plan.pending if item.relative_path != INDEX_NAME]
+        
+        failed_bundles = set()
+        
+        def on_bundle_done(item, action):
+            if action == ACTION_FAILED:
+                failed_bundles.add(item.relative_path)
+                self.logger.error(f"❌ 묶음 업로드 실패: {item.relative_path}")
+            else:
+                self.logger.info(f"📦 묶음 업로드 완료: {item.relative_path}")
+        
+        scheduler = AdaptiveUploadScheduler(bundle_engine, max_workers=MAX_WORKERS,
+                                            initial_workers=INITIAL_WORKERS)
+        scheduler.run(bundle_items, progress=on_bundle_done)
+        
+        # 색인은 모든 묶음이 올라간 뒤에만 갱신 (복원시 색인-묶음 불일치 방지)
+        if failed_bundles:
+            self.logger.error(f"❌ 묶음 {len(failed_bundles)}개 실패 - 묶음 색인 갱신 보류")
+        else:
+            for item in index_items:
+                on_bundle_done(item, bundle_engine.sync_file(item))
+            bundle_engine.save()
+        
+        for name, entry in index['bundles'].items():
+            if name in failed_bundles or INDEX_NAME in failed_bundles:
+                self.failed_files += len(entry['members'])
+            else:
+                self.bundled_files += len(entry['members'])
+        return not failed_bundles
+    
+    def restore_files(self, relative_paths: List[str], dest_dir: str) -> bool:
+        """묶음에서 개별 파일 복원 (해당 구성원 바이트 범위만 다운로드)"""
+        folder_id = PARENT_FOLDER_ID
+        for name in (BACKUP_FOLDER_NAME, BUNDLE_FOLDER_NAME):
+            query = (f"name='{escape_query_value(name)}' and '{folder_id}' in parents "
+                     f"and mimeType='application/vnd.google-apps.folder' and trashed=false")
+            items = self.service.files().list(q=query, fields="files(id)").execute().get('files', [])
+            if not items:
+                self.logger.error(f"❌ 원격 폴더 없음: {name}")
+                return False
+            folder_id = items[0]['id']
+        
+        restorer = BundleRestorer(self.service, folder_id).load()
+        restored = 0
+        for relative_path in relative_paths:
+            try:
+                target = restorer.restore(relative_path, dest_dir)
+                restored += 1
+                self.logger.info(f"✅ 복원 완료: {relative_path} → {target}")
+            except Exception as e:
+                self.logger.error(f"❌ 복원 실패 '{relative_path}': {e}")
+        self.logger.info(f"📊 복원 {restored}/{len(relative_paths)}개")
+        return restored == len(relative_paths)
+    
+    def restore_tree(self, prefix: str, dest_dir: str) -> bool:
+        """해시 맵 기준 트리 복원 (같은 내용은 한 번만 다운로드)"""
+        query = (f"name='{escape_query_value(BACKUP_FOLDER_NAME)}' and '{PARENT_FOLDER_ID}' in parents "
+                 f"and mimeType='application/vnd.google-apps.folder' and trashed=false")
+        items = self.service.files().list(q=query, fields="files(id)").execute().get('files', [])
+        if not items:
+            self.logger.error(f"❌ 원격 폴더 없음: {BACKUP_FOLDER_NAME}")
+            return False
+        
+        restorer = ContentRestorer(self.service, items[0]['id']).load()
+        failed = restorer.restore(dest_dir, prefix=prefix)
+        for path in failed:
+            self.logger.error(f"❌ 복원 실패: {path}")
+        stats = restorer.stats
+        self.logger.info(f"📊 복원 {stats['files']:,}개 (다운로드 {stats['downloaded']:,}개 "
+                         f"{stats['bytes'] / (1024*1024):.1f} MB, 로컬 복사 {stats['copied']:,}개), 실패 {len(failed)}개")
+        return not failed
+    
     def print_summary(self):
         """업로드 결과 요약"""
         self.logger.info("\n" + "="*70)
@@ -381,11 +425,19 @@ class GoogleDriveUploader:
         self.logger.info(f"백업 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         self.logger.info("-"*70)
         self.logger.info(f"전체 파일: {self.total_files:,}개")
-        self.logger.info(f"업로드 성공: {self.uploaded_files:,}개")
+        self.logger.info(f"신규 업로드: {self.uploaded_files:,}개")
+        self.logger.info(f"변경 갱신: {self.updated_files:,}개")
+        self.logger.info(f"변경 없음: {self.unchanged_files:,}개")
+        if self.bundled_files:
+            self.logger.info(f"묶음 백업: {self.bundled_files:,}개")
+        if self.deduped_files:
+            self.logger.info(f"중복 참조: {self.deduped_files:,}개")
         self.logger.info(f"건너뜀: {self.skipped_files:,}개")
         self.logger.info(f"실패: {self.failed_files:,}개")
         
-        success_rate = (self.uploaded_files / self.total_files * 100) if self.total_files > 0 else 0
+        backed_up = (self.uploaded_files + self.updated_files + self.unchanged_files
+                     + self.bundled_files + self.deduped_files)
+        success_rate = (backed_up / self.total_files * 100) if self.total_files > 0 else 0
         self.logger.info(f"성공률: {success_rate:.1f}%")
         self.logger.info("="*70)
         
@@ -413,8 +465,23 @@ def validate_environment() -> bool:
     print("[OK] 환경 검증 완료")
     return True
 
-def main():
+def parse_args(argv=None):
+    """명령행 인자"""
+    parser = argparse.ArgumentParser(description="GPT4wiseTide Google Drive 백업")
+    parser.add_argument('--bundle', action='store_true',
+                        help="작은 파일을 디렉토리별 tar 묶음으로 업로드")
+    parser.add_argument('--restore', nargs='+', metavar='PATH',
+                        help="묶음에서 복원할 파일 (소스 기준 상대 경로)")
+    parser.add_argument('--dedup', action='store_true',
+                        help="같은 내용이 이미 원격에 있으면 업로드 대신 참조로 기록")
+    parser.add_argument('--restore-all', nargs='?', const='', metavar='PREFIX',
+                        help="해시 맵으로 트리 복원 (접두어 지정시 해당 경로만)")
+    parser.add_argument('--dest', default='restored', help="복원 위치 (기본: restored)")
+    return parser.parse_args(argv)
+
+def main(args=None):
     """메인 실행 함수"""
+    args = args or parse_args([])
     print(">> GPT4wiseTide 독립 백업 프로그램 v2.0")
     print("="*70)
     print("목적: 전체 프로젝트를 Google Drive에 백업")
@@ -422,8 +489,9 @@ def main():
     print(f"대상: Google Drive/{BACKUP_FOLDER_NAME}")
     print("="*70)
     
-    # 환경 검증
-    if not validate_environment():
+    # 환경 검증 (복원은 소스 디렉토리 불필요)
+    restoring = args.restore or args.restore_all is not None
+    if not restoring and not validate_environment():
         return False
     
     # 업로더 초기화 및 실행
@@ -436,8 +504,16 @@ def main():
             print("[ERROR] Google Drive 인증 실패")
             return False
         
-        # 2. 파일 개수 확인
-        total_files = uploader.count_total_files()
+        if args.restore:
+            print(f"\n[복원] 묶음에서 {len(args.restore)}개 파일 복원 → {args.dest}")
+            return uploader.restore_files(args.restore, args.dest)
+        
+        if args.restore_all is not None:
+            print(f"\n[복원] 해시 맵 기준 트리 복원 '{args.restore_all or '전체'}' → {args.dest}")
+            return uploader.restore_tree(args.restore_all, args.dest)
+        
+        # 2. 파일 목록 수집 (1회 탐색, 업로드 단계에서 재사용)
+        total_files = len(uploader.collect_all_files())
         print(f"\n[정보] 업로드 대상 파일: {total_files:,}개")
         
         if total_files == 0:
@@ -450,11 +526,11 @@ def main():
         print("[자동] 자동 모드로 업로드를 시작합니다...")
         
         # 4. 업로드 실행
-        print(f"\n[시작] 업로드 시작... (최대 {MAX_WORKERS}개 스레드 사용)")
+        print(f"\n[시작] 업로드 시작... (동시 업로드 {INITIAL_WORKERS}개로 시작, 최대 {MAX_WORKERS}개까지 자동 조절)")
         print("진행상황은 로그 파일에서도 확인할 수 있습니다.")
         
         start_time = time.time()
-        success = uploader.upload_all_files()
+        success = uploader.upload_all_files(bundle=args.bundle, dedup=args.dedup)
         end_time = time.time()
         
         # 5. 결과 출력
@@ -464,7 +540,8 @@ def main():
         print(f"\n[시간] 총 소요시간: {elapsed_time/60:.1f}분")
         
         if success and uploader.failed_files == 0:
-            print(f"\n[완료] 백업 완료! 모든 {uploader.uploaded_files:,}개 파일이 Google Drive에 업로드되었습니다.")
+            print(f"\n[완료] 백업 완료! 신규 {uploader.uploaded_files:,}개, 갱신 {uploader.updated_files:,}개 "
+                  f"(변경 없음 {uploader.unchanged_files:,}개)")
             print(f"[위치] 백업 위치: Google Drive > {BACKUP_FOLDER_NAME}")
         
         return success
@@ -479,8 +556,9 @@ def main():
         return False
 
 if __name__ == "__main__":
+    args = parse_args()
     print(__doc__)
-    success = main()
+    success = main(args)
     
     if success:
         print("\n" + "="*70)
@@ -5,9 +5,9 @@
 완전히 독립된 백업 도구 - 배포버전에 포함되지 않음
 
 기능:
-- drive_status_report.json에서 누락된 파일 목록 읽기
+- drive_status_report.jsonl(check_drive_status)에서 누락/변경 파일 목록 읽기 (상대경로)
 - 누락된 파일만 선택적으로 업로드
-- 기존 파일 덮어쓰기 기능
+- 기존 파일 덮어쓰기 기능 (원격 인덱스 조회 - 파일별 존재 확인 API 호출 없음)
 - 업로드 진행률 실시간 표시
 """
 
@@ -16,6 +16,7 @@ import sys
 import json
 import time
 from datetime import datetime
+from pathlib import Path
 import pickle
 
 # Windows 콘솔 UTF-8 인코딩 설정
@@ -33,6 +34,15 @@ except ImportError as e:
     print("설치 명령어: pip install google-api-python-client google-auth-oauthlib google-auth-httplib2")
     sys.exit(1)
 
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.drive_sync_engine import (
+    DriveSyncEngine, SyncItem, to_manifest_path, ACTION_NEW, ACTION_CHANGED, ACTION_FAILED
+)
+from support.drive_remote_index import DriveRemoteIndex
+from support.drive_diff import read_report, STATUS_MISSING, STATUS_CHANGED
+
 # Google Drive API 설정
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 SOURCE_DIR = r"C:\Claude_Works\Projects\GPT4wiseTide"
@@ -40,7 +50,7 @@ CREDENTIALS_FILE = r"C:\Claude_Works\Projects\GPT4wiseTide\Policy\Register_Key\c
 TOKEN_FILE = "Policy/Register_Key/token.pickle"
 BACKUP_FOLDER_ID = "1D9AvLY9th8cuKthD30KHjWmmq6P4aPO8"
 BACKUP_FOLDER_NAME = "(StokAutoTrade)wiseTide_Backup"
-STATUS_REPORT_FILE = "drive_status_report.json"
+STATUS_REPORT_FILE = "drive_status_report.jsonl"
 
 class IndividualFileUploader:
     def __init__(self):
@@ -50,8 +60,9 @@ class IndividualFileUploader:
         self.failed = 0
         self.skipped = 0
         self.overwritten = 0
-        self.missing_files = []
-        self.uploaded_files = {}
+        self.missing_files = []  # 상대경로 (누락 + 변경)
+        self.remote_index = None
+        self.engine = None
         
     def authenticate(self):
         """Google Drive API 인증"""
@@ -126,89 +137,71 @@ class IndividualFileUploader:
             return False
     
     def load_status_report(self):
-        """상태 리포트에서 누락된 파일 목록 로드"""
+        """상태 리포트에서 누락/변경 파일 목록 로드 (JSONL 순차 읽기)"""
         if not os.path.exists(STATUS_REPORT_FILE):
             print(f"[ERROR] 상태 리포트 없음: {STATUS_REPORT_FILE}")
             return False
             
         try:
-            with open(STATUS_REPORT_FILE, 'r', encoding='utf-8') as f:
-                report = json.load(f)
-            
-            self.missing_files = report.get('missing_files', [])
-            self.uploaded_files = report.get('uploaded_files', {})
+            missing = changed = 0
+            for record in read_report(STATUS_REPORT_FILE, (STATUS_MISSING, STATUS_CHANGED)):
+                self.missing_files.append(record['path'])
+                if record['status'] == STATUS_MISSING:
+                    missing += 1
+                else:
+                    changed += 1
             
-            print(f"[OK] 상태 리포트 로드: {len(self.missing_files)}개 누락 파일")
+            print(f"[OK] 상태 리포트 로드: 누락 {missing}개, 변경 {changed}개")
             return len(self.missing_files) > 0
             
         except Exception as e:
             print(f"[ERROR] 상태 리포트 로드 실패: {e}")
             return False
     
-    def check_file_exists(self, filename):
-        """Google Drive에 파일이 존재하는지 확인"""
+    def load_remote_index(self):
+        """백업 폴더 전체 원격 인덱스 준비 (캐시 + 변경분, 없으면 전체 목록 1회 조회)"""
         try:
-            query = f"name='{filename}' and parents in '{self.backup_folder_id}'"
-            results = self.service.files().list(q=query).execute()
-            items = results.get('files', [])
-            
-            if items:
-                return items[0]['id']  # 파일 ID 반환
-            return None
-            
+            self.remote_index = DriveRemoteIndex(self.service, self.backup_folder_id).load()
+            self.engine = DriveSyncEngine(self.service, self.backup_folder_id, SOURCE_DIR,
+                                          remote_index=self.remote_index)
+            print(f"[OK] 원격 인덱스: 파일 {len(self.remote_index.files)}개")
+            return True
         except Exception as e:
-            print(f"[WARNING] 파일 존재 확인 실패 {filename}: {e}")
-            return None
+            print(f"[ERROR] 원격 인덱스 조회 실패: {e}")
+            return False
+    
+    def check_file_exists(self, relative_path):
+        """Google Drive에 파일이 존재하는지 확인 (원격 인덱스 조회)"""
+        remote = self.remote_index.lookup(to_manifest_path(relative_path))
+        return remote.id if remote else None
     
     def upload_single_file(self, filename, file_path):
         """단일 파일 업로드 (덮어쓰기 지원)"""
         try:
             # 파일 크기 확인
-            file_size = os.path.getsize(file_path)
-            if file_size > 100 * 1024 * 1024:  # 100MB 제한
+            stat = os.stat(file_path)
+            if stat.st_size > 100 * 1024 * 1024:  # 100MB 제한
                 print(f"[SKIP] 파일이 너무 큽니다 (100MB 초과): {filename}")
                 self.skipped += 1
                 return True
             
-            # 기존 파일 확인
-            existing_file_id = self.check_file_exists(filename)
+            relative_path = os.path.relpath(file_path, SOURCE_DIR)
             
-            if existing_file_id:
-                # 기존 파일 덮어쓰기
-                try:
-                    media = MediaFileUpload(file_path, resumable=False)
-                    updated_file = self.service.files().update(
-                        fileId=existing_file_id,
-                        media_body=media
-                    ).execute()
-                    
-                    self.overwritten += 1
-                    print(f"[OVERWRITE] {filename}")
-                    return True
-                    
-                except Exception as e:
-                    print(f"[ERROR] 덮어쓰기 실패 {filename}: {e}")
-                    # 덮어쓰기 실패시 새 파일로 업로드 시도
-                    pass
-            
-            # 새 파일 업로드
-            file_metadata = {
-                'name': filename,
-                'parents': [self.backup_folder_id]
-            }
+            # 기존 파일이 있으면 덮어쓰기, 없으면 같은 폴더 구조로 새 업로드
+            existing_file_id = self.check_file_exists(relative_path)
+            item = SyncItem(file_path, to_manifest_path(relative_path), stat.st_size, stat.st_mtime_ns,
+                            ACTION_CHANGED if existing_file_id else ACTION_NEW, file_id=existing_file_id)
+            action = self.engine.sync_file(item)
             
-            media = MediaFileUpload(file_path, resumable=False)
-            result = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name'
-            ).execute()
-            
-            self.uploaded += 1
-            print(f"[NEW] {filename}")
-            
-            # API 제한 방지를 위한 짧은 대기
-            time.sleep(0.1)
+            if action == ACTION_CHANGED:
+                self.overwritten += 1
+                print(f"[OVERWRITE] {relative_path}")
+            elif action == ACTION_NEW:
+                self.uploaded += 1
+                print(f"[NEW] {relative_path}")
+            else:
+                self.failed += 1
+                return False
             
             return True
             
@@ -225,15 +218,9 @@ class IndividualFileUploader:
         start_time = time.time()
         
         for i, filename in enumerate(self.missing_files, 1):
-            # 로컬 파일 경로 찾기
-            file_found = False
-            for root, dirs, files in os.walk(SOURCE_DIR):
-                if filename in files:
-                    file_path = os.path.join(root, filename)
-                    file_found = True
-                    break
-            
-            if not file_found:
+            # 리포트 경로는 '/' 구분 상대경로
+            file_path = os.path.join(SOURCE_DIR, *filename.split('/'))
+            if not os.path.isfile(file_path):
                 print(f"[ERROR] 로컬 파일 없음: {filename}")
                 self.failed += 1
                 continue
@@ -255,6 +242,8 @@ class IndividualFileUploader:
             # 파일 업로드
             self.upload_single_file(filename, file_path)
         
+        self.engine.save()
+        self.remote_index.save()
         return True
     
     def print_summary(self):
@@ -317,11 +306,16 @@ def main():
             print("[INFO] 누락된 파일이 없거나 상태 리포트를 찾을 수 없습니다.")
             return False
         
-        # 4. 누락 파일 업로드
-        print("\n[4단계] 누락 파일 업로드 시작...")
+        # 4. 원격 인덱스 준비
+        print("\n[4단계] 원격 인덱스 준비...")
+        if not uploader.load_remote_index():
+            return False
+        
+        # 5. 누락 파일 업로드
+        print("\n[5단계] 누락 파일 업로드 시작...")
         success = uploader.upload_missing_files()
         
-        # 5. 결과 출력
+        # 6. 결과 출력
         uploader.print_summary()
         
         return success
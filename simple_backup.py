@@ -6,6 +6,7 @@
 
 목적: C:\\Claude_Works\\Projects\\GPT4wiseTide 폴더의 모든 파일을 
      Google Drive의 지정된 폴더에 백업
+     (증분 백업: 매니페스트 기준 신규/변경 파일만 업로드)
 """
 
 import os
@@ -31,6 +32,17 @@ except ImportError as e:
     print("설치 명령어: pip install google-api-python-client google-auth-oauthlib google-auth-httplib2")
     sys.exit(1)
 
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.drive_sync_engine import (
+    DriveSyncEngine, print_plan, print_progress,
+    ACTION_NEW, ACTION_CHANGED, ACTION_UNCHANGED, ACTION_SKIPPED, ACTION_FAILED
+)
+from support.drive_remote_index import DriveRemoteIndex
+from support.drive_upload_scheduler import AdaptiveUploadScheduler
+from support.file_walker import FileWalker
+
 # Google Drive API 설정
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 SOURCE_DIR = r"C:\Claude_Works\Projects\GPT4wiseTide"
@@ -44,8 +56,11 @@ BACKUP_FOLDER_NAME = "(StokAutoTrade)wiseTide_Backup"
 class SimpleBackup:
     def __init__(self):
         self.service = None
+        self.creds = None
         self.backup_folder_id = None
         self.uploaded = 0
+        self.updated = 0
+        self.unchanged = 0
         self.failed = 0
         self.skipped = 0
         self.total = 0
@@ -96,6 +111,7 @@ class SimpleBackup:
                 print(f"[WARNING] 토큰 저장 실패: {e}")
         
         try:
+            self.creds = creds
             self.service = build('drive', 'v3', credentials=creds)
             print("[OK] Google Drive API 초기화")
             return True
@@ -130,104 +146,62 @@ class SimpleBackup:
             print(f"[ERROR] 폴더 생성/찾기 실패: {e}")
             return False
     
-    def count_files(self):
-        """업로드할 파일 개수 계산"""
-        total = 0
-        try:
-            for root, dirs, files in os.walk(SOURCE_DIR):
-                # 숨김 폴더 제외
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
-                
-                for file in files:
-                    if not file.startswith('.') and not file.endswith(('.tmp', '.pyc')):
-                        total += 1
-                        
-            return total
-        except Exception as e:
-            print(f"[ERROR] 파일 개수 계산 실패: {e}")
-            return 0
+    def create_service(self):
+        """업로드 워커 스레드 전용 Drive 서비스 (httplib2는 스레드 간 공유 불가)"""
+        return build('drive', 'v3', credentials=self.creds, cache_discovery=False)
     
-    def upload_single_file(self, file_path, relative_path):
-        """단일 파일 업로드"""
-        try:
-            # 파일 크기 확인
-            file_size = os.path.getsize(file_path)
-            if file_size > 100 * 1024 * 1024:  # 100MB 제한
-                print(f"[SKIP] 파일이 너무 큽니다 (100MB 초과): {relative_path}")
-                self.skipped += 1
-                return True
-            
-            # 파일 메타데이터
-            file_metadata = {
-                'name': os.path.basename(relative_path),
-                'parents': [self.backup_folder_id]
-            }
-            
-            # 미디어 업로드 객체 생성 (간단한 방식)
-            media = MediaFileUpload(file_path, resumable=False)
-            
-            # 업로드 실행
-            result = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name'
-            ).execute()
-            
-            self.uploaded += 1
-            print(f"[OK] ({self.uploaded}/{self.total}) {relative_path}")
-            
-            # API 제한 방지를 위한 짧은 대기
-            time.sleep(0.1)
-            
-            return True
-            
-        except Exception as e:
-            print(f"[ERROR] 업로드 실패 {relative_path}: {e}")
-            self.failed += 1
-            return False
+    def collect_files(self):
+        """백업 대상 파일 목록 (공용 제외 규칙, 1회 탐색)"""
+        walker = FileWalker(SOURCE_DIR, progress=lambda w: print(f"[탐색] {w.files}개 파일..."))
+        return list(walker)
     
     def backup_all_files(self):
-        """모든 파일 백업"""
+        """신규/변경 파일 백업 (증분)"""
         print(f"[정보] 소스: {SOURCE_DIR}")
         print(f"[정보] 대상: Google Drive/{BACKUP_FOLDER_NAME}")
         
-        # 파일 개수 계산
-        self.total = self.count_files()
+        try:
+            files = self.collect_files()
+        except Exception as e:
+            print(f"[ERROR] 파일 목록 수집 실패: {e}")
+            return False
+        
+        self.total = len(files)
         print(f"[정보] 총 파일: {self.total}개")
         
         if self.total == 0:
             print("[ERROR] 백업할 파일이 없습니다")
             return False
         
+        remote_index = DriveRemoteIndex(self.service, self.backup_folder_id).load()
+        engine = DriveSyncEngine(self.service, self.backup_folder_id, SOURCE_DIR,
+                                 remote_index=remote_index, service_factory=self.create_service)
+        plan = engine.plan(files)
+        print_plan(plan)
+        self.unchanged = plan.counts[ACTION_UNCHANGED]
+        self.skipped = plan.counts[ACTION_SKIPPED]
+        pending = len(plan.pending)
+        
+        if pending == 0:
+            print("[OK] 변경된 파일 없음 - 백업이 최신 상태입니다")
+            return True
+        
         start_time = time.time()
         
+        def on_file_done(item, action):
+            if action == ACTION_NEW:
+                self.uploaded += 1
+                print(f"[NEW] {item.relative_path}")
+            elif action == ACTION_CHANGED:
+                self.updated += 1
+                print(f"[UPDATE] {item.relative_path}")
+            elif action == ACTION_FAILED:
+                self.failed += 1
+            print_progress(self.uploaded + self.updated + self.failed, pending, start_time)
+        
         try:
-            for root, dirs, files in os.walk(SOURCE_DIR):
-                # 숨김 폴더 제외
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
-                
-                for file in files:
-                    if file.startswith('.') or file.endswith(('.tmp', '.pyc')):
-                        continue
-                    
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, SOURCE_DIR)
-                    
-                    # 진행률 표시 (50개마다)
-                    processed = self.uploaded + self.failed + self.skipped
-                    if processed > 0 and processed % 50 == 0:
-                        elapsed = time.time() - start_time
-                        rate = processed / elapsed
-                        remaining = self.total - processed
-                        eta = remaining / rate if rate > 0 else 0
-                        progress = (processed / self.total) * 100
-                        print(f"[진행률] {processed}/{self.total} ({progress:.1f}%) - 예상 남은 시간: {eta/60:.1f}분")
-                    
-                    # 파일 업로드
-                    self.upload_single_file(file_path, relative_path)
-            
+            AdaptiveUploadScheduler(engine).run(plan.pending, progress=on_file_done)
             return True
-            
         except Exception as e:
             print(f"[ERROR] 백업 프로세스 실패: {e}")
             return False
@@ -238,12 +212,14 @@ class SimpleBackup:
         print("GPT4wiseTide 백업 완료 보고서")
         print("="*60)
         print(f"전체 파일: {self.total}개")
-        print(f"업로드 성공: {self.uploaded}개")
+        print(f"신규 업로드: {self.uploaded}개")
+        print(f"변경 갱신: {self.updated}개")
+        print(f"변경 없음: {self.unchanged}개")
         print(f"건너뜀: {self.skipped}개")
         print(f"실패: {self.failed}개")
         
         if self.total > 0:
-            success_rate = (self.uploaded / self.total) * 100
+            success_rate = ((self.uploaded + self.updated + self.unchanged) / self.total) * 100
             print(f"성공률: {success_rate:.1f}%")
         
         print(f"백업 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
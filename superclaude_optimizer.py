@@ -7,6 +7,8 @@ SuperClaude 통합 최적화 (GPT4wiseTide 특화)
 import os
 from typing import Dict, List, Tuple
 
+from support.prompt_encoder import estimate_tokens
+
 class SuperClaudeOptimizer:
     """GPT4wiseTide용 SuperClaude 최적화"""
     
@@ -15,9 +17,23 @@ class SuperClaudeOptimizer:
             'OK': '✓', 'FAIL': '✗', 'WARN': '⚠', 
             'INFO': 'ℹ', 'RUN': '▶', 'DONE': '■'
         }
+        # 실측 통계 (로컬 토큰 추정치)
+        self.calls = 0
+        self.optimized_calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
         
     def optimize_output(self, text: str) -> str:
-        """--uc 모드 출력 최적화"""
+        """--uc 모드 출력 최적화 (입출력 토큰 수 기록)"""
+        result = self._optimize(text)
+        self.calls += 1
+        self.input_tokens += estimate_tokens(text)
+        self.output_tokens += estimate_tokens(result)
+        if result != text:
+            self.optimized_calls += 1
+        return result
+    
+    def _optimize(self, text: str) -> str:
         if len(text) < 200: return text
         
         # 핵심 정보 추출
@@ -41,12 +57,14 @@ class SuperClaudeOptimizer:
         """.strip()
     
     def get_performance_stats(self) -> Dict:
-        """성능 통계"""
+        """성능 통계 (optimize_output 호출 실측치)"""
+        saved = self.input_tokens - self.output_tokens
         return {
-            'token_reduction': '35%',
-            'processing_speed': '+40%',
-            'memory_usage': '-25%',
-            'optimizations_applied': 8
+            'calls': self.calls,
+            'optimizations_applied': self.optimized_calls,
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'token_reduction': f"{saved / self.input_tokens:.0%}" if self.input_tokens else '0%'
         }
 
 # 전역 인스턴스
@@ -8,17 +8,79 @@ GPT4wiseTide 프로젝트의 모든 AI API 키는 오직 Register_Key.md에서
 - 하드코딩된 API 키 절대 금지
 - 환경변수나 별도 설정파일 사용 금지
 - AuthoritativeRegisterKeyLoader를 통해서만 접근
+
+**설정 변경 반영 (재시작 불필요):**
+- Register_Key.md mtime/크기 확인 (최대 CONFIG_CHECK_INTERVAL초마다) → 변경시 SHA-256 비교
+- 내용이 바뀐 경우에만 재파싱, 불변 스냅샷(AIConfigSnapshot)으로 원자적 교체
+- subscribe()로 등록한 엔진에 새 스냅샷 통지 (키 교체, 가중치 변경 등 세션 중 반영)
 """
 
+import os
 import re
+import time
+import hashlib
 import logging
-from typing import Dict, Optional, Any
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Optional, Any, Callable, List, Mapping
 from pathlib import Path
 
 from .authoritative_register_key_loader import AuthoritativeRegisterKeyLoader
+from .decision_fusion import FUSION_RULES, DEFAULT_RULE
 
 logger = logging.getLogger(__name__)
 
+CONFIG_CHECK_INTERVAL = 1.0  # Register_Key.md 변경 확인 최소 간격 (초)
+
+
+def _freeze(value: Any) -> Any:
+    """중첩 dict/list → 읽기 전용 MappingProxyType/tuple"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class AIConfigSnapshot:
+    """파싱 완료된 AI 설정 불변 스냅샷"""
+    version: int
+    config: Mapping[str, Mapping[str, Any]]
+    source_hash: Optional[str]
+    loaded_at: datetime
+
+
+class _Subscription:
+    """
+    설정 변경 구독 항목
+    
+    해제는 active 플래그만 바꾸고 목록 정리는 _reload가 잠금 안에서 수행
+    (해제가 GC 도중 어느 스레드에서 일어나도 _reload_lock을 잡지 않도록)
+    """
+    
+    __slots__ = ('callback', 'method', 'active')
+    
+    def __init__(self, callback: Callable[[AIConfigSnapshot], None], weak: bool):
+        self.callback = None if weak else callback
+        self.method = weakref.WeakMethod(callback) if weak else None
+        self.active = True
+    
+    def resolve(self) -> Optional[Callable[[AIConfigSnapshot], None]]:
+        """호출할 콜백 (해제되었거나 대상 객체가 수거되었으면 None)"""
+        if not self.active:
+            return None
+        if self.method is None:
+            return self.callback
+        callback = self.method()
+        if callback is None:
+            self.active = False
+        return callback
+
+
 class AIAPIManager:
     """AI API 키 및 설정 관리자 - Register_Key.md 전용"""
     
@@ -30,7 +92,15 @@ class AIAPIManager:
             project_root: 프로젝트 루트 경로 (None이면 자동 탐지)
         """
         self.key_loader = AuthoritativeRegisterKeyLoader(project_root)
-        self._ai_config_cache: Optional[Dict[str, Any]] = None
+        self.project_root = Path(project_root) if project_root else Path(__file__).parent.parent
+        self.register_key_path = self.project_root / "Policy" / "Register_Key" / "Register_Key.md"
+        
+        self._snapshot: Optional[AIConfigSnapshot] = None
+        self._ai_config_cache: Optional[Mapping[str, Any]] = None
+        self._source_stat = None  # (mtime_ns, size)
+        self._last_check = 0.0
+        self._reload_lock = threading.Lock()
+        self._subscribers: List[_Subscription] = []
         
         logger.info("AI API Manager 초기화 - Register_Key.md 전용")
     
@@ -56,7 +126,8 @@ class AIAPIManager:
                 'api_key': all_config.get('claude_api_key', ''),
                 'model': all_config.get('claude_model', 'claude-3.5-sonnet'),
                 'max_tokens': int(all_config.get('claude_max_tokens', '4000')),
-                'temperature': float(all_config.get('claude_temperature', '0.1'))
+                'temperature': float(all_config.get('claude_temperature', '0.1')),
+                'base_url': all_config.get('claude_base_url', 'https://api.anthropic.com').rstrip('/')
             }
             
             # Gemini 설정
@@ -64,7 +135,8 @@ class AIAPIManager:
                 'api_key': all_config.get('gemini_api_key', ''),
                 'model': all_config.get('gemini_model', 'gemini-1.5-pro'),
                 'max_tokens': int(all_config.get('gemini_max_tokens', '4000')),
-                'temperature': float(all_config.get('gemini_temperature', '0.1'))
+                'temperature': float(all_config.get('gemini_temperature', '0.1')),
+                'base_url': all_config.get('gemini_base_url', 'https://generativelanguage.googleapis.com').rstrip('/')
             }
             
             # 하이브리드 설정
@@ -72,23 +144,181 @@ class AIAPIManager:
                 'enabled': all_config.get('hybrid_mode_enabled', 'false').lower() == 'true',
                 'claude_weight': float(all_config.get('claude_weight', '0.6')),
                 'gemini_weight': float(all_config.get('gemini_weight', '0.4')),
+                'fusion_rule': all_config.get('fusion_rule', 'conservative').strip().lower(),
+                'fusion_vote_threshold': float(all_config.get('fusion_vote_threshold', '0.35')),
                 'timeout_seconds': int(all_config.get('api_timeout', '10')),
-                'max_retries': int(all_config.get('max_retries', '3'))
+                'max_retries': int(all_config.get('max_retries', '3')),
+                'parse_retries': int(all_config.get('parse_retries', '0')),
+                'connection_pool_size': int(all_config.get('connection_pool_size', '20')),
+                'connection_keepalive_seconds': float(all_config.get('connection_keepalive', '60')),
+                'warmup_probe': all_config.get('warmup_probe', 'false').lower() == 'true',
+                'warmup_lead_seconds': float(all_config.get('warmup_lead_seconds', '120')),
+                'decision_budget_seconds': float(all_config.get('decision_budget', '8')),
+                'partial_confidence_factor': float(all_config.get('partial_confidence_factor', '0.5')),
+                'streaming_enabled': all_config.get('streaming_mode', 'false').lower() == 'true',
+                'prompt_mode': all_config.get('prompt_mode', 'compact').strip().lower(),
+                'max_prompt_tokens': int(all_config.get('max_prompt_tokens', '1200')),
+                'breaker_window': int(all_config.get('breaker_window', '20')),
+                'breaker_min_calls': int(all_config.get('breaker_min_calls', '5')),
+                'breaker_error_rate': float(all_config.get('breaker_error_rate', '0.5')),
+                'breaker_slow_call_seconds': float(all_config.get('breaker_slow_call_seconds', '5')),
+                'breaker_slow_rate': float(all_config.get('breaker_slow_rate', '0.8')),
+                'breaker_open_seconds': float(all_config.get('breaker_open_seconds', '60')),
+                'gate_uncertain_low': float(all_config.get('gate_uncertain_low', '0.45')),
+                'gate_uncertain_high': float(all_config.get('gate_uncertain_high', '0.75')),
+                'gate_cycle_token_budget': int(all_config.get('gate_cycle_token_budget', '20000')),
+                'gate_daily_token_budget': int(all_config.get('gate_daily_token_budget', '500000')),
+                'gate_cycle_time_budget': float(all_config.get('gate_cycle_time_budget', '60')),
+                'gate_daily_time_budget': float(all_config.get('gate_daily_time_budget', '3600')),
+                'decision_workers': int(all_config.get('decision_workers', '2')),
+                'worker_concurrency': int(all_config.get('worker_concurrency', '4')),
+                'worker_deadline_seconds': float(all_config.get('worker_deadline', '10')),
+                'prefetch_enabled': all_config.get('prefetch_mode', 'false').lower() == 'true',
+                'prefetch_top_n': int(all_config.get('prefetch_top_n', '5')),
+                'prefetch_concurrency': int(all_config.get('prefetch_concurrency', '4')),
+                'prefetch_price_tolerance_pct': float(all_config.get('prefetch_price_tolerance', '0.5')),
+                'prefetch_max_age_seconds': float(all_config.get('prefetch_max_age', '240')),
+                'prefetch_safety_margin_seconds': float(all_config.get('prefetch_safety_margin', '10'))
             }
             
-            self._ai_config_cache = ai_config
+            # 융합 규칙 오타는 모든 결정을 안전 모드 HOLD로 만들므로 로드 시점에 기본 규칙으로 대체
+            fusion_rule = ai_config['hybrid']['fusion_rule']
+            if fusion_rule not in FUSION_RULES:
+                logger.warning(f"알 수 없는 fusion_rule '{fusion_rule}' (허용: {', '.join(FUSION_RULES)}) "
+                               f"- {DEFAULT_RULE} 규칙 사용")
+                ai_config['hybrid']['fusion_rule'] = DEFAULT_RULE
+            
             return ai_config
             
         except Exception as e:
             logger.error(f"AI 설정 로드 실패: {e}")
             raise RuntimeError(f"Register_Key.md에서 AI 설정을 읽을 수 없습니다: {e}")
     
-    def get_openai_config(self) -> Dict[str, Any]:
+    def _read_source_hash(self) -> Optional[str]:
+        """Register_Key.md 내용 SHA-256 (파일 없으면 None)"""
+        try:
+            return hashlib.sha256(self.register_key_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+    
+    def _stat_source(self):
+        try:
+            stat = self.register_key_path.stat()
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    
+    def _reload(self, force: bool = False) -> bool:
+        """
+        설정 재파싱 및 스냅샷 교체 (내용 해시가 같으면 생략)
+        
+        Returns:
+            새 스냅샷으로 교체되었으면 True
+        """
+        with self._reload_lock:
+            source_stat = self._stat_source()
+            source_hash = self._read_source_hash()
+            previous = self._snapshot
+            
+            if not force and previous is not None and source_hash == previous.source_hash:
+                self._source_stat = source_stat
+                return False
+            
+            try:
+                ai_config = self._load_ai_config()
+            except RuntimeError:
+                if previous is None:
+                    raise
+                # 편집 중인 파일 등 파싱 실패시 기존 스냅샷 유지 (다음 변경시 재시도)
+                logger.warning("변경된 Register_Key.md 파싱 실패 - 기존 AI 설정 유지")
+                self._source_stat = source_stat
+                return False
+            
+            snapshot = AIConfigSnapshot(
+                version=previous.version + 1 if previous else 1,
+                config=_freeze(ai_config),
+                source_hash=source_hash,
+                loaded_at=datetime.now()
+            )
+            self._snapshot = snapshot
+            self._ai_config_cache = snapshot.config
+            self._source_stat = source_stat
+            self._prune_subscribers()
+            subscribers = list(self._subscribers)
+        
+        if previous is not None:
+            logger.info(f"AI 설정 변경 감지 - 스냅샷 v{snapshot.version} 적용")
+            for subscription in subscribers:
+                callback = subscription.resolve()  # 통지 중 해제/수거된 구독은 건너뜀
+                if callback is None:
+                    continue
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    logger.error(f"AI 설정 변경 통지 실패 ({callback}): {e}")
+        return True
+    
+    def check_for_updates(self) -> bool:
+        """
+        Register_Key.md 변경 확인 (CONFIG_CHECK_INTERVAL 이내 재호출시 확인 생략)
+        
+        Returns:
+            새 설정이 적용되었으면 True
+        """
+        if self._snapshot is None:
+            return self._reload()
+        
+        now = time.monotonic()
+        if now - self._last_check < CONFIG_CHECK_INTERVAL:
+            return False
+        self._last_check = now
+        
+        if self._stat_source() == self._source_stat:
+            return False
+        return self._reload()
+    
+    def _current_config(self) -> Mapping[str, Any]:
+        """현재 설정 스냅샷 (변경 확인 포함)"""
+        self.check_for_updates()
+        return self._snapshot.config
+    
+    def get_snapshot(self) -> AIConfigSnapshot:
+        """현재 AI 설정 불변 스냅샷"""
+        self.check_for_updates()
+        return self._snapshot
+    
+    def _prune_subscribers(self):
+        """해제되었거나 대상이 수거된 구독 제거 (_reload_lock 안에서 호출)"""
+        self._subscribers = [s for s in self._subscribers if s.resolve() is not None]
+    
+    def subscribe(self, callback: Callable[[AIConfigSnapshot], None], weak: bool = False) -> Callable[[], None]:
+        """
+        설정 변경 통지 등록
+        
+        Args:
+            callback: 새 스냅샷을 인자로 호출됨 (변경을 감지한 스레드에서 실행)
+            weak: 바운드 메서드를 약한 참조로 등록 (객체가 수거되면 통지 대상에서 제외,
+                  close() 없이 버려진 엔진이 구독 목록에 붙잡혀 남지 않도록)
+            
+        Returns:
+            등록 해제 함수 (잠금 없이 즉시 반환, 어느 스레드에서 호출해도 안전)
+        """
+        subscription = _Subscription(callback, weak)
+        
+        def unsubscribe():
+            subscription.active = False
+        
+        with self._reload_lock:
+            self._prune_subscribers()
+            self._subscribers.append(subscription)
+        
+        return unsubscribe
+    
+    def get_openai_config(self) -> Mapping[str, Any]:
         """OpenAI API 설정 반환"""
-        if not self._ai_config_cache:
-            self._load_ai_config()
+        config_map = self._current_config()
         
-        config = self._ai_config_cache['openai']
+        config = config_map['openai']
         if not config['api_key']:
             raise ValueError(
                 "OpenAI API 키가 설정되지 않았습니다.\n"
@@ -96,12 +326,11 @@ class AIAPIManager:
             )
         return config
     
-    def get_claude_config(self) -> Dict[str, Any]:
+    def get_claude_config(self) -> Mapping[str, Any]:
         """Claude API 설정 반환"""
-        if not self._ai_config_cache:
-            self._load_ai_config()
+        config_map = self._current_config()
         
-        config = self._ai_config_cache['claude']
+        config = config_map['claude']
         if not config['api_key']:
             raise ValueError(
                 "Claude API 키가 설정되지 않았습니다.\n"
@@ -109,12 +338,11 @@ class AIAPIManager:
             )
         return config
     
-    def get_gemini_config(self) -> Dict[str, Any]:
+    def get_gemini_config(self) -> Mapping[str, Any]:
         """Gemini API 설정 반환"""
-        if not self._ai_config_cache:
-            self._load_ai_config()
+        config_map = self._current_config()
         
-        config = self._ai_config_cache['gemini']
+        config = config_map['gemini']
         if not config['api_key']:
             raise ValueError(
                 "Gemini API 키가 설정되지 않았습니다.\n"
@@ -122,12 +350,24 @@ class AIAPIManager:
             )
         return config
     
-    def get_hybrid_config(self) -> Dict[str, Any]:
+    def get_hybrid_config(self) -> Mapping[str, Any]:
         """하이브리드 모드 설정 반환"""
-        if not self._ai_config_cache:
-            self._load_ai_config()
+        config_map = self._current_config()
+        
+        return config_map['hybrid']
+    
+    def get_api_base_url(self, provider: str) -> str:
+        """
+        AI API 기본 URL 반환 (API 키 검증 없음)
+        
+        Register_Key.md에서 로컬 모의 서버(ai_mock_server.py)를 지정할 수 있음
         
-        return self._ai_config_cache['hybrid']
+        Args:
+            provider: 'claude' 또는 'gemini'
+        """
+        config_map = self._current_config()
+        
+        return config_map[provider]['base_url']
     
     def is_hybrid_mode_enabled(self) -> bool:
         """하이브리드 모드 활성화 여부 확인"""
@@ -183,24 +423,41 @@ class AIAPIManager:
         return availability
     
     def refresh_cache(self):
-        """설정 캐시 새로고침"""
-        self._ai_config_cache = None
+        """설정 강제 재로드 (변경 여부와 무관하게 재파싱, 구독자 통지)"""
+        self._reload(force=True)
         logger.info("AI 설정 캐시 새로고침 완료")
 
 
-# 전역 인스턴스 (싱글톤 패턴)
+# 전역 인스턴스 (프로세스별 싱글톤 - 스레드 간 공유, 설정 스냅샷은 읽기 전용)
 _ai_api_manager_instance: Optional[AIAPIManager] = None
+_ai_api_manager_pid: Optional[int] = None
+_ai_api_manager_lock = threading.Lock()
 
 def get_ai_api_manager(project_root: Path = None) -> AIAPIManager:
-    """AI API Manager 싱글톤 인스턴스 반환"""
-    global _ai_api_manager_instance
+    """AI API Manager 싱글톤 인스턴스 반환 (스레드 안전, fork된 자식 프로세스는 새 인스턴스)"""
+    global _ai_api_manager_instance, _ai_api_manager_pid
     
-    if _ai_api_manager_instance is None:
-        _ai_api_manager_instance = AIAPIManager(project_root)
+    pid = os.getpid()
+    instance = _ai_api_manager_instance
+    if instance is not None and _ai_api_manager_pid == pid:
+        return instance
     
-    return _ai_api_manager_instance
+    with _ai_api_manager_lock:
+        if _ai_api_manager_instance is None or _ai_api_manager_pid != pid:
+            _ai_api_manager_instance = AIAPIManager(project_root)
+            _ai_api_manager_pid = pid
+        return _ai_api_manager_instance
+
+def _reset_lock_after_fork():
+    global _ai_api_manager_lock
+    _ai_api_manager_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):  # Windows에는 없음 (fork 없음)
+    os.register_at_fork(after_in_child=_reset_lock_after_fork)
 
 def reset_ai_api_manager():
     """AI API Manager 인스턴스 리셋 (테스트용)"""
-    global _ai_api_manager_instance
-    _ai_api_manager_instance = None
\ No newline at end of file
+    global _ai_api_manager_instance, _ai_api_manager_pid
+    with _ai_api_manager_lock:
+        _ai_api_manager_instance = None
+        _ai_api_manager_pid = None
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+AI 결정 게이팅 계층 (비용/지연 예산 관리)
+- 1차: 규칙 기반 분석 (NewDayTradingAlgorithm._analyze_surge_stock_realtime)
+- 2차: 규칙 신뢰도가 "불확실" 구간에 있는 종목만 하이브리드 엔진 호출
+- 사이클/일 단위 토큰 및 AI 소요시간 예산 초과시 규칙 결과 유지
+- 계층별 처리 건수 보고
+- 사이클 사이 유휴 구간에 다음 사이클 AI 결정 선계산 (SpeculativePrefetcher, prefetch_mode=true)
+
+**계층 구분:**
+- rule: 규칙 신뢰도가 불확실 구간 밖 → 규칙 결과로 확정
+- ai: 불확실 구간 → 하이브리드 엔진 결정 사용
+- budget: 불확실 구간이지만 예산 소진 또는 결정 예산 내 AI 분석 없음 → 규칙 결과 유지
+- error: AI 호출 실패 (안전 모드 HOLD) → 규칙 결과 유지
+
+사용 예 (매매 사이클의 이벤트 루프 안에서, 엔진은 engine_registry의 루프 전용 엔진):
+    gate = AIDecisionGate(algorithm)            # algorithm: NewDayTradingAlgorithm
+    gate.begin_cycle()
+    for stock_code, stock_data in candidates.items():
+        signal = await gate.resolve(stock_code, stock_data)   # signal['tier']: rule/ai/budget/error
+        ...
+    gate.log_cycle_summary()
+    await gate.prefetch_next_cycle(held_codes, ranked_surges, latest_data, idle_seconds)
+"""
+
+import time
+import logging
+from datetime import datetime, date
+from typing import Dict, Any, Iterable, Optional
+
+from .gpt_interfaces import MarketContext
+from .clean_console_logger import clean_log
+from .speculative_prefetcher import SpeculativePrefetcher
+
+logger = logging.getLogger(__name__)
+
+TIERS = ('rule', 'ai', 'budget', 'error')
+
+
+class _BudgetWindow:
+    """사이클 또는 일 단위 예산 사용량"""
+
+    def __init__(self, token_budget: int, time_budget: float):
+        self.token_budget = token_budget
+        self.time_budget = time_budget
+        self.token_start = 0
+        self.ai_seconds = 0.0
+        self.tiers = {tier: 0 for tier in TIERS}
+
+    def reset(self, token_total: int):
+        self.token_start = token_total
+        self.ai_seconds = 0.0
+        self.tiers = {tier: 0 for tier in TIERS}
+
+    def tokens_used(self, token_total: int) -> int:
+        return token_total - self.token_start
+
+    def has_room(self, token_total: int, expected_tokens: float, expected_seconds: float) -> bool:
+        if self.tokens_used(token_total) + expected_tokens > self.token_budget:
+            return False
+        if self.ai_seconds + expected_seconds > self.time_budget:
+            return False
+        return True
+
+    def report(self, token_total: int) -> Dict[str, Any]:
+        return {
+            "tiers": dict(self.tiers),
+            "tokens_used": self.tokens_used(token_total),
+            "token_budget": self.token_budget,
+            "ai_seconds": round(self.ai_seconds, 3),
+            "time_budget": self.time_budget
+        }
+
+
+class AIDecisionGate:
+    """규칙 → AI 2단계 게이팅"""
+
+    def __init__(self, algorithm, engine=None, hybrid_config: Optional[Dict[str, Any]] = None):
+        """
+        초기화
+
+        Args:
+            algorithm: NewDayTradingAlgorithm 인스턴스 (규칙 기반 1차 분석)
+            engine: ClaudeGeminiHybridEngine 인스턴스 (None이면 현재 이벤트 루프 전용 엔진)
+            hybrid_config: 하이브리드 설정 (None이면 엔진 설정 사용)
+        """
+        if engine is None:
+            from .engine_registry import get_hybrid_engine
+            engine = get_hybrid_engine()
+        self.algorithm = algorithm
+        self.engine = engine
+        config = hybrid_config or engine.hybrid_config
+
+        self.uncertain_low = config['gate_uncertain_low']
+        self.uncertain_high = config['gate_uncertain_high']
+
+        self.cycle = _BudgetWindow(config['gate_cycle_token_budget'], config['gate_cycle_time_budget'])
+        self.day = _BudgetWindow(config['gate_daily_token_budget'], config['gate_daily_time_budget'])
+        self.cycle_number = 0
+        self.current_day: Optional[date] = None
+
+        # 결정당 평균 비용 (예산 사전 판정용)
+        self.ai_decisions = 0
+        self.ai_tokens_total = 0
+        self.ai_seconds_total = 0.0
+
+        self.prefetcher = SpeculativePrefetcher(engine)
+
+        self.begin_cycle()
+
+    def begin_cycle(self):
+        """새 매매 사이클 시작 (사이클 예산 초기화, 일자 변경시 일 예산 초기화)"""
+        token_total = self.engine.metrics.total_tokens()
+        today = date.today()
+        if self.current_day != today:
+            self.day.reset(token_total)
+            self.current_day = today
+        self.cycle.reset(token_total)
+        self.cycle_number += 1
+
+    def is_uncertain(self, confidence: float) -> bool:
+        """규칙 신뢰도가 불확실 구간인지 확인"""
+        return self.uncertain_low <= confidence < self.uncertain_high
+
+    def _expected_cost(self):
+        if self.ai_decisions == 0:
+            return 0.0, 0.0
+        return self.ai_tokens_total / self.ai_decisions, self.ai_seconds_total / self.ai_decisions
+
+    async def resolve(self, stock_code: str, stock_data: Dict[str, Any],
+                      rule_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        종목 매매 신호 결정
+
+        Args:
+            stock_code: 종목코드
+            stock_data: 실시간 종목 데이터 dict
+            rule_result: 이미 계산된 규칙 분석 결과 (None이면 계산)
+
+        Returns:
+            알고리즘 신호 형식 dict + 'tier' 키
+        """
+        if rule_result is None:
+            rule_result = self.algorithm._analyze_surge_stock_realtime(stock_data, stock_code)
+
+        confidence = float(rule_result.get('confidence', 0.0))
+        if not self.is_uncertain(confidence):
+            return self._finish(rule_result, 'rule')
+
+        token_total = self.engine.metrics.total_tokens()
+        expected_tokens, expected_seconds = self._expected_cost()
+        if not (self.cycle.has_room(token_total, expected_tokens, expected_seconds)
+                and self.day.has_room(token_total, expected_tokens, expected_seconds)):
+            logger.info(f"AI 게이트 예산 소진: {stock_code} 규칙 결과 유지 (신뢰도 {confidence:.2f})")
+            return self._finish(rule_result, 'budget')
+
+        started = time.perf_counter()
+        failure = None  # (계층, 사유)
+        try:
+            decision = await self.engine.make_decision(self._build_context(stock_code, stock_data, rule_result))
+        except Exception as e:
+            decision, failure = None, ('error', str(e))
+        elapsed = time.perf_counter() - started
+        tokens = self.engine.metrics.total_tokens() - token_total
+
+        self.cycle.ai_seconds += elapsed
+        self.day.ai_seconds += elapsed
+        self.ai_decisions += 1
+        self.ai_tokens_total += max(0, tokens)
+        self.ai_seconds_total += elapsed
+
+        # 안전 모드 HOLD(신뢰도 0)는 AI 판단이 아니므로 규칙 결과로 대체
+        if decision is not None and self.engine.is_safe_decision(decision):
+            metadata = decision.metadata or {}
+            failure = ('budget' if metadata.get('safe_reason') == 'deadline' else 'error', metadata.get('error', ''))
+        if failure is not None:
+            tier, error = failure
+            logger.warning(f"AI 게이트 {tier}: {stock_code} 규칙 결과 유지 (신뢰도 {confidence:.2f}) - {error}")
+            fallback = dict(rule_result)
+            fallback['details'] = {**rule_result.get('details', {}), 'ai_error': error, 'ai_seconds': elapsed}
+            return self._finish(fallback, tier)
+
+        return self._finish({
+            'signal': decision.decision,
+            'confidence': decision.confidence,
+            'reason': f"AI 게이트 결정 (규칙 신뢰도 {confidence:.2f}): {decision.reasoning[:200]}",
+            'details': {
+                'rule_signal': rule_result.get('signal'),
+                'rule_confidence': confidence,
+                'ai_metadata': decision.metadata,
+                'ai_seconds': elapsed
+            }
+        }, 'ai')
+
+    async def prefetch_next_cycle(self, held_positions: Iterable[str], ranked_surges: Iterable[Any],
+                                  stock_data_by_code: Dict[str, Dict[str, Any]],
+                                  idle_seconds: float) -> Dict[str, Any]:
+        """
+        다음 사이클 AI 결정 선계산 (엔진 결정 캐시에 저장, 다음 resolve()의 make_decision에서 사용)
+
+        Args:
+            held_positions: 보유 종목코드
+            ranked_surges: 급등 순위 목록 (종목코드 또는 'symbol'/'stock_code' 키를 가진 dict)
+            stock_data_by_code: 종목코드 → 최신 실시간 종목 데이터
+            idle_seconds: 다음 사이클 시작까지 남은 시간
+
+        Returns:
+            선계산 결과 요약 (SpeculativePrefetcher.run_idle_gap)
+        """
+        def build_context(stock_code: str) -> Optional[MarketContext]:
+            stock_data = stock_data_by_code.get(stock_code)
+            if stock_data is None:
+                return None
+            rule_result = self.algorithm._analyze_surge_stock_realtime(stock_data, stock_code)
+            # 규칙 결과로 확정될 종목은 AI를 호출하지 않으므로 선계산하지 않음
+            if not self.is_uncertain(float(rule_result.get('confidence', 0.0))):
+                return None
+            return self._build_context(stock_code, stock_data, rule_result)
+
+        return await self.prefetcher.run_idle_gap(held_positions, ranked_surges, build_context, idle_seconds)
+
+    def _finish(self, result: Dict[str, Any], tier: str) -> Dict[str, Any]:
+        self.cycle.tiers[tier] += 1
+        self.day.tiers[tier] += 1
+        result = dict(result)
+        result['tier'] = tier
+        return result
+
+    @staticmethod
+    def _build_context(stock_code: str, stock_data: Dict[str, Any], rule_result: Dict[str, Any]) -> MarketContext:
+        """실시간 종목 데이터로 MarketContext 생성"""
+        current_price = float(stock_data.get('current_price', 0))
+        open_price = float(stock_data.get('open_price', 0)) or current_price
+        high_price = float(stock_data.get('high_price', current_price))
+        details = rule_result.get('details', {})
+
+        return MarketContext(
+            symbol=stock_code,
+            current_price=current_price,
+            price_change_pct=float(stock_data.get('change_rate', 0)),
+            volume=int(stock_data.get('volume', 0)),
+            technical_indicators={
+                "intraday_return": (current_price - open_price) / open_price * 100 if open_price else 0.0,
+                "price_to_high": current_price / high_price if high_price else 1.0,
+                "rule_confidence": float(rule_result.get('confidence', 0.0)),
+                "conditions_met": float(details.get('conditions_met', 0))
+            },
+            news_sentiment={"positive": 0.0, "neutral": 1.0, "negative": 0.0},
+            market_conditions={"rule_signal": rule_result.get('signal'), "rule_reason": rule_result.get('reason', '')},
+            risk_factors=[],
+            timestamp=datetime.now()
+        )
+
+    def get_report(self) -> Dict[str, Any]:
+        """계층별 처리 건수 및 예산 사용량"""
+        token_total = self.engine.metrics.total_tokens()
+        avg_tokens, avg_seconds = self._expected_cost()
+        return {
+            "cycle_number": self.cycle_number,
+            "uncertain_band": [self.uncertain_low, self.uncertain_high],
+            "cycle": self.cycle.report(token_total),
+            "day": self.day.report(token_total),
+            "avg_tokens_per_ai_decision": avg_tokens,
+            "avg_seconds_per_ai_decision": avg_seconds
+        }
+
+    def log_cycle_summary(self):
+        """사이클 처리 결과 로그"""
+        tiers = self.cycle.tiers
+        clean_log(
+            f"[AI_GATE] 사이클 {self.cycle_number}: 규칙 {tiers['rule']} / AI {tiers['ai']} / "
+            f"예산초과 {tiers['budget']} / AI 오류 {tiers['error']}",
+            "INFO"
+        )
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+하이브리드 엔진 제공자별 지연/비용 계측
+- 호출 지연 히스토그램 (p50/p95/p99 + 고정 버킷)
+- 시도/타임아웃/오류/취소 횟수
+- 프롬프트/응답 토큰 수 (제공자 보고치) 및 프롬프트 크기 (로컬 추정치)
+- 응답 JSON 파싱 결과 (정상/보정/실패)
+- 결정 캐시 적중률
+"""
+
+import json
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+LATENCY_SAMPLE_SIZE = 2048
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0)  # 초
+
+
+def _percentile(sorted_samples, q: float) -> Optional[float]:
+    if not sorted_samples:
+        return None
+    index = min(len(sorted_samples) - 1, int(round(q * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+class ProviderMetrics:
+    """단일 AI 제공자 계측치"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.cancelled = 0
+        self.attempts = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.response_tokens = 0
+        self.prompts = 0
+        self.prompt_estimated_tokens = 0
+        self.prompt_chars = 0
+        self.prompt_max_tokens = 0
+        self.parse_outcomes = {'clean': 0, 'repaired': 0, 'failed': 0}
+        self.latency_samples: deque = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe_latency(self, seconds: float):
+        self.latency_samples.append(seconds)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.latency_buckets[i] += 1
+                return
+        self.latency_buckets[-1] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        samples = sorted(self.latency_samples)
+        finished = self.successes + self.failures
+        bucket_labels = [f"<={b}s" for b in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "cancelled": self.cancelled,
+            "attempts": self.attempts,
+            "attempts_per_call": self.attempts / self.calls if self.calls else 0.0,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "timeout_rate": self.timeouts / self.attempts if self.attempts else 0.0,
+            "error_rate": self.failures / finished if finished else 0.0,
+            "prompt_tokens": self.prompt_tokens,
+            "response_tokens": self.response_tokens,
+            "parse": dict(self.parse_outcomes),
+            "prompt": {
+                "count": self.prompts,
+                "avg_estimated_tokens": self.prompt_estimated_tokens / self.prompts if self.prompts else 0.0,
+                "max_estimated_tokens": self.prompt_max_tokens,
+                "avg_chars": self.prompt_chars / self.prompts if self.prompts else 0.0
+            },
+            "latency": {
+                "samples": len(samples),
+                "p50": _percentile(samples, 0.50),
+                "p95": _percentile(samples, 0.95),
+                "p99": _percentile(samples, 0.99),
+                "max": samples[-1] if samples else None,
+                "histogram": dict(zip(bucket_labels, self.latency_buckets))
+            }
+        }
+
+
+class HybridEngineMetrics:
+    """하이브리드 엔진 전체 계측 (스레드 안전)"""
+
+    def __init__(self, providers=('claude', 'gemini')):
+        self._lock = threading.Lock()
+        self.providers: Dict[str, ProviderMetrics] = {p: ProviderMetrics(p) for p in providers}
+        self.decision_latency = ProviderMetrics('decision')
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.started_at = datetime.now()
+
+    def record_attempt(self, provider: str):
+        with self._lock:
+            self.providers[provider].attempts += 1
+
+    def record_timeout(self, provider: str):
+        with self._lock:
+            self.providers[provider].timeouts += 1
+
+    def record_error(self, provider: str):
+        with self._lock:
+            self.providers[provider].errors += 1
+
+    def record_tokens(self, provider: str, prompt_tokens: int = 0, response_tokens: int = 0):
+        with self._lock:
+            metrics = self.providers[provider]
+            metrics.prompt_tokens += int(prompt_tokens or 0)
+            metrics.response_tokens += int(response_tokens or 0)
+
+    def record_prompt(self, provider: str, estimated_tokens: int, chars: int):
+        """전송 프롬프트 크기 기록 (로컬 토큰 추정치)"""
+        with self._lock:
+            metrics = self.providers[provider]
+            metrics.prompts += 1
+            metrics.prompt_estimated_tokens += estimated_tokens
+            metrics.prompt_chars += chars
+            metrics.prompt_max_tokens = max(metrics.prompt_max_tokens, estimated_tokens)
+
+    def record_parse(self, provider: str, outcome: str):
+        """응답 JSON 파싱 결과 기록 ('clean' / 'repaired' / 'failed')"""
+        with self._lock:
+            self.providers[provider].parse_outcomes[outcome] += 1
+
+    def record_call(self, provider: str, seconds: float, outcome: str):
+        """
+        제공자 호출 1건 기록
+
+        Args:
+            provider: 'claude' / 'gemini'
+            seconds: 재시도 포함 호출 소요 시간
+            outcome: 'success' / 'failure' / 'cancelled'
+        """
+        with self._lock:
+            metrics = self.providers[provider]
+            metrics.calls += 1
+            if outcome == 'success':
+                metrics.successes += 1
+                metrics.observe_latency(seconds)
+            elif outcome == 'cancelled':
+                metrics.cancelled += 1
+            else:
+                metrics.failures += 1
+                metrics.observe_latency(seconds)
+
+    def record_decision(self, seconds: float, success: bool = True):
+        with self._lock:
+            self.decision_latency.calls += 1
+            if success:
+                self.decision_latency.successes += 1
+            else:
+                self.decision_latency.failures += 1
+            self.decision_latency.observe_latency(seconds)
+
+    def record_cache(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def total_tokens(self) -> int:
+        """전체 제공자 누적 토큰 (프롬프트 + 응답)"""
+        with self._lock:
+            return sum(m.prompt_tokens + m.response_tokens for m in self.providers.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 계측치 스냅샷"""
+        with self._lock:
+            lookups = self.cache_hits + self.cache_misses
+            return {
+                "timestamp": datetime.now().isoformat(),
+                "since": self.started_at.isoformat(),
+                "providers": {name: m.snapshot() for name, m in self.providers.items()},
+                "decisions": self.decision_latency.snapshot(),
+                "cache": {
+                    "hits": self.cache_hits,
+                    "misses": self.cache_misses,
+                    "hit_rate": self.cache_hits / lookups if lookups else 0.0
+                }
+            }
+
+    def export(self, path: Path) -> Path:
+        """스냅샷을 JSON 파일로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2, ensure_ascii=False)
+        return path
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+AI 모델 응답 JSON 추출/검증
+- 마크다운 펜스, 앞뒤 설명문이 섞인 응답에서 첫 번째 유효 JSON 객체를 한 번의 선형 스캔으로 추출
+- 후행 쉼표 등 흔한 형식 오류 보정
+- 매매 결정 스키마 검증 (decision / confidence 필수)
+- 정상 / 보정 / 실패 건수는 호출측(HybridEngineMetrics)에서 집계
+"""
+
+import json
+import re
+from typing import Dict, Any, Tuple, Iterator
+
+VALID_DECISIONS = ("BUY", "SELL", "HOLD")
+SCORE_FIELDS = ("fundamental_score", "technical_score")
+
+_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+
+PARSE_CLEAN = "clean"
+PARSE_REPAIRED = "repaired"
+PARSE_FAILED = "failed"
+
+
+class AIResponseParseError(ValueError):
+    """모델 응답에서 유효한 결정 JSON을 찾지 못함"""
+
+
+def _object_spans(text: str) -> Iterator[Tuple[int, int]]:
+    """균형 잡힌 최상위 {...} 구간을 순서대로 산출 (문자열 내부 괄호 무시)"""
+    depth = 0
+    start = -1
+    in_string = False
+    escape = False
+
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            if depth > 0:
+                in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield start, i + 1
+
+
+def iter_json_objects(text: str) -> Iterator[Tuple[Dict[str, Any], bool]]:
+    """
+    텍스트 내 유효 JSON 객체를 등장 순서대로 산출
+
+    Yields:
+        (객체, 보정 여부) - 텍스트 전체가 그대로 JSON이면 보정 여부 False
+    """
+    stripped = text.strip()
+    try:
+        value = json.loads(stripped)
+        if isinstance(value, dict):
+            yield value, False
+            return
+    except json.JSONDecodeError:
+        pass
+
+    for start, end in _object_spans(stripped):
+        candidate = stripped[start:end]
+        for attempt in (candidate, _TRAILING_COMMA.sub(r'\1', candidate)):
+            try:
+                value = json.loads(attempt)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(value, dict):
+                yield value, True
+            break
+
+
+def extract_json_object(text: str) -> Tuple[Dict[str, Any], bool]:
+    """
+    텍스트에서 첫 번째 유효 JSON 객체 추출
+
+    Raises:
+        AIResponseParseError: 유효한 JSON 객체 없음
+    """
+    for value, extracted in iter_json_objects(text):
+        return value, extracted
+    raise AIResponseParseError(f"응답에서 JSON 객체를 찾을 수 없음: {text.strip()[:80]!r}")
+
+
+def validate_decision(analysis: Dict[str, Any]) -> bool:
+    """
+    매매 결정 스키마 검증 및 정규화 (제자리 수정)
+
+    - decision: 대소문자/공백 정규화 후 BUY/SELL/HOLD 중 하나
+    - confidence: 0~1 실수 (1 초과 0~100 값은 백분율로 간주)
+    - fundamental_score / technical_score: 있으면 0~1로 제한, 숫자가 아니면 제거
+
+    Returns:
+        정규화가 필요했으면 True
+
+    Raises:
+        AIResponseParseError: 필수 필드 누락 또는 값 오류
+    """
+    normalized = False
+
+    decision = analysis.get('decision')
+    if not isinstance(decision, str):
+        raise AIResponseParseError(f"decision 필드 누락/오류: {decision!r}")
+    clean_decision = decision.strip().upper()
+    if clean_decision not in VALID_DECISIONS:
+        raise AIResponseParseError(f"허용되지 않는 decision 값: {decision!r}")
+    if clean_decision != decision:
+        analysis['decision'] = clean_decision
+        normalized = True
+
+    confidence = analysis.get('confidence')
+    try:
+        value = float(str(confidence).rstrip('%')) if isinstance(confidence, str) else float(confidence)
+    except (TypeError, ValueError):
+        raise AIResponseParseError(f"confidence 필드 누락/오류: {confidence!r}")
+    if 1.0 < value <= 100.0:
+        value /= 100.0
+    if not 0.0 <= value <= 1.0:
+        raise AIResponseParseError(f"confidence 범위 오류: {confidence!r}")
+    if value != confidence:
+        analysis['confidence'] = value
+        normalized = True
+
+    for field in SCORE_FIELDS:
+        if field not in analysis:
+            continue
+        try:
+            score = min(1.0, max(0.0, float(analysis[field])))
+        except (TypeError, ValueError):
+            del analysis[field]
+            normalized = True
+            continue
+        if score != analysis[field]:
+            analysis[field] = score
+            normalized = True
+
+    return normalized
+
+
+def parse_decision_response(text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    모델 응답 → 검증된 결정 dict (결정 스키마를 만족하는 첫 번째 객체)
+
+    Returns:
+        (분석 결과, PARSE_CLEAN 또는 PARSE_REPAIRED)
+
+    Raises:
+        AIResponseParseError: 추출 또는 검증 실패
+    """
+    last_error = None
+    for analysis, extracted in iter_json_objects(text):
+        try:
+            normalized = validate_decision(analysis)
+        except AIResponseParseError as e:
+            last_error = e
+            continue
+        return analysis, PARSE_REPAIRED if (extracted or normalized) else PARSE_CLEAN
+
+    if last_error is not None:
+        raise last_error
+    raise AIResponseParseError(f"응답에서 JSON 객체를 찾을 수 없음: {text.strip()[:80]!r}")
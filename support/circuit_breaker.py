@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+AI 제공자별 서킷 브레이커
+- CLOSED: 정상 호출, 최근 호출 결과를 롤링 윈도우로 추적
+- OPEN: 오류율/지연 호출 비율 초과시 즉시 실패 (타임아웃/재시도 비용 없음)
+- HALF_OPEN: 차단 시간 경과 후 탐침 호출 1건만 허용, 성공시 CLOSED 복귀
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Dict, Any, Optional
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+
+class ProviderCircuitBreaker:
+    """단일 제공자 서킷 브레이커"""
+
+    def __init__(self, name: str, window_size: int = 20, min_calls: int = 5,
+                 error_rate_threshold: float = 0.5, slow_call_seconds: float = 5.0,
+                 slow_rate_threshold: float = 0.8, open_seconds: float = 60.0):
+        """
+        초기화
+
+        Args:
+            name: 제공자 이름
+            window_size: 롤링 윈도우 호출 수
+            min_calls: 상태 판정에 필요한 최소 호출 수
+            error_rate_threshold: OPEN 전환 오류율
+            slow_call_seconds: 지연 호출 기준 (초)
+            slow_rate_threshold: OPEN 전환 지연 호출 비율
+            open_seconds: OPEN 유지 시간 (경과 후 HALF_OPEN 탐침)
+        """
+        self.name = name
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_rate_threshold = slow_rate_threshold
+        self.open_seconds = open_seconds
+
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.last_state_change = time.time()
+        self.open_count = 0
+        self.rejected_calls = 0
+        self._probe_in_flight = False
+        self._window: deque = deque(maxlen=window_size)  # (성공 여부, 지연 초)
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (OPEN이면 즉시 거부, HALF_OPEN이면 탐침 1건만 허용)"""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.open_seconds:
+                    self.rejected_calls += 1
+                    return False
+                self._transition(HALF_OPEN)
+
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    self.rejected_calls += 1
+                    return False
+                self._probe_in_flight = True
+
+            return True
+
+    def record_result(self, success: bool, latency: float):
+        """호출 결과 기록"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                if success and latency < self.slow_call_seconds:
+                    self._window.clear()
+                    self._transition(CLOSED)
+                else:
+                    self._open()
+                return
+
+            self._window.append((success, latency))
+            if self.state == CLOSED and len(self._window) >= self.min_calls:
+                error_rate, slow_rate = self._rates()
+                if error_rate >= self.error_rate_threshold or slow_rate >= self.slow_rate_threshold:
+                    self._open()
+
+    def record_cancelled(self, latency: float):
+        """취소된 호출 기록 (결정 예산 초과 등) - 지연 기준을 넘긴 경우만 지연 호출로 집계"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                return
+        if latency >= self.slow_call_seconds:
+            self.record_result(True, latency)
+
+    def _open(self):
+        self.opened_at = time.monotonic()
+        self.open_count += 1
+        self._transition(OPEN)
+
+    def _transition(self, state: str):
+        self.state = state
+        self.last_state_change = time.time()
+
+    def _rates(self):
+        total = len(self._window)
+        if total == 0:
+            return 0.0, 0.0
+        errors = sum(1 for ok, _ in self._window if not ok)
+        slow = sum(1 for _, latency in self._window if latency >= self.slow_call_seconds)
+        return errors / total, slow / total
+
+    def health_score(self) -> float:
+        """건강도 점수 (0.0~1.0): 성공률과 지연 호출 비율 기반, OPEN이면 0"""
+        with self._lock:
+            if self.state == OPEN:
+                return 0.0
+            error_rate, slow_rate = self._rates()
+            score = (1.0 - error_rate) * (1.0 - 0.5 * slow_rate)
+            return round(score * (0.5 if self.state == HALF_OPEN else 1.0), 3)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """상태 정보"""
+        health = self.health_score()
+        with self._lock:
+            error_rate, slow_rate = self._rates()
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = max(0.0, self.open_seconds - (time.monotonic() - self.opened_at))
+            return {
+                "state": self.state,
+                "health_score": health,
+                "window_calls": len(self._window),
+                "error_rate": error_rate,
+                "slow_call_rate": slow_rate,
+                "open_count": self.open_count,
+                "rejected_calls": self.rejected_calls,
+                "retry_in_seconds": retry_in,
+                "last_state_change": time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.last_state_change))
+            }
@@ -14,8 +14,14 @@ Claude + Gemini 하이브리드 매매 결정 엔진
 import asyncio
 import aiohttp
 import json
+import time
+import itertools
+import socket
 import logging
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta, time as datetime_time
+from urllib.parse import urlparse
+from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import asdict
 
@@ -25,14 +31,41 @@ from .gpt_interfaces import (
 )
 from .ai_api_manager import get_ai_api_manager
 from .clean_console_logger import clean_log
+from .streaming_json_parser import IncrementalJSONParser
+from .decision_log import DecisionLog
+from .ai_engine_metrics import HybridEngineMetrics
+from .circuit_breaker import ProviderCircuitBreaker
+from .decision_fusion import fuse_pair, rule_config
+from .prompt_encoder import CompactPromptEncoder, estimate_tokens
+from .ai_response_parser import (
+    parse_decision_response, validate_decision, AIResponseParseError, PARSE_CLEAN, PARSE_FAILED, PARSE_REPAIRED
+)
 
 logger = logging.getLogger(__name__)
 
+PROJECT_ROOT = Path(__file__).parent.parent
+DECISION_HISTORY_SIZE = 100
+DECISION_LOG_DIR = PROJECT_ROOT / "logs" / "ai_decisions"
+METRICS_DIR = PROJECT_ROOT / "logs" / "ai_metrics"
+MARKET_OPEN = datetime_time(9, 0, 0)
+SAFE_MODE_ENGINE = "Safe Mode"
+
+# 스트리밍 조기 확정 필드 (융합에 쓰이는 점수까지 도착해야 확정, reasoning만 백그라운드 수신)
+STREAM_EARLY_FIELDS = {
+    'claude': ('decision', 'confidence', 'fundamental_score'),
+    'gemini': ('decision', 'confidence', 'technical_score'),
+}
+
 class ClaudeGeminiHybridEngine(GPTDecisionEngine):
     """Claude + Gemini 하이브리드 매매 결정 엔진"""
     
-    def __init__(self):
-        """초기화 - Register_Key.md에서 설정 로드"""
+    def __init__(self, decision_log: Optional[DecisionLog] = None):
+        """
+        초기화 - Register_Key.md에서 설정 로드
+        
+        Args:
+            decision_log: 공유 결정 로그 (None이면 엔진 전용 로그 생성, engine_registry 참고)
+        """
         self.engine_name = "Claude+Gemini 하이브리드 엔진"
         
         # AI API 관리자 초기화
@@ -45,17 +78,58 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
                 "메뉴 3. Setup → 1. Register_Key에서 Claude와 Gemini API 키를 모두 설정하세요."
             )
         
-        # 설정 로드
+        # 설정 로드 (불변 스냅샷, Register_Key.md 변경시 _on_config_update로 교체)
         self.claude_config = self.ai_manager.get_claude_config()
         self.gemini_config = self.ai_manager.get_gemini_config()
         self.hybrid_config = self.ai_manager.get_hybrid_config()
+        self.config_version = self.ai_manager.get_snapshot().version
         
         # 성능 추적
         self.performance = TradingPerformance()
         self.risk_manager = TradingRiskManager()
         
-        # 결정 히스토리
-        self.decision_history: List[Dict[str, Any]] = []
+        # 결정 히스토리 (메모리: 최근 N건 링버퍼, 디스크: append-only 로그)
+        self.decision_history: deque = deque(maxlen=DECISION_HISTORY_SIZE)
+        self._owns_decision_log = decision_log is None
+        self.decision_log = decision_log if decision_log is not None else DecisionLog(DECISION_LOG_DIR)
+        self.total_decisions = 0
+        
+        # 스트리밍 응답의 나머지(reasoning)를 수신 중인 백그라운드 작업 (분석 결과의 stream_id → 작업)
+        self._stream_tasks: Dict[int, asyncio.Task] = {}
+        self._stream_ids = itertools.count(1)
+        
+        # 제공자별 지연/비용 계측
+        self.metrics = HybridEngineMetrics()
+        
+        # 프롬프트 인코더 (compact: 축약 키 고정 스키마, verbose: 기존 서술형)
+        self.prompt_encoder = CompactPromptEncoder(self.hybrid_config['max_prompt_tokens'])
+        
+        # 유휴 구간 선계산 결정 캐시 (종목코드 → 결정 및 계산 당시 컨텍스트)
+        self.decision_cache: Dict[str, Dict[str, Any]] = {}
+        self.stale_prefetches = 0
+        
+        # 제공자별 서킷 브레이커
+        self.circuit_breakers = {
+            provider: ProviderCircuitBreaker(
+                provider,
+                window_size=self.hybrid_config['breaker_window'],
+                min_calls=self.hybrid_config['breaker_min_calls'],
+                error_rate_threshold=self.hybrid_config['breaker_error_rate'],
+                slow_call_seconds=self.hybrid_config['breaker_slow_call_seconds'],
+                slow_rate_threshold=self.hybrid_config['breaker_slow_rate'],
+                open_seconds=self.hybrid_config['breaker_open_seconds']
+            )
+            for provider in ('claude', 'gemini')
+        }
+        
+        # 제공자 공용 HTTP 세션 (연결 풀 + DNS 캐시, 최초 사용 또는 warm_up()시 생성)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.readiness: Dict[str, Dict[str, Any]] = {}
+        
+        # Register_Key.md 변경 통지 구독 (키 교체, 가중치 변경 등 재시작 없이 반영)
+        # 약한 참조: close_engine 없이 루프가 닫혀 레지스트리에서 빠진 엔진도 수거되도록
+        self._unsubscribe_config = self.ai_manager.subscribe(self._on_config_update, weak=True)
         
         clean_log(f"하이브리드 엔진 초기화: Claude({self.claude_config['model']}) + Gemini({self.gemini_config['model']})", "SUCCESS")
         
@@ -70,47 +144,397 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
         Returns:
             매매 결정 결과
         """
+        # 설정 변경 확인 (호출 간격 제한으로 대부분 즉시 반환)
+        self.ai_manager.check_for_updates()
+        
+        # 유휴 구간에 미리 계산된 결정 사용 (컨텍스트 변화가 허용 범위 이내일 때만)
+        cached = self._take_prefetched_decision(context)
+        if cached is not None:
+            return cached
+        
+        decision, claude_result, gemini_result = await self._compute_decision(context)
+        
+        # 히스토리 기록 (안전 모드 결정은 기록하지 않음)
+        if claude_result is not None or gemini_result is not None:
+            self._record_decision(decision, claude_result, gemini_result)
+        
+        return decision
+    
+    async def _compute_decision(self, context: MarketContext) -> Tuple[DecisionResult, Optional[Dict], Optional[Dict]]:
+        """
+        AI 분석 및 융합 실행
+        
+        Returns:
+            (결정, Claude 분석, Gemini 분석) - 안전 모드면 분석은 None
+        """
+        start_time = datetime.now()
+        tasks: Dict[str, asyncio.Future] = {}
+        
         try:
-            start_time = datetime.now()
+            # 서킷 브레이커 확인 (OPEN 제공자는 호출하지 않고 즉시 제외)
+            analyzers = {'claude': self._analyze_with_claude, 'gemini': self._analyze_with_gemini}
+            blocked = [p for p in analyzers if not self.circuit_breakers[p].allow_request()]
+            if len(blocked) == len(analyzers):
+                raise Exception("서킷 브레이커 OPEN: 모든 AI 제공자 차단 중")
             
-            # 병렬로 두 AI 분석 실행
-            claude_task = self._analyze_with_claude(context)
-            gemini_task = self._analyze_with_gemini(context)
+            # 병렬로 AI 분석 실행
+            tasks = {
+                provider: asyncio.ensure_future(self._timed_call(provider, analyze(context)))
+                for provider, analyze in analyzers.items() if provider not in blocked
+            }
             
-            # 둘 다 성공해야 진행 (하나라도 실패시 예외 발생)
-            claude_result, gemini_result = await asyncio.gather(
-                claude_task, gemini_task,
-                return_exceptions=False  # 실패시 즉시 예외
+            # 결정 지연 예산 내에서 대기 (하나라도 실패시 즉시 종료)
+            budget = self.hybrid_config['decision_budget_seconds']
+            done, pending = await asyncio.wait(
+                set(tasks.values()),
+                timeout=budget,
+                return_when=asyncio.FIRST_EXCEPTION
             )
             
-            # 결과 융합
-            decision = self._fuse_decisions(claude_result, gemini_result, context)
+            # 미완료 요청은 finally에서 취소
+            
+            # 완료된 분석 중 실패가 있으면 예외 전파 (안전 모드)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+            
+            results = {p: task.result() for p, task in tasks.items() if task in done}
+            claude_result = results.get('claude')
+            gemini_result = results.get('gemini')
+            
+            if claude_result is not None and gemini_result is not None:
+                # 결과 융합
+                decision = self._fuse_decisions(claude_result, gemini_result, context)
+            elif results:
+                # 예산 초과 또는 서킷 차단: 완료된 분석만으로 부분 융합
+                reason = 'circuit_open' if blocked else 'deadline'
+                decision = self._fuse_partial_decision(claude_result, gemini_result, context, reason)
+                if blocked:
+                    clean_log(
+                        f"[HYBRID_ENGINE] ⚡ {', '.join(blocked)} 서킷 OPEN - 부분 융합 적용", "WARNING"
+                    )
+                else:
+                    clean_log(
+                        f"[HYBRID_ENGINE] ⏱ 결정 예산 {budget:.1f}초 초과 - "
+                        f"{decision.metadata['missing_provider']} 분석 취소, 부분 융합 적용",
+                        "WARNING"
+                    )
+            else:
+                raise asyncio.TimeoutError(f"결정 예산 {budget:.1f}초 내 완료된 분석 없음")
             
             # 처리 시간 기록
             processing_time = (datetime.now() - start_time).total_seconds()
             decision.metadata = decision.metadata or {}
             decision.metadata['processing_time'] = processing_time
-            decision.metadata['claude_confidence'] = claude_result.get('confidence', 0.0)
-            decision.metadata['gemini_confidence'] = gemini_result.get('confidence', 0.0)
+            decision.metadata['decision_budget'] = budget
+            decision.metadata['circuit_blocked'] = blocked
+            decision.metadata['claude_confidence'] = (claude_result or {}).get('confidence', 0.0)
+            decision.metadata['gemini_confidence'] = (gemini_result or {}).get('confidence', 0.0)
             
-            # 히스토리 기록
-            self._record_decision(decision, claude_result, gemini_result)
+            self.metrics.record_decision(processing_time, success=True)
             
-            return decision
+            return decision, claude_result, gemini_result
             
         except Exception as e:
             error_msg = f"하이브리드 엔진 분석 실패: {str(e)}"
             logger.error(error_msg)
             clean_log(f"[HYBRID_ENGINE] ❌ {error_msg}", "ERROR")
+            self.metrics.record_decision((datetime.now() - start_time).total_seconds(), success=False)
             
             # 안전 모드 결정 반환
-            return self._create_safe_decision(context, error_msg)
+            reason = 'deadline' if isinstance(e, asyncio.TimeoutError) else 'error'
+            return self._create_safe_decision(context, error_msg, reason), None, None
+        
+        finally:
+            # 예산 초과/실패/외부 취소(선계산 마감, 워커 타임아웃) 모두 진행 중 호출 취소 후 종료 대기
+            # (버려진 결정을 위해 토큰 사용, 브레이커/지표 갱신이 계속되지 않도록)
+            unfinished = [task for task in tasks.values() if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
+    
+    async def prefetch_decisions(self, contexts: List[MarketContext], deadline_seconds: float) -> Dict[str, Any]:
+        """
+        다음 사이클 대비 결정 선계산 (유휴 구간용)
+        
+        Args:
+            contexts: 선계산할 종목 컨텍스트 (우선순위 순)
+            deadline_seconds: 선계산 허용 시간 (초과분은 취소)
+            
+        Returns:
+            선계산 결과 요약
+        """
+        semaphore = asyncio.Semaphore(self.hybrid_config['prefetch_concurrency'])
+        stored = []
+        
+        async def prefetch_one(context: MarketContext):
+            async with semaphore:
+                decision, claude_result, gemini_result = await self._compute_decision(context)
+            if claude_result is None and gemini_result is None:
+                return
+            self.decision_cache[context.symbol] = {
+                "decision": decision,
+                "claude_result": claude_result,
+                "gemini_result": gemini_result,
+                "price": context.current_price,
+                "price_change_pct": context.price_change_pct,
+                "created_at": time.monotonic()
+            }
+            stored.append(context.symbol)
+        
+        tasks = [asyncio.ensure_future(prefetch_one(c)) for c in contexts]
+        if not tasks:
+            return {"requested": 0, "stored": 0, "cancelled": 0}
+        
+        _, pending = await asyncio.wait(tasks, timeout=deadline_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        clean_log(f"[HYBRID_ENGINE] 결정 선계산: {len(stored)}/{len(contexts)}건 (취소 {len(pending)}건)", "INFO")
+        return {"requested": len(contexts), "stored": len(stored), "cancelled": len(pending), "symbols": stored}
+    
+    def _take_prefetched_decision(self, context: MarketContext) -> Optional[DecisionResult]:
+        """선계산 결정 조회 (1회 사용 후 제거, 허용 범위 초과시 stale 처리)"""
+        if not self.hybrid_config['prefetch_enabled']:
+            return None
+        
+        entry = self.decision_cache.pop(context.symbol, None)
+        if entry is None:
+            self.metrics.record_cache(hit=False)
+            return None
+        
+        age = time.monotonic() - entry['created_at']
+        price_move_pct = (abs(context.current_price - entry['price']) / entry['price'] * 100
+                          if entry['price'] else float('inf'))
+        if (age > self.hybrid_config['prefetch_max_age_seconds']
+                or price_move_pct > self.hybrid_config['prefetch_price_tolerance_pct']):
+            self.stale_prefetches += 1
+            self.metrics.record_cache(hit=False)
+            logger.info(f"선계산 결정 폐기 (stale): {context.symbol} 경과 {age:.0f}초, 가격변동 {price_move_pct:.2f}%")
+            return None
+        
+        self.metrics.record_cache(hit=True)
+        decision = entry['decision']
+        decision.metadata = decision.metadata or {}
+        decision.metadata['prefetched'] = True
+        decision.metadata['prefetch_age_seconds'] = age
+        decision.metadata['prefetch_price_move_pct'] = price_move_pct
+        self._record_decision(decision, entry['claude_result'], entry['gemini_result'])
+        return decision
+    
+    def _on_config_update(self, snapshot):
+        """Register_Key.md 변경 통지 (다른 이벤트 루프 스레드에서 감지된 경우 소유 루프에서 반영)"""
+        owner = self._session_loop
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        if owner is not None and owner is not current and owner.is_running():
+            owner.call_soon_threadsafe(self._apply_config, snapshot)
+        else:
+            self._apply_config(snapshot)
+    
+    def _apply_config(self, snapshot):
+        """새 설정 스냅샷 반영 (API 키가 비어 있으면 기존 설정 유지)"""
+        try:
+            claude_config = self.ai_manager.get_claude_config()
+            gemini_config = self.ai_manager.get_gemini_config()
+        except ValueError as e:
+            clean_log(f"[HYBRID_ENGINE] ⚠ 변경된 설정 무시 (기존 설정 유지): {e}", "WARNING")
+            return
+        
+        hybrid_config = snapshot.config['hybrid']
+        self.claude_config = claude_config
+        self.gemini_config = gemini_config
+        self.hybrid_config = hybrid_config
+        self.config_version = snapshot.version
+        
+        self.prompt_encoder.max_prompt_tokens = hybrid_config['max_prompt_tokens']
+        for breaker in self.circuit_breakers.values():
+            breaker.min_calls = hybrid_config['breaker_min_calls']
+            breaker.error_rate_threshold = hybrid_config['breaker_error_rate']
+            breaker.slow_call_seconds = hybrid_config['breaker_slow_call_seconds']
+            breaker.slow_rate_threshold = hybrid_config['breaker_slow_rate']
+            breaker.open_seconds = hybrid_config['breaker_open_seconds']
+        
+        # 이전 설정(가중치 등)으로 계산된 선계산 결정 폐기
+        self.decision_cache.clear()
+        
+        clean_log(
+            f"[HYBRID_ENGINE] 🔄 설정 v{snapshot.version} 적용 - "
+            f"가중치 Claude {hybrid_config['claude_weight']} / Gemini {hybrid_config['gemini_weight']}",
+            "INFO"
+        )
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """공용 HTTP 세션 (연결 재사용, 이벤트 루프가 바뀌면 재생성)"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.hybrid_config['connection_pool_size'],
+                ttl_dns_cache=300,
+                keepalive_timeout=self.hybrid_config['connection_keepalive_seconds']
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self):
+        """reasoning 수신 작업 취소, HTTP 세션 및 결정 로그 종료, 설정 변경 구독 해제"""
+        self._unsubscribe_config()
+        
+        # 완료 콜백이 결정 로그에 기록하므로 세션/로그 종료 전에 취소 후 종료 대기
+        stream_tasks = list(self._stream_tasks.values())
+        for task in stream_tasks:
+            task.cancel()
+        if stream_tasks:
+            await asyncio.gather(*stream_tasks, return_exceptions=True)
+        
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._owns_decision_log:
+            self.decision_log.close()
+    
+    async def warm_up(self, probe: Optional[bool] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        장 시작 전 AI 경로 예열
+        
+        1. 제공자 호스트 DNS 사전 조회
+        2. 공용 세션 연결 풀에 TLS 연결 생성 (HEAD 요청, 토큰 비용 없음)
+        3. (선택) 모델 조회 탐침 요청으로 API 키/모델 확인 (토큰 비용 없음)
+        
+        Args:
+            probe: 탐침 요청 여부 (None이면 Register_Key.md warmup_probe 설정)
+            
+        Returns:
+            제공자별 준비 상태 및 단계별 지연 (초)
+        """
+        if probe is None:
+            probe = self.hybrid_config['warmup_probe']
+        
+        results = await asyncio.gather(
+            self._warm_up_provider('claude', probe),
+            self._warm_up_provider('gemini', probe)
+        )
+        self.readiness = dict(zip(('claude', 'gemini'), results))
+        
+        for provider, status in self.readiness.items():
+            if status['ready']:
+                clean_log(
+                    f"[HYBRID_ENGINE] 🔥 {provider} 예열 완료 - DNS {status['dns_seconds']:.3f}초 / "
+                    f"연결 {status['connect_seconds']:.3f}초"
+                    + (f" / 탐침 {status['probe_seconds']:.3f}초" if status['probe_seconds'] is not None else ""),
+                    "SUCCESS"
+                )
+            else:
+                clean_log(f"[HYBRID_ENGINE] ❌ {provider} 예열 실패: {status['error']}", "ERROR")
+        
+        return self.readiness
+    
+    async def warm_up_before_open(self, lead_seconds: Optional[float] = None,
+                                  probe: Optional[bool] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        장 시작(09:00) lead_seconds 전까지 대기 후 예열 (이미 지났으면 즉시 예열)
+        
+        Args:
+            lead_seconds: 장 시작 전 예열 시점 (None이면 Register_Key.md warmup_lead_seconds 설정)
+            probe: 탐침 요청 여부
+        """
+        if lead_seconds is None:
+            lead_seconds = self.hybrid_config['warmup_lead_seconds']
+        
+        now = datetime.now()
+        warm_at = datetime.combine(now.date(), MARKET_OPEN) - timedelta(seconds=lead_seconds)
+        wait = (warm_at - now).total_seconds()
+        if wait > 0:
+            clean_log(f"[HYBRID_ENGINE] AI 경로 예열 예약: {warm_at.strftime('%H:%M:%S')}", "INFO")
+            await asyncio.sleep(wait)
+        
+        return await self.warm_up(probe)
+    
+    async def _warm_up_provider(self, provider: str, probe: bool) -> Dict[str, Any]:
+        """단일 제공자 예열"""
+        config = self.claude_config if provider == 'claude' else self.gemini_config
+        base_url = config['base_url']
+        parsed = urlparse(base_url)
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        timeout = aiohttp.ClientTimeout(total=self.hybrid_config['timeout_seconds'])
+        status = {
+            "ready": False,
+            "dns_seconds": None,
+            "connect_seconds": None,
+            "probe_seconds": None,
+            "probe_status": None,
+            "error": None,
+            "checked_at": datetime.now().isoformat()
+        }
+        
+        try:
+            started = time.perf_counter()
+            await asyncio.get_running_loop().getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)
+            status['dns_seconds'] = time.perf_counter() - started
+            
+            # 응답 코드와 무관하게 연결이 풀에 남음
+            session = self._get_session()
+            started = time.perf_counter()
+            async with session.head(base_url, timeout=timeout, allow_redirects=False) as response:
+                await response.read()
+            status['connect_seconds'] = time.perf_counter() - started
+            
+            if probe:
+                if provider == 'claude':
+                    url = f"{base_url}/v1/models/{config['model']}"
+                    headers = {"x-api-key": config['api_key'], "anthropic-version": "2023-06-01"}
+                    params = None
+                else:
+                    url = f"{base_url}/v1beta/models/{config['model']}"
+                    headers = None
+                    params = {"key": config['api_key']}
+                
+                started = time.perf_counter()
+                async with session.get(url, headers=headers, params=params, timeout=timeout) as response:
+                    await response.read()
+                    status['probe_status'] = response.status
+                status['probe_seconds'] = time.perf_counter() - started
+                if status['probe_status'] != 200:
+                    raise Exception(f"탐침 응답 {status['probe_status']}")
+            
+            status['ready'] = True
+            
+        except Exception as e:
+            status['error'] = str(e) or type(e).__name__
+        
+        return status
+    
+    async def _timed_call(self, provider: str, coro) -> Dict[str, Any]:
+        """제공자 호출 소요 시간 및 결과 계측"""
+        started = time.perf_counter()
+        try:
+            result = await coro
+        except asyncio.CancelledError:
+            elapsed = time.perf_counter() - started
+            self.metrics.record_call(provider, elapsed, 'cancelled')
+            self.circuit_breakers[provider].record_cancelled(elapsed)
+            raise
+        except Exception:
+            elapsed = time.perf_counter() - started
+            self.metrics.record_call(provider, elapsed, 'failure')
+            self.circuit_breakers[provider].record_result(False, elapsed)
+            raise
+        elapsed = time.perf_counter() - started
+        self.metrics.record_call(provider, elapsed, 'success')
+        self.circuit_breakers[provider].record_result(True, elapsed)
+        return result
     
     async def _analyze_with_claude(self, context: MarketContext) -> Dict[str, Any]:
         """Claude를 이용한 정성적 펀더멘털 분석"""
         
         # Claude 전용 프롬프트 (정성적 분석 특화)
-        prompt = self._build_claude_prompt(context)
+        prompt = self._build_prompt('claude', context)
         
         # Claude API 호출
         headers = {
@@ -128,37 +552,59 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
             ]
         }
         
+        if self.hybrid_config['streaming_enabled']:
+            payload["stream"] = True
+            return await self._analyze_streaming(
+                'claude', f"{self.claude_config['base_url']}/v1/messages", headers, None, payload,
+                self._extract_claude_stream_text
+            )
+        
         timeout = aiohttp.ClientTimeout(total=self.hybrid_config['timeout_seconds'])
         
+        parse_failures = 0
         for attempt in range(self.hybrid_config['max_retries']):
+            self.metrics.record_attempt('claude')
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.post(
-                        "https://api.anthropic.com/v1/messages",
-                        headers=headers,
-                        json=payload
-                    ) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            content = result['content'][0]['text']
+                session = self._get_session()
+                async with session.post(
+                    f"{self.claude_config['base_url']}/v1/messages",
+                    headers=headers,
+                    json=payload,
+                    timeout=timeout
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        usage = result.get('usage', {})
+                        self.metrics.record_tokens('claude', usage.get('input_tokens', 0),
+                                                   usage.get('output_tokens', 0))
+                        content = result['content'][0]['text']
                             
-                            # JSON 파싱
-                            analysis = json.loads(content)
-                            analysis['source'] = 'claude'
-                            analysis['attempt'] = attempt + 1
+                        # JSON 추출 및 스키마 검증
+                        analysis = self._parse_analysis('claude', content)
+                        analysis['source'] = 'claude'
+                        analysis['attempt'] = attempt + 1
                             
-                            return analysis
-                        else:
-                            error_text = await response.text()
-                            raise Exception(f"Claude API 오류 {response.status}: {error_text}")
+                        return analysis
+                    else:
+                        error_text = await response.text()
+                        raise Exception(f"Claude API 오류 {response.status}: {error_text}")
                             
+            except AIResponseParseError as e:
+                # 응답은 받았으므로 전송 오류로 집계하지 않음 (PARSE_FAILED는 _parse_analysis에서 기록)
+                parse_failures += 1
+                if self._retry_parse_failure(parse_failures, attempt):
+                    continue
+                raise Exception(f"Claude 응답 파싱 실패: {e}")
+            
             except asyncio.TimeoutError:
+                self.metrics.record_timeout('claude')
                 if attempt < self.hybrid_config['max_retries'] - 1:
                     await asyncio.sleep(1)
                     continue
                 raise Exception(f"Claude API 타임아웃 (시도: {attempt + 1})")
             
             except Exception as e:
+                self.metrics.record_error('claude')
                 if attempt < self.hybrid_config['max_retries'] - 1:
                     await asyncio.sleep(1)
                     continue
@@ -170,10 +616,10 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
         """Gemini를 이용한 정량적 기술적 분석"""
         
         # Gemini 전용 프롬프트 (기술적 분석 특화)
-        prompt = self._build_gemini_prompt(context)
+        prompt = self._build_prompt('gemini', context)
         
         # Gemini API 호출
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.gemini_config['model']}:generateContent"
+        url = f"{self.gemini_config['base_url']}/v1beta/models/{self.gemini_config['model']}:generateContent"
         params = {"key": self.gemini_config['api_key']}
         
         payload = {
@@ -186,33 +632,54 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
             }
         }
         
+        if self.hybrid_config['streaming_enabled']:
+            stream_url = url.replace(':generateContent', ':streamGenerateContent')
+            return await self._analyze_streaming(
+                'gemini', stream_url, None, {**params, "alt": "sse"}, payload,
+                self._extract_gemini_stream_text
+            )
+        
         timeout = aiohttp.ClientTimeout(total=self.hybrid_config['timeout_seconds'])
         
+        parse_failures = 0
         for attempt in range(self.hybrid_config['max_retries']):
+            self.metrics.record_attempt('gemini')
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.post(url, params=params, json=payload, timeout=timeout) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            content = result['candidates'][0]['content']['parts'][0]['text']
+                session = self._get_session()
+                async with session.post(url, params=params, json=payload, timeout=timeout) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        usage = result.get('usageMetadata', {})
+                        self.metrics.record_tokens('gemini', usage.get('promptTokenCount', 0),
+                                                   usage.get('candidatesTokenCount', 0))
+                        content = result['candidates'][0]['content']['parts'][0]['text']
                             
-                            # JSON 파싱
-                            analysis = json.loads(content)
-                            analysis['source'] = 'gemini'
-                            analysis['attempt'] = attempt + 1
+                        # JSON 추출 및 스키마 검증
+                        analysis = self._parse_analysis('gemini', content)
+                        analysis['source'] = 'gemini'
+                        analysis['attempt'] = attempt + 1
                             
-                            return analysis
-                        else:
-                            error_text = await response.text()
-                            raise Exception(f"Gemini API 오류 {response.status}: {error_text}")
+                        return analysis
+                    else:
+                        error_text = await response.text()
+                        raise Exception(f"Gemini API 오류 {response.status}: {error_text}")
                             
+            except AIResponseParseError as e:
+                # 응답은 받았으므로 전송 오류로 집계하지 않음 (PARSE_FAILED는 _parse_analysis에서 기록)
+                parse_failures += 1
+                if self._retry_parse_failure(parse_failures, attempt):
+                    continue
+                raise Exception(f"Gemini 응답 파싱 실패: {e}")
+            
             except asyncio.TimeoutError:
+                self.metrics.record_timeout('gemini')
                 if attempt < self.hybrid_config['max_retries'] - 1:
                     await asyncio.sleep(1)
                     continue
                 raise Exception(f"Gemini API 타임아웃 (시도: {attempt + 1})")
             
             except Exception as e:
+                self.metrics.record_error('gemini')
                 if attempt < self.hybrid_config['max_retries'] - 1:
                     await asyncio.sleep(1)
                     continue
@@ -220,6 +687,196 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
         
         raise Exception(f"Gemini API {self.hybrid_config['max_retries']}회 시도 모두 실패")
     
+    async def _analyze_streaming(self, source: str, url: str, headers: Optional[Dict], params: Optional[Dict],
+                                 payload: Dict, extract_text) -> Dict[str, Any]:
+        """
+        SSE 스트리밍 분석 - decision/confidence/점수 도착 즉시 반환
+        
+        나머지 필드(reasoning 등)는 백그라운드에서 계속 수신하여
+        반환된 분석 결과와 히스토리 기록에 채워 넣는다.
+        """
+        max_retries = self.hybrid_config['max_retries']
+        parse_failures = 0
+        
+        for attempt in range(max_retries):
+            self.metrics.record_attempt(source)
+            early = asyncio.get_running_loop().create_future()
+            stream_task = asyncio.ensure_future(
+                self._consume_stream(source, url, headers, params, payload, extract_text, early)
+            )
+            
+            try:
+                fields = await early
+            except asyncio.CancelledError:
+                stream_task.cancel()
+                raise
+            except Exception as e:
+                stream_task.cancel()
+                if isinstance(e, asyncio.TimeoutError):
+                    self.metrics.record_timeout(source)
+                else:
+                    self.metrics.record_error(source)
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(1)
+                    continue
+                raise Exception(f"{source} 스트리밍 호출 실패 (시도: {attempt + 1}): {e}")
+            
+            analysis = dict(fields)
+            try:
+                self.metrics.record_parse(source, PARSE_REPAIRED if validate_decision(analysis) else PARSE_CLEAN)
+            except AIResponseParseError as e:
+                stream_task.cancel()
+                self.metrics.record_parse(source, PARSE_FAILED)
+                parse_failures += 1
+                if self._retry_parse_failure(parse_failures, attempt):
+                    continue
+                raise Exception(f"{source} 스트리밍 응답 검증 실패: {e}")
+            analysis['source'] = source
+            analysis['attempt'] = attempt + 1
+            analysis['streaming'] = True
+            
+            if stream_task.done():
+                self._merge_stream_fields(analysis, stream_task)
+            else:
+                # 분석 결과는 선계산 캐시에도 보관되므로 작업 객체 대신 식별자만 담음
+                stream_id = next(self._stream_ids)
+                analysis['stream_id'] = stream_id
+                self._stream_tasks[stream_id] = stream_task
+                stream_task.add_done_callback(lambda t, a=analysis: self._merge_stream_fields(a, t))
+                stream_task.add_done_callback(lambda t, k=stream_id: self._stream_tasks.pop(k, None))
+            
+            return analysis
+        
+        raise Exception(f"{source} 스트리밍 {max_retries}회 시도 모두 실패")
+    
+    async def _consume_stream(self, source: str, url: str, headers: Optional[Dict], params: Optional[Dict],
+                              payload: Dict, extract_text, early: asyncio.Future) -> Dict[str, Any]:
+        """SSE 스트림 수신 및 증분 파싱 (전체 필드 반환)"""
+        parser = IncrementalJSONParser()
+        early_fields = STREAM_EARLY_FIELDS.get(source, ('decision', 'confidence'))
+        usage = {'prompt': 0, 'response': 0}
+        timeout = aiohttp.ClientTimeout(total=self.hybrid_config['timeout_seconds'])
+        
+        try:
+            session = self._get_session()
+            async with session.post(url, headers=headers, params=params, json=payload, timeout=timeout) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"{source} API 오류 {response.status}: {error_text}")
+                    
+                async for raw_line in response.content:
+                    line = raw_line.decode('utf-8').strip()
+                    if not line.startswith('data:'):
+                        continue
+                    data = line[5:].strip()
+                    if not data or data == '[DONE]':
+                        continue
+                        
+                    event = json.loads(data)
+                    self._update_stream_usage(event, usage)
+                    text = extract_text(event)
+                    if not text:
+                        continue
+                        
+                    parser.feed(text)
+                    if not early.done() and parser.has(*early_fields):
+                        early.set_result(dict(parser.fields))
+                    if parser.complete:
+                        break
+            
+            self.metrics.record_tokens(source, usage['prompt'], usage['response'])
+            if not parser.has('decision', 'confidence'):
+                raise Exception(f"{source} 스트림에 decision/confidence 필드 없음")
+            if not early.done():
+                early.set_result(dict(parser.fields))
+            return parser.fields
+            
+        except Exception as e:
+            if not early.done():
+                early.set_exception(e)
+                return {}
+            # 조기 결정 이후의 실패는 reasoning 누락으로만 처리
+            logger.warning(f"{source} 스트림 후속 수신 실패: {e}")
+            return parser.fields
+    
+    def _retry_parse_failure(self, parse_failures: int, attempt: int) -> bool:
+        """
+        파싱 실패 후 재요청 여부 (parse_retries 설정, 기본 0 = 즉시 실패 → 안전 모드)
+        
+        같은 프롬프트는 대개 같은 형식의 응답을 내므로 전송 오류와 달리 대기 없이 설정 횟수만 재요청한다.
+        """
+        return (parse_failures <= self.hybrid_config['parse_retries']
+                and attempt < self.hybrid_config['max_retries'] - 1)
+    
+    def _parse_analysis(self, provider: str, content: str) -> Dict[str, Any]:
+        """모델 응답 텍스트에서 결정 JSON 추출 (펜스/설명문 허용) 및 결과 집계"""
+        try:
+            analysis, outcome = parse_decision_response(content)
+        except AIResponseParseError:
+            self.metrics.record_parse(provider, PARSE_FAILED)
+            raise
+        self.metrics.record_parse(provider, outcome)
+        return analysis
+    
+    @staticmethod
+    def _update_stream_usage(event: Dict[str, Any], usage: Dict[str, int]):
+        """SSE 이벤트의 토큰 사용량 반영 (Claude: message_start/delta, Gemini: usageMetadata 누적값)"""
+        if event.get('type') == 'message_start':
+            usage['prompt'] = event.get('message', {}).get('usage', {}).get('input_tokens', usage['prompt'])
+        elif event.get('type') == 'message_delta':
+            usage['response'] = event.get('usage', {}).get('output_tokens', usage['response'])
+        elif 'usageMetadata' in event:
+            usage['prompt'] = event['usageMetadata'].get('promptTokenCount', usage['prompt'])
+            usage['response'] = event['usageMetadata'].get('candidatesTokenCount', usage['response'])
+    
+    @staticmethod
+    def _extract_claude_stream_text(event: Dict[str, Any]) -> str:
+        """Claude SSE 이벤트에서 텍스트 조각 추출"""
+        if event.get('type') == 'content_block_delta':
+            return event.get('delta', {}).get('text', '')
+        return ''
+    
+    @staticmethod
+    def _extract_gemini_stream_text(event: Dict[str, Any]) -> str:
+        """Gemini SSE 이벤트에서 텍스트 조각 추출"""
+        try:
+            return event['candidates'][0]['content']['parts'][0].get('text', '')
+        except (KeyError, IndexError):
+            return ''
+    
+    @staticmethod
+    def _merge_stream_fields(analysis: Dict[str, Any], stream_task: asyncio.Task):
+        """백그라운드 스트림 완료 필드를 분석 결과에 병합 (조기 확정 값은 유지)"""
+        if stream_task.cancelled() or stream_task.exception() is not None:
+            return
+        for key, value in stream_task.result().items():
+            analysis.setdefault(key, value)
+    
+    def _build_prompt(self, provider: str, context: MarketContext) -> str:
+        """
+        제공자별 프롬프트 생성 및 크기 기록
+        
+        verbose 모드에서 최대 크기를 넘으면 압축 프롬프트로 대체
+        """
+        max_tokens = self.hybrid_config['max_prompt_tokens']
+        if self.hybrid_config['prompt_mode'] == 'verbose':
+            if provider == 'claude':
+                prompt = self._build_claude_prompt(context)
+            else:
+                prompt = self._build_gemini_prompt(context)
+            tokens = estimate_tokens(prompt)
+            if not max_tokens or tokens <= max_tokens:
+                self.metrics.record_prompt(provider, tokens, len(prompt))
+                return prompt
+            logger.warning(f"{provider} 서술형 프롬프트 최대 크기 초과 ({tokens} > {max_tokens}) - 압축 프롬프트 사용")
+        
+        if provider == 'claude':
+            prompt, tokens = self.prompt_encoder.encode_claude(context)
+        else:
+            prompt, tokens = self.prompt_encoder.encode_gemini(context)
+        self.metrics.record_prompt(provider, tokens, len(prompt))
+        return prompt
+    
     def _build_claude_prompt(self, context: MarketContext) -> str:
         """Claude용 정성적 분석 프롬프트 생성"""
         return f"""당신은 한국 주식시장의 펀더멘털 분석 전문가입니다.
@@ -292,39 +949,22 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
         claude_weight = self.hybrid_config['claude_weight']
         gemini_weight = self.hybrid_config['gemini_weight']
         
-        weighted_confidence = (
-            claude_result['confidence'] * claude_weight +
-            gemini_result['confidence'] * gemini_weight
-        )
-        
         # 점수 융합
         fundamental_score = claude_result.get('fundamental_score', 0.5)
         technical_score = gemini_result.get('technical_score', 0.5)
         
         combined_score = fundamental_score * claude_weight + technical_score * gemini_weight
         
-        # 결정 융합 로직
+        # 결정 융합 로직 (일치시 그대로, 불일치시 합의 규칙 적용 - decision_fusion 참고)
         claude_decision = claude_result['decision']
         gemini_decision = gemini_result['decision']
+        fusion_rule, vote_threshold = rule_config(self.hybrid_config)
         
-        if claude_decision == gemini_decision:
-            # 일치하는 경우
-            final_decision = claude_decision
-        elif claude_decision == 'HOLD' or gemini_decision == 'HOLD':
-            # 하나라도 HOLD면 안전하게 HOLD
-            final_decision = 'HOLD'
-            weighted_confidence *= 0.7  # 신뢰도 감소
-        elif (claude_decision == 'BUY' and gemini_decision == 'SELL') or \
-             (claude_decision == 'SELL' and gemini_decision == 'BUY'):
-            # 상반된 경우 보수적으로 HOLD
-            final_decision = 'HOLD'
-            weighted_confidence *= 0.5  # 신뢰도 크게 감소
-        else:
-            # 기타 경우 높은 신뢰도 쪽 선택
-            if claude_result['confidence'] > gemini_result['confidence']:
-                final_decision = claude_decision
-            else:
-                final_decision = gemini_decision
+        final_decision, weighted_confidence = fuse_pair(
+            claude_decision, claude_result['confidence'],
+            gemini_decision, gemini_result['confidence'],
+            claude_weight, gemini_weight, fusion_rule, vote_threshold
+        )
         
         # 융합된 분석 내용
         combined_reasoning = f"""
@@ -362,12 +1002,81 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
                 "claude_model": self.claude_config['model'],
                 "gemini_model": self.gemini_config['model'],
                 "claude_weight": claude_weight,
-                "gemini_weight": gemini_weight
+                "gemini_weight": gemini_weight,
+                "fusion_rule": fusion_rule
+            }
+        )
+    
+    def _fuse_partial_decision(self, claude_result: Optional[Dict], gemini_result: Optional[Dict],
+                               context: MarketContext, reason: str = 'deadline') -> DecisionResult:
+        """
+        단일 분석으로 결정 생성 (신뢰도 하향)
+        
+        Args:
+            reason: 'deadline' (결정 예산 초과) 또는 'circuit_open' (서킷 차단)
+        """
+        if claude_result is not None:
+            source, missing, result = 'claude', 'gemini', claude_result
+            score = claude_result.get('fundamental_score', 0.5)
+        else:
+            source, missing, result = 'gemini', 'claude', gemini_result
+            score = gemini_result.get('technical_score', 0.5)
+        
+        # 단일 분석은 교차 검증이 없으므로 신뢰도 감소
+        partial_factor = self.hybrid_config['partial_confidence_factor']
+        degraded_confidence = result['confidence'] * partial_factor
+        
+        decision = result['decision']
+        if decision not in ("BUY", "SELL", "HOLD"):
+            decision = "HOLD"
+        
+        reason_label = "서킷 차단" if reason == 'circuit_open' else "결정 예산 초과"
+        reasoning = f"""
+⏱ {reason_label} - 부분 융합 ({source} 단독)
+{result.get('reasoning', 'N/A')}
+
+⚖️ 부분 융합 결론:
+- {source} 신뢰도: {result['confidence']:.2f}
+- 감쇠 계수: {partial_factor:.2f}
+- 최종 신뢰도: {degraded_confidence:.2f}
+"""
+        
+        return DecisionResult(
+            symbol=context.symbol,
+            decision=decision,
+            confidence=degraded_confidence,
+            confidence_level="LOW",
+            risk_level="HIGH",
+            reasoning=reasoning.strip(),
+            technical_signals={
+                "claude_decision": (claude_result or {}).get('decision'),
+                "gemini_decision": (gemini_result or {}).get('decision'),
+                "fundamental_score": (claude_result or {}).get('fundamental_score'),
+                "technical_score": (gemini_result or {}).get('technical_score')
+            },
+            sentiment_score=score,
+            position_size_recommendation=min(0.07, score * 0.1 * partial_factor),
+            metadata={
+                "engine": "Claude+Gemini Hybrid (partial)",
+                "claude_model": self.claude_config['model'],
+                "gemini_model": self.gemini_config['model'],
+                "partial_fusion": True,
+                "partial_reason": reason,
+                "deadline_exceeded": reason == 'deadline',
+                "completed_provider": source,
+                "missing_provider": missing,
+                "partial_confidence_factor": partial_factor
             }
         )
     
-    def _create_safe_decision(self, context: MarketContext, error_msg: str) -> DecisionResult:
-        """안전 모드 결정 생성 (API 실패시)"""
+    @staticmethod
+    def _create_safe_decision(context: MarketContext, error_msg: str, reason: str = 'error') -> DecisionResult:
+        """
+        안전 모드 결정 생성 (API 실패시, 결정 워커 풀 마감 초과시)
+        
+        Args:
+            reason: 'error' (호출 실패/차단) 또는 'deadline' (결정 예산 내 완료된 분석 없음)
+        """
         return DecisionResult(
             symbol=context.symbol,
             decision="HOLD",
@@ -378,27 +1087,57 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
             technical_signals={"error": True},
             sentiment_score=0.0,
             position_size_recommendation=0.0,
-            metadata={"engine": "Safe Mode", "error": error_msg}
+            metadata={"engine": SAFE_MODE_ENGINE, "error": error_msg, "safe_reason": reason}
         )
     
-    def _record_decision(self, decision: DecisionResult, claude_result: Dict, gemini_result: Dict):
-        """결정 히스토리 기록"""
+    @staticmethod
+    def is_safe_decision(decision: DecisionResult) -> bool:
+        """AI 분석 없이 만든 안전 모드 HOLD인지 확인"""
+        return (decision.metadata or {}).get('engine') == SAFE_MODE_ENGINE
+    
+    def _record_decision(self, decision: DecisionResult, claude_result: Optional[Dict],
+                         gemini_result: Optional[Dict]):
+        """결정 히스토리 기록 (부분 융합시 누락된 분석은 None)"""
+        claude_result = claude_result or {}
+        gemini_result = gemini_result or {}
         record = {
             "timestamp": datetime.now().isoformat(),
             "symbol": decision.symbol,
             "decision": decision.decision,
             "confidence": decision.confidence,
-            "claude_decision": claude_result['decision'],
-            "claude_confidence": claude_result['confidence'],
-            "gemini_decision": gemini_result['decision'],
-            "gemini_confidence": gemini_result['confidence']
+            "claude_decision": claude_result.get('decision'),
+            "claude_confidence": claude_result.get('confidence'),
+            "gemini_decision": gemini_result.get('decision'),
+            "gemini_confidence": gemini_result.get('confidence'),
+            "partial_fusion": bool((decision.metadata or {}).get('partial_fusion', False)),
+            "claude_reasoning": claude_result.get('reasoning'),
+            "gemini_reasoning": gemini_result.get('reasoning')
         }
         
         self.decision_history.append(record)
+        self.total_decisions += 1
+        
+        # 스트리밍 응답은 reasoning 수신 완료 후 기록 보완 및 디스크 기록
+        pending = []
+        for source, result in (('claude', claude_result), ('gemini', gemini_result)):
+            stream_task = self._stream_tasks.get(result.get('stream_id'))
+            if stream_task is not None and not stream_task.done():
+                pending.append((f"{source}_reasoning", result, stream_task))
+        
+        if not pending:
+            self.decision_log.append(record)
+            return
         
-        # 최대 100개 기록만 유지
-        if len(self.decision_history) > 100:
-            self.decision_history = self.decision_history[-100:]
+        remaining = {'count': len(pending)}
+        
+        def on_stream_done(_task, key, result):
+            record[key] = result.get('reasoning')
+            remaining['count'] -= 1
+            if remaining['count'] == 0:
+                self.decision_log.append(record)
+        
+        for key, result, stream_task in pending:
+            stream_task.add_done_callback(lambda t, k=key, r=result: on_stream_done(t, k, r))
     
     def get_engine_info(self) -> Dict[str, Any]:
         """엔진 정보 반환"""
@@ -413,12 +1152,41 @@ class ClaudeGeminiHybridEngine(GPTDecisionEngine):
             "hybrid_enabled": availability['hybrid'],
             "claude_weight": self.hybrid_config['claude_weight'],
             "gemini_weight": self.hybrid_config['gemini_weight'],
-            "decision_count": len(self.decision_history)
+            "decision_budget_seconds": self.hybrid_config['decision_budget_seconds'],
+            "config_version": self.config_version,
+            "readiness": self.readiness,
+            "prompt_mode": self.hybrid_config['prompt_mode'],
+            "max_prompt_tokens": self.hybrid_config['max_prompt_tokens'],
+            "trimmed_prompts": self.prompt_encoder.trimmed_prompts,
+            "decision_count": len(self.decision_history),
+            "total_decisions": self.total_decisions,
+            "decision_log_dir": str(self.decision_log.log_dir),
+            "metrics": self.metrics.snapshot(),
+            "circuit_breakers": {p: b.snapshot() for p, b in self.circuit_breakers.items()},
+            "prefetch_enabled": self.hybrid_config['prefetch_enabled'],
+            "prefetched_pending": len(self.decision_cache),
+            "stale_prefetches": self.stale_prefetches
         }
     
+    def export_metrics_snapshot(self, path: Optional[Path] = None) -> Path:
+        """
+        계측 스냅샷 파일 저장
+        
+        Args:
+            path: 저장 경로 (None이면 logs/ai_metrics/metrics_YYYYMMDD_HHMMSS.json)
+            
+        Returns:
+            저장된 파일 경로
+        """
+        if path is None:
+            path = METRICS_DIR / f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        saved = self.metrics.export(path)
+        clean_log(f"[HYBRID_ENGINE] 계측 스냅샷 저장: {saved}", "INFO")
+        return saved
+    
     def get_decision_history(self) -> List[Dict[str, Any]]:
         """결정 히스토리 반환"""
-        return self.decision_history.copy()
+        return list(self.decision_history)
     
     def validate_decision(self, decision: DecisionResult) -> bool:
         """결정 유효성 검증"""
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Claude / Gemini 분석 결과 융합 규칙
+- fuse_pair(): 결정 1건 융합 (하이브리드 엔진 실시간 경로)
+- fuse_batch(): 제공자 결과 배열 일괄 융합 (오프라인 가중치 보정용, numpy 벡터 연산)
+- 두 함수는 같은 규칙 정의(FUSION_RULES)를 공유하므로 보정 결과가 실시간 결정과 일치
+
+**합의 규칙:**
+- conservative: 불일치시 항상 HOLD (기존 동작)
+- vote_on_hold: 한쪽만 HOLD이면 가중 투표로 결정, BUY/SELL 상반시 HOLD
+- vote_all: 모든 불일치를 가중 투표로 결정
+
+가중 투표: v = (w_c·conf_c·s_c + w_g·conf_g·s_g) / (w_c + w_g), s = BUY +1 / SELL -1 / HOLD 0
+|v| ≥ vote_threshold 이면 v 부호 방향, 아니면 HOLD
+"""
+
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+
+DECISION_CODES = {"BUY": 1, "HOLD": 0, "SELL": -1}
+CODE_DECISIONS = {code: decision for decision, code in DECISION_CODES.items()}
+
+HOLD_PENALTY = 0.7       # 한쪽 HOLD 불일치시 신뢰도 감소
+CONFLICT_PENALTY = 0.5   # BUY/SELL 상반시 신뢰도 감소
+
+FUSION_RULES = ("conservative", "vote_on_hold", "vote_all")
+DEFAULT_RULE = "conservative"
+DEFAULT_VOTE_THRESHOLD = 0.35
+
+
+def _check_rule(rule: str):
+    if rule not in FUSION_RULES:
+        raise ValueError(f"알 수 없는 융합 규칙: {rule} (허용: {', '.join(FUSION_RULES)})")
+
+
+def fuse_pair(claude_decision: str, claude_confidence: float,
+              gemini_decision: str, gemini_confidence: float,
+              claude_weight: float, gemini_weight: float,
+              rule: str = DEFAULT_RULE, vote_threshold: float = DEFAULT_VOTE_THRESHOLD) -> Tuple[str, float]:
+    """
+    결정 1건 융합
+
+    Returns:
+        (최종 결정, 가중 신뢰도)
+    """
+    _check_rule(rule)
+    weighted_confidence = claude_confidence * claude_weight + gemini_confidence * gemini_weight
+
+    if claude_decision == gemini_decision:
+        return claude_decision, weighted_confidence
+
+    conflict = 'HOLD' not in (claude_decision, gemini_decision)
+    penalty = CONFLICT_PENALTY if conflict else HOLD_PENALTY
+    use_vote = rule == "vote_all" or (rule == "vote_on_hold" and not conflict)
+
+    final_decision = 'HOLD'
+    if use_vote:
+        total_weight = claude_weight + gemini_weight
+        vote = (claude_weight * claude_confidence * DECISION_CODES.get(claude_decision, 0) +
+                gemini_weight * gemini_confidence * DECISION_CODES.get(gemini_decision, 0))
+        vote = vote / total_weight if total_weight else 0.0
+        if vote != 0 and abs(vote) >= vote_threshold:
+            final_decision = 'BUY' if vote > 0 else 'SELL'
+
+    return final_decision, weighted_confidence * penalty
+
+
+def fuse_batch(claude_codes: np.ndarray, claude_confidence: np.ndarray,
+               gemini_codes: np.ndarray, gemini_confidence: np.ndarray,
+               claude_weight: float, gemini_weight: float,
+               rule: str = DEFAULT_RULE, vote_threshold: float = DEFAULT_VOTE_THRESHOLD,
+               fundamental_scores: Optional[np.ndarray] = None,
+               technical_scores: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    제공자 결과 배열 일괄 융합 (fuse_pair와 동일 규칙)
+
+    Args:
+        claude_codes / gemini_codes: 결정 코드 배열 (DECISION_CODES, encode_decisions() 참고)
+        claude_confidence / gemini_confidence: 신뢰도 배열
+        fundamental_scores / technical_scores: 점수 배열 (없으면 0.5)
+
+    Returns:
+        {"decision": 결정 코드, "confidence": 가중 신뢰도, "combined_score": 종합 점수}
+    """
+    _check_rule(rule)
+    claude_codes = np.asarray(claude_codes, dtype=np.int8)
+    gemini_codes = np.asarray(gemini_codes, dtype=np.int8)
+    claude_confidence = np.asarray(claude_confidence, dtype=np.float64)
+    gemini_confidence = np.asarray(gemini_confidence, dtype=np.float64)
+
+    weighted_confidence = claude_confidence * claude_weight + gemini_confidence * gemini_weight
+
+    agree = claude_codes == gemini_codes
+    conflict = (claude_codes * gemini_codes) < 0
+    one_hold = ~agree & ~conflict
+
+    decision = np.where(agree, claude_codes, 0).astype(np.int8)
+    confidence = weighted_confidence.copy()
+    confidence[one_hold] *= HOLD_PENALTY
+    confidence[conflict] *= CONFLICT_PENALTY
+
+    if rule != "conservative":
+        total_weight = claude_weight + gemini_weight
+        vote = (claude_weight * claude_confidence * claude_codes +
+                gemini_weight * gemini_confidence * gemini_codes)
+        vote = vote / total_weight if total_weight else np.zeros_like(vote)
+        voted = np.where(np.abs(vote) >= vote_threshold, np.sign(vote), 0).astype(np.int8)
+        use_vote = one_hold if rule == "vote_on_hold" else ~agree
+        decision = np.where(use_vote, voted, decision)
+
+    n = len(claude_codes)
+    fundamental = np.full(n, 0.5) if fundamental_scores is None else np.asarray(fundamental_scores, dtype=np.float64)
+    technical = np.full(n, 0.5) if technical_scores is None else np.asarray(technical_scores, dtype=np.float64)
+
+    return {
+        "decision": decision,
+        "confidence": confidence,
+        "combined_score": fundamental * claude_weight + technical * gemini_weight
+    }
+
+
+def encode_decisions(decisions) -> np.ndarray:
+    """결정 문자열 시퀀스 → 코드 배열 (알 수 없는 값은 HOLD)"""
+    return np.fromiter((DECISION_CODES.get(d, 0) for d in decisions), dtype=np.int8)
+
+
+def rule_config(hybrid_config: Dict[str, Any]) -> Tuple[str, float]:
+    """하이브리드 설정에서 (융합 규칙, 투표 임계값) 조회"""
+    return (hybrid_config.get('fusion_rule', DEFAULT_RULE),
+            hybrid_config.get('fusion_vote_threshold', DEFAULT_VOTE_THRESHOLD))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+AI 매매 결정 영구 로그 (append-only JSONL)
+- 일자별 파일 + 크기 초과시 순번 회전: decisions_YYYYMMDD_NNN.jsonl
+- 기록 스트림 지정시 전용 파일: decisions_YYYYMMDD_<스트림>_NNN.jsonl
+  (크기/회전은 프로세스별로 추적하므로 여러 프로세스는 각자 다른 스트림 사용, decision_worker_pool)
+- 한 줄 = 결정 1건 (compact JSON)
+- 사후 분석은 iter_records()로 한 줄씩 스트리밍 (전체 로드 없음, 모든 스트림 포함)
+- 스레드 안전 (같은 프로세스의 여러 엔진이 하나의 인스턴스를 공유 가능)
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024  # 파일당 16MB
+DEFAULT_RETENTION_DAYS = 90
+
+
+class DecisionLog:
+    """결정 기록 append-only 로그"""
+
+    FILE_PREFIX = "decisions_"
+
+    def __init__(self, log_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES,
+                 retention_days: int = DEFAULT_RETENTION_DAYS, stream: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            log_dir: 로그 디렉토리
+            max_bytes: 파일당 최대 크기 (초과시 다음 순번 파일로 회전)
+            retention_days: 보관 일수 (0이면 삭제하지 않음)
+            stream: 기록 스트림 이름 (영숫자, 프로세스마다 다르게 지정, None이면 기본 파일)
+        """
+        if stream is not None and not stream.isalnum():
+            raise ValueError(f"결정 로그 스트림 이름은 영숫자만 허용: {stream!r}")
+        self.log_dir = Path(log_dir)
+        self.max_bytes = max_bytes
+        self.retention_days = retention_days
+        self.stream = stream
+
+        self._file = None
+        self._file_path: Optional[Path] = None
+        self._file_date: Optional[date] = None
+        self._file_size = 0
+        self._lock = threading.Lock()
+
+    def append(self, record: Dict[str, Any]):
+        """결정 기록 1건 추가"""
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str) + "\n"
+        data = line.encode('utf-8')
+
+        with self._lock:
+            try:
+                self._ensure_file(len(data))
+                self._file.write(data)
+                self._file.flush()
+                self._file_size += len(data)
+            except OSError as e:
+                logger.error(f"결정 로그 기록 실패: {e}")
+
+    def _ensure_file(self, incoming: int):
+        """현재 기록 파일 준비 (일자 변경/크기 초과시 회전)"""
+        today = date.today()
+        if (self._file is not None and self._file_date == today
+                and self._file_size + incoming <= self.max_bytes):
+            return
+
+        self._close_file()
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+
+        if self._file_date != today:
+            self._cleanup_expired(today)
+
+        seq = self._last_sequence(today)
+        path = self._path_for(today, seq)
+        if path.exists() and path.stat().st_size + incoming > self.max_bytes:
+            seq += 1
+            path = self._path_for(today, seq)
+
+        self._file = open(path, 'ab')
+        self._file_path = path
+        self._file_date = today
+        self._file_size = path.stat().st_size
+
+    def _path_for(self, day: date, seq: int) -> Path:
+        stream = f"_{self.stream}" if self.stream else ""
+        return self.log_dir / f"{self.FILE_PREFIX}{day.strftime('%Y%m%d')}{stream}_{seq:03d}.jsonl"
+
+    def _last_sequence(self, day: date) -> int:
+        """이 스트림의 해당 일자 마지막 순번 (다른 스트림 파일은 제외)"""
+        expected = [day.strftime('%Y%m%d')] + ([self.stream] if self.stream else [])
+        seqs = []
+        for path in self.log_dir.glob(f"{self.FILE_PREFIX}{expected[0]}_*.jsonl"):
+            parts = path.stem[len(self.FILE_PREFIX):].split('_')
+            if parts[:-1] == expected and parts[-1].isdigit():
+                seqs.append(int(parts[-1]))
+        return max(seqs) if seqs else 1
+
+    def _cleanup_expired(self, today: date):
+        """보관 기간이 지난 로그 파일 삭제"""
+        if self.retention_days <= 0:
+            return
+        cutoff = today - timedelta(days=self.retention_days)
+        for path in self.log_files():
+            if self._file_day(path) < cutoff:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass  # 다른 프로세스가 먼저 삭제
+                except OSError as e:
+                    logger.warning(f"만료 로그 삭제 실패 {path.name}: {e}")
+
+    def _file_day(self, path: Path) -> date:
+        return datetime.strptime(path.stem[len(self.FILE_PREFIX):].split('_')[0], '%Y%m%d').date()
+
+    def log_files(self, since: Optional[date] = None, until: Optional[date] = None) -> List[Path]:
+        """기간 내 로그 파일 목록 (시간순)"""
+        if not self.log_dir.exists():
+            return []
+        files = []
+        for path in sorted(self.log_dir.glob(f"{self.FILE_PREFIX}*.jsonl")):
+            day = self._file_day(path)
+            if since and day < since:
+                continue
+            if until and day > until:
+                continue
+            files.append(path)
+        return files
+
+    def iter_records(self, since: Optional[date] = None, until: Optional[date] = None,
+                     symbol: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        기록 스트리밍 조회 (파일을 한 줄씩 읽음)
+
+        Args:
+            since: 시작 일자 (포함)
+            until: 종료 일자 (포함)
+            symbol: 종목코드 필터
+        """
+        for path in self.log_files(since, until):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 비정상 종료로 잘린 마지막 줄 무시
+                        continue
+                    if symbol and record.get('symbol') != symbol:
+                        continue
+                    yield record
+
+    def close(self):
+        """열린 파일 닫기"""
+        with self._lock:
+            self._close_file()
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            finally:
+                self._file = None
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+하이브리드 엔진 멀티프로세스 결정 워커 풀
+- 매매 프로세스는 결정 요청을 로컬 큐에 넣고 결과만 기다림 (주문 처리 이벤트 루프 부담 최소화)
+- 워커 프로세스 N개가 공유 요청 큐에서 꺼내 처리 (가용 워커가 가져가는 방식으로 자동 부하 분산)
+- 워커마다 전용 ClaudeGeminiHybridEngine + 공용 HTTP 세션 (engine_registry)
+- 워커마다 전용 결정 로그 스트림 (decisions_YYYYMMDD_w<번호>_NNN.jsonl, 회전은 프로세스별로 추적)
+- 요청마다 절대 마감 시각을 함께 전달: 워커는 남은 시간만큼만 계산하고, 초과분은 안전 모드 HOLD
+- 워커는 시작 성공/실패와 요청 수령("taken")을 결과 큐로 알림
+- 워커 프로세스 종료는 sentinel로 즉시 감지: 그 워커가 수령한 요청은 바로 안전 모드 HOLD,
+  살아 있는 워커가 없으면 대기 중 요청과 이후 요청도 즉시 안전 모드 HOLD로 처리
+
+사용 예:
+    pool = DecisionWorkerPool(workers=4)
+    pool.start()
+    decision = await pool.make_decision(context)   # 엔진과 같은 인터페이스
+    ...
+    await pool.close()
+"""
+
+import time
+import asyncio
+import logging
+import threading
+import itertools
+import multiprocessing as mp
+from multiprocessing import connection as mp_connection
+from typing import Dict, Any, Optional, Set, Tuple
+
+from .gpt_interfaces import MarketContext, DecisionResult
+from .ai_api_manager import get_ai_api_manager
+from .claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine
+from .clean_console_logger import clean_log
+
+logger = logging.getLogger(__name__)
+
+_STOP = None  # 종료 신호
+
+
+def _worker_main(worker_id: int, request_queue, result_queue, concurrency: int, warm_up: bool):
+    """워커 프로세스 진입점"""
+    try:
+        asyncio.run(_worker_loop(worker_id, request_queue, result_queue, concurrency, warm_up))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        result_queue.put(("failed", worker_id, f"{type(e).__name__}: {e}"))
+        raise
+
+
+async def _worker_loop(worker_id: int, request_queue, result_queue, concurrency: int, warm_up: bool):
+    """요청 수신 → 마감 시각 내 결정 → 결과 반환"""
+    try:
+        from .engine_registry import get_engine_registry, get_hybrid_engine, close_hybrid_engine
+
+        get_engine_registry(log_stream=f"w{worker_id}")  # 워커 전용 결정 로그
+        engine = get_hybrid_engine()
+        readiness = await engine.warm_up() if warm_up else {}
+    except Exception as e:
+        logger.exception(f"결정 워커 {worker_id} 시작 실패")
+        result_queue.put(("failed", worker_id, f"{type(e).__name__}: {e}"))
+        return
+    result_queue.put(("ready", worker_id, readiness))
+
+    loop = asyncio.get_running_loop()
+
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = set()
+
+    async def handle(request_id: int, context: MarketContext, deadline: float):
+        async with semaphore:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                result_queue.put(("expired", request_id, worker_id, None))
+                return
+            try:
+                decision = await asyncio.wait_for(engine.make_decision(context), timeout=remaining)
+                result_queue.put(("ok", request_id, worker_id, decision))
+            except asyncio.TimeoutError:
+                result_queue.put(("expired", request_id, worker_id, None))
+            except Exception as e:
+                result_queue.put(("error", request_id, worker_id, str(e)))
+
+    while True:
+        item = await loop.run_in_executor(None, request_queue.get)
+        if item is _STOP:
+            break
+        request_id, context, deadline = item
+        result_queue.put(("taken", request_id, worker_id))  # 이 워커가 종료되면 부모가 즉시 실패 처리
+        task = asyncio.ensure_future(handle(request_id, context, deadline))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    await close_hybrid_engine()
+
+
+class DecisionWorkerPool:
+    """결정 워커 프로세스 풀 (ClaudeGeminiHybridEngine.make_decision과 같은 호출 방식)"""
+
+    def __init__(self, workers: Optional[int] = None, concurrency: Optional[int] = None,
+                 deadline_seconds: Optional[float] = None, warm_up: bool = True):
+        """
+        초기화
+
+        Args:
+            workers: 워커 프로세스 수 (None이면 Register_Key.md decision_workers 설정)
+            concurrency: 워커당 동시 결정 수 (None이면 worker_concurrency 설정)
+            deadline_seconds: 기본 요청 마감 시간 (None이면 worker_deadline_seconds 설정)
+            warm_up: 워커 시작시 제공자 연결 예열 여부
+        """
+        hybrid_config = get_ai_api_manager().get_hybrid_config()
+        self.workers = workers or hybrid_config['decision_workers']
+        self.concurrency = concurrency or hybrid_config['worker_concurrency']
+        self.deadline_seconds = deadline_seconds or hybrid_config['worker_deadline_seconds']
+        self.warm_up = warm_up
+
+        # spawn: 부모의 이벤트 루프/세션/스레드 상태를 물려받지 않음
+        self._ctx = mp.get_context('spawn')
+        self._request_queue = None
+        self._result_queue = None
+        self._processes = []
+        self._reader: Optional[threading.Thread] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self._pending_lock = threading.Lock()
+        self._assigned: Dict[int, Set[int]] = {}  # 워커 → 수령한 요청 (결과 수신 스레드 전용)
+        self._closing = False
+        self._broken: Optional[str] = None  # 사용 가능한 워커가 없을 때 사유
+
+        self.readiness: Dict[int, Dict[str, Any]] = {}
+        self.failed: Dict[int, str] = {}  # 시작 실패/비정상 종료 워커 → 사유
+        self.stats = {"submitted": 0, "completed": 0, "expired": 0, "errors": 0}
+        self.worker_completed: Dict[int, int] = {}
+
+    def start(self):
+        """워커 프로세스 및 결과 수신 스레드 시작"""
+        if self._processes:
+            return
+        self._request_queue = self._ctx.Queue()
+        self._result_queue = self._ctx.Queue()
+        self._closing = False
+        self._broken = None
+        self._assigned = {}
+        self.failed = {}
+
+        for worker_id in range(self.workers):
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(worker_id, self._request_queue, self._result_queue, self.concurrency, self.warm_up),
+                name=f"decision-worker-{worker_id}",
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+
+        self._reader = threading.Thread(target=self._read_results, name="decision-pool-reader", daemon=True)
+        self._reader.start()
+        self._watcher = threading.Thread(target=self._watch_workers, name="decision-pool-watcher", daemon=True)
+        self._watcher.start()
+        clean_log(f"[DECISION_POOL] 워커 {self.workers}개 시작 (워커당 동시 {self.concurrency}건)", "SUCCESS")
+
+    def _read_results(self):
+        """결과 큐 수신 → 요청한 이벤트 루프의 Future 완료"""
+        while True:
+            message = self._result_queue.get()
+            if message is _STOP:
+                return
+
+            kind = message[0]
+            if kind == "ready":
+                _, worker_id, readiness = message
+                self.readiness[worker_id] = readiness
+                continue
+            if kind == "taken":
+                _, request_id, worker_id = message
+                self._assigned.setdefault(worker_id, set()).add(request_id)
+                continue
+            if kind == "failed":
+                _, worker_id, reason = message
+                self._worker_failed(worker_id, reason)
+                continue
+            if kind == "exited":
+                _, worker_id, exitcode = message
+                self._worker_failed(worker_id, f"프로세스 종료 (exitcode {exitcode})")
+                continue
+
+            status, request_id, worker_id, payload = message
+            self._assigned.get(worker_id, set()).discard(request_id)
+            with self._pending_lock:
+                entry = self._pending.pop(request_id, None)
+            if entry is None:
+                continue  # 호출측에서 이미 마감 처리됨
+
+            self.worker_completed[worker_id] = self.worker_completed.get(worker_id, 0) + 1
+            loop, future = entry
+            loop.call_soon_threadsafe(self._resolve, future, status, payload)
+
+    def _watch_workers(self):
+        """
+        워커 프로세스 종료 즉시 감지 (sentinel 대기)
+        
+        종료 통지는 결과 큐로 보내므로, 워커가 종료 전에 보낸 결과가 먼저 처리된 뒤 실패로 기록된다
+        """
+        sentinels = {process.sentinel: (worker_id, process) for worker_id, process in enumerate(self._processes)}
+        while sentinels:
+            for sentinel in mp_connection.wait(list(sentinels)):
+                worker_id, process = sentinels.pop(sentinel)
+                if not self._closing:
+                    process.join(1.0)  # sentinel은 종료 직후 신호되므로 회수까지 잠깐 대기 (exitcode 수집)
+                    self._result_queue.put(("exited", worker_id, process.exitcode))
+
+    def _worker_failed(self, worker_id: int, reason: str):
+        """워커 실패 기록 및 그 워커가 수령한 요청 즉시 실패 처리 (남은 워커가 없으면 대기 중 요청 전부)"""
+        if worker_id in self.failed:
+            return
+        self.failed[worker_id] = reason
+        self.readiness.pop(worker_id, None)
+        assigned = self._assigned.pop(worker_id, set())
+        clean_log(f"[DECISION_POOL] 워커 {worker_id} 사용 불가 - {reason}", "ERROR")
+
+        with self._pending_lock:
+            if len(self.failed) >= len(self._processes):
+                self._broken = f"사용 가능한 결정 워커 없음 ({reason})"
+                assigned = set(self._pending)
+            # 수령 통지 전에 종료된 요청은 호출측 마감(budget + 1초)으로 처리됨
+            failed = [self._pending.pop(request_id) for request_id in assigned if request_id in self._pending]
+        error = self._broken or f"결정 워커 {worker_id} 종료 ({reason})"
+        for loop, future in failed:
+            loop.call_soon_threadsafe(self._resolve, future, "error", error)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, status: str, payload):
+        if not future.done():
+            future.set_result((status, payload))
+
+    async def make_decision(self, context: MarketContext, trading_rules: Dict[str, Any] = None,
+                            deadline_seconds: Optional[float] = None) -> DecisionResult:
+        """
+        워커 풀에 결정 요청
+
+        Args:
+            context: 시장 컨텍스트
+            trading_rules: 매매 규칙 (엔진 인터페이스 호환용)
+            deadline_seconds: 요청 마감 시간 (None이면 풀 기본값)
+
+        Returns:
+            매매 결정 (마감 초과/워커 오류시 안전 모드 HOLD)
+        """
+        if not self._processes:
+            raise RuntimeError("결정 워커 풀이 시작되지 않았습니다 (start() 호출 필요)")
+
+        budget = deadline_seconds or self.deadline_seconds
+        request_id = next(self._ids)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._pending_lock:
+            broken = self._broken
+            if broken is None:
+                self._pending[request_id] = (loop, future)
+        if broken is not None:
+            self.stats["errors"] += 1
+            return ClaudeGeminiHybridEngine._create_safe_decision(context, f"결정 워커 오류: {broken}")
+
+        self.stats["submitted"] += 1
+        self._request_queue.put((request_id, context, time.time() + budget))
+
+        try:
+            # 워커가 마감 시각 기준으로 응답하므로 큐 전달 지연만큼 여유를 둠
+            status, payload = await asyncio.wait_for(future, timeout=budget + 1.0)
+        except asyncio.TimeoutError:
+            status, payload = "expired", None
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+        if status == "ok":
+            self.stats["completed"] += 1
+            return payload
+        if status == "expired":
+            self.stats["expired"] += 1
+            return ClaudeGeminiHybridEngine._create_safe_decision(context, f"결정 마감 {budget:.1f}초 초과", 'deadline')
+        self.stats["errors"] += 1
+        return ClaudeGeminiHybridEngine._create_safe_decision(context, f"결정 워커 오류: {payload}")
+
+    def get_report(self) -> Dict[str, Any]:
+        """워커 풀 상태"""
+        with self._pending_lock:
+            in_flight = len(self._pending)
+        return {
+            "workers": self.workers,
+            "alive": sum(1 for p in self._processes if p.is_alive()),
+            "concurrency_per_worker": self.concurrency,
+            "deadline_seconds": self.deadline_seconds,
+            "in_flight": in_flight,
+            "broken": self._broken,
+            "failed": dict(self.failed),
+            "stats": dict(self.stats),
+            "worker_completed": dict(self.worker_completed),
+            "readiness": dict(self.readiness)
+        }
+
+    async def close(self, timeout: float = 10.0):
+        """진행 중 요청 완료 후 워커 종료"""
+        if not self._processes:
+            return
+        self._closing = True
+        for _ in self._processes:
+            self._request_queue.put(_STOP)
+
+        loop = asyncio.get_running_loop()
+        for process in self._processes:
+            await loop.run_in_executor(None, process.join, timeout)
+            if process.is_alive():
+                logger.warning(f"{process.name} 종료 지연 - 강제 종료")
+                process.terminate()
+        await loop.run_in_executor(None, self._watcher.join, timeout)
+
+        self._result_queue.put(_STOP)
+        await loop.run_in_executor(None, self._reader.join, timeout)
+        self._processes = []
+        clean_log(f"[DECISION_POOL] 워커 종료 - {self.stats}", "INFO")
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+작은 파일 묶음 백업 (Google Drive 백업 스크립트 공용)
+- 작은 파일(session_*.json, *_5min.csv, 로그 등)을 디렉토리별 tar 묶음으로 모아 업로드
+  → 파일당 API 호출 대신 묶음당 1회
+- 묶음 형식: 일반 tar, 구성원마다 개별 gzip 압축 ("<경로>.gz")
+  → 표준 도구로 풀 수 있고, 색인의 (오프셋, 길이)로 파일 하나만 범위 다운로드해 복원 가능
+- 묶음은 결정적으로 생성 (정렬 순서, 고정 헤더, gzip mtime=0): 내용이 같으면 바이트도 같아
+  DriveSyncEngine 증분 비교에서 변경 없음으로 처리됨
+- 디렉토리 구성원 (크기, mtime)이 이전 색인과 같으면 묶음 재생성 생략
+  (색인도 결정적 → 변경이 없으면 업로드 0건)
+
+원격 구조:
+    <백업 루트>/_bundles/<디렉토리>__000.tar ...
+    <백업 루트>/_bundles/bundle_index.json      (경로 → 묶음, 오프셋, 길이, MD5)
+"""
+
+import os
+import io
+import json
+import gzip
+import hashlib
+import tarfile
+from pathlib import PurePosixPath
+from typing import Dict, Any, Optional, List, Iterable, Tuple, Union
+
+from .drive_sync_engine import MANIFEST_DIR, BUNDLE_FOLDER_NAME, to_manifest_path, escape_query_value
+from .file_walker import FileEntry, entry_info
+
+SMALL_FILE_SIZE = 256 * 1024  # 미만이면 묶음 대상
+BUNDLE_TARGET_SIZE = 16 * 1024 * 1024  # 묶음당 원본 합계 목표 크기
+COMPRESS_LEVEL = 6
+BUNDLE_STAGING_DIR = os.path.join(MANIFEST_DIR, "bundles")
+INDEX_NAME = "bundle_index.json"
+INDEX_VERSION = 1
+ROOT_DIR_NAME = "_root"
+
+
+def split_small_files(files: Iterable[Union[FileEntry, Tuple[str, str]]],
+                      small_file_size: int = SMALL_FILE_SIZE) -> Tuple[list, list]:
+    """FileEntry 또는 (로컬 경로, 상대 경로) 목록 → (묶음 대상, 개별 업로드 대상)"""
+    small, large = [], []
+    for file in files:
+        try:
+            size = entry_info(file)[2]
+        except OSError:
+            continue
+        (small if size < small_file_size else large).append(file)
+    return small, large
+
+
+def bundle_prefix(relative_dir: str) -> str:
+    """디렉토리 → 묶음 파일명 접두어 (평면 구조)"""
+    return ROOT_DIR_NAME if relative_dir in ('', '.') else relative_dir.replace('/', '__')
+
+
+class BundleBuilder:
+    """작은 파일 → 디렉토리별 tar 묶음 + 색인 (로컬 스테이징 디렉토리)"""
+
+    def __init__(self, staging_dir: str = BUNDLE_STAGING_DIR, target_size: int = BUNDLE_TARGET_SIZE,
+                 compress_level: int = COMPRESS_LEVEL):
+        """
+        초기화
+
+        Args:
+            staging_dir: 묶음/색인 생성 위치 (DriveSyncEngine 소스 디렉토리로 사용)
+            target_size: 묶음당 원본 합계 목표 크기
+            compress_level: gzip 압축 수준
+        """
+        self.staging_dir = staging_dir
+        self.target_size = target_size
+        self.compress_level = compress_level
+        self.index_path = os.path.join(staging_dir, INDEX_NAME)
+        self.stats = {"directories": 0, "rebuilt_directories": 0, "bundles": 0,
+                      "files": 0, "raw_bytes": 0, "packed_bytes": 0}
+
+    def build(self, files: Iterable[Union[FileEntry, Tuple[str, str]]]) -> Dict[str, Any]:
+        """
+        묶음 생성/갱신 후 색인 저장
+
+        Args:
+            files: 묶음 대상 FileEntry 또는 (로컬 경로, 소스 기준 상대 경로)
+
+        Returns:
+            색인 {'bundles': {묶음: {'dir', 'members': {경로: [오프셋, 길이, 크기, MD5, mtime_ns]}}},
+                  'files': {경로: 묶음}}
+        """
+        os.makedirs(self.staging_dir, exist_ok=True)
+        previous = self._load_index()
+
+        # 디렉토리 → [(로컬 경로, 키, 크기, mtime_ns)]
+        groups: Dict[str, List[Tuple[str, str, int, int]]] = {}
+        for file in files:
+            try:
+                local_path, relative_path, size, mtime_ns = entry_info(file)
+            except OSError:
+                continue
+            key = to_manifest_path(relative_path)
+            groups.setdefault(str(PurePosixPath(key).parent), []).append((local_path, key, size, mtime_ns))
+
+        bundles: Dict[str, Dict[str, Any]] = {}
+        for relative_dir in sorted(groups):
+            members = sorted(groups[relative_dir], key=lambda m: m[1])
+            reused = self._reuse(previous, relative_dir, members)
+            bundles.update(reused if reused is not None else self._write_directory(relative_dir, members))
+            self.stats["directories"] += 1
+            self.stats["files"] += len(members)
+
+        # 사라진 디렉토리/줄어든 묶음 파일 정리
+        for name in os.listdir(self.staging_dir):
+            if name.endswith('.tar') and name not in bundles:
+                os.remove(os.path.join(self.staging_dir, name))
+
+        index = {
+            'version': INDEX_VERSION,
+            'bundles': bundles,
+            'files': {path: name for name, bundle in bundles.items() for path in bundle['members']}
+        }
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+        os.replace(temp_path, self.index_path)
+
+        self.stats["bundles"] = len(bundles)
+        return index
+
+    def _load_index(self) -> Dict[str, Any]:
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if index.get('version') == INDEX_VERSION else {}
+        except Exception:
+            return {}
+
+    def _reuse(self, previous: Dict[str, Any], relative_dir: str,
+               members: List[Tuple[str, str, int, int]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """디렉토리 구성원 (경로, 크기, mtime)이 이전 색인과 같고 묶음 파일이 있으면 재사용"""
+        old = {name: bundle for name, bundle in previous.get('bundles', {}).items()
+               if bundle.get('dir') == relative_dir}
+        if not old:
+            return None
+        recorded = {path: (entry[2], entry[4]) for bundle in old.values() for path, entry in bundle['members'].items()}
+        current = {key: (size, mtime_ns) for _, key, size, mtime_ns in members}
+        if recorded != current:
+            return None
+        if not all(os.path.exists(os.path.join(self.staging_dir, name)) for name in old):
+            return None
+        return old
+
+    def _write_directory(self, relative_dir: str,
+                         members: List[Tuple[str, str, int, int]]) -> Dict[str, Dict[str, Any]]:
+        """디렉토리 구성원을 목표 크기 단위 묶음으로 기록"""
+        chunks: List[List[Tuple[str, str, int, int]]] = [[]]
+        chunk_size = 0
+        for member in members:
+            if chunks[-1] and chunk_size + member[2] > self.target_size:
+                chunks.append([])
+                chunk_size = 0
+            chunks[-1].append(member)
+            chunk_size += member[2]
+
+        prefix = bundle_prefix(relative_dir)
+        bundles = {}
+        for number, chunk in enumerate(chunks):
+            name = f"{prefix}__{number:03d}.tar"
+            bundles[name] = {'dir': relative_dir, 'members': self._write_bundle(name, chunk)}
+        self.stats["rebuilt_directories"] += 1
+        return bundles
+
+    def _write_bundle(self, name: str, members: List[Tuple[str, str, int, int]]) -> Dict[str, List[Any]]:
+        """tar 묶음 기록 → 구성원별 [데이터 오프셋, 압축 길이, 원본 크기, MD5, mtime_ns]"""
+        entries = {}
+        path = os.path.join(self.staging_dir, name)
+        temp_path = f"{path}.tmp"
+        with tarfile.open(temp_path, 'w', format=tarfile.PAX_FORMAT) as tar:
+            for local_path, key, _, mtime_ns in members:
+                with open(local_path, 'rb') as f:
+                    data = f.read()
+                packed = gzip.compress(data, compresslevel=self.compress_level, mtime=0)
+
+                info = tarfile.TarInfo(name=f"{key}.gz")
+                info.size = len(packed)
+                info.mtime = mtime_ns // 1_000_000_000
+                info.mode = 0o644
+                header = info.tobuf(tar.format, tar.encoding, tar.errors)
+                offset = tar.offset + len(header)
+                tar.addfile(info, io.BytesIO(packed))
+
+                entries[key] = [offset, len(packed), len(data), hashlib.md5(data).hexdigest(), mtime_ns]
+                self.stats["raw_bytes"] += len(data)
+                self.stats["packed_bytes"] += len(packed)
+        os.replace(temp_path, path)
+        return entries
+
+
+class BundleRestorer:
+    """묶음에서 개별 파일 복원 (해당 구성원 바이트 범위만 다운로드)"""
+
+    def __init__(self, service, bundles_folder_id: str):
+        """
+        초기화
+
+        Args:
+            service: Google Drive v3 서비스
+            bundles_folder_id: 원격 _bundles 폴더 ID
+        """
+        self.service = service
+        self.bundles_folder_id = bundles_folder_id
+        self.file_ids: Dict[str, str] = {}
+        self.index: Dict[str, Any] = {}
+
+    def load(self) -> "BundleRestorer":
+        """묶음 폴더 목록(파일명 → ID) + 원격 색인 다운로드"""
+        page_token = None
+        while True:
+            response = self.service.files().list(
+                q=f"'{escape_query_value(self.bundles_folder_id)}' in parents and trashed=false",
+                pageSize=1000,
+                fields="nextPageToken, files(id, name)",
+                pageToken=page_token
+            ).execute()
+            for item in response.get('files', []):
+                self.file_ids[item['name']] = item['id']
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+        if INDEX_NAME not in self.file_ids:
+            raise FileNotFoundError(f"원격 묶음 색인 없음: {BUNDLE_FOLDER_NAME}/{INDEX_NAME}")
+        content = self.service.files().get_media(fileId=self.file_ids[INDEX_NAME]).execute()
+        self.index = json.loads(content.decode('utf-8'))
+        return self
+
+    def restore(self, relative_path: str, dest_dir: str) -> str:
+        """
+        파일 하나 복원
+
+        Args:
+            relative_path: 소스 기준 상대 경로
+            dest_dir: 복원 위치 (상대 경로 구조 유지)
+
+        Returns:
+            복원된 로컬 경로
+        """
+        key = to_manifest_path(relative_path)
+        bundle_name = self.index.get('files', {}).get(key)
+        if bundle_name is None:
+            raise KeyError(f"묶음 색인에 없는 파일: {key}")
+        offset, length, size, md5, _ = self.index['bundles'][bundle_name]['members'][key]
+
+        request = self.service.files().get_media(fileId=self.file_ids[bundle_name])
+        request.headers['Range'] = f"bytes={offset}-{offset + length - 1}"
+        data = gzip.decompress(request.execute())
+        if len(data) != size or hashlib.md5(data).hexdigest() != md5:
+            raise IOError(f"복원 검증 실패 (크기/MD5 불일치): {key}")
+
+        target = os.path.join(dest_dir, *PurePosixPath(key).parts)
+        os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(data)
+        return target
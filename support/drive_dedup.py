@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+내용 기준 중복 제거 백업의 해시 맵 업로드/복원
+- DriveSyncEngine(dedup=True)은 신규 파일 MD5가 이미 원격에 있으면 업로드 대신 매니페스트에 참조로 기록
+  (5분/10분/30분 데이터, 날짜별 백업 폴더처럼 같은 내용이 반복되는 파일은 한 번만 저장)
+- 해시 맵(경로 → MD5, MD5 → 원격 파일 ID)을 백업 루트의 content_map.json으로 업로드
+- 복원: 해시 맵으로 트리 재구성, 같은 내용은 한 번만 다운로드 후 나머지 경로에 복사
+
+해시 맵 (content_map.json):
+    {
+        "version": 1,
+        "paths":   {상대경로('/' 구분): MD5},
+        "objects": {MD5: 원격 파일 ID}
+    }
+
+사용 예:
+    upload_content_map(service, backup_folder_id, build_content_map(engine.manifest))
+    restorer = ContentRestorer(service, backup_folder_id).load()
+    restorer.restore("restored", prefix="data/5min/")
+"""
+
+import os
+import io
+import json
+import shutil
+from pathlib import PurePosixPath
+from typing import Dict, Any, Optional, List
+
+from .drive_sync_engine import BackupManifest, CONTENT_MAP_NAME, escape_query_value, file_md5
+
+try:
+    from googleapiclient.http import MediaIoBaseUpload, MediaIoBaseDownload
+except ImportError:  # 백업 스크립트에서 설치 안내 후 종료
+    MediaIoBaseUpload = MediaIoBaseDownload = None
+
+CONTENT_MAP_VERSION = 1
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def build_content_map(manifest: BackupManifest) -> Dict[str, Any]:
+    """매니페스트 → 해시 맵 (MD5/원격 ID가 기록된 항목만, 키 정렬로 내용이 같으면 같은 바이트)"""
+    paths: Dict[str, str] = {}
+    objects: Dict[str, str] = {}
+    for path, entry in sorted(manifest.files.items()):
+        if not entry.get('md5') or not entry.get('file_id'):
+            continue
+        paths[path] = entry['md5']
+        objects.setdefault(entry['md5'], entry['file_id'])
+    return {'version': CONTENT_MAP_VERSION, 'paths': paths, 'objects': objects}
+
+
+def _find_content_map(service, folder_id: str) -> Optional[str]:
+    query = (f"name='{CONTENT_MAP_NAME}' and '{escape_query_value(folder_id)}' in parents "
+             f"and trashed=false")
+    items = service.files().list(q=query, fields="files(id)").execute().get('files', [])
+    return items[0]['id'] if items else None
+
+
+def upload_content_map(service, folder_id: str, content_map: Dict[str, Any]) -> str:
+    """해시 맵을 백업 루트에 업로드 (기존 파일은 제자리 갱신) → 파일 ID"""
+    data = json.dumps(content_map, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    media = MediaIoBaseUpload(io.BytesIO(data), mimetype='application/json')
+    file_id = _find_content_map(service, folder_id)
+    if file_id:
+        service.files().update(fileId=file_id, media_body=media, fields='id').execute()
+        return file_id
+    result = service.files().create(
+        body={'name': CONTENT_MAP_NAME, 'parents': [folder_id]},
+        media_body=media,
+        fields='id'
+    ).execute()
+    return result['id']
+
+
+class ContentRestorer:
+    """해시 맵 기준 트리 복원 (같은 내용은 한 번만 다운로드)"""
+
+    def __init__(self, service, backup_folder_id: str):
+        """
+        초기화
+
+        Args:
+            service: Google Drive v3 서비스
+            backup_folder_id: 원격 백업 루트 폴더 ID
+        """
+        self.service = service
+        self.backup_folder_id = backup_folder_id
+        self.content_map: Dict[str, Any] = {}
+        self.stats = {'files': 0, 'downloaded': 0, 'copied': 0, 'bytes': 0}
+
+    def load(self) -> "ContentRestorer":
+        """원격 해시 맵 다운로드"""
+        file_id = _find_content_map(self.service, self.backup_folder_id)
+        if file_id is None:
+            raise FileNotFoundError(f"원격 해시 맵 없음: {CONTENT_MAP_NAME}")
+        content = self.service.files().get_media(fileId=file_id).execute()
+        self.content_map = json.loads(content.decode('utf-8'))
+        return self
+
+    def restore(self, dest_dir: str, prefix: str = "") -> List[str]:
+        """
+        트리 복원
+
+        Args:
+            dest_dir: 복원 위치 (상대 경로 구조 유지)
+            prefix: 이 접두어로 시작하는 경로만 복원 ('/' 구분, 빈 값이면 전체)
+
+        Returns:
+            복원 실패 경로 목록
+        """
+        by_md5: Dict[str, List[str]] = {}
+        for path, md5 in self.content_map.get('paths', {}).items():
+            if path.startswith(prefix):
+                by_md5.setdefault(md5, []).append(path)
+
+        failed = []
+        objects = self.content_map.get('objects', {})
+        for md5, paths in by_md5.items():
+            targets = [os.path.join(dest_dir, *PurePosixPath(path).parts) for path in paths]
+            try:
+                self._download(objects[md5], md5, targets[0])
+            except Exception:
+                failed.extend(paths)
+                continue
+            self.stats['downloaded'] += 1
+            for target in targets[1:]:
+                os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+                shutil.copyfile(targets[0], target)
+                self.stats['copied'] += 1
+            self.stats['files'] += len(targets)
+        return failed
+
+    def _download(self, file_id: str, md5: str, target: str):
+        """원격 파일 → 임시 파일 다운로드, MD5 검증 후 교체"""
+        os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+        tmp_path = f"{target}.part"
+        with open(tmp_path, 'wb') as f:
+            downloader = MediaIoBaseDownload(f, self.service.files().get_media(fileId=file_id),
+                                             chunksize=DOWNLOAD_CHUNK_SIZE)
+            done = False
+            while not done:
+                _, done = downloader.next_chunk()
+        if file_md5(tmp_path) != md5:
+            os.remove(tmp_path)
+            raise IOError(f"복원 검증 실패 (MD5 불일치): {file_id}")
+        self.stats['bytes'] += os.path.getsize(tmp_path)
+        os.replace(tmp_path, target)
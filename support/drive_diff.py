@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+로컬 ↔ Google Drive 백업 비교 (상대경로 + MD5)
+- 로컬 탐색 결과를 한 번 순회하며 원격 인덱스(경로 → ID/MD5/크기)와 대조 → 남은 원격 항목은 extra
+- 같은 이름 파일이 여러 폴더에 있어도 경로 기준이라 오분류 없음
+- 로컬 MD5는 매니페스트 기록(크기/mtime 일치시) 재사용, 크기가 같고 기록이 없을 때만 계산
+- 묶음 백업(drive_bundler) 색인에 있는 파일은 묶음 MD5로 비교 (묶음 파일이 원격에 없으면 missing)
+- 중복 제거 참조(매니페스트 ref 항목)는 참조 대상 원격 파일이 남아 있으면 기록된 MD5로 비교
+- 결과는 줄 단위 JSON(JSONL)으로 즉시 기록 (마지막 줄 = 요약)
+
+상태:
+    missing   : 로컬에만 있음
+    changed   : 양쪽에 있으나 내용 다름
+    extra     : Drive에만 있음
+    identical : 같음
+
+사용 예:
+    diff = DriveDiff(remote_index, manifest)
+    with DiffReportWriter("drive_status_report.jsonl") as report:
+        for record in diff.run(FileWalker(SOURCE_DIR)):
+            report.write(record)
+        report.write_summary(diff.counts)
+"""
+
+import os
+import json
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterable, Iterator, Union, Tuple
+
+from .drive_sync_engine import BackupManifest, file_md5, to_manifest_path
+from .file_walker import FileEntry, entry_info
+from .drive_bundler import BUNDLE_FOLDER_NAME
+
+STATUS_MISSING = "missing"
+STATUS_CHANGED = "changed"
+STATUS_EXTRA = "extra"
+STATUS_IDENTICAL = "identical"
+STATUSES = (STATUS_MISSING, STATUS_CHANGED, STATUS_EXTRA, STATUS_IDENTICAL)
+
+
+@dataclass
+class DiffRecord:
+    """비교 결과 1건"""
+    status: str
+    path: str  # 매니페스트 키 ('/' 구분 상대경로)
+    size: Optional[int] = None
+    remote_size: Optional[int] = None
+    md5: Optional[str] = None
+    remote_md5: Optional[str] = None
+    remote_id: Optional[str] = None
+    location: str = "file"  # file | bundle | dedup
+
+
+class DriveDiff:
+    """원격 인덱스 기준 단일 순회 비교"""
+
+    def __init__(self, remote_index, manifest: Optional[BackupManifest] = None,
+                 bundle_index: Optional[Dict[str, Any]] = None, skip_prefixes: Tuple[str, ...] = ()):
+        """
+        초기화
+
+        Args:
+            remote_index: 로드된 DriveRemoteIndex
+            manifest: 백업 매니페스트 (로컬 MD5 재사용, None이면 필요시 계산)
+            bundle_index: 묶음 색인 (drive_bundler bundle_index.json 내용)
+            skip_prefixes: extra에서 제외할 원격 경로 접두어 (예: "_bundles/")
+        """
+        self.remote_index = remote_index
+        self.manifest = manifest
+        self.bundle_index = bundle_index or {}
+        self.skip_prefixes = skip_prefixes
+        self.counts: Dict[str, int] = {status: 0 for status in STATUSES}
+        self.hashed = 0  # 직접 계산한 MD5 수
+
+    def run(self, local_files: Iterable[Union[FileEntry, Tuple[str, str]]]) -> Iterator[DiffRecord]:
+        """로컬 파일 순회 → 비교 결과 생성 (원격 남은 항목은 마지막에 extra)"""
+        remaining = dict(self.remote_index.files)
+        bundled = self.bundle_index.get('files', {})
+        bundles = self.bundle_index.get('bundles', {})
+        manifest_files = self.manifest.files if self.manifest is not None else {}
+        remote_ids = None  # 참조 항목이 있을 때만 구성
+
+        for file in local_files:
+            try:
+                local_path, relative_path, size, mtime_ns = entry_info(file)
+            except OSError:
+                continue
+            key = to_manifest_path(relative_path)
+            remote = remaining.pop(key, None)
+
+            if remote is None and key in bundled:
+                bundle_remote = self.remote_index.files.get(f"{BUNDLE_FOLDER_NAME}/{bundled[key]}")
+                if bundle_remote is None:
+                    # 로컬 색인에만 있고 업로드되지 않은 묶음
+                    record = DiffRecord(STATUS_MISSING, key, size, location="bundle")
+                else:
+                    _, _, remote_size, remote_md5, _ = bundles[bundled[key]]['members'][key]
+                    record = DiffRecord(STATUS_IDENTICAL, key, size, remote_size, None, remote_md5,
+                                        bundle_remote.id, location="bundle")
+            elif remote is None and manifest_files.get(key, {}).get('ref'):
+                entry = manifest_files[key]
+                if remote_ids is None:
+                    remote_ids = {f.id for f in self.remote_index.files.values()}
+                if entry['file_id'] in remote_ids:
+                    record = DiffRecord(STATUS_IDENTICAL, key, size, entry['size'], None, entry['md5'],
+                                        entry['file_id'], location="dedup")
+                else:
+                    record = DiffRecord(STATUS_MISSING, key, size)
+            elif remote is None:
+                record = DiffRecord(STATUS_MISSING, key, size)
+            else:
+                record = DiffRecord(STATUS_IDENTICAL, key, size, remote.size, None, remote.md5, remote.id)
+
+            if record.status == STATUS_IDENTICAL:
+                if size != record.remote_size:
+                    record.status = STATUS_CHANGED
+                elif record.remote_md5:
+                    try:
+                        record.md5 = self._local_md5(key, local_path, size, mtime_ns)
+                    except OSError:
+                        continue
+                    if record.md5 != record.remote_md5:
+                        record.status = STATUS_CHANGED
+
+            self.counts[record.status] += 1
+            yield record
+
+        for key, remote in remaining.items():
+            if key.startswith(self.skip_prefixes):
+                continue
+            self.counts[STATUS_EXTRA] += 1
+            yield DiffRecord(STATUS_EXTRA, key, None, remote.size, None, remote.md5, remote.id)
+
+    def _local_md5(self, key: str, local_path: str, size: int, mtime_ns: int) -> str:
+        """매니페스트 기록이 현재 파일(크기/mtime)과 같으면 재사용"""
+        if self.manifest is not None:
+            entry = self.manifest.files.get(key)
+            if entry and entry.get('md5') and entry.get('size') == size and entry.get('mtime_ns') == mtime_ns:
+                return entry['md5']
+        self.hashed += 1
+        return file_md5(local_path)
+
+
+class DiffReportWriter:
+    """비교 결과 JSONL 기록기 (레코드마다 바로 기록, 메모리에 모으지 않음)"""
+
+    def __init__(self, path: str, include_identical: bool = True):
+        """
+        Args:
+            path: 리포트 경로 (.jsonl)
+            include_identical: identical 레코드 기록 여부 (요약 집계는 항상 포함)
+        """
+        self.path = path
+        self.include_identical = include_identical
+        self._file = None
+
+    def __enter__(self) -> "DiffReportWriter":
+        self._file = open(f"{self.path}.tmp", 'w', encoding='utf-8')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is None:
+            os.replace(f"{self.path}.tmp", self.path)
+        return False
+
+    def write(self, record: DiffRecord):
+        if record.status == STATUS_IDENTICAL and not self.include_identical:
+            return
+        data = {k: v for k, v in asdict(record).items() if v is not None}
+        self._file.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def write_summary(self, counts: Dict[str, int], **extra):
+        summary = {'status': 'summary', 'timestamp': datetime.now().isoformat(timespec='seconds'),
+                   'counts': counts, **extra}
+        self._file.write(json.dumps(summary, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+
+def read_report(path: str, statuses: Iterable[str] = (STATUS_MISSING, STATUS_CHANGED)) -> Iterator[Dict[str, Any]]:
+    """JSONL 리포트에서 지정 상태 레코드만 순차 읽기"""
+    wanted = set(statuses)
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get('status') in wanted:
+                yield record
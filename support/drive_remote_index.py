@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Google Drive 백업 트리 원격 인덱스 (백업 스크립트 공용)
+- 전체 목록 1회 페이지 조회 (필요 필드만) → 상대경로 → (ID, MD5, 크기) 인덱스
+- 로컬 캐시 + 변경 토큰: 다음 실행부터는 changes.list 차분만 반영
+- 파일 존재 확인/비교는 API 호출 없이 딕셔너리 조회
+
+사용 예:
+    index = DriveRemoteIndex(service, backup_folder_id)
+    index.load()                        # 캐시 + 변경분 반영 (없으면 전체 조회)
+    remote = index.lookup("data/5min/001016_5min.csv")
+"""
+
+import os
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+try:
+    from googleapiclient.errors import HttpError
+except ImportError:  # 백업 스크립트에서 설치 안내 후 종료
+    HttpError = Exception
+
+from .drive_sync_engine import MANIFEST_DIR, FOLDER_MIME_TYPE
+
+INDEX_VERSION = 1
+PAGE_SIZE = 1000
+FILE_FIELDS = "id, name, parents, mimeType, md5Checksum, size, modifiedTime, trashed"
+
+
+@dataclass(frozen=True)
+class RemoteFile:
+    """원격 파일 요약"""
+    id: str
+    md5: Optional[str]
+    size: int
+    modified: str
+
+
+class DriveRemoteIndex:
+    """백업 루트 폴더 이하 원격 파일/폴더 인덱스"""
+
+    def __init__(self, service, root_folder_id: str, cache_dir: str = MANIFEST_DIR):
+        """
+        초기화
+
+        Args:
+            service: Google Drive v3 서비스
+            root_folder_id: 백업 루트 폴더 ID
+            cache_dir: 인덱스 캐시 디렉토리
+        """
+        self.service = service
+        self.root_folder_id = root_folder_id
+        self.cache_path = os.path.join(cache_dir, f"remote_index_{root_folder_id}.json")
+
+        # 원격 노드: ID → [이름, 상위 ID, MD5, 크기, 폴더 여부, 수정 시각]
+        self.nodes: Dict[str, List[Any]] = {}
+        self.change_token: Optional[str] = None
+        self.files: Dict[str, RemoteFile] = {}
+        self.folders: Dict[str, str] = {}
+        self.duplicates: List[str] = []
+        self.api_calls = 0
+
+    def load(self, refresh: bool = True) -> "DriveRemoteIndex":
+        """
+        인덱스 준비 (캐시 → 변경분 반영, 캐시 없거나 토큰 만료시 전체 조회)
+
+        Args:
+            refresh: 캐시 사용시 변경 토큰으로 최신화 여부
+        """
+        if self._load_cache():
+            if refresh:
+                try:
+                    applied = self._apply_changes()
+                    print(f"[INDEX] 캐시 사용 - 변경 {applied}건 반영")
+                except HttpError as e:
+                    print(f"[WARNING] 변경 토큰 사용 실패 - 전체 재조회: {e}")
+                    self.build()
+                    return self
+        else:
+            self.build()
+            return self
+
+        self._rebuild_paths()
+        self.save()
+        return self
+
+    def build(self):
+        """전체 목록 페이지 조회로 인덱스 재구성"""
+        # 목록 조회 전 토큰 확보: 조회 중 변경분은 다음 실행에서 반영
+        self.change_token = self._get_start_token()
+        self.nodes = {}
+
+        page_token = None
+        while True:
+            response = self.service.files().list(
+                q="trashed=false",
+                spaces='drive',
+                pageSize=PAGE_SIZE,
+                fields=f"nextPageToken, files({FILE_FIELDS})",
+                pageToken=page_token
+            ).execute()
+            self.api_calls += 1
+            for item in response.get('files', []):
+                self._upsert(item)
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+        self._rebuild_paths()
+        self.save()
+        print(f"[INDEX] 원격 목록 조회 완료: 파일 {len(self.files)}개, 폴더 {len(self.folders)}개 "
+              f"(API {self.api_calls}회)")
+
+    def lookup(self, relative_path: str) -> Optional[RemoteFile]:
+        """상대경로('/' 구분)의 원격 파일"""
+        return self.files.get(relative_path)
+
+    def folder_id(self, relative_dir: str) -> Optional[str]:
+        """상대 디렉토리의 원격 폴더 ID"""
+        if relative_dir in ('', '.'):
+            return self.root_folder_id
+        return self.folders.get(relative_dir)
+
+    def record(self, relative_path: str, file_id: str, md5: Optional[str], size: int):
+        """업로드 결과 즉시 반영 (다음 변경분 조회 전까지 인덱스 최신 유지)"""
+        self.files[relative_path] = RemoteFile(file_id, md5, size, datetime.now().isoformat())
+
+    def save(self):
+        """인덱스 캐시 저장 (원자적 교체)"""
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        data = {
+            'version': INDEX_VERSION,
+            'root_folder_id': self.root_folder_id,
+            'change_token': self.change_token,
+            'saved_at': datetime.now().isoformat(),
+            'nodes': self.nodes
+        }
+        temp_path = f"{self.cache_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, self.cache_path)
+
+    def _load_cache(self) -> bool:
+        if not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[WARNING] 인덱스 캐시 로드 실패: {e}")
+            return False
+        if data.get('version') != INDEX_VERSION or not data.get('change_token'):
+            return False
+        self.nodes = data.get('nodes', {})
+        self.change_token = data['change_token']
+        return True
+
+    def _get_start_token(self) -> str:
+        self.api_calls += 1
+        return self.service.changes().getStartPageToken().execute()['startPageToken']
+
+    def _apply_changes(self) -> int:
+        """변경 토큰 이후 변경분 반영 → 반영 건수"""
+        applied = 0
+        page_token = self.change_token
+        while page_token:
+            response = self.service.changes().list(
+                pageToken=page_token,
+                spaces='drive',
+                pageSize=PAGE_SIZE,
+                fields=f"nextPageToken, newStartPageToken, changes(fileId, removed, file({FILE_FIELDS}))"
+            ).execute()
+            self.api_calls += 1
+
+            for change in response.get('changes', []):
+                item = change.get('file')
+                if change.get('removed') or not item or item.get('trashed'):
+                    self.nodes.pop(change['fileId'], None)
+                else:
+                    self._upsert(item)
+                applied += 1
+
+            if 'newStartPageToken' in response:
+                self.change_token = response['newStartPageToken']
+            page_token = response.get('nextPageToken')
+        return applied
+
+    def _upsert(self, item: Dict[str, Any]):
+        parents = item.get('parents') or [None]
+        self.nodes[item['id']] = [
+            item['name'],
+            parents[0],
+            item.get('md5Checksum'),
+            int(item.get('size', 0)),
+            item.get('mimeType') == FOLDER_MIME_TYPE,
+            item.get('modifiedTime', '')
+        ]
+
+    def _rebuild_paths(self):
+        """노드 상위 체인 → 백업 루트 기준 상대경로 (루트 밖 노드는 제외)"""
+        paths: Dict[str, Optional[str]] = {self.root_folder_id: ''}
+
+        def resolve(node_id: str) -> Optional[str]:
+            chain: List[Tuple[str, str]] = []
+            current = node_id
+            while current not in paths:
+                node = self.nodes.get(current)
+                if node is None:
+                    break
+                chain.append((current, node[0]))
+                current = node[1]
+            base = paths.get(current)
+            # 체인 위쪽부터 경로 확정 (중간 노드도 캐시)
+            for chain_id, name in reversed(chain):
+                base = None if base is None else (f"{base}/{name}" if base else name)
+                paths[chain_id] = base
+            return paths.get(node_id)
+
+        self.files = {}
+        self.folders = {}
+        self.duplicates = []
+        for node_id, (name, parent, md5, size, is_folder, modified) in self.nodes.items():
+            path = resolve(node_id)
+            if not path:
+                continue
+            if is_folder:
+                self.folders.setdefault(path, node_id)
+                continue
+            existing = self.files.get(path)
+            if existing is not None:
+                self.duplicates.append(path)
+                if existing.modified >= modified:
+                    continue  # 최근 수정본 유지
+            self.files[path] = RemoteFile(node_id, md5, size, modified)
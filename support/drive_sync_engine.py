@@ -0,0 +1,744 @@
+#!/usr/bin/env python3
+"""
+Google Drive 증분 백업 엔진 (백업 스크립트 공용)
+- 로컬 매니페스트: 상대경로 → (크기, mtime, MD5, 원격 파일 ID)
+- 크기/mtime이 같으면 해시 없이 건너뜀, 다르면 MD5 비교 후 실제 변경분만 업로드
+- 변경 파일은 기존 원격 파일을 제자리 갱신(files.update) - 중복 파일 생성 없음
+- 원격 폴더 구조는 로컬 상대경로와 동일하게 유지 (폴더 ID도 매니페스트에 기록)
+- 업로드 전 필요한 폴더 트리를 깊이별 배치 요청으로 일괄 생성 (prepare_folders)
+- 업로드 저널(drive_upload_journal): resumable 세션 URI/오프셋, 완료 기록 → 중단 후 이어받기
+- 원격 인덱스(drive_remote_index) 사용시 매니페스트에 없는 기존 원격 파일도 MD5로 인식
+- 중복 제거(dedup=True): 신규 파일 내용(MD5)이 이미 원격에 있으면 업로드 대신 매니페스트에 참조로 기록
+  (참조되는 원격 파일은 제자리 갱신하지 않고 _objects 폴더로 옮겨 보존, 복원은 drive_dedup)
+
+사용 예:
+    engine = DriveSyncEngine(service, backup_folder_id, SOURCE_DIR)
+    plan = engine.plan(files)          # FileWalker 항목 또는 [(로컬 경로, 상대 경로), ...]
+    stats = engine.sync(plan)          # 폴더 일괄 확보 후 업로드
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path, PurePath, PurePosixPath
+from typing import Dict, Any, Optional, List, Iterable, Tuple, Callable, Union
+
+from .drive_upload_journal import UploadJournal
+from .file_walker import FileEntry, entry_info
+
+try:
+    from googleapiclient.http import MediaFileUpload
+    from googleapiclient.errors import HttpError
+except ImportError:  # 백업 스크립트에서 설치 안내 후 종료
+    MediaFileUpload = None
+    HttpError = Exception
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+MANIFEST_DIR = str(PROJECT_ROOT / "logs" / "drive_backup")  # 실행 위치와 무관하게 프로젝트 기준
+MANIFEST_VERSION = 1
+MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB 제한
+HASH_CHUNK_SIZE = 1024 * 1024
+RESUMABLE_THRESHOLD = 10 * 1024 * 1024  # 10MB 이상은 청크 단위 resumable 업로드
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 256KB 배수
+SAVE_EVERY = 50  # 업로드 N건마다 매니페스트 중간 저장
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+BATCH_LIMIT = 100  # Drive 배치 요청당 최대 호출 수
+MAX_RATE_LIMIT_RETRIES = 6
+OBJECTS_FOLDER_NAME = "_objects"  # 참조 보존용 원격 폴더 (백업 루트 아래)
+BUNDLE_FOLDER_NAME = "_bundles"  # 작은 파일 묶음 원격 폴더 (drive_bundler)
+CONTENT_MAP_NAME = "content_map.json"  # 원격 해시 맵 (drive_dedup)
+# 백업 도구가 올린 관리 객체 (원격 경로 접두어) - 비교/중복 제거 원본에서 제외
+MANAGED_PREFIXES = (f"{BUNDLE_FOLDER_NAME}/", f"{OBJECTS_FOLDER_NAME}/", CONTENT_MAP_NAME)
+
+# 동기화 동작
+ACTION_NEW = "new"
+ACTION_CHANGED = "changed"
+ACTION_UNCHANGED = "unchanged"
+ACTION_SKIPPED = "skipped"
+ACTION_FAILED = "failed"
+ACTION_DEDUPED = "deduped"  # 같은 내용이 이미 원격에 있어 참조로 기록
+
+
+class RateLimitError(Exception):
+    """Drive 요청 한도 초과 (429, 403 rateLimitExceeded/userRateLimitExceeded) - 재시도 대상"""
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """HttpError가 요청 한도 초과 응답인지 확인"""
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    if status == 429:
+        return True
+    if status == 403:
+        content = getattr(error, 'content', b'') or b''
+        return b'ratelimitexceeded' in content.lower()
+    return False
+
+
+def rate_limit_backoff(attempt: int) -> float:
+    """지수 백오프 + 지터 (초)"""
+    return min(64.0, 2.0 ** attempt) + random.random()
+
+
+def file_md5(path: str) -> str:
+    """파일 MD5 (Drive md5Checksum과 같은 형식)"""
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def to_manifest_path(relative_path: str) -> str:
+    """OS 상대경로 → 매니페스트 키 (Windows/Linux 공통 '/' 구분)"""
+    return PurePosixPath(*PurePath(relative_path).parts).as_posix()
+
+
+def escape_query_value(value: str) -> str:
+    """Drive 검색 쿼리 문자열 이스케이프"""
+    return value.replace('\\', '\\\\').replace("'", "\\'")
+
+
+@dataclass
+class SyncItem:
+    """동기화 대상 파일"""
+    local_path: str
+    relative_path: str  # 매니페스트 키
+    size: int
+    mtime_ns: int
+    action: str
+    md5: Optional[str] = None
+    file_id: Optional[str] = None
+
+
+@dataclass
+class SyncPlan:
+    """동기화 계획 (업로드 대상 + 변경 없음/건너뜀 집계)"""
+    items: List[SyncItem] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=lambda: {
+        ACTION_NEW: 0, ACTION_CHANGED: 0, ACTION_UNCHANGED: 0, ACTION_SKIPPED: 0, ACTION_FAILED: 0,
+        ACTION_DEDUPED: 0
+    })
+
+    @property
+    def pending(self) -> List[SyncItem]:
+        return [item for item in self.items if item.action in (ACTION_NEW, ACTION_CHANGED)]
+
+    @property
+    def pending_bytes(self) -> int:
+        return sum(item.size for item in self.pending)
+
+
+class BackupManifest:
+    """백업 대상 폴더별 로컬 매니페스트 (JSON, 원자적 저장)"""
+
+    def __init__(self, root_folder_id: str, source_dir: str, manifest_dir: str = MANIFEST_DIR):
+        self.root_folder_id = root_folder_id
+        self.source_dir = source_dir
+        self.path = os.path.join(manifest_dir, f"manifest_{root_folder_id}.json")
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.folders: Dict[str, str] = {}
+        self.load()
+
+    def load(self):
+        """매니페스트 로드 (없거나 손상되면 빈 매니페스트)"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != MANIFEST_VERSION:
+                print(f"[WARNING] 매니페스트 버전 불일치 - 전체 재확인: {self.path}")
+                return
+            self.files = data.get('files', {})
+            self.folders = data.get('folders', {})
+        except Exception as e:
+            print(f"[WARNING] 매니페스트 로드 실패 - 전체 재확인: {e}")
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체 (중단되어도 기존 매니페스트 보존)"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            'version': MANIFEST_VERSION,
+            'root_folder_id': self.root_folder_id,
+            'source_dir': self.source_dir,
+            'updated_at': datetime.now().isoformat(),
+            'files': self.files,
+            'folders': self.folders
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+
+
+class DriveSyncEngine:
+    """매니페스트 기반 증분 업로드"""
+
+    def __init__(self, service, root_folder_id: str, source_dir: str,
+                 manifest: Optional[BackupManifest] = None, max_file_size: int = MAX_FILE_SIZE,
+                 remote_index=None, service_factory: Optional[Callable[[], Any]] = None,
+                 journal: Optional[UploadJournal] = None, dedup: bool = False):
+        """
+        초기화
+
+        Args:
+            service: Google Drive v3 서비스
+            root_folder_id: 백업 루트 폴더 ID
+            source_dir: 로컬 소스 디렉토리
+            manifest: 매니페스트 (None이면 root_folder_id 기준 기본 위치)
+            max_file_size: 최대 업로드 파일 크기 (초과시 건너뜀)
+            remote_index: DriveRemoteIndex (매니페스트에 없는 원격 파일/폴더 확인용)
+            service_factory: 스레드별 Drive 서비스 생성 함수 (httplib2는 스레드 안전하지 않음,
+                             None이면 모든 스레드가 service 공유)
+            journal: 업로드 저널 (None이면 매니페스트와 같은 위치의 기본 저널)
+            dedup: 내용 기준 중복 제거 (신규 파일 MD5가 원격에 있으면 참조로 기록)
+        """
+        self.service_factory = service_factory
+        self._shared_service = service
+        self._local = threading.local()
+        self._local.service = service
+        self.root_folder_id = root_folder_id
+        self.source_dir = source_dir
+        self.manifest = manifest or BackupManifest(root_folder_id, source_dir)
+        self.max_file_size = max_file_size
+        self.remote_index = remote_index
+
+        self._lock = threading.Lock()
+        self._folder_lock = threading.Lock()
+        self._unsaved = 0
+        self.folder_requests = 0  # 폴더 확보용 HTTP 요청 수 (배치 1건 = 1회)
+        self.resumed_bytes = 0  # 이전 실행에서 전송 완료되어 건너뛴 바이트
+
+        # 중복 제거: MD5 → 원격 파일 ID, 참조되는 원격 파일 ID, 같은 실행 내 원본 업로드 대기 참조
+        self.dedup = dedup
+        self.content_objects: Dict[str, str] = {}
+        self.referenced_ids: set = set()
+        self.deferred_refs: List[SyncItem] = []
+
+        self.journal = journal or UploadJournal(root_folder_id, os.path.dirname(self.manifest.path))
+        self._state_prefix = self._find_state_prefix()
+        self._recover_journal()
+
+    def _find_state_prefix(self) -> Optional[str]:
+        """백업 상태 폴더(매니페스트/저널/묶음 준비)가 소스 안에 있으면 그 상대경로 접두어
+        (실행 중 다시 쓰는 파일이 업로드 대상에 섞이지 않도록 plan에서 제외)"""
+        source = os.path.normcase(os.path.abspath(self.source_dir))
+        state = os.path.normcase(os.path.abspath(os.path.dirname(self.manifest.path)))
+        if state == source or not state.startswith(source.rstrip(os.sep) + os.sep):
+            return None  # 소스 밖 (또는 묶음 준비 폴더처럼 소스가 상태 폴더 안)
+        return to_manifest_path(os.path.relpath(state, source)) + '/'
+
+    def _recover_journal(self):
+        """이전 실행의 완료 기록을 매니페스트에 반영 (매니페스트 저장 전 중단 대비)"""
+        recovered = dict(self.journal.completed)
+        if recovered:
+            self.manifest.files.update(recovered)
+            self.save()
+        if recovered or self.journal.sessions:
+            print(f"[JOURNAL] 이전 실행 완료분 {len(recovered)}개 복구, "
+                  f"이어받을 업로드 세션 {len(self.journal.sessions)}개")
+
+    @property
+    def service(self):
+        """현재 스레드의 Drive 서비스 (service_factory 지정시 스레드마다 생성)"""
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            if self.service_factory is None:
+                return self._shared_service
+            service = self._local.service = self.service_factory()
+        return service
+
+    def plan(self, files: Iterable[Union[FileEntry, Tuple[str, str]]]) -> SyncPlan:
+        """
+        로컬 파일과 매니페스트 비교 → 동기화 계획
+
+        Args:
+            files: FileEntry (stat 정보 재사용) 또는 (로컬 경로, 소스 기준 상대 경로) 목록
+        """
+        plan = SyncPlan()
+        touched = 0
+        for file in files:
+            try:
+                local_path, relative_path, size, mtime_ns = entry_info(file)
+            except OSError:
+                continue  # 접근 불가 파일
+
+            key = to_manifest_path(relative_path)
+            if self._state_prefix and key.startswith(self._state_prefix):
+                continue  # 백업 상태 파일
+            item = SyncItem(local_path, key, size, mtime_ns, ACTION_NEW)
+            entry = self.manifest.files.get(key)
+
+            if size > self.max_file_size:
+                item.action = ACTION_SKIPPED
+            elif entry and entry.get('file_id'):
+                # 참조 항목의 원격 파일은 공유 내용 → 제자리 갱신 금지 (변경시 신규 취급)
+                item.file_id = None if entry.get('ref') else entry['file_id']
+                if entry.get('size') == size and entry.get('mtime_ns') == mtime_ns:
+                    item.action = ACTION_UNCHANGED
+                else:
+                    # 크기/mtime 변경 → 내용까지 바뀌었는지 해시로 확인
+                    try:
+                        item.md5 = file_md5(local_path)
+                    except OSError:
+                        continue
+                    if item.md5 == entry.get('md5'):
+                        item.action = ACTION_UNCHANGED
+                        entry['size'] = size
+                        entry['mtime_ns'] = mtime_ns
+                        touched += 1
+                    else:
+                        item.action = ACTION_CHANGED if item.file_id else ACTION_NEW
+            elif self.remote_index is not None:
+                remote = self.remote_index.lookup(key)
+                if remote is not None:
+                    # 매니페스트 이전 업로드분: 같은 내용이면 채택, 다르면 제자리 갱신
+                    try:
+                        item.md5 = file_md5(local_path)
+                    except OSError:
+                        continue
+                    item.file_id = remote.id
+                    if item.md5 == remote.md5:
+                        item.action = ACTION_UNCHANGED
+                        self.manifest.files[key] = {
+                            'size': size,
+                            'mtime_ns': mtime_ns,
+                            'md5': item.md5,
+                            'file_id': remote.id,
+                            'uploaded_at': remote.modified
+                        }
+                        touched += 1
+                    else:
+                        item.action = ACTION_CHANGED
+
+            plan.items.append(item)
+            plan.counts[item.action] += 1
+
+        self.referenced_ids = {e['file_id'] for e in self.manifest.files.values() if e.get('ref')}
+        if self.dedup:
+            touched += self._dedup(plan)
+        if touched:
+            self.manifest.save()
+        return plan
+
+    def _dedup(self, plan: SyncPlan) -> int:
+        """신규 파일 중 같은 내용이 원격(또는 같은 실행의 다른 신규 파일)에 있으면 참조로 전환 → 즉시 기록 수"""
+        self.content_objects = {e['md5']: e['file_id'] for e in self.manifest.files.values()
+                                if e.get('md5') and e.get('file_id')}
+        if self.remote_index is not None:
+            for path, remote in self.remote_index.files.items():
+                # 묶음/보존 원본/해시 맵은 관리 도구가 교체·이동하므로 참조 원본으로 쓰지 않음
+                if remote.md5 and not path.startswith(MANAGED_PREFIXES):
+                    self.content_objects.setdefault(remote.md5, remote.id)
+
+        recorded = 0
+        first_by_md5: Dict[str, SyncItem] = {}
+        for item in plan.items:
+            if item.action != ACTION_NEW:
+                continue
+            try:
+                item.md5 = item.md5 or file_md5(item.local_path)
+            except OSError:
+                continue
+            if item.md5 in self.content_objects:
+                item.file_id = self.content_objects[item.md5]
+                self._record_reference(item)
+                recorded += 1
+            elif item.md5 in first_by_md5:
+                self.deferred_refs.append(item)  # 원본 업로드 후 save()에서 기록
+            else:
+                first_by_md5[item.md5] = item
+                continue
+            item.action = ACTION_DEDUPED
+            plan.counts[ACTION_NEW] -= 1
+            plan.counts[ACTION_DEDUPED] += 1
+        return recorded
+
+    def _record_reference(self, item: SyncItem):
+        """참조 항목 기록 (업로드 없이 같은 내용의 원격 파일 ID를 가리킴)"""
+        self.manifest.files[item.relative_path] = {
+            'size': item.size,
+            'mtime_ns': item.mtime_ns,
+            'md5': item.md5,
+            'file_id': item.file_id,
+            'ref': True,
+            'uploaded_at': datetime.now().isoformat(timespec='seconds')
+        }
+        self.referenced_ids.add(item.file_id)
+
+    def sync(self, plan: SyncPlan, progress: Optional[Callable[[SyncItem, str], None]] = None) -> Dict[str, int]:
+        """
+        계획의 신규/변경 파일 업로드 (순차)
+
+        Args:
+            plan: plan() 결과
+            progress: 파일 처리마다 호출 (항목, 결과 동작)
+
+        Returns:
+            동작별 파일 수
+        """
+        stats = dict(plan.counts)
+        stats[ACTION_NEW] = stats[ACTION_CHANGED] = 0
+        pending = plan.pending
+        self.prepare_folders(pending)
+        try:
+            for item in pending:
+                action = self._sync_with_retry(item)
+                stats[action] += 1
+                if progress:
+                    progress(item, action)
+        finally:
+            self.save()
+        return stats
+
+    def _sync_with_retry(self, item: SyncItem) -> str:
+        for attempt in range(MAX_RATE_LIMIT_RETRIES):
+            try:
+                return self.sync_file(item)
+            except RateLimitError:
+                time.sleep(rate_limit_backoff(attempt))
+        print(f"[ERROR] 요청 한도 초과 재시도 소진: {item.relative_path}")
+        return ACTION_FAILED
+
+    def sync_file(self, item: SyncItem) -> str:
+        """
+        단일 파일 업로드 (스레드 안전: 매니페스트/폴더 캐시 잠금)
+
+        Returns:
+            ACTION_NEW / ACTION_CHANGED / ACTION_FAILED
+
+        Raises:
+            RateLimitError: 요청 한도 초과 (호출측에서 백오프 후 재시도)
+        """
+        try:
+            md5 = item.md5 = item.md5 or file_md5(item.local_path)
+            result = None
+            action = ACTION_NEW
+
+            if item.file_id and item.file_id in self.referenced_ids:
+                # 다른 경로가 참조하는 내용 → 보존 폴더로 옮기고 이 경로는 새로 업로드
+                self._preserve_object(item)
+                item.file_id = None
+                action = ACTION_CHANGED
+
+            if item.file_id:
+                try:
+                    result = self._update_file(item)
+                    action = ACTION_CHANGED
+                except HttpError as e:
+                    if getattr(getattr(e, 'resp', None), 'status', None) != 404:
+                        raise
+                    # 원격에서 삭제됨 → 새로 생성
+                    print(f"[WARNING] 원격 파일 없음 - 새로 업로드: {item.relative_path}")
+
+            if result is None:
+                parent_id = self.get_folder_id(str(PurePosixPath(item.relative_path).parent))
+                result = self._create_file(item, parent_id)
+
+            remote_md5 = result.get('md5Checksum')
+            if remote_md5 and remote_md5 != md5:
+                raise IOError(f"업로드 검증 실패 (MD5 불일치): {remote_md5} != {md5}")
+
+            if self.remote_index is not None:
+                self.remote_index.record(item.relative_path, result['id'], md5, item.size)
+            entry = {
+                'size': item.size,
+                'mtime_ns': item.mtime_ns,
+                'md5': md5,
+                'file_id': result['id'],
+                'uploaded_at': datetime.now().isoformat(timespec='seconds')
+            }
+            with self._lock:
+                # 저널 완료 기록과 매니페스트 반영을 같은 잠금 안에서 (save()의 저널 압축과 배타)
+                self.journal.complete(item.relative_path, entry)
+                self.manifest.files[item.relative_path] = entry
+                self.content_objects.setdefault(md5, result['id'])
+                self._unsaved += 1
+                save_now = self._unsaved >= SAVE_EVERY
+            if save_now:
+                self.save()
+            return action
+
+        except Exception as e:
+            if is_rate_limited(e):
+                raise RateLimitError(str(e)) from e
+            print(f"[ERROR] 업로드 실패 {item.relative_path}: {e}")
+            return ACTION_FAILED
+
+    def _preserve_object(self, item: SyncItem):
+        """참조되는 원격 파일을 _objects/<MD5>로 이동 (메타데이터만 변경, 파일 ID 유지)"""
+        old_md5 = self.manifest.files.get(item.relative_path, {}).get('md5') or item.file_id
+        objects_id = self.get_folder_id(OBJECTS_FOLDER_NAME)
+        parent_id = self.get_folder_id(str(PurePosixPath(item.relative_path).parent))
+        self.service.files().update(
+            fileId=item.file_id,
+            addParents=objects_id,
+            removeParents=parent_id,
+            body={'name': old_md5},
+            fields='id'
+        ).execute()
+
+    def _media(self, item: SyncItem):
+        return MediaFileUpload(item.local_path, chunksize=UPLOAD_CHUNK_SIZE,
+                               resumable=item.size >= RESUMABLE_THRESHOLD)
+
+    def _execute(self, item: SyncItem, make_request: Callable[[Any], Any]) -> Dict[str, Any]:
+        """
+        업로드 요청 실행
+
+        resumable이면 청크마다 세션 URI/오프셋을 저널에 기록하고, 저널에 같은 파일의
+        세션이 남아 있으면 서버에 실제 수신 오프셋을 확인한 뒤 그 지점부터 이어서 전송
+        """
+        media = self._media(item)
+        request = make_request(media)
+        if not media.resumable():
+            return request.execute()
+
+        session = self.journal.session_for(item.relative_path, item.size, item.mtime_ns, item.md5)
+        resumed = 0
+        if session:
+            # 전송 전에 서버 수신 범위를 조회해 그 지점부터 이어서 전송
+            offset, response = self._query_session(request, session['uri'], item.size)
+            if response is not None:
+                self.resumed_bytes += item.size
+                print(f"[JOURNAL] 이전 실행에서 업로드 완료됨: {item.relative_path}")
+                return response
+            if offset is None:
+                print(f"[JOURNAL] 업로드 세션 만료 - 처음부터 다시: {item.relative_path}")
+                self.journal.discard(item.relative_path)
+                session = None
+            else:
+                request.resumable_uri = session['uri']
+                request.resumable_progress = resumed = offset
+                self.resumed_bytes += offset
+                print(f"[JOURNAL] 이어받기: {item.relative_path} "
+                      f"({offset / (1024 * 1024):.1f}/{item.size / (1024 * 1024):.1f} MB)")
+
+        response = None
+        while response is None:
+            try:
+                _, response = request.next_chunk()
+            except HttpError as e:
+                status = getattr(getattr(e, 'resp', None), 'status', None)
+                if not session or status not in (404, 410):
+                    raise
+                # 이어받는 중 세션 만료 → 처음부터 새 세션
+                print(f"[JOURNAL] 업로드 세션 만료 - 처음부터 다시: {item.relative_path}")
+                self.journal.discard(item.relative_path)
+                self.resumed_bytes -= resumed
+                session, resumed = None, 0
+                media = self._media(item)
+                request = make_request(media)
+                continue
+
+            if response is None and request.resumable_uri:
+                self.journal.checkpoint(item.relative_path, request.resumable_uri, request.resumable_progress,
+                                        item.size, item.mtime_ns, item.md5)
+        return response
+
+    def _query_session(self, request, uri: str, size: int) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+        """
+        resumable 세션 상태 조회 (빈 PUT + Content-Range: bytes */<크기>)
+
+        Returns:
+            (서버 수신 바이트 수, 완료 응답) - 완료됐으면 응답, 세션 만료(404/410)면 (None, None)
+        """
+        resp, content = request.http.request(uri, 'PUT', headers={
+            'Content-Length': '0',
+            'Content-Range': f'bytes */{size}'
+        })
+        status = int(resp.status)
+        if status in (200, 201):
+            return size, request.postproc(resp, content)
+        if status == 308:
+            received = resp.get('range')  # "bytes=0-<마지막 바이트>", 없으면 수신분 없음
+            return (int(received.rsplit('-', 1)[1]) + 1 if received else 0), None
+        if status in (404, 410):
+            return None, None
+        raise HttpError(resp, content, uri=uri)
+
+    def _update_file(self, item: SyncItem) -> Dict[str, Any]:
+        """기존 원격 파일 내용 갱신 (파일 ID 유지)"""
+        return self._execute(item, lambda media: self.service.files().update(
+            fileId=item.file_id,
+            media_body=media,
+            fields='id, md5Checksum'
+        ))
+
+    def _create_file(self, item: SyncItem, parent_id: str) -> Dict[str, Any]:
+        """새 원격 파일 생성"""
+        return self._execute(item, lambda media: self.service.files().create(
+            body={'name': PurePosixPath(item.relative_path).name, 'parents': [parent_id]},
+            media_body=media,
+            fields='id, md5Checksum'
+        ))
+
+    def prepare_folders(self, items: Iterable[SyncItem]) -> int:
+        """
+        업로드 대상의 상위 폴더 트리 일괄 확보 (깊이별 배치 요청, 업로드 시작 전 호출)
+
+        폴더 수와 무관하게 깊이 단계마다 배치 요청 1회 (100개 단위), 원격 인덱스가
+        없으면 기존 폴더 검색 배치가 단계마다 1회 추가됨. 실패한 폴더는 업로드시
+        get_folder_id()가 개별 확보 (배치 전송 자체가 실패하면 남은 단계 전체를 개별 확보로 전환,
+        개별 확보는 검색 후 생성이므로 전송 실패 전에 만들어진 폴더도 중복 생성하지 않음).
+
+        Returns:
+            새로 생성한 폴더 수
+        """
+        needed = set()
+        for item in items:
+            parent = PurePosixPath(item.relative_path).parent
+            while parent.parts and str(parent) not in needed:
+                needed.add(str(parent))
+                parent = parent.parent
+
+        levels: Dict[int, List[str]] = {}
+        for relative_dir in needed:
+            if self._known_folder_id(relative_dir) is None:
+                levels.setdefault(len(PurePosixPath(relative_dir).parts), []).append(relative_dir)
+        if not levels:
+            return 0
+
+        requests_before = self.folder_requests
+        created = 0
+        for depth in sorted(levels):
+            level = []
+            for relative_dir in sorted(levels[depth]):
+                parent_id = self._known_folder_id(str(PurePosixPath(relative_dir).parent))
+                if parent_id is not None:  # 상위 생성 실패시 업로드 단계에서 개별 처리
+                    level.append((relative_dir, parent_id))
+
+            try:
+                if self.remote_index is None:
+                    found = self._batch_folders(level, self._folder_query_request,
+                                                lambda r: r['files'][0]['id'] if r.get('files') else None)
+                    level = [(d, parent_id) for d, parent_id in level if d not in found]
+
+                created += len(self._batch_folders(level, self._folder_create_request, lambda r: r['id']))
+            except Exception as e:
+                print(f"[WARNING] 폴더 배치 전송 실패 - 남은 폴더는 업로드시 개별 확보: {e}")
+                self.save()
+                return created
+
+        self.save()
+        print(f"[FOLDER] 폴더 {sum(len(v) for v in levels.values())}개 확보 (신규 {created}개, "
+              f"깊이 {len(levels)}단계, 요청 {self.folder_requests - requests_before}회)")
+        return created
+
+    def _known_folder_id(self, relative_dir: str) -> Optional[str]:
+        if relative_dir in ('', '.'):
+            return self.root_folder_id
+        folder_id = self.manifest.folders.get(relative_dir)
+        if folder_id is None and self.remote_index is not None:
+            folder_id = self.remote_index.folder_id(relative_dir)
+            if folder_id is not None:
+                self.manifest.folders[relative_dir] = folder_id
+        return folder_id
+
+    def _folder_query_request(self, name: str, parent_id: str):
+        query = (f"name='{escape_query_value(name)}' and '{parent_id}' in parents "
+                 f"and mimeType='{FOLDER_MIME_TYPE}' and trashed=false")
+        return self.service.files().list(q=query, fields="files(id)")
+
+    def _folder_create_request(self, name: str, parent_id: str):
+        return self.service.files().create(
+            body={'name': name, 'parents': [parent_id], 'mimeType': FOLDER_MIME_TYPE},
+            fields='id'
+        )
+
+    def _batch_folders(self, level: List[Tuple[str, str]], make_request: Callable,
+                       extract: Callable[[Dict[str, Any]], Optional[str]]) -> Dict[str, str]:
+        """(상대 디렉토리, 상위 ID) 목록을 배치 요청으로 실행 → 확보된 폴더 ID"""
+        resolved: Dict[str, str] = {}
+
+        def callback(request_id, response, exception):
+            if exception is not None:
+                print(f"[WARNING] 폴더 배치 요청 실패 {request_id}: {exception}")
+                return
+            folder_id = extract(response)
+            if folder_id:
+                resolved[request_id] = folder_id
+
+        try:
+            for start in range(0, len(level), BATCH_LIMIT):
+                batch = self.service.new_batch_http_request(callback=callback)
+                for relative_dir, parent_id in level[start:start + BATCH_LIMIT]:
+                    batch.add(make_request(PurePosixPath(relative_dir).name, parent_id), request_id=relative_dir)
+                self.folder_requests += 1
+                batch.execute()
+        finally:
+            # 전송 실패 전 배치에서 확보된 폴더는 유지
+            with self._folder_lock:
+                self.manifest.folders.update(resolved)
+        return resolved
+
+    def get_folder_id(self, relative_dir: str) -> str:
+        """상대 디렉토리의 원격 폴더 ID (매니페스트 → 검색 → 생성 순)"""
+        if relative_dir in ('', '.'):
+            return self.root_folder_id
+
+        with self._folder_lock:
+            folder_id = self.manifest.folders.get(relative_dir)
+        if folder_id:
+            return folder_id
+
+        # 상위 폴더부터 확보 (재귀, 잠금 밖에서)
+        parent_id = self.get_folder_id(str(PurePosixPath(relative_dir).parent))
+
+        with self._folder_lock:
+            folder_id = self.manifest.folders.get(relative_dir)
+            if folder_id is None and self.remote_index is not None:
+                folder_id = self.remote_index.folder_id(relative_dir)
+            if folder_id is None:
+                folder_id = self._find_or_create_folder(PurePosixPath(relative_dir).name, parent_id)
+                self.manifest.folders[relative_dir] = folder_id
+            return folder_id
+
+    def _find_or_create_folder(self, name: str, parent_id: str) -> str:
+        self.folder_requests += 1
+        items = self._folder_query_request(name, parent_id).execute().get('files', [])
+        if items:
+            return items[0]['id']
+        self.folder_requests += 1
+        return self._folder_create_request(name, parent_id).execute()['id']
+
+    def save(self):
+        """매니페스트 저장 후 저널 압축 (완료 기록은 매니페스트로 이관됨, 원본이 올라간 대기 참조도 기록)"""
+        with self._lock:
+            waiting = []
+            for item in self.deferred_refs:
+                item.file_id = self.content_objects.get(item.md5)
+                if item.file_id:
+                    self._record_reference(item)
+                else:
+                    waiting.append(item)
+            self.deferred_refs = waiting
+            self._unsaved = 0
+            self.manifest.save()
+            self.journal.compact()
+
+
+def print_plan(plan: SyncPlan):
+    """동기화 계획 요약 출력"""
+    counts = plan.counts
+    deduped = f", 중복 참조 {counts[ACTION_DEDUPED]}개" if counts[ACTION_DEDUPED] else ""
+    print(f"[PLAN] 신규 {counts[ACTION_NEW]}개, 변경 {counts[ACTION_CHANGED]}개, "
+          f"변경 없음 {counts[ACTION_UNCHANGED]}개, 건너뜀 {counts[ACTION_SKIPPED]}개{deduped} "
+          f"- 업로드 {plan.pending_bytes / (1024 * 1024):.1f} MB")
+
+
+def print_progress(done: int, total: int, start_time: float, every: int = 50):
+    """진행률 출력 (every건마다 및 마지막)"""
+    if total <= 0 or (done % every and done != total):
+        return
+    elapsed = time.time() - start_time
+    rate = done / elapsed if elapsed > 0 else 0
+    eta = (total - done) / rate if rate > 0 else 0
+    print(f"[진행률] {done}/{total} ({done / total * 100:.1f}%) - "
+          f"속도: {rate:.1f}파일/초 - 예상 남은 시간: {eta / 60:.1f}분")
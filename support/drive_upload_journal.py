@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Google Drive 업로드 저널 (중단 후 이어받기용, 백업 스크립트 공용)
+- resumable 세션 URI + 전송 오프셋을 청크마다 기록 → 재시작시 파일 중간부터 이어서 업로드
+- 업로드 완료도 즉시 기록 → 매니페스트 저장 전에 중단되어도 완료 파일은 다시 올리지 않음
+- 추가 기록 전용 JSONL (한 줄 = 한 상태 변경, flush + fsync), 매니페스트 저장시 압축
+
+레코드 상태:
+    session  : 진행 중 세션 (path, uri, offset, size, mtime_ns, md5)
+    done     : 업로드 완료 (path, entry=매니페스트 항목)
+    discard  : 세션 폐기 (파일 변경/세션 만료)
+"""
+
+import os
+import json
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+STATE_SESSION = "session"
+STATE_DONE = "done"
+STATE_DISCARD = "discard"
+
+
+class UploadJournal:
+    """업로드 세션/완료 저널 (스레드 안전)"""
+
+    def __init__(self, root_folder_id: str, journal_dir: str):
+        """
+        초기화
+
+        Args:
+            root_folder_id: 백업 루트 폴더 ID
+            journal_dir: 저널 디렉토리 (매니페스트와 같은 위치)
+        """
+        self.path = os.path.join(journal_dir, f"journal_{root_folder_id}.jsonl")
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self._load()
+
+    def _load(self):
+        """저널 재생 (마지막 줄이 중단으로 잘렸으면 무시)"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                path = record.get('path')
+                state = record.get('state')
+                if state == STATE_SESSION:
+                    self.sessions[path] = record
+                elif state == STATE_DONE:
+                    self.sessions.pop(path, None)
+                    self.completed[path] = record['entry']
+                elif state == STATE_DISCARD:
+                    self.sessions.pop(path, None)
+
+    def _append(self, record: Dict[str, Any]):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def session_for(self, path: str, size: int, mtime_ns: int, md5: str) -> Optional[Dict[str, Any]]:
+        """이어받을 수 있는 세션 (로컬 파일이 세션 시작 때와 같을 때만)"""
+        with self._lock:
+            session = self.sessions.get(path)
+        if session and session['size'] == size and session['mtime_ns'] == mtime_ns and session['md5'] == md5:
+            return session
+        return None
+
+    def checkpoint(self, path: str, uri: str, offset: int, size: int, mtime_ns: int, md5: str):
+        """세션 진행 기록 (청크 전송마다)"""
+        record = {
+            'state': STATE_SESSION, 'path': path, 'uri': uri, 'offset': offset,
+            'size': size, 'mtime_ns': mtime_ns, 'md5': md5,
+            'ts': datetime.now().isoformat(timespec='seconds')
+        }
+        with self._lock:
+            self.sessions[path] = record
+            self._append(record)
+
+    def complete(self, path: str, entry: Dict[str, Any]):
+        """업로드 완료 기록 (매니페스트 항목 포함)"""
+        with self._lock:
+            self.sessions.pop(path, None)
+            self.completed[path] = entry
+            self._append({'state': STATE_DONE, 'path': path, 'entry': entry})
+
+    def discard(self, path: str):
+        """세션 폐기 기록"""
+        with self._lock:
+            if self.sessions.pop(path, None) is not None:
+                self._append({'state': STATE_DISCARD, 'path': path})
+
+    def compact(self):
+        """매니페스트 저장 직후 호출: 완료 기록 제거, 진행 중 세션만 남김 (원자적 교체)"""
+        with self._lock:
+            self.completed = {}
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if not self.sessions:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                return
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in self.sessions.values():
+                    f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+            os.replace(temp_path, self.path)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
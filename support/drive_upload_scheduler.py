@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Google Drive 적응형 동시 업로드 스케줄러 (백업 스크립트 공용)
+- 워커 스레드마다 전용 Drive 서비스 (googleapiclient/httplib2는 스레드 안전하지 않음)
+- 동시 업로드 수 자동 조절: 구간 처리량이 늘면 +1, 줄면 방향 전환, 요청 한도 초과시 절반
+- 큰 파일은 동시성 슬롯 절반까지만 사용해 먼저 시작, 나머지 슬롯은 작은 파일을 연속 처리
+  (큰 파일 하나가 끝날 때까지 작은 파일이 기다리지 않음)
+
+사용 예:
+    engine = DriveSyncEngine(service, folder_id, SOURCE_DIR, service_factory=make_service)
+    scheduler = AdaptiveUploadScheduler(engine)
+    stats = scheduler.run(plan.pending, progress=callback)
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, List, Callable
+
+from .drive_sync_engine import (
+    SyncItem, RateLimitError, rate_limit_backoff,
+    ACTION_NEW, ACTION_CHANGED, ACTION_FAILED, MAX_RATE_LIMIT_RETRIES
+)
+
+MIN_WORKERS = 1
+MAX_WORKERS = 8
+INITIAL_WORKERS = 3
+LARGE_FILE_SIZE = 5 * 1024 * 1024  # 이상이면 큰 파일 슬롯에서 처리
+ADJUST_INTERVAL = 5.0  # 처리량 측정 구간 (초)
+THROUGHPUT_TOLERANCE = 0.05  # 이 비율 이내 감소는 유지로 간주
+REQUEST_COST_BYTES = 64 * 1024  # 파일당 요청 고정 비용 (바이트 환산, 작은 파일 처리량 반영)
+
+
+class AdaptiveUploadScheduler:
+    """처리량 기반 동시성 조절 업로드 스케줄러"""
+
+    def __init__(self, engine, min_workers: int = MIN_WORKERS, max_workers: int = MAX_WORKERS,
+                 initial_workers: int = INITIAL_WORKERS, large_file_size: int = LARGE_FILE_SIZE):
+        """
+        초기화
+
+        Args:
+            engine: DriveSyncEngine (service_factory 지정 권장)
+            min_workers: 최소 동시 업로드 수
+            max_workers: 최대 동시 업로드 수 (워커 스레드 수)
+            initial_workers: 시작 동시 업로드 수
+            large_file_size: 큰 파일 기준 크기
+        """
+        self.engine = engine
+        self.min_workers = min_workers
+        self.max_workers = max(max_workers, min_workers)
+        self.limit = min(max(initial_workers, min_workers), self.max_workers)
+        self.large_file_size = large_file_size
+
+        self._cond = threading.Condition()
+        self._large: deque = deque()
+        self._small: deque = deque()
+        self._active = 0
+        self._active_large = 0
+
+        # 처리량 측정
+        self._window_start = 0.0
+        self._window_bytes = 0
+        self._last_score: Optional[float] = None
+        self._direction = 1
+
+        self.stats = {ACTION_NEW: 0, ACTION_CHANGED: 0, ACTION_FAILED: 0}
+        self.rate_limited = 0
+        self.limit_history: List[int] = []
+
+    def run(self, items: List[SyncItem],
+            progress: Optional[Callable[[SyncItem, str], None]] = None) -> Dict[str, int]:
+        """
+        업로드 실행 (상위 폴더 일괄 확보 후 시작, 완료시 매니페스트 저장)
+
+        Args:
+            items: 업로드 대상 (plan.pending)
+            progress: 파일 처리마다 호출 (스케줄러 잠금 안에서 순차 호출)
+
+        Returns:
+            동작별 파일 수
+        """
+        self.engine.prepare_folders(items)
+
+        # 큰 파일은 큰 것부터, 작은 파일은 작은 것부터
+        self._large = deque(sorted((i for i in items if i.size >= self.large_file_size),
+                                   key=lambda i: i.size, reverse=True))
+        self._small = deque(sorted((i for i in items if i.size < self.large_file_size),
+                                   key=lambda i: i.size))
+        self._window_start = time.time()
+        self.limit_history = [self.limit]
+
+        workers = [
+            threading.Thread(target=self._worker, args=(progress,), name=f"drive-upload-{n}", daemon=True)
+            for n in range(self.max_workers)
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                while worker.is_alive():
+                    worker.join(0.5)  # 주 스레드 KeyboardInterrupt 수신 유지
+        except KeyboardInterrupt:
+            with self._cond:
+                self._large.clear()
+                self._small.clear()
+                self._cond.notify_all()
+            raise
+        finally:
+            self.engine.save()
+
+        print(f"[SCHEDULER] 동시 업로드 수 변화: {self.limit_history} (요청 한도 초과 {self.rate_limited}회)")
+        return dict(self.stats)
+
+    def _next_item(self) -> Optional[SyncItem]:
+        """큰 파일 슬롯(동시성 절반까지)이 비면 큰 파일, 아니면 작은 파일 (잠금 안에서 호출)"""
+        large_slots = max(1, self.limit // 2)
+        if self._large and (self._active_large < large_slots or not self._small):
+            return self._large.popleft()
+        if self._small:
+            return self._small.popleft()
+        return None
+
+    def _worker(self, progress):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._large and not self._small:
+                        self._cond.notify_all()
+                        return
+                    if self._active < self.limit:
+                        break
+                    self._cond.wait(0.5)
+                item = self._next_item()
+                is_large = item.size >= self.large_file_size
+                self._active += 1
+                self._active_large += is_large
+
+            action = None
+            attempt = 0
+            while action is None:
+                try:
+                    action = self.engine.sync_file(item)
+                except RateLimitError:
+                    self._on_rate_limited()
+                    if attempt + 1 >= MAX_RATE_LIMIT_RETRIES:
+                        print(f"[ERROR] 요청 한도 초과 재시도 소진: {item.relative_path}")
+                        action = ACTION_FAILED
+                        break
+                    # 대기 중에는 동시성 슬롯 반납
+                    with self._cond:
+                        self._active -= 1
+                        self._active_large -= is_large
+                        self._cond.notify_all()
+                    time.sleep(rate_limit_backoff(attempt))
+                    attempt += 1
+                    with self._cond:
+                        while self._active >= self.limit:
+                            self._cond.wait(0.5)
+                        self._active += 1
+                        self._active_large += is_large
+
+            with self._cond:
+                self._active -= 1
+                self._active_large -= is_large
+                self.stats[action] += 1
+                if action != ACTION_FAILED:
+                    self._window_bytes += item.size + REQUEST_COST_BYTES
+                self._maybe_adjust()
+                if progress:
+                    progress(item, action)
+                self._cond.notify_all()
+
+    def _maybe_adjust(self):
+        """측정 구간마다 처리량 비교 → 동시성 ±1 (잠금 안에서 호출)"""
+        elapsed = time.time() - self._window_start
+        if elapsed < ADJUST_INTERVAL:
+            return
+        score = self._window_bytes / elapsed
+        if self._last_score is not None and score < self._last_score * (1 - THROUGHPUT_TOLERANCE):
+            self._direction = -self._direction  # 이전 조정이 처리량을 떨어뜨림 → 반대로
+        self._set_limit(self.limit + self._direction)
+        if self.limit in (self.min_workers, self.max_workers):
+            self._direction = 1 if self.limit == self.min_workers else -1  # 경계에서는 반대쪽 탐색
+        self._last_score = score
+        self._window_start = time.time()
+        self._window_bytes = 0
+
+    def _on_rate_limited(self):
+        """요청 한도 초과 → 동시성 절반, 측정 구간 초기화"""
+        with self._cond:
+            self.rate_limited += 1
+            self._set_limit(self.limit // 2)
+            self._direction = 1
+            self._last_score = None
+            self._window_start = time.time()
+            self._window_bytes = 0
+
+    def _set_limit(self, limit: int):
+        limit = min(max(limit, self.min_workers), self.max_workers)
+        if limit != self.limit:
+            self.limit = limit
+            self.limit_history.append(limit)
+            self._cond.notify_all()
+
+    def get_report(self) -> Dict[str, Any]:
+        """스케줄러 상태"""
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "active": self._active,
+                "queued_large": len(self._large),
+                "queued_small": len(self._small),
+                "rate_limited": self.rate_limited,
+                "stats": dict(self.stats),
+                "limit_history": list(self.limit_history)
+            }
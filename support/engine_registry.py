@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+이벤트 루프별 하이브리드 엔진 레지스트리
+- 이벤트 루프(스레드)마다 전용 ClaudeGeminiHybridEngine (HTTP 세션, 계측, 서킷 브레이커, 결정 캐시)
+- 프로세스 안에서는 AIAPIManager 설정 스냅샷(읽기 전용)과 결정 로그를 공유
+- fork된 자식 프로세스는 부모 엔진을 물려받지 않고 새로 생성 (결정 로그도 pid별 전용 스트림)
+
+사용 예:
+    async def strategy_worker():
+        engine = get_hybrid_engine()      # 현재 루프 전용 엔진
+        decision = await engine.make_decision(context)
+        ...
+        await close_hybrid_engine()       # 루프 종료 전 세션 정리
+"""
+
+import os
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Dict, Any, Optional, Callable
+
+from .decision_log import DecisionLog
+from .claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine, DECISION_LOG_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class EngineRegistry:
+    """이벤트 루프 → 엔진 매핑 (스레드 안전)"""
+
+    def __init__(self, engine_factory: Optional[Callable[[DecisionLog], ClaudeGeminiHybridEngine]] = None,
+                 log_stream: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            engine_factory: 공유 결정 로그를 받아 엔진을 생성하는 함수 (None이면 기본 생성자)
+            log_stream: 결정 로그 스트림 이름 (프로세스마다 달라야 함, None이면 기본 파일)
+        """
+        self.engine_factory = engine_factory or (lambda log: ClaudeGeminiHybridEngine(decision_log=log))
+        self.decision_log = DecisionLog(DECISION_LOG_DIR, stream=log_stream)
+        self.pid = os.getpid()
+        self._engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ClaudeGeminiHybridEngine]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get_engine(self) -> ClaudeGeminiHybridEngine:
+        """현재 실행 중인 이벤트 루프의 엔진 (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        engine = self._engines.get(loop)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            engine = self._engines.get(loop)
+            if engine is None:
+                engine = self.engine_factory(self.decision_log)
+                self._engines[loop] = engine
+                logger.info(f"하이브리드 엔진 생성 (pid {self.pid}, 루프 {id(loop):#x}, 총 {len(self._engines)}개)")
+        return engine
+
+    async def close_engine(self):
+        """현재 이벤트 루프의 엔진 종료 및 등록 해제"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            engine = self._engines.pop(loop, None)
+        if engine is not None:
+            await engine.close()
+
+    def get_report(self) -> Dict[str, Any]:
+        """루프별 엔진 요약"""
+        with self._lock:
+            engines = list(self._engines.items())
+        return {
+            "pid": self.pid,
+            "engines": len(engines),
+            "loops": {
+                f"{id(loop):#x}": {
+                    "total_decisions": engine.total_decisions,
+                    "config_version": engine.config_version
+                }
+                for loop, engine in engines
+            }
+        }
+
+
+# 프로세스별 레지스트리
+_registry: Optional[EngineRegistry] = None
+_registry_lock = threading.Lock()
+_forked_child = False
+
+
+def _reset_after_fork():
+    global _registry, _registry_lock, _forked_child
+    _registry = None
+    _registry_lock = threading.Lock()
+    _forked_child = True
+
+
+if hasattr(os, "register_at_fork"):  # Windows에는 없음 (fork 없음)
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_engine_registry(log_stream: Optional[str] = None) -> EngineRegistry:
+    """
+    현재 프로세스의 엔진 레지스트리 (fork된 자식 프로세스는 새 레지스트리)
+
+    Args:
+        log_stream: 결정 로그 스트림 이름 (레지스트리 최초 생성시에만 적용)
+    """
+    global _registry
+
+    registry = _registry
+    if registry is not None and registry.pid == os.getpid():
+        return registry
+
+    with _registry_lock:
+        if _registry is None or _registry.pid != os.getpid():
+            if log_stream is None and (_forked_child or _registry is not None):
+                log_stream = f"p{os.getpid()}"  # fork된 자식: 부모와 같은 로그 파일에 쓰지 않음
+            _registry = EngineRegistry(log_stream=log_stream)
+        return _registry
+
+
+def get_hybrid_engine() -> ClaudeGeminiHybridEngine:
+    """현재 이벤트 루프 전용 하이브리드 엔진"""
+    return get_engine_registry().get_engine()
+
+
+async def close_hybrid_engine():
+    """현재 이벤트 루프 전용 하이브리드 엔진 종료"""
+    await get_engine_registry().close_engine()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+백업 대상 파일 탐색 (백업 스크립트 공용)
+- os.scandir 1회 탐색: 디렉토리 항목의 stat 정보를 그대로 사용 (파일마다 os.stat 재호출 없음)
+- gitignore 형식 제외 규칙을 정규식으로 한 번만 컴파일 → 모든 스크립트가 같은 제외 기준 사용
+- 제외된 디렉토리는 하위로 내려가지 않음
+- 탐색하면서 파일 수/바이트 누적 → 개수 세기용 별도 탐색 없이 진행 상황 갱신
+
+제외 규칙 (gitignore 형식):
+    *.pyc           이름 일치 (모든 깊이)
+    node_modules/   디렉토리만
+    /data/raw       루트 기준 경로
+    docs/**/*.tmp   ** = 0개 이상 디렉토리
+    !keep.tmp       앞선 규칙 예외
+소스 루트의 .backupignore 파일 규칙이 기본 규칙 뒤에 추가됨
+
+사용 예:
+    walker = FileWalker(SOURCE_DIR)
+    for entry in walker:                # FileEntry(path, relative_path, size, mtime_ns)
+        ...
+    print(walker.files, walker.bytes)
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Tuple, Optional, Iterable, Iterator, Callable, Union
+
+IGNORE_FILE_NAME = ".backupignore"
+PROGRESS_EVERY = 1000
+
+# Drive 백업 스크립트 공통 제외 규칙
+DEFAULT_IGNORE_RULES = (
+    ".*",  # 숨김 파일/폴더 (.git, .vscode, .pytest_cache 포함)
+    "__pycache__/",
+    "node_modules/",
+    "dist/",
+    "build/",
+    "*.tmp",
+    "*.pyc",
+    "/logs/drive_backup/",  # 백업 상태 폴더 (drive_sync_engine.MANIFEST_DIR: 매니페스트/저널/묶음 준비)
+)
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """탐색된 파일 (stat 정보 포함)"""
+    path: str
+    relative_path: str  # OS 구분자 기준 (기존 스크립트와 동일)
+    size: int
+    mtime_ns: int
+
+
+def _translate(pattern: str) -> str:
+    """gitignore 글롭 → 정규식 본문"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+            continue
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end < 0:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                out.append(f'[{body}]')
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+
+class IgnoreRules:
+    """컴파일된 제외 규칙 (마지막으로 일치한 규칙 우선)"""
+
+    def __init__(self, patterns: Iterable[str] = DEFAULT_IGNORE_RULES):
+        # (정규식, 예외 여부, 디렉토리 전용)
+        self.rules: List[Tuple["re.Pattern", bool, bool]] = []
+        for line in patterns:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            negate = line.startswith('!')
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            anchored = '/' in line
+            body = _translate(line.lstrip('/'))
+            regex = re.compile(f'^{body}$' if anchored else f'^(?:.*/)?{body}$')
+            self.rules.append((regex, negate, dir_only))
+
+        # 예외 규칙이 없으면 정규식 하나로 합쳐 한 번에 검사
+        self._combined = None
+        if not any(negate for _, negate, _ in self.rules):
+            file_rules = [r.pattern for r, _, dir_only in self.rules if not dir_only]
+            all_rules = [r.pattern for r, _, _ in self.rules]
+            self._combined = (
+                re.compile('|'.join(f'(?:{p})' for p in file_rules)) if file_rules else None,
+                re.compile('|'.join(f'(?:{p})' for p in all_rules)) if all_rules else None,
+            )
+
+    @classmethod
+    def for_source(cls, source_dir: str, patterns: Iterable[str] = DEFAULT_IGNORE_RULES) -> "IgnoreRules":
+        """기본 규칙 + 소스 루트 .backupignore"""
+        patterns = list(patterns)
+        ignore_file = os.path.join(source_dir, IGNORE_FILE_NAME)
+        if os.path.isfile(ignore_file):
+            with open(ignore_file, 'r', encoding='utf-8') as f:
+                patterns.extend(f.read().splitlines())
+        return cls(patterns)
+
+    def ignored(self, relative_path: str, is_dir: bool) -> bool:
+        """상대경로('/' 구분) 제외 여부"""
+        if self._combined is not None:
+            regex = self._combined[1 if is_dir else 0]
+            return bool(regex and regex.match(relative_path))
+        for regex, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relative_path):
+                return not negate
+        return False
+
+
+class FileWalker:
+    """os.scandir 기반 1회 탐색 (FileEntry 생성기)"""
+
+    def __init__(self, root: str, rules: Optional[Union[IgnoreRules, Iterable[str]]] = None,
+                 progress: Optional[Callable[["FileWalker"], None]] = None,
+                 progress_every: int = PROGRESS_EVERY):
+        """
+        초기화
+
+        Args:
+            root: 탐색 루트
+            rules: 제외 규칙 (None이면 기본 규칙 + .backupignore)
+            progress: progress_every개마다 호출 (walker.files/bytes로 누적치 확인)
+            progress_every: 진행 콜백 간격 (파일 수)
+        """
+        self.root = root
+        if rules is None:
+            rules = IgnoreRules.for_source(root)
+        elif not isinstance(rules, IgnoreRules):
+            rules = IgnoreRules(rules)
+        self.rules = rules
+        self.progress = progress
+        self.progress_every = progress_every
+
+        self.files = 0
+        self.bytes = 0
+        self.dirs = 0
+        self.ignored = 0
+        self.errors: List[str] = []
+
+    def __iter__(self) -> Iterator[FileEntry]:
+        stack = [('', self.root)]
+        while stack:
+            relative_dir, directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                self.errors.append(f"{directory}: {e}")
+                continue
+            self.dirs += 1
+
+            subdirs = []
+            for entry in entries:
+                relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if self.rules.ignored(relative, is_dir):
+                        self.ignored += 1
+                        continue
+                    if is_dir:
+                        subdirs.append((relative, entry.path))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError as e:
+                    self.errors.append(f"{entry.path}: {e}")
+                    continue
+
+                self.files += 1
+                self.bytes += stat.st_size
+                yield FileEntry(entry.path, relative.replace('/', os.sep), stat.st_size, stat.st_mtime_ns)
+                if self.progress and self.files % self.progress_every == 0:
+                    self.progress(self)
+
+            # 이름순 깊이 우선 (스택이므로 역순으로 추가)
+            stack.extend(reversed(subdirs))
+
+        if self.progress and self.files % self.progress_every:
+            self.progress(self)
+
+
+def walk_files(root: str, rules: Optional[Union[IgnoreRules, Iterable[str]]] = None) -> List[FileEntry]:
+    """루트 이하 백업 대상 파일 목록"""
+    return list(FileWalker(root, rules))
+
+
+def entry_info(file: Union[FileEntry, Tuple[str, str]]) -> Tuple[str, str, int, int]:
+    """FileEntry 또는 (로컬 경로, 상대 경로) → (로컬 경로, 상대 경로, 크기, mtime_ns)
+
+    Raises:
+        OSError: (경로, 상대 경로) 형식에서 파일 접근 불가
+    """
+    if isinstance(file, FileEntry):
+        return file.path, file.relative_path, file.size, file.mtime_ns
+    local_path, relative_path = file
+    stat = os.stat(local_path)
+    return local_path, relative_path, stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+하이브리드 엔진 압축 프롬프트 인코더
+- 고정 스키마 + 축약 키 + 수치 반올림 (compact JSON 한 줄)
+- 로컬 토큰 추정기 (API 호출 없이 프롬프트 크기 계측)
+- 최대 프롬프트 크기 강제: 초과시 선택 항목을 절반씩 축소 후 제거
+  (Claude: 위험 요인 → 시장 상황, Gemini: 기술지표)
+
+**입력 축약 키 (프롬프트 범례와 동일):**
+s=종목코드, p=현재가(원), chg=등락률(%), vol=거래량,
+ns=뉴스감정[긍정,중립,부정], mc=시장상황, ti=기술지표, rf=위험요인
+"""
+
+import json
+import re
+from typing import Dict, Any, Tuple, Optional
+
+from .gpt_interfaces import MarketContext
+
+# 토큰 추정 계수 (문자 유형별 토큰당 문자 수 근사치)
+ASCII_CHARS_PER_TOKEN = 4.0
+HANGUL_CHARS_PER_TOKEN = 1.0
+OTHER_CHARS_PER_TOKEN = 1.5
+
+_HANGUL = re.compile(r'[가-힣ㄱ-ㆎ]')
+
+MAX_STRING_LENGTH = 80
+MAX_LIST_ITEMS = 5
+
+MARKET_CONDITION_KEYS = {
+    "trend": "tr",
+    "volatility": "vt",
+    "market_trend": "mt",
+    "sector": "sec",
+    "rule_signal": "rs",
+    "rule_reason": "rr",
+    "kospi_change": "kospi",
+    "kosdaq_change": "kosdaq"
+}
+
+CLAUDE_SCHEMA = ('{"decision":"BUY|SELL|HOLD","confidence":0~1,"fundamental_score":0~1,'
+                 '"sustainability":"HIGH|MEDIUM|LOW","risk_factors":[],"reasoning":"한국어 3문장 이내"}')
+GEMINI_SCHEMA = ('{"decision":"BUY|SELL|HOLD","confidence":0~1,"technical_score":0~1,'
+                 '"trend":"BULLISH|BEARISH|NEUTRAL","momentum":"STRONG|WEAK|NEUTRAL",'
+                 '"entry_timing":"EXCELLENT|GOOD|POOR","reasoning":"한국어 3문장 이내"}')
+
+CLAUDE_HEADER = ("한국주식 펀더멘털 분석가. 뉴스감정/시장상황으로 급등락 원인, 지속성, 위험 평가.\n"
+                 "키: s=종목,p=현재가,chg=등락률%,ns=뉴스감정[긍정,중립,부정],mc=시장상황,rf=위험요인")
+GEMINI_HEADER = ("한국주식 기술적 분석가. 지표로 추세, 신호강도, 지지/저항, 단기모멘텀 평가.\n"
+                 "키: s=종목,p=현재가,chg=등락률%,vol=거래량,ti=기술지표")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    로컬 토큰 수 추정 (제공자 토크나이저 근사)
+
+    한글은 음절당 약 1토큰, ASCII는 약 4자당 1토큰으로 계산
+    """
+    if not text:
+        return 0
+    hangul = len(_HANGUL.findall(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other = len(text) - hangul - ascii_chars
+    return int(round(hangul / HANGUL_CHARS_PER_TOKEN +
+                     ascii_chars / ASCII_CHARS_PER_TOKEN +
+                     other / OTHER_CHARS_PER_TOKEN))
+
+
+def compact_number(value: float) -> Any:
+    """수치 반올림 (정수값은 int, 크기에 따라 유효자릿수 축소)"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+    if float(value).is_integer():
+        return int(value)
+    magnitude = abs(value)
+    if magnitude >= 100:
+        return int(round(value))
+    if magnitude >= 1:
+        return round(value, 2)
+    return round(value, 3)
+
+
+def compact_value(value: Any) -> Any:
+    """중첩 값 압축 (수치 반올림, 긴 문자열 절단, 긴 목록 절단)"""
+    if isinstance(value, dict):
+        return {MARKET_CONDITION_KEYS.get(k, k): compact_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [compact_value(v) for v in list(value)[:MAX_LIST_ITEMS]]
+    if isinstance(value, str):
+        return value if len(value) <= MAX_STRING_LENGTH else value[:MAX_STRING_LENGTH] + "…"
+    return compact_number(value)
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+class CompactPromptEncoder:
+    """고정 스키마 압축 프롬프트 생성기"""
+
+    def __init__(self, max_prompt_tokens: int = 0):
+        """
+        초기화
+
+        Args:
+            max_prompt_tokens: 최대 프롬프트 추정 토큰 수 (0이면 제한 없음)
+        """
+        self.max_prompt_tokens = max_prompt_tokens
+        self.trimmed_prompts = 0
+
+    def encode_claude(self, context: MarketContext) -> Tuple[str, int]:
+        """Claude 펀더멘털 분석 프롬프트 → (프롬프트, 추정 토큰 수)"""
+        sentiment = context.news_sentiment or {}
+        payload = {
+            "s": context.symbol,
+            "p": compact_number(context.current_price),
+            "chg": round(context.price_change_pct, 2),
+            "ns": [round(float(sentiment.get(k, 0)), 2) for k in ('positive', 'neutral', 'negative')],
+            "mc": compact_value(context.market_conditions or {}),
+            "rf": compact_value(context.risk_factors or [])
+        }
+        return self._fit(CLAUDE_HEADER, payload, CLAUDE_SCHEMA, optional=('mc', 'rf'))
+
+    def encode_gemini(self, context: MarketContext) -> Tuple[str, int]:
+        """Gemini 기술적 분석 프롬프트 → (프롬프트, 추정 토큰 수)"""
+        payload = {
+            "s": context.symbol,
+            "p": compact_number(context.current_price),
+            "chg": round(context.price_change_pct, 2),
+            "vol": int(context.volume),
+            "ti": {k: compact_number(v) for k, v in (context.technical_indicators or {}).items()}
+        }
+        return self._fit(GEMINI_HEADER, payload, GEMINI_SCHEMA, optional=('ti',))
+
+    @staticmethod
+    def _render(header: str, payload: Dict[str, Any], schema: str) -> str:
+        return f"{header}\n입력:{_dumps(payload)}\nJSON만 응답:{schema}"
+
+    def _fit(self, header: str, payload: Dict[str, Any], schema: str,
+             optional: Tuple[str, ...]) -> Tuple[str, int]:
+        """최대 크기에 맞게 선택 항목 축소 (뒤쪽 항목부터, dict/list는 절반씩)"""
+        prompt = self._render(header, payload, schema)
+        tokens = estimate_tokens(prompt)
+        if not self.max_prompt_tokens or tokens <= self.max_prompt_tokens:
+            return prompt, tokens
+
+        self.trimmed_prompts += 1
+        for key in reversed(optional):
+            while payload.get(key) and tokens > self.max_prompt_tokens:
+                payload[key] = self._shrink(payload[key])
+                prompt = self._render(header, payload, schema)
+                tokens = estimate_tokens(prompt)
+            if tokens <= self.max_prompt_tokens:
+                return prompt, tokens
+            payload.pop(key, None)
+
+        prompt = self._render(header, payload, schema)
+        tokens = estimate_tokens(prompt)
+        if tokens > self.max_prompt_tokens:
+            raise ValueError(f"프롬프트 필수 항목만으로 최대 크기 초과: {tokens} > {self.max_prompt_tokens} 토큰")
+        return prompt, tokens
+
+    @staticmethod
+    def _shrink(value: Any) -> Optional[Any]:
+        if isinstance(value, dict):
+            items = list(value.items())
+            return dict(items[:len(items) // 2]) or None
+        if isinstance(value, list):
+            return value[:len(value) // 2] or None
+        return None
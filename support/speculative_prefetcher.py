@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+다음 사이클 AI 결정 선계산 (speculative pre-fetch)
+- 사이클 사이 유휴 구간에 다음 사이클에서 결정이 필요할 종목 예측
+  (보유 종목 우선 + 급등 순위 상위 N개)
+- 하이브리드 엔진 결정 캐시에 미리 계산해 두고,
+  사용 시점에 가격 변동이 허용 범위를 넘으면 엔진이 stale로 폐기
+"""
+
+import logging
+from typing import Dict, Any, List, Iterable, Callable, Optional
+
+from .gpt_interfaces import MarketContext
+
+logger = logging.getLogger(__name__)
+
+
+class SpeculativePrefetcher:
+    """유휴 구간 결정 선계산기"""
+
+    def __init__(self, engine, top_n: Optional[int] = None, safety_margin_seconds: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            engine: ClaudeGeminiHybridEngine 인스턴스
+            top_n: 선계산할 급등 순위 상위 종목 수 (None이면 엔진 설정)
+            safety_margin_seconds: 다음 사이클 시작 전 남겨둘 여유 시간 (None이면 엔진 설정)
+        """
+        self.engine = engine
+        config = engine.hybrid_config
+        self.top_n = top_n if top_n is not None else config['prefetch_top_n']
+        self.safety_margin = (safety_margin_seconds if safety_margin_seconds is not None
+                              else config['prefetch_safety_margin_seconds'])
+        self.last_result: Dict[str, Any] = {}
+
+    def predict_symbols(self, held_positions: Iterable[str], ranked_surges: Iterable[Any]) -> List[str]:
+        """
+        다음 사이클 결정 대상 예측
+
+        Args:
+            held_positions: 보유 종목코드 (매도 판단 필요 → 최우선)
+            ranked_surges: 급등 순위 목록 (종목코드 또는 'symbol'/'stock_code' 키를 가진 dict, 순위순)
+
+        Returns:
+            중복 제거된 종목코드 목록 (우선순위 순)
+        """
+        symbols: List[str] = []
+        seen = set()
+
+        for code in held_positions:
+            if code not in seen:
+                symbols.append(code)
+                seen.add(code)
+
+        added = 0
+        for item in ranked_surges:
+            if added >= self.top_n:
+                break
+            code = item if isinstance(item, str) else item.get('symbol') or item.get('stock_code')
+            if code and code not in seen:
+                symbols.append(code)
+                seen.add(code)
+                added += 1
+
+        return symbols
+
+    async def run_idle_gap(self, held_positions: Iterable[str], ranked_surges: Iterable[Any],
+                           build_context: Callable[[str], Optional[MarketContext]],
+                           idle_seconds: float) -> Dict[str, Any]:
+        """
+        유휴 구간 선계산 실행
+
+        Args:
+            held_positions: 보유 종목코드
+            ranked_surges: 급등 순위 목록
+            build_context: 종목코드 → 최신 MarketContext (데이터 없으면 None)
+            idle_seconds: 다음 사이클 시작까지 남은 시간
+
+        Returns:
+            선계산 결과 요약
+        """
+        if not self.engine.hybrid_config['prefetch_enabled']:
+            return {"requested": 0, "stored": 0, "cancelled": 0, "skipped": "prefetch_disabled"}
+
+        deadline = idle_seconds - self.safety_margin
+        if deadline <= 0:
+            return {"requested": 0, "stored": 0, "cancelled": 0, "skipped": "no_idle_time"}
+
+        contexts = []
+        for code in self.predict_symbols(held_positions, ranked_surges):
+            try:
+                context = build_context(code)
+            except Exception as e:
+                logger.warning(f"선계산 컨텍스트 생성 실패 {code}: {e}")
+                continue
+            if context is not None:
+                contexts.append(context)
+
+        self.last_result = await self.engine.prefetch_decisions(contexts, deadline)
+        return self.last_result
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+스트리밍 병렬 압축 ZIP 아카이브 → Google Drive resumable 업로드
+- 파일을 청크 단위로 프로세스 풀에서 deflate 압축 (청크마다 독립 압축 + sync flush → 이어 붙이면 하나의 deflate 스트림)
+- ZIP은 데이터 디스크립터 방식으로 순차 기록 (탐색 불필요, 4GB 초과시 ZIP64)
+- 압축 결과는 크기 제한 버퍼(큐)로 업로드 스레드에 전달 → 로컬 임시 아카이브 없음
+- 압축과 업로드가 동시에 진행되어 소요 시간 ≈ max(압축, 업로드)
+
+사용 예:
+    archive = StreamingZipArchive(files, workers=4)
+    media = ArchiveMediaUpload(archive.start())
+    request = service.files().create(body=metadata, media_body=media, fields='id')
+    while response is None:
+        status, response = request.next_chunk()
+    archive.join()
+"""
+
+import os
+import time
+import zlib
+import queue
+import struct
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional, Iterable
+
+try:
+    from googleapiclient.http import MediaUpload
+except ImportError:  # 백업 유틸리티에서 설치 안내
+    MediaUpload = object
+
+COMPRESS_CHUNK_SIZE = 4 * 1024 * 1024  # 압축 작업 단위
+COMPRESS_LEVEL = 6
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 256KB 배수
+BUFFER_BLOCKS = 16  # 업로드 대기 블록 수 상한 (메모리 상한 ≈ 블록 수 × 압축 청크)
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_ENTRY_LIMIT = 0xFFFF
+
+_END = None  # 스트림 종료 표시
+
+
+def crc32_combine(crc1: int, crc2: int, len2: int) -> int:
+    """crc32(A), crc32(B), len(B) → crc32(A + B) (zlib crc32_combine 이식, GF(2) 행렬 거듭제곱)"""
+    if len2 <= 0:
+        return crc1
+
+    def times(matrix, vector):
+        total = 0
+        row = 0
+        while vector:
+            if vector & 1:
+                total ^= matrix[row]
+            vector >>= 1
+            row += 1
+        return total
+
+    def square(matrix):
+        return [times(matrix, matrix[n]) for n in range(32)]
+
+    odd = [0xEDB88320] + [1 << n for n in range(31)]  # 1비트 이동 연산자
+    even = square(odd)  # 2비트
+    odd = square(even)  # 4비트
+
+    while True:
+        even = square(odd)
+        if len2 & 1:
+            crc1 = times(even, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+        odd = square(even)
+        if len2 & 1:
+            crc1 = times(odd, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+    return crc1 ^ crc2
+
+
+def _compress_chunk(path: str, offset: int, length: int, final: bool, level: int) -> Tuple[int, int, bytes]:
+    """워커 프로세스: 파일 구간 읽기 → (CRC32, 원본 길이, raw deflate 바이트)"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        data = f.read(length)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    packed = compressor.compress(data) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+    return zlib.crc32(data), len(data), packed
+
+
+def _dos_datetime(mtime: float) -> Tuple[int, int]:
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (1 << 5) | 1  # 1980-01-01 00:00
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+
+class StreamingZipArchive:
+    """병렬 압축 ZIP 스트림 생성기 (백그라운드 스레드 → 크기 제한 큐)"""
+
+    def __init__(self, files: Iterable[Tuple[str, str]], workers: Optional[int] = None,
+                 level: int = COMPRESS_LEVEL, chunk_size: int = COMPRESS_CHUNK_SIZE,
+                 buffer_blocks: int = BUFFER_BLOCKS):
+        """
+        초기화
+
+        Args:
+            files: (로컬 경로, 아카이브 내 경로) 목록
+            workers: 압축 프로세스 수 (None이면 CPU 수)
+            level: deflate 압축 수준
+            chunk_size: 압축 작업 단위
+            buffer_blocks: 업로드 대기 블록 수 상한
+        """
+        self.files = list(files)
+        self.workers = workers or os.cpu_count() or 1
+        self.level = level
+        self.chunk_size = chunk_size
+        self.buffer: queue.Queue = queue.Queue(maxsize=buffer_blocks)
+
+        self.offset = 0  # 아카이브 기록 바이트
+        self.raw_bytes = 0
+        self.entries: List[tuple] = []  # 중앙 디렉토리용 (파일명, 헤더 오프셋, CRC, 원본/압축 길이, zip64, DOS 시각)
+        self.error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StreamingZipArchive":
+        """압축 스레드 시작"""
+        self._thread = threading.Thread(target=self._run, name="zip-stream", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """중단 (업로드 실패시 압축 스레드 정리)"""
+        self._stop.set()
+        while self._thread and self._thread.is_alive():
+            try:
+                self.buffer.get_nowait()
+            except queue.Empty:
+                self._thread.join(0.1)
+
+    def join(self):
+        """압축 스레드 종료 대기 (압축 중 오류는 여기서 다시 발생)"""
+        if self._thread:
+            self._thread.join()
+        if self.error:
+            raise self.error
+
+    def read_block(self) -> Optional[bytes]:
+        """업로드 측: 다음 블록 (끝이면 None)"""
+        return self.buffer.get()
+
+    def _emit(self, data: bytes):
+        if not data:
+            return
+        while not self._stop.is_set():
+            try:
+                self.buffer.put(data, timeout=0.5)
+                break
+            except queue.Full:
+                continue
+        self.offset += len(data)
+
+    def _tasks(self):
+        """(파일 번호, 경로, 오프셋, 길이, 마지막 여부) 순차 생성"""
+        for number, (local_path, _) in enumerate(self.files):
+            try:
+                size = os.path.getsize(local_path)
+            except OSError:
+                continue
+            offset = 0
+            while True:
+                length = min(self.chunk_size, size - offset)
+                final = offset + length >= size
+                yield number, local_path, offset, length, final
+                if final:
+                    break
+                offset += length
+
+    def _run(self):
+        try:
+            in_flight = self.workers * 2  # 순서 유지 + 메모리 상한
+            pending: deque = deque()
+            current = None  # 기록 중인 항목 (_write_local_header 참고)
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                for task in self._tasks():
+                    if self._stop.is_set():
+                        break
+                    pending.append((task, executor.submit(_compress_chunk, *task[1:], self.level)))
+                    if len(pending) >= in_flight:
+                        current = self._write_chunk(current, *pending.popleft())
+                while pending and not self._stop.is_set():
+                    current = self._write_chunk(current, *pending.popleft())
+                if self._stop.is_set():
+                    for _, future in pending:
+                        future.cancel()
+                    return
+            self._write_central_directory()
+        except BaseException as e:
+            self.error = e
+        finally:
+            self._emit_end()
+
+    def _emit_end(self):
+        while True:
+            try:
+                self.buffer.put(_END, timeout=0.5)
+                return
+            except queue.Full:
+                if self._stop.is_set():
+                    return
+
+    def _write_chunk(self, current, task, future):
+        number, _, offset, _, final = task
+        crc, length, packed = future.result()
+        if offset == 0:
+            current = self._write_local_header(number)
+        current[2] = crc32_combine(current[2], crc, length) if offset else crc
+        current[3] += length
+        current[4] += len(packed)
+        self._emit(packed)
+        if final:
+            self._write_descriptor(current)
+            return None
+        return current
+
+    def _write_local_header(self, number: int) -> list:
+        """로컬 헤더 기록 → [파일 번호, 헤더 오프셋, CRC, 원본 길이, 압축 길이, zip64, (DOS 시각), 파일명]"""
+        local_path, arcname = self.files[number]
+        stat = os.stat(local_path)
+        name = arcname.replace(os.sep, '/').encode('utf-8')
+        zip64 = stat.st_size >= ZIP64_LIMIT * 0.9  # 압축 후 크기 증가 여유
+        extra = struct.pack('<HHQQ', 1, 16, 0, 0) if zip64 else b''
+        dos_time, dos_date = _dos_datetime(stat.st_mtime)
+        header = struct.pack(
+            '<4s2B4HL2L2H', b'PK\x03\x04', 45 if zip64 else 20, 0,
+            0x0808, 8, dos_time, dos_date,  # 플래그: 데이터 디스크립터 + UTF-8 파일명
+            0, ZIP64_LIMIT if zip64 else 0, ZIP64_LIMIT if zip64 else 0,
+            len(name), len(extra)
+        )
+        header_offset = self.offset
+        self._emit(header + name + extra)
+        return [number, header_offset, 0, 0, 0, zip64, (dos_time, dos_date), name]
+
+    def _write_descriptor(self, current: list):
+        _, header_offset, crc, size, packed_size, zip64, (dos_time, dos_date), name = current
+        if zip64:
+            self._emit(struct.pack('<4sLQQ', b'PK\x07\x08', crc, packed_size, size))
+        else:
+            self._emit(struct.pack('<4sLLL', b'PK\x07\x08', crc, packed_size, size))
+        self.raw_bytes += size
+        self.entries.append((name, header_offset, crc, size, packed_size, zip64, dos_time, dos_date))
+
+    def _write_central_directory(self):
+        start = self.offset
+        for name, header_offset, crc, size, packed_size, zip64, dos_time, dos_date in self.entries:
+            extra_values = [v for v in (size, packed_size, header_offset) if v >= ZIP64_LIMIT]
+            extra = struct.pack(f'<HH{len(extra_values)}Q', 1, 8 * len(extra_values), *extra_values) \
+                if extra_values else b''
+            version = 45 if zip64 or extra_values else 20
+            self._emit(struct.pack(
+                '<4s4B4HL2L5H2L', b'PK\x01\x02', version, 3, version, 0,
+                0x0808, 8, dos_time, dos_date, crc,
+                min(packed_size, ZIP64_LIMIT), min(size, ZIP64_LIMIT),
+                len(name), len(extra), 0, 0, 0, 0o644 << 16, min(header_offset, ZIP64_LIMIT)
+            ) + name + extra)
+
+        count = len(self.entries)
+        cd_size = self.offset - start
+        if count >= ZIP64_ENTRY_LIMIT or cd_size >= ZIP64_LIMIT or start >= ZIP64_LIMIT:
+            zip64_end = self.offset
+            self._emit(struct.pack('<4sQ2H2L4Q', b'PK\x06\x06', 44, 45, 45, 0, 0, count, count, cd_size, start))
+            self._emit(struct.pack('<4sLQL', b'PK\x06\x07', 0, zip64_end, 1))
+        self._emit(struct.pack(
+            '<4s4H2LH', b'PK\x05\x06', 0, 0,
+            min(count, ZIP64_ENTRY_LIMIT), min(count, ZIP64_ENTRY_LIMIT),
+            min(cd_size, ZIP64_LIMIT), min(start, ZIP64_LIMIT), 0
+        ))
+
+
+class ArchiveMediaUpload(MediaUpload):
+    """크기 미정 스트림 resumable 업로드 (googleapiclient MediaUpload)
+
+    - 업로드 청크 1개만 메모리에 유지 (재전송 대비), 나머지는 압축 스레드 큐에서 순차 소비
+    - 마지막 청크가 정확히 청크 크기와 같으면 chunksize()를 1 늘려 라이브러리가 마지막 청크로 인식하게 함
+    """
+
+    def __init__(self, archive: StreamingZipArchive, chunksize: int = UPLOAD_CHUNK_SIZE,
+                 mimetype: str = 'application/zip'):
+        self._archive = archive
+        self._chunksize = chunksize
+        self._mimetype = mimetype
+        self._base = 0  # _data[0]의 스트림 오프셋
+        self._data = bytearray()
+        self._eof = False
+        self._final_chunk = False
+
+    def chunksize(self):
+        return self._chunksize + 1 if self._final_chunk else self._chunksize
+
+    def mimetype(self):
+        return self._mimetype
+
+    def size(self):
+        return None
+
+    def resumable(self):
+        return True
+
+    def has_stream(self):
+        return False
+
+    def getbytes(self, begin, length):
+        if begin < self._base:
+            raise IOError(f"스트림 되감기 불가: 요청 {begin}, 보유 시작 {self._base}")
+        # 서버 확정분 버림
+        del self._data[:begin - self._base]
+        self._base = begin
+        # 다음 청크 + 1바이트(종료 확인)까지 채움
+        while not self._eof and len(self._data) <= length:
+            block = self._archive.read_block()
+            if block is _END:
+                self._eof = True
+                self._archive.join()
+            else:
+                self._data += block
+        self._final_chunk = self._eof and len(self._data) <= length
+        return bytes(self._data[:length])
+
+    def to_json(self):
+        raise NotImplementedError("스트리밍 업로드는 직렬화할 수 없습니다")
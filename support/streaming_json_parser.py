@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+스트리밍 응답용 증분 JSON 파서
+- SSE로 조금씩 도착하는 모델 텍스트를 그대로 feed()
+- 최상위 필드가 완성되는 즉시 값을 확정 (decision, confidence 조기 추출)
+- 응답 앞의 마크다운 펜스/설명 문장은 첫 '{' 전까지 무시
+"""
+
+import json
+from typing import Dict, Any, List
+
+
+class IncrementalJSONParser:
+    """최상위 JSON 객체의 필드를 도착 순서대로 확정하는 증분 파서"""
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.complete = False
+
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_buffer: List[str] = []
+        self._value_buffer: List[str] = []
+        self._current_key = None
+        self._reading_key = False
+        self._reading_value = False
+
+    def feed(self, chunk: str) -> Dict[str, Any]:
+        """
+        텍스트 조각 입력
+
+        Args:
+            chunk: 스트림에서 새로 도착한 텍스트
+
+        Returns:
+            이번 조각으로 새로 완성된 최상위 필드
+        """
+        completed = {}
+
+        for ch in chunk:
+            if self.complete:
+                break
+
+            if not self._started:
+                if ch == '{':
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._reading_key and self._depth == 1:
+                    if self._escape:
+                        self._key_buffer.append(ch)
+                        self._escape = False
+                    elif ch == '\\':
+                        self._key_buffer.append(ch)
+                        self._escape = True
+                    elif ch == '"':
+                        self._in_string = False
+                        self._current_key = json.loads('"' + ''.join(self._key_buffer) + '"')
+                        self._key_buffer = []
+                        self._reading_key = False
+                    else:
+                        self._key_buffer.append(ch)
+                    continue
+
+                self._value_buffer.append(ch)
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if self._depth == 1 and not self._reading_value:
+                # 키 또는 구분자 대기
+                if ch == '"':
+                    self._in_string = True
+                    self._reading_key = True
+                elif ch == ':' and self._current_key is not None:
+                    self._reading_value = True
+                elif ch == '}':
+                    self.complete = True
+                continue
+
+            # 값 읽는 중
+            if ch == '"':
+                self._in_string = True
+                self._value_buffer.append(ch)
+            elif ch in '{[':
+                self._depth += 1
+                self._value_buffer.append(ch)
+            elif ch in '}]' and self._depth > 1:
+                self._depth -= 1
+                self._value_buffer.append(ch)
+            elif self._depth == 1 and ch in ',}':
+                field = self._finish_value()
+                if field:
+                    completed.update(field)
+                if ch == '}':
+                    self.complete = True
+            else:
+                self._value_buffer.append(ch)
+
+        return completed
+
+    def _finish_value(self) -> Dict[str, Any]:
+        """버퍼에 쌓인 값 확정"""
+        raw = ''.join(self._value_buffer).strip()
+        key = self._current_key
+
+        self._value_buffer = []
+        self._current_key = None
+        self._reading_value = False
+
+        if key is None or not raw:
+            return {}
+
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            return {}
+
+        self.fields[key] = value
+        return {key: value}
+
+    def has(self, *keys: str) -> bool:
+        """지정한 필드가 모두 확정되었는지 확인"""
+        return all(key in self.fields for key in keys)
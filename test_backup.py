@@ -6,6 +6,7 @@
 
 import os
 import sys
+from pathlib import Path
 
 try:
     from google.auth.transport.requests import Request
@@ -20,6 +21,10 @@ except ImportError as e:
     print(f"Import error: {e}")
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support.file_walker import FileWalker
+
 # Settings
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 SOURCE_DIR = r"C:\Claude_Works\Projects\GPT4wiseTide"
@@ -75,11 +80,9 @@ def main():
         service = authenticate()
         print("Service created successfully")
         
-        # Count files
-        file_count = 0
-        for root, dirs, files in os.walk(SOURCE_DIR):
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            file_count += len([f for f in files if not f.startswith('.')])
+        # Collect files (one pass, shared ignore rules)
+        entries = list(FileWalker(SOURCE_DIR))
+        file_count = len(entries)
         
         print(f"Found {file_count} files to backup")
         
@@ -103,35 +106,26 @@ def main():
         
         # Upload first 10 files as test
         uploaded = 0
-        for root, dirs, files in os.walk(SOURCE_DIR):
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            for file in files:
-                if file.startswith('.') or uploaded >= 10:
-                    continue
+        for entry in entries:
+            file = os.path.basename(entry.path)
+            try:
+                file_metadata = {
+                    'name': file,
+                    'parents': [backup_folder_id]
+                }
+                
+                media = MediaFileUpload(entry.path, resumable=False)
+                result = service.files().create(
+                    body=file_metadata,
+                    media_body=media,
+                    fields='id'
+                ).execute()
                 
-                file_path = os.path.join(root, file)
-                try:
-                    file_metadata = {
-                        'name': file,
-                        'parents': [backup_folder_id]
-                    }
-                    
-                    media = MediaFileUpload(file_path, resumable=False)
-                    result = service.files().create(
-                        body=file_metadata,
-                        media_body=media,
-                        fields='id'
-                    ).execute()
-                    
-                    uploaded += 1
-                    print(f"Uploaded {uploaded}/10: {file}")
-                    
-                except Exception as e:
-                    print(f"Failed to upload {file}: {e}")
+                uploaded += 1
+                print(f"Uploaded {uploaded}/10: {file}")
                 
-                if uploaded >= 10:
-                    break
+            except Exception as e:
+                print(f"Failed to upload {file}: {e}")
             
             if uploaded >= 10:
                 break
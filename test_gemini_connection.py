@@ -72,7 +72,10 @@ async def test_gemini_connection():
         # Gemini API 테스트 호출
         print("\n📡 Gemini API 연결 테스트 중...")
         
-        url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-exp:generateContent"
+        # Base URL은 Register_Key.md에서 로드 (로컬 모의 서버 지정 가능)
+        base_url = ai_manager.get_api_base_url('gemini')
+        url = f"{base_url}/v1beta/models/gemini-2.0-flash-exp:generateContent"
+        print(f"   엔드포인트: {base_url}")
         params = {"key": gemini_api_key}
         
         payload = {
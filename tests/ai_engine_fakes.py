@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 엔진 테스트용 가짜 구성요소
+- FakeKeyLoader: 임시 Register_Key.md (key=value 줄)를 읽는 키 로더
+- install_ai_manager: 임시 프로젝트 루트의 AIAPIManager를 프로세스 싱글톤으로 설치
+- FakeProvider: 지정 지연 후 분석 결과 반환, 취소 여부 기록
+- FakeSession/FakeResponse: aiohttp 세션 대체 (SSE 줄 사이에 asyncio.Event 대기 지점 삽입 가능)
+"""
+
+import os
+import json
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from support import ai_api_manager
+from support.gpt_interfaces import MarketContext
+
+DEFAULT_KEYS = {
+    'claude_api_key': 'test-claude-key',
+    'gemini_api_key': 'test-gemini-key',
+    'hybrid_mode_enabled': 'true',
+}
+
+
+def register_key_path(project_root: Path) -> Path:
+    return Path(project_root) / "Policy" / "Register_Key" / "Register_Key.md"
+
+
+def write_register_key(project_root: Path, **values) -> Path:
+    """임시 Register_Key.md 작성 (기본 API 키 포함)"""
+    path = register_key_path(project_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [f"{key}={value}" for key, value in {**DEFAULT_KEYS, **values}.items()]
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return path
+
+
+class FakeKeyLoader:
+    """AuthoritativeRegisterKeyLoader 대체 (key=value 줄 파싱)"""
+
+    def __init__(self, project_root: Optional[Path] = None):
+        self.path = register_key_path(project_root)
+        self.loads = 0
+
+    def load_all_configuration(self) -> Dict[str, str]:
+        self.loads += 1
+        values = {}
+        for line in self.path.read_text(encoding='utf-8').splitlines():
+            if '=' in line:
+                key, value = line.split('=', 1)
+                values[key.strip()] = value.strip()
+        return values
+
+
+def install_ai_manager(monkeypatch, project_root: Path, **values) -> "ai_api_manager.AIAPIManager":
+    """임시 설정의 AIAPIManager를 get_ai_api_manager()가 반환하도록 설치"""
+    monkeypatch.setattr(ai_api_manager, "AuthoritativeRegisterKeyLoader", FakeKeyLoader)
+    write_register_key(project_root, **values)
+    manager = ai_api_manager.AIAPIManager(Path(project_root))
+    monkeypatch.setattr(ai_api_manager, "_ai_api_manager_instance", manager)
+    monkeypatch.setattr(ai_api_manager, "_ai_api_manager_pid", os.getpid())
+    return manager
+
+
+def make_context(symbol: str = "005930", price: float = 70000.0, **overrides) -> MarketContext:
+    """테스트용 시장 컨텍스트"""
+    fields = dict(
+        symbol=symbol,
+        current_price=price,
+        price_change_pct=1.5,
+        volume=1000000,
+        technical_indicators={"RSI": 55.0, "MACD": 0.4},
+        news_sentiment={"positive": 0.5, "neutral": 0.4, "negative": 0.1},
+        market_conditions={"trend": "NEUTRAL", "volatility": "MEDIUM"},
+        risk_factors=[],
+        timestamp=datetime.now()
+    )
+    fields.update(overrides)
+    return MarketContext(**fields)
+
+
+def analysis(decision: str, confidence: float, **fields) -> Dict[str, Any]:
+    """제공자 분석 결과"""
+    return {'decision': decision, 'confidence': confidence, **fields}
+
+
+class FakeProvider:
+    """_analyze_with_claude/_analyze_with_gemini 대체 (지연 후 결과 또는 예외)"""
+
+    def __init__(self, result: Optional[Dict[str, Any]] = None, delay: float = 0.0,
+                 error: Optional[Exception] = None):
+        self.result = result
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def __call__(self, context: MarketContext) -> Dict[str, Any]:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return dict(self.result)
+
+
+class FakeResponse:
+    """aiohttp 응답 대체 (lines: SSE 줄 bytes 또는 수신을 멈출 asyncio.Event)"""
+
+    def __init__(self, status: int = 200, body: Optional[Dict[str, Any]] = None, lines: Optional[List] = None):
+        self.status = status
+        self._body = body or {}
+        self._lines = lines or []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self._body
+
+    async def text(self):
+        return json.dumps(self._body)
+
+    async def read(self):
+        return b""
+
+    @property
+    def content(self):
+        return self._iter_lines()
+
+    async def _iter_lines(self):
+        for line in self._lines:
+            if isinstance(line, asyncio.Event):
+                await line.wait()
+                continue
+            yield line
+
+
+class FakeSession:
+    """aiohttp.ClientSession 대체 (responder(method, url, kwargs) → FakeResponse)"""
+
+    def __init__(self, responder: Callable[[str, str, Dict[str, Any]], FakeResponse]):
+        self.responder = responder
+        self.requests = []
+        self.closed = False
+
+    def _request(self, method: str, url: str, **kwargs) -> FakeResponse:
+        self.requests.append((method, url, kwargs))
+        return self.responder(method, url, kwargs)
+
+    def post(self, url, **kwargs):
+        return self._request("POST", url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self._request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self._request("HEAD", url, **kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
+def use_session(engine, session: FakeSession):
+    """엔진 공용 세션을 가짜 세션으로 고정"""
+    engine._session = session
+    engine._get_session = lambda: session
+
+
+def _sse(event: Dict[str, Any]) -> bytes:
+    return b"data: " + json.dumps(event, ensure_ascii=False).encode('utf-8') + b"\n"
+
+
+def claude_sse(*parts) -> List:
+    """Claude 메시지 스트림 (parts: 텍스트 조각 또는 asyncio.Event)"""
+    lines = [_sse({'type': 'message_start', 'message': {'usage': {'input_tokens': 100}}})]
+    for part in parts:
+        lines.append(part if isinstance(part, asyncio.Event) else
+                     _sse({'type': 'content_block_delta', 'delta': {'text': part}}))
+    lines.append(_sse({'type': 'message_delta', 'usage': {'output_tokens': 50}}))
+    return lines
+
+
+def gemini_sse(*parts) -> List:
+    """Gemini streamGenerateContent SSE (parts: 텍스트 조각 또는 asyncio.Event)"""
+    return [part if isinstance(part, asyncio.Event) else
+            _sse({'candidates': [{'content': {'parts': [{'text': part}]}}]})
+            for part in parts]
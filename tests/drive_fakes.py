@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Google Drive 백업 테스트용 가짜 Drive v3 서비스 (메모리 저장소)
+- files().list/create/update/get_media: 이름/상위 폴더 검색 쿼리, 페이지 조회
+- resumable 업로드: 청크 전송(next_chunk), 세션 상태 조회(빈 PUT), lose_response_after 번째 청크 후 응답 유실
+- changes().getStartPageToken/list: 변경 로그 기반 차분 (삭제/휴지통 포함, 페이지 단위)
+- new_batch_http_request: 배치 요청 (failing_batches 번째 배치는 요청이 반영된 뒤 응답 수신 실패)
+- 호출 수 집계 (calls), 파일/폴더 경로 조회 헬퍼
+"""
+
+import re
+import json
+import hashlib
+import itertools
+from typing import Dict, Any, List, Optional
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+ROOT_ID = "ROOT"
+
+_NAME_PARENT_QUERY = re.compile(r"name='((?:[^'\\]|\\.)*)' and '([^']*)' in parents")
+
+
+def http_error(status: int, content: bytes = b'') -> HttpError:
+    """지정 상태 코드의 HttpError"""
+    return HttpError(httplib2.Response({'status': status}), content)
+
+
+class FakeRequest:
+    """execute() 시점에 실행되는 요청"""
+
+    def __init__(self, run):
+        self._run = run
+
+    def execute(self, num_retries: int = 0):
+        return self._run()
+
+
+def _media_bytes(media) -> bytes:
+    return media.getbytes(0, media.size())
+
+
+class FakeUploadRequest:
+    """resumable 업로드 요청 (HttpRequest의 next_chunk/resumable_uri/resumable_progress/http/postproc)"""
+
+    def __init__(self, drive: "FakeDrive", media, run):
+        self.drive = drive
+        self.http = drive.http
+        self.resumable = media
+        self.resumable_uri: Optional[str] = None
+        self.resumable_progress = 0
+        self._run = run  # 전체 내용 → 응답
+
+    def next_chunk(self, num_retries: int = 0):
+        if self.resumable_uri is None:
+            self.resumable_uri = self.drive.open_session(self._run)
+        session = self.drive.sessions.get(self.resumable_uri)
+        if session is None:
+            raise http_error(404)
+        # 클라이언트 오프셋은 서버 수신분과 일치해야 함 (이어받기 검증)
+        assert self.resumable_progress == len(session['data']), (self.resumable_progress, len(session['data']))
+
+        chunk = self.resumable.getbytes(self.resumable_progress, self.resumable.chunksize())
+        self.drive.count('chunk')
+        self.drive.sent_bytes += len(chunk)
+        session['data'] += chunk
+        if len(session['data']) >= self.resumable.size():
+            session['result'] = session['run'](bytes(session['data']))
+        if self.drive.calls['chunk'] == self.drive.lose_response_after:
+            raise ConnectionError("청크 응답 수신 실패")  # 서버에는 반영됨
+        self.resumable_progress = len(session['data'])
+        if 'result' in session:
+            return None, session['result']
+        return object(), None
+
+    def postproc(self, resp, content: bytes):
+        return json.loads(content)
+
+
+class FakeHttp:
+    """세션 상태 조회 (PUT + Content-Range: bytes */<크기>)"""
+
+    def __init__(self, drive: "FakeDrive"):
+        self.drive = drive
+
+    def request(self, uri: str, method: str = 'GET', body=None, headers=None):
+        self.drive.count('status')
+        assert method == 'PUT' and headers['Content-Range'].startswith('bytes */')
+        session = self.drive.sessions.get(uri)
+        if session is None:
+            return httplib2.Response({'status': 404}), b''
+        if 'result' in session:
+            return httplib2.Response({'status': 200}), json.dumps(session['result']).encode()
+        headers = {'status': 308}
+        if session['data']:
+            headers['range'] = f"bytes=0-{len(session['data']) - 1}"
+        return httplib2.Response(headers), b''
+
+
+class FakeFiles:
+    def __init__(self, drive: "FakeDrive"):
+        self.drive = drive
+
+    def list(self, q: Optional[str] = None, fields=None, pageSize: int = 100, pageToken=None, **kwargs):
+        def run():
+            self.drive.count('list')
+            items = [dict(id=file_id, **record) for file_id, record in self.drive.store.items()]
+            if q and "trashed=false" in q:
+                items = [item for item in items if not item.get('trashed')]
+            match = _NAME_PARENT_QUERY.search(q or '')
+            if match:
+                name = re.sub(r"\\(.)", r"\1", match.group(1))
+                items = [item for item in items if item['name'] == name and match.group(2) in item['parents']]
+            start = int(pageToken or 0)
+            response = {'files': items[start:start + pageSize]}
+            if start + pageSize < len(items):
+                response['nextPageToken'] = str(start + pageSize)
+            return response
+        return FakeRequest(run)
+
+    def _request(self, run, media_body):
+        if media_body is not None and media_body.resumable():
+            return FakeUploadRequest(self.drive, media_body, run)
+        return FakeRequest(run)
+
+    def create(self, body=None, media_body=None, fields=None, **kwargs):
+        def run(content: Optional[bytes] = None):
+            self.drive.count('create')
+            if content is None and media_body is not None:
+                content = _media_bytes(media_body)
+            file_id = self.drive.add(body['name'], body['parents'][0], content,
+                                     mime_type=body.get('mimeType', 'application/octet-stream'))
+            return {'id': file_id, 'md5Checksum': self.drive.store[file_id].get('md5Checksum')}
+        return self._request(run, media_body)
+
+    def update(self, fileId=None, media_body=None, body=None, addParents=None, removeParents=None,
+               fields=None, **kwargs):
+        def run(content: Optional[bytes] = None):
+            self.drive.count('update')
+            record = self.drive.store.get(fileId)
+            if record is None:
+                raise http_error(404)
+            if media_body is not None:
+                self.drive.set_content(fileId, content if content is not None else _media_bytes(media_body))
+            if body and body.get('name'):
+                record['name'] = body['name']
+            if addParents:
+                record['parents'] = [p for p in record['parents'] if p != removeParents] + [addParents]
+            self.drive.changelog.append(fileId)
+            return {'id': fileId, 'md5Checksum': record.get('md5Checksum')}
+        return self._request(run, media_body)
+
+    def get_media(self, fileId=None, **kwargs):
+        def run():
+            self.drive.count('get_media')
+            return self.drive.content[fileId]
+        return FakeRequest(run)
+
+
+class FakeChanges:
+    def __init__(self, drive: "FakeDrive"):
+        self.drive = drive
+
+    def getStartPageToken(self, **kwargs):
+        return FakeRequest(lambda: {'startPageToken': str(len(self.drive.changelog))})
+
+    def list(self, pageToken=None, pageSize: int = 100, **kwargs):
+        def run():
+            self.drive.count('changes')
+            if self.drive.expired_tokens:
+                raise http_error(410)
+            start = int(pageToken)
+            end = min(start + min(pageSize, self.drive.changes_page_size), len(self.drive.changelog))
+            changes = []
+            for file_id in self.drive.changelog[start:end]:
+                record = self.drive.store.get(file_id)
+                if record is None:
+                    changes.append({'fileId': file_id, 'removed': True})
+                else:
+                    changes.append({'fileId': file_id, 'removed': False, 'file': dict(id=file_id, **record)})
+            response = {'changes': changes}
+            if end < len(self.drive.changelog):
+                response['nextPageToken'] = str(end)
+            else:
+                response['newStartPageToken'] = str(end)
+            return response
+        return FakeRequest(run)
+
+
+class FakeBatch:
+    def __init__(self, drive: "FakeDrive", callback):
+        self.drive = drive
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request: FakeRequest, request_id: Optional[str] = None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.drive.count('batch')
+        if self.drive.calls['batch'] in self.drive.failing_batches:
+            for _, request in self.requests:
+                request.execute()  # 서버에는 반영되었지만 응답을 받지 못한 경우
+            raise ConnectionError("배치 응답 수신 실패")
+        for request_id, request in self.requests:
+            try:
+                response, exception = request.execute(), None
+            except HttpError as e:
+                response, exception = None, e
+            self.callback(request_id, response, exception)
+
+
+class FakeDrive:
+    """메모리 Drive (ROOT_ID 백업 루트 폴더 포함)"""
+
+    def __init__(self):
+        self.store: Dict[str, Dict[str, Any]] = {}
+        self.content: Dict[str, bytes] = {}
+        self.changelog: List[str] = []  # 변경된 파일 ID (변경 토큰 = 인덱스)
+        self.calls: Dict[str, int] = {}
+        self.changes_page_size = 100
+        self.expired_tokens = False
+        self.failing_batches = set()  # 실패시킬 배치 순번 (1부터)
+        self.sessions: Dict[str, Dict[str, Any]] = {}  # resumable 세션 URI → 수신 내용/완료 응답
+        self.sent_bytes = 0
+        self.lose_response_after = 0  # N번째 청크 응답 유실 (0이면 없음)
+        self.http = FakeHttp(self)
+        self._ids = itertools.count(1)
+        self.store[ROOT_ID] = {'name': "backup", 'parents': ["MY_DRIVE"], 'mimeType': FOLDER_MIME_TYPE}
+
+    def count(self, name: str):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def files(self):
+        return FakeFiles(self)
+
+    def changes(self):
+        return FakeChanges(self)
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self, callback)
+
+    def open_session(self, run) -> str:
+        uri = f"https://upload.example/session{len(self.sessions) + 1}"
+        self.sessions[uri] = {'data': bytearray(), 'run': run}
+        return uri
+
+    def add(self, name: str, parent: str, content: Optional[bytes] = None,
+            mime_type: str = 'application/octet-stream', modified: str = "2026-01-01T00:00:00") -> str:
+        """파일(content 지정) 또는 폴더(content None + 폴더 MIME) 추가 → ID"""
+        file_id = f"id{next(self._ids)}"
+        self.store[file_id] = {'name': name, 'parents': [parent], 'mimeType': mime_type, 'modifiedTime': modified}
+        if content is not None:
+            self.set_content(file_id, content)
+        self.changelog.append(file_id)
+        return file_id
+
+    def add_folder(self, name: str, parent: str = ROOT_ID) -> str:
+        return self.add(name, parent, mime_type=FOLDER_MIME_TYPE)
+
+    def set_content(self, file_id: str, content: bytes):
+        self.content[file_id] = content
+        self.store[file_id]['md5Checksum'] = hashlib.md5(content).hexdigest()
+        self.store[file_id]['size'] = str(len(content))
+
+    def trash(self, file_id: str):
+        self.store[file_id]['trashed'] = True
+        self.changelog.append(file_id)
+
+    def delete(self, file_id: str):
+        self.store.pop(file_id)
+        self.content.pop(file_id, None)
+        self.changelog.append(file_id)
+
+    def path_of(self, file_id: str) -> str:
+        """백업 루트 기준 상대경로"""
+        parts = []
+        while file_id != ROOT_ID:
+            record = self.store[file_id]
+            parts.append(record['name'])
+            file_id = record['parents'][0]
+        return "/".join(reversed(parts))
+
+    def paths(self, folders: bool = False) -> List[str]:
+        """백업 루트 이하 파일(또는 폴더) 상대경로"""
+        result = []
+        for file_id, record in self.store.items():
+            if file_id == ROOT_ID or record.get('trashed'):
+                continue
+            if (record['mimeType'] == FOLDER_MIME_TYPE) != folders:
+                continue
+            try:
+                result.append(self.path_of(file_id))
+            except KeyError:
+                continue  # 루트 밖
+        return sorted(result)
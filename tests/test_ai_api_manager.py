@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI API 관리자 설정 재로드 검증 (Register_Key.md는 임시 파일, 키 로더는 FakeKeyLoader)
+- 내용이 같으면 재파싱하지 않음, 바뀌면 새 스냅샷(버전+1) 적용 및 구독자 통지
+- 파싱 실패시 기존 스냅샷 유지, 스냅샷은 읽기 전용
+- 하이브리드 엔진이 새 스냅샷의 설정을 반영
+- 약한 참조 구독: 수거된 객체는 통지하지 않고 목록에서 정리, 해제는 잠금을 잡지 않음
+"""
+
+import gc
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support import ai_api_manager
+from support.claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine
+from support.decision_log import DecisionLog
+from ai_engine_fakes import install_ai_manager, write_register_key
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    monkeypatch.setattr(ai_api_manager, "CONFIG_CHECK_INTERVAL", 0.0)
+    manager = install_ai_manager(monkeypatch, tmp_path, decision_budget='8')
+    manager.get_snapshot()
+    return manager
+
+
+def rewrite(project_root: Path, **values):
+    """Register_Key.md 재작성 (같은 크기여도 변경이 감지되도록 mtime 증가)"""
+    path = write_register_key(project_root, **values)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_unchanged_content_is_not_reparsed(manager, tmp_path):
+    loads = manager.key_loader.loads
+    assert manager.check_for_updates() is False  # mtime/크기 동일
+
+    rewrite(tmp_path, decision_budget='8')  # mtime만 변경
+    assert manager.check_for_updates() is False
+    assert manager.key_loader.loads == loads
+    assert manager.get_snapshot().version == 1
+
+
+def test_changed_content_swaps_snapshot_and_notifies(manager, tmp_path):
+    received = []
+    manager.subscribe(received.append)
+    first = manager.get_snapshot()
+
+    rewrite(tmp_path, decision_budget='3')
+    assert manager.check_for_updates() is True
+
+    snapshot = manager.get_snapshot()
+    assert snapshot.version == first.version + 1
+    assert snapshot.config['hybrid']['decision_budget_seconds'] == 3.0
+    assert first.config['hybrid']['decision_budget_seconds'] == 8.0  # 이전 스냅샷은 그대로
+    assert received == [snapshot]
+
+
+def test_parse_failure_keeps_previous_snapshot(manager, tmp_path):
+    received = []
+    manager.subscribe(received.append)
+    first = manager.get_snapshot()
+
+    rewrite(tmp_path, decision_budget='abc')
+    assert manager.check_for_updates() is False
+    assert manager.get_snapshot() is first
+    assert received == []
+
+    rewrite(tmp_path, decision_budget='4')
+    assert manager.check_for_updates() is True
+    assert manager.get_hybrid_config()['decision_budget_seconds'] == 4.0
+
+
+def test_snapshot_is_read_only(manager):
+    hybrid = manager.get_hybrid_config()
+    with pytest.raises(TypeError):
+        hybrid['decision_budget_seconds'] = 1.0
+    with pytest.raises(AttributeError):
+        manager.get_snapshot().version = 99
+
+
+def test_unsubscribe_stops_notifications(manager, tmp_path):
+    received = []
+    unsubscribe = manager.subscribe(received.append)
+    unsubscribe()
+
+    rewrite(tmp_path, decision_budget='3')
+    assert manager.check_for_updates() is True
+    assert received == []
+
+
+def test_engine_applies_new_snapshot(manager, tmp_path):
+    engine = ClaudeGeminiHybridEngine(decision_log=DecisionLog(tmp_path / "decisions"))
+
+    rewrite(tmp_path, decision_budget='2', claude_weight='0.7', max_prompt_tokens='500')
+    manager.check_for_updates()
+    assert engine.config_version == 2
+    assert engine.hybrid_config['decision_budget_seconds'] == 2.0
+    assert engine.prompt_encoder.max_prompt_tokens == 500
+
+    rewrite(tmp_path, decision_budget='1', claude_api_key='')  # 빈 API 키는 무시
+    manager.check_for_updates()
+    assert engine.config_version == 2
+    assert engine.hybrid_config['decision_budget_seconds'] == 2.0
+    engine.decision_log.close()
+
+
+class Listener:
+    received = []
+
+    def on_update(self, snapshot):
+        Listener.received.append(snapshot.version)
+
+
+def test_collected_weak_subscriber_is_not_called(manager, tmp_path):
+    Listener.received = []
+    kept, dropped = Listener(), Listener()
+    manager.subscribe(kept.on_update, weak=True)
+    manager.subscribe(dropped.on_update, weak=True)
+    del dropped
+    gc.collect()
+
+    rewrite(tmp_path, decision_budget='3')
+    assert manager.check_for_updates() is True
+    assert Listener.received == [2]
+    assert len(manager._subscribers) == 1
+
+
+def test_unsubscribe_does_not_take_reload_lock(manager):
+    unsubscribe = manager.subscribe(Listener().on_update, weak=True)
+    done = threading.Event()
+
+    def release():
+        unsubscribe()
+        gc.collect()  # 수거도 잠금 없이 진행
+        done.set()
+
+    with manager._reload_lock:  # _reload 진행 중 다른 스레드에서 해제/수거
+        thread = threading.Thread(target=release, daemon=True)
+        thread.start()
+        assert done.wait(2.0)
+    thread.join()
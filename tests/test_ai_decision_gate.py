@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 결정 게이팅 검증 (제공자 호출은 FakeProvider로 대체)
+- 불확실 구간 밖 규칙 신뢰도: 규칙 결과 확정 (AI 미호출)
+- 불확실 구간: 하이브리드 엔진 결정 사용
+- AI 오류 / 결정 예산 내 분석 없음 / 게이트 예산 소진: 규칙 결과 유지 (tier error/budget)
+- 엔진 미지정시 engine_registry의 루프 전용 엔진 사용
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support import engine_registry
+from support.ai_decision_gate import AIDecisionGate
+from support.claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine
+from support.decision_log import DecisionLog
+from ai_engine_fakes import install_ai_manager, analysis, FakeProvider
+
+STOCK_DATA = {'current_price': 10500, 'open_price': 10000, 'high_price': 10800,
+              'change_rate': 5.0, 'volume': 300000}
+
+
+class FakeAlgorithm:
+    """NewDayTradingAlgorithm 대체 (규칙 분석 결과 고정)"""
+
+    def __init__(self, signal: str, confidence: float):
+        self.result = {'signal': signal, 'confidence': confidence, 'reason': "규칙",
+                       'details': {'conditions_met': 3}}
+        self.calls = 0
+
+    def _analyze_surge_stock_realtime(self, stock_data, stock_code):
+        self.calls += 1
+        return dict(self.result)
+
+
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    install_ai_manager(monkeypatch, tmp_path, decision_budget='0.3')
+    engine = ClaudeGeminiHybridEngine(decision_log=DecisionLog(tmp_path / "decisions"))
+    yield engine
+    asyncio.run(engine.close())
+    engine.decision_log.close()
+
+
+def use_providers(engine, claude: FakeProvider, gemini: FakeProvider):
+    engine._analyze_with_claude = claude
+    engine._analyze_with_gemini = gemini
+
+
+def resolve(gate: AIDecisionGate, stock_code: str = "005930"):
+    return asyncio.run(gate.resolve(stock_code, STOCK_DATA))
+
+
+def test_certain_rule_result_skips_ai(engine):
+    claude, gemini = FakeProvider(analysis("SELL", 0.9)), FakeProvider(analysis("SELL", 0.9))
+    use_providers(engine, claude, gemini)
+    gate = AIDecisionGate(FakeAlgorithm("BUY", 0.9), engine)
+
+    signal = resolve(gate)
+    assert (signal['tier'], signal['signal']) == ('rule', "BUY")
+    assert claude.calls == gemini.calls == 0
+
+
+def test_uncertain_rule_result_uses_ai(engine):
+    use_providers(engine, FakeProvider(analysis("SELL", 0.8)), FakeProvider(analysis("SELL", 0.7)))
+    gate = AIDecisionGate(FakeAlgorithm("BUY", 0.6), engine)
+
+    signal = resolve(gate)
+    assert (signal['tier'], signal['signal']) == ('ai', "SELL")
+    assert signal['details']['rule_signal'] == "BUY"
+    assert gate.get_report()['cycle']['tiers']['ai'] == 1
+
+
+def test_ai_error_keeps_rule_result(engine):
+    use_providers(engine, FakeProvider(error=RuntimeError("boom")), FakeProvider(analysis("SELL", 0.7)))
+    gate = AIDecisionGate(FakeAlgorithm("BUY", 0.6), engine)
+
+    signal = resolve(gate)
+    assert (signal['tier'], signal['signal'], signal['confidence']) == ('error', "BUY", 0.6)
+    assert "boom" in signal['details']['ai_error']
+    assert signal['details']['conditions_met'] == 3
+
+
+def test_engine_exception_keeps_rule_result(engine):
+    async def fail(context):
+        raise RuntimeError("engine down")
+
+    engine.make_decision = fail
+    gate = AIDecisionGate(FakeAlgorithm("BUY", 0.6), engine)
+
+    signal = resolve(gate)
+    assert (signal['tier'], signal['signal']) == ('error', "BUY")
+    assert signal['details']['ai_error'] == "engine down"
+
+
+def test_decision_deadline_keeps_rule_result_as_budget(engine):
+    use_providers(engine, FakeProvider(analysis("SELL", 0.8), delay=5.0),
+                  FakeProvider(analysis("SELL", 0.8), delay=5.0))
+    gate = AIDecisionGate(FakeAlgorithm("BUY", 0.6), engine)
+
+    signal = resolve(gate)
+    assert (signal['tier'], signal['signal'], signal['confidence']) == ('budget', "BUY", 0.6)
+    assert gate.get_report()['cycle']['tiers'] == {'rule': 0, 'ai': 0, 'budget': 1, 'error': 0}
+
+
+def test_exhausted_cycle_budget_skips_ai(engine):
+    claude, gemini = FakeProvider(analysis("SELL", 0.8), delay=0.01), FakeProvider(analysis("SELL", 0.7))
+    use_providers(engine, claude, gemini)
+    gate = AIDecisionGate(FakeAlgorithm("BUY", 0.6), engine,
+                          hybrid_config={**engine.hybrid_config, 'gate_cycle_time_budget': 0.005})
+
+    assert resolve(gate)['tier'] == 'ai'
+    assert resolve(gate, "000660")['tier'] == 'budget'  # 평균 소요시간이 남은 사이클 예산 초과
+    assert claude.calls == 1
+    assert gate.get_report()['day']['tiers'] == {'rule': 0, 'ai': 1, 'budget': 1, 'error': 0}
+
+
+def test_default_engine_comes_from_registry(monkeypatch, tmp_path):
+    install_ai_manager(monkeypatch, tmp_path)
+    monkeypatch.setattr(engine_registry, "DECISION_LOG_DIR", tmp_path / "decisions")
+    monkeypatch.setattr(engine_registry, "_registry", None)
+
+    async def run():
+        gate = AIDecisionGate(FakeAlgorithm("BUY", 0.9))
+        same = gate.engine is engine_registry.get_hybrid_engine()
+        await engine_registry.close_hybrid_engine()
+        return same
+
+    assert asyncio.run(run())
+    engine_registry.get_engine_registry().decision_log.close()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+하이브리드 엔진 계측 검증
+- 호출 결과별 집계 (취소는 지연 분포에서 제외), 백분위/히스토그램
+- 토큰/프롬프트/파싱/캐시 집계 및 스냅샷 저장
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.ai_engine_metrics import HybridEngineMetrics, LATENCY_BUCKETS
+
+
+def test_call_outcomes_and_latency():
+    metrics = HybridEngineMetrics()
+    for seconds in (0.1, 0.2, 0.3, 0.4):
+        metrics.record_call('claude', seconds, 'success')
+    metrics.record_call('claude', 40.0, 'failure')
+    metrics.record_call('claude', 9.0, 'cancelled')
+
+    claude = metrics.snapshot()['providers']['claude']
+    assert (claude['calls'], claude['successes'], claude['failures'], claude['cancelled']) == (6, 4, 1, 1)
+    assert claude['error_rate'] == pytest.approx(1 / 5)
+    assert claude['latency']['samples'] == 5  # 취소는 지연 분포에서 제외
+    assert claude['latency']['p50'] == 0.3
+    assert claude['latency']['max'] == 40.0
+    assert claude['latency']['histogram']["<=0.25s"] == 2
+    assert claude['latency']['histogram'][f">{LATENCY_BUCKETS[-1]}s"] == 1
+
+
+def test_attempts_tokens_prompts_and_parse():
+    metrics = HybridEngineMetrics()
+    metrics.record_call('gemini', 1.0, 'success')
+    for _ in range(3):
+        metrics.record_attempt('gemini')
+    metrics.record_timeout('gemini')
+    metrics.record_tokens('gemini', 120, 30)
+    metrics.record_tokens('claude', None, 10)
+    metrics.record_prompt('gemini', 100, 300)
+    metrics.record_prompt('gemini', 50, 150)
+    metrics.record_parse('gemini', 'repaired')
+
+    gemini = metrics.snapshot()['providers']['gemini']
+    assert gemini['attempts_per_call'] == 3.0
+    assert gemini['timeout_rate'] == pytest.approx(1 / 3)
+    assert (gemini['prompt_tokens'], gemini['response_tokens']) == (120, 30)
+    assert gemini['prompt'] == {"count": 2, "avg_estimated_tokens": 75.0, "max_estimated_tokens": 100,
+                                "avg_chars": 225.0}
+    assert gemini['parse'] == {'clean': 0, 'repaired': 1, 'failed': 0}
+    assert metrics.total_tokens() == 160
+
+
+def test_decisions_cache_and_export(tmp_path):
+    metrics = HybridEngineMetrics()
+    metrics.record_decision(0.5)
+    metrics.record_decision(2.0, success=False)
+    metrics.record_cache(hit=True)
+    metrics.record_cache(hit=False)
+    metrics.record_cache(hit=False)
+
+    saved = metrics.export(tmp_path / "out" / "metrics.json")
+    with open(saved, 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    assert (snapshot['decisions']['successes'], snapshot['decisions']['failures']) == (1, 1)
+    assert snapshot['cache']['hit_rate'] == pytest.approx(1 / 3)
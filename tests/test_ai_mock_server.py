@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 모의 서버 검증
+- LatencyModel 분포 지정 파싱
+- MockDecisionPolicy: 압축/서술형 프롬프트 수치 기반 규칙 응답
+- Anthropic / Gemini 형식 응답 (일반, SSE 스트리밍, 장애 주입)
+- 하이브리드 엔진이 모의 서버만으로 결정 생성 (일반/스트리밍)
+"""
+
+import sys
+import json
+import asyncio
+from pathlib import Path
+
+import pytest
+from aiohttp.test_utils import TestServer, TestClient
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ai_mock_server import LatencyModel, MockDecisionPolicy, AIMockServer
+from support.claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine
+from support.decision_log import DecisionLog
+from ai_engine_fakes import install_ai_manager, make_context
+
+
+def make_server(**kwargs) -> AIMockServer:
+    latency = {'claude': LatencyModel("fixed:0"), 'gemini': LatencyModel("fixed:0")}
+    return AIMockServer(latency, kwargs.pop('policy', MockDecisionPolicy()), **kwargs)
+
+
+def run_with_client(server: AIMockServer, scenario):
+    async def run():
+        async with TestClient(TestServer(server.create_app())) as client:
+            return await scenario(client)
+    return asyncio.run(run())
+
+
+def test_latency_model_specs():
+    assert LatencyModel("fixed:0.25").sample() == 0.25
+    assert 0.2 <= LatencyModel("uniform:0.2,0.3").sample() <= 0.3
+    assert LatencyModel("normal:0,0").sample() == 0.0
+    with pytest.raises(ValueError):
+        LatencyModel("pareto:1")
+
+
+def test_policy_reads_compact_and_verbose_prompts():
+    policy = MockDecisionPolicy()
+    compact = "종목 분석\n입력:{\"chg\":3.0,\"ti\":{\"rsi\":60}}\n응답 JSON"
+    assert json.loads(policy.build('claude', compact))['decision'] == "BUY"
+    assert json.loads(policy.build('gemini', "등락률: -2.50%\nRSI=40"))['decision'] == "SELL"
+    assert json.loads(policy.build('gemini', "입력:{\"chg\":1.0,\"ti\":{\"RSI\":90}}"))['decision'] == "SELL"
+    assert json.loads(policy.build('claude', "수치 없음"))['decision'] == "HOLD"
+
+
+def test_canned_policy_with_fences():
+    policy = MockDecisionPolicy(mode='canned', canned={"decision": "BUY", "confidence": 0.9}, fence_rate=1.0)
+    text = policy.build('claude', "")
+    assert "```json" in text
+    assert json.loads(text.split("```json\n", 1)[1].split("\n```", 1)[0]) == {"decision": "BUY", "confidence": 0.9}
+
+
+def test_claude_messages_response():
+    async def scenario(client):
+        response = await client.post("/v1/messages", json={"model": "m", "messages": [
+            {"role": "user", "content": "등락률: +3.00%"}]})
+        return response.status, await response.json()
+
+    status, body = run_with_client(make_server(), scenario)
+    assert status == 200
+    assert json.loads(body['content'][0]['text'])['decision'] == "BUY"
+    assert body['usage']['output_tokens'] > 0
+
+
+def test_gemini_stream_reassembles_to_decision():
+    async def scenario(client):
+        response = await client.post("/v1beta/models/m:streamGenerateContent", json={
+            "contents": [{"parts": [{"text": "등락률: -3.00%"}]}]})
+        text = ""
+        async for raw_line in response.content:
+            line = raw_line.decode('utf-8').strip()
+            if line.startswith("data:"):
+                text += json.loads(line[5:])['candidates'][0]['content']['parts'][0]['text']
+        return text
+
+    assert json.loads(run_with_client(make_server(), scenario))['decision'] == "SELL"
+
+
+def test_error_injection_and_stats():
+    server = make_server(error_rate=1.0)
+
+    async def scenario(client):
+        response = await client.post("/v1/messages", json={"messages": [{"role": "user", "content": ""}]})
+        stats = await (await client.get("/stats")).json()
+        return response.status, stats
+
+    status, stats = run_with_client(server, scenario)
+    assert status == 500
+    assert stats['providers']['claude'] == {'requests': 1, 'ok': 0, 'errors_injected': 1,
+                                            'rate_limited': 0, 'streamed': 0}
+
+
+@pytest.mark.parametrize("streaming", ['false', 'true'])
+def test_engine_decides_against_mock_server(monkeypatch, tmp_path, streaming):
+    async def run():
+        server = TestServer(make_server().create_app())
+        await server.start_server()
+        base_url = str(server.make_url("")).rstrip('/')
+        try:
+            install_ai_manager(monkeypatch, tmp_path, claude_base_url=base_url, gemini_base_url=base_url,
+                               streaming_mode=streaming, decision_budget='5')
+            engine = ClaudeGeminiHybridEngine(decision_log=DecisionLog(tmp_path / "decisions"))
+            decision = await engine.make_decision(make_context(price_change_pct=3.0))
+            await engine.close()
+            engine.decision_log.close()
+            return decision
+        finally:
+            await server.close()
+
+    decision = asyncio.run(run())
+    assert decision.decision == "BUY"
+    assert decision.metadata['engine'] == "Claude+Gemini Hybrid"
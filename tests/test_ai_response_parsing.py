@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 응답 파서 검증
+- IncrementalJSONParser: 조각 단위 입력, 필드 조기 확정, 펜스/설명문 무시
+- ai_response_parser: JSON 추출, 결정 스키마 검증/정규화
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.streaming_json_parser import IncrementalJSONParser
+from support.ai_response_parser import (
+    AIResponseParseError, extract_json_object, parse_decision_response, validate_decision,
+    PARSE_CLEAN, PARSE_REPAIRED
+)
+
+RESPONSE = ('```json\n{"decision": "BUY", "confidence": 0.8, "fundamental_score": 0.7, '
+            '"risk_factors": ["a, b", {"x": "}"}], "reasoning": "따옴표 \\"포함\\" 설명"}\n```')
+
+
+def feed_chunks(parser, text, size):
+    completed = {}
+    for start in range(0, len(text), size):
+        completed.update(parser.feed(text[start:start + size]))
+    return completed
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, len(RESPONSE)])
+def test_incremental_parser_matches_json_for_any_chunking(size):
+    parser = IncrementalJSONParser()
+    completed = feed_chunks(parser, RESPONSE, size)
+    assert parser.complete
+    assert completed == parser.fields
+    assert parser.fields == {
+        "decision": "BUY", "confidence": 0.8, "fundamental_score": 0.7,
+        "risk_factors": ["a, b", {"x": "}"}], "reasoning": '따옴표 "포함" 설명'
+    }
+
+
+def test_incremental_parser_confirms_fields_before_object_ends():
+    parser = IncrementalJSONParser()
+    parser.feed('설명문 {"decision": "SELL", "confidence": 0.6')
+    assert parser.has('decision')
+    assert not parser.has('confidence')  # 값 뒤 구분자 도착 전에는 미확정
+    assert parser.feed(', "reas') == {"confidence": 0.6}
+    assert parser.has('decision', 'confidence')
+    assert not parser.complete
+
+
+def test_incremental_parser_ignores_text_after_object():
+    parser = IncrementalJSONParser()
+    parser.feed('{"decision": "HOLD"} {"decision": "BUY"}')
+    assert parser.complete
+    assert parser.fields == {"decision": "HOLD"}
+
+
+def test_extract_json_object_from_fenced_text():
+    analysis, extracted = extract_json_object(RESPONSE)
+    assert extracted
+    assert analysis["decision"] == "BUY"
+
+    analysis, extracted = extract_json_object('{"decision": "HOLD", "confidence": 0.5}')
+    assert not extracted
+
+
+def test_extract_json_object_repairs_trailing_comma():
+    analysis, _ = extract_json_object('결과: {"decision": "BUY", "confidence": 0.7,}')
+    assert analysis == {"decision": "BUY", "confidence": 0.7}
+
+
+def test_extract_json_object_without_object_raises():
+    with pytest.raises(AIResponseParseError):
+        extract_json_object("분석할 수 없습니다")
+
+
+def test_validate_decision_normalizes_values():
+    analysis = {"decision": " buy ", "confidence": "85%", "fundamental_score": 1.4, "technical_score": "n/a"}
+    assert validate_decision(analysis) is True
+    assert analysis == {"decision": "BUY", "confidence": 0.85, "fundamental_score": 1.0}
+
+
+def test_validate_decision_clean_input_is_untouched():
+    analysis = {"decision": "SELL", "confidence": 0.4, "technical_score": 0.3}
+    assert validate_decision(analysis) is False
+    assert analysis == {"decision": "SELL", "confidence": 0.4, "technical_score": 0.3}
+
+
+@pytest.mark.parametrize("analysis", [
+    {"confidence": 0.5},
+    {"decision": "WAIT", "confidence": 0.5},
+    {"decision": "BUY"},
+    {"decision": "BUY", "confidence": "high"},
+    {"decision": "BUY", "confidence": 150},
+    {"decision": "BUY", "confidence": -0.1},
+])
+def test_validate_decision_rejects_invalid(analysis):
+    with pytest.raises(AIResponseParseError):
+        validate_decision(analysis)
+
+
+def test_parse_decision_response_outcomes():
+    analysis, outcome = parse_decision_response('{"decision": "HOLD", "confidence": 0.5}')
+    assert (analysis["decision"], outcome) == ("HOLD", PARSE_CLEAN)
+
+    analysis, outcome = parse_decision_response(RESPONSE)
+    assert (analysis["decision"], outcome) == ("BUY", PARSE_REPAIRED)
+
+
+def test_parse_decision_response_skips_non_decision_objects():
+    text = '예시 {"note": "형식"} 실제 {"decision": "SELL", "confidence": 0.9}'
+    analysis, _ = parse_decision_response(text)
+    assert analysis["decision"] == "SELL"
+
+
+def test_parse_decision_response_reports_validation_error():
+    with pytest.raises(AIResponseParseError):
+        parse_decision_response('{"decision": "MAYBE", "confidence": 0.5}')
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+서킷 브레이커 검증
+- ProviderCircuitBreaker 상태 전이 (CLOSED → OPEN → HALF_OPEN → CLOSED/OPEN)
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.circuit_breaker import ProviderCircuitBreaker, CLOSED, OPEN, HALF_OPEN
+
+
+def make_breaker(**kwargs):
+    params = dict(window_size=10, min_calls=4, error_rate_threshold=0.5,
+                  slow_call_seconds=1.0, slow_rate_threshold=0.8, open_seconds=60.0)
+    params.update(kwargs)
+    return ProviderCircuitBreaker("test", **params)
+
+
+def test_breaker_stays_closed_below_min_calls():
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_result(False, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_breaker_opens_on_error_rate_and_rejects():
+    breaker = make_breaker()
+    for success in (True, False, True, False):
+        breaker.record_result(success, 0.1)
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.rejected_calls == 1
+    assert breaker.health_score() == 0.0
+
+
+def test_breaker_opens_on_slow_calls():
+    breaker = make_breaker()
+    for _ in range(4):
+        breaker.record_result(True, 2.0)
+    assert breaker.state == OPEN
+
+
+def test_breaker_half_open_probe_closes_on_success():
+    breaker = make_breaker(open_seconds=0.0)
+    for _ in range(4):
+        breaker.record_result(False, 0.1)
+    assert breaker.state == OPEN
+
+    assert breaker.allow_request()      # 탐침 1건 허용
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()  # 탐침 진행 중 추가 호출 거부
+    breaker.record_result(True, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["window_calls"] == 0
+
+
+def test_breaker_half_open_probe_failure_reopens():
+    breaker = make_breaker(open_seconds=0.0)
+    for _ in range(4):
+        breaker.record_result(False, 0.1)
+    assert breaker.allow_request()
+    breaker.record_result(False, 0.1)
+    assert breaker.state == OPEN
+    assert breaker.open_count == 2
+
+
+def test_breaker_cancelled_probe_releases_slot():
+    breaker = make_breaker(open_seconds=0.0)
+    for _ in range(4):
+        breaker.record_result(False, 0.1)
+    assert breaker.allow_request()
+    breaker.record_cancelled(0.5)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_breaker_cancelled_fast_call_not_counted():
+    breaker = make_breaker()
+    breaker.record_cancelled(0.2)
+    assert breaker.snapshot()["window_calls"] == 0
+    breaker.record_cancelled(1.5)
+    assert breaker.snapshot()["window_calls"] == 1
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+결정 융합 검증
+- fuse_batch가 모든 결정 조합·규칙에서 fuse_pair와 같은 결과를 내는지
+"""
+
+import sys
+import itertools
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.decision_fusion import (
+    fuse_pair, fuse_batch, encode_decisions, rule_config,
+    DECISION_CODES, CODE_DECISIONS, FUSION_RULES, DEFAULT_RULE, HOLD_PENALTY, CONFLICT_PENALTY
+)
+
+DECISIONS = ("BUY", "HOLD", "SELL")
+CONFIDENCES = (0.1, 0.45, 0.6, 0.9)
+
+
+def test_fuse_pair_agreement_keeps_decision():
+    decision, confidence = fuse_pair("BUY", 0.8, "BUY", 0.6, 0.6, 0.4)
+    assert decision == "BUY"
+    assert confidence == pytest.approx(0.72)
+
+
+def test_fuse_pair_conservative_disagreement_holds_with_penalty():
+    assert fuse_pair("BUY", 0.8, "HOLD", 0.6, 0.6, 0.4) == ("HOLD", pytest.approx(0.72 * HOLD_PENALTY))
+    assert fuse_pair("BUY", 0.8, "SELL", 0.6, 0.6, 0.4) == ("HOLD", pytest.approx(0.72 * CONFLICT_PENALTY))
+
+
+def test_fuse_pair_vote_rules():
+    # 한쪽 HOLD: vote_on_hold/vote_all 모두 가중 투표
+    assert fuse_pair("BUY", 0.9, "HOLD", 0.6, 0.6, 0.4, rule="vote_on_hold")[0] == "BUY"
+    # BUY/SELL 상반: vote_on_hold는 HOLD, vote_all은 투표
+    assert fuse_pair("BUY", 0.9, "SELL", 0.2, 0.6, 0.4, rule="vote_on_hold")[0] == "HOLD"
+    assert fuse_pair("BUY", 0.9, "SELL", 0.2, 0.6, 0.4, rule="vote_all")[0] == "BUY"
+    # 임계값 미만이면 HOLD
+    assert fuse_pair("BUY", 0.3, "HOLD", 0.6, 0.6, 0.4, rule="vote_all")[0] == "HOLD"
+
+
+def test_fuse_pair_unknown_rule_raises():
+    with pytest.raises(ValueError):
+        fuse_pair("BUY", 0.8, "BUY", 0.8, 0.6, 0.4, rule="vote_some")
+
+
+@pytest.mark.parametrize("rule", FUSION_RULES)
+def test_fuse_batch_matches_fuse_pair(rule):
+    combos = list(itertools.product(DECISIONS, CONFIDENCES, DECISIONS, CONFIDENCES))
+    claude_weight, gemini_weight = 0.6, 0.4
+
+    result = fuse_batch(
+        encode_decisions(c[0] for c in combos), np.array([c[1] for c in combos]),
+        encode_decisions(c[2] for c in combos), np.array([c[3] for c in combos]),
+        claude_weight, gemini_weight, rule=rule
+    )
+
+    for i, (cd, cc, gd, gc) in enumerate(combos):
+        decision, confidence = fuse_pair(cd, cc, gd, gc, claude_weight, gemini_weight, rule=rule)
+        assert CODE_DECISIONS[int(result["decision"][i])] == decision, (cd, cc, gd, gc)
+        assert result["confidence"][i] == pytest.approx(confidence)
+
+
+def test_fuse_batch_combined_score():
+    result = fuse_batch(
+        encode_decisions(["BUY", "SELL"]), np.array([0.8, 0.8]),
+        encode_decisions(["BUY", "SELL"]), np.array([0.8, 0.8]),
+        0.6, 0.4, fundamental_scores=np.array([1.0, 0.0]), technical_scores=None
+    )
+    assert result["combined_score"] == pytest.approx([0.6 + 0.2, 0.2])
+
+
+def test_encode_decisions_unknown_is_hold():
+    assert list(encode_decisions(["BUY", "SELL", "WAIT"])) == [DECISION_CODES["BUY"], DECISION_CODES["SELL"], 0]
+
+
+def test_rule_config_defaults():
+    assert rule_config({})[0] == DEFAULT_RULE
+    assert rule_config({'fusion_rule': 'vote_all', 'fusion_vote_threshold': 0.5}) == ('vote_all', 0.5)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+결정 로그 검증
+- 크기 초과시 순번 회전
+- 조회 필터 (기간, 종목), 잘린 마지막 줄 무시, 보관 기간 지난 파일 삭제
+- 스트림별 전용 파일: 순번이 서로 섞이지 않고, 읽기는 모든 스트림 포함
+"""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.decision_log import DecisionLog
+
+
+def write(log, count, tag):
+    for i in range(count):
+        log.append({'i': i, 'tag': tag})
+    log.close()
+
+
+def test_rotation_by_size(tmp_path):
+    write(DecisionLog(tmp_path, max_bytes=40), 4, "main")
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert len(names) > 1
+    assert all(name.startswith("decisions_") and name.endswith(".jsonl") for name in names)
+    assert [r['i'] for r in DecisionLog(tmp_path).iter_records()] == [0, 1, 2, 3]
+
+
+def test_streams_rotate_independently(tmp_path):
+    write(DecisionLog(tmp_path, max_bytes=40), 3, "main")
+    write(DecisionLog(tmp_path, max_bytes=40, stream="w0"), 3, "w0")
+    write(DecisionLog(tmp_path, max_bytes=40, stream="w1"), 1, "w1")
+
+    for stream in ("w0", "w1"):
+        files = [p for p in tmp_path.iterdir() if f"_{stream}_" in p.name]
+        assert files and sorted(p.stem.rsplit('_', 1)[1] for p in files)[0] == "001"
+    # 기본 스트림 순번은 워커 파일에 영향받지 않음
+    main_files = [p for p in tmp_path.iterdir() if p.stem.count('_') == 2]
+    assert DecisionLog(tmp_path)._last_sequence(date.today()) == len(main_files)
+
+    records = list(DecisionLog(tmp_path).iter_records())
+    assert sorted(r['tag'] for r in records) == ["main"] * 3 + ["w0"] * 3 + ["w1"]
+
+
+def test_invalid_stream_name(tmp_path):
+    with pytest.raises(ValueError):
+        DecisionLog(tmp_path, stream="w_1")
+
+
+def test_filters_and_truncated_line(tmp_path):
+    log = DecisionLog(tmp_path)
+    log.append({'symbol': "005930", 'decision': "BUY"})
+    log.append({'symbol': "000660", 'decision': "SELL"})
+    log.close()
+    (old,) = log.log_files()
+    with open(old, 'a', encoding='utf-8') as f:
+        f.write('{"symbol":"005930","dec')
+    (tmp_path / "decisions_20200101_001.jsonl").write_text('{"symbol":"005930","decision":"HOLD"}\n', encoding='utf-8')
+
+    assert [r['decision'] for r in log.iter_records(symbol="005930")] == ["HOLD", "BUY"]
+    assert [r['decision'] for r in log.iter_records(since=date.today())] == ["BUY", "SELL"]
+    assert [r['decision'] for r in log.iter_records(until=date(2020, 1, 1))] == ["HOLD"]
+
+
+def test_retention_removes_expired_files(tmp_path):
+    expired = (date.today() - timedelta(days=10)).strftime('%Y%m%d')
+    kept = (date.today() - timedelta(days=2)).strftime('%Y%m%d')
+    for day in (expired, kept):
+        (tmp_path / f"decisions_{day}_001.jsonl").write_text("{}\n", encoding='utf-8')
+    (tmp_path / f"decisions_{expired}_w0_001.jsonl").write_text("{}\n", encoding='utf-8')
+
+    write(DecisionLog(tmp_path, retention_days=5), 1, "main")
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert names == [f"decisions_{kept}_001.jsonl", f"decisions_{date.today().strftime('%Y%m%d')}_001.jsonl"]
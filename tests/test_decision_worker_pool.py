@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+결정 워커 풀 장애 처리 검증 (워커 프로세스 대신 큐에 직접 메시지 전달)
+- 워커 종료 통지시 그 워커가 수령한 요청만 즉시 안전 모드 HOLD, 다른 워커 요청은 계속 대기
+- 모든 워커 실패시 대기 중 요청과 이후 요청 즉시 안전 모드 HOLD
+- 워커 프로세스 종료를 sentinel로 즉시 감지해 결과 큐로 통지
+"""
+
+import os
+import sys
+import time
+import queue
+import asyncio
+import threading
+import multiprocessing as mp
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support.decision_worker_pool import DecisionWorkerPool, _STOP
+from support.claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine
+from ai_engine_fakes import install_ai_manager, make_context
+
+
+@pytest.fixture
+def pool(monkeypatch, tmp_path):
+    """워커 프로세스 없이 큐와 결과 수신 스레드만 연결한 풀"""
+    install_ai_manager(monkeypatch, tmp_path)
+    pool = DecisionWorkerPool(workers=2, concurrency=1, deadline_seconds=5, warm_up=False)
+    pool._processes = [object() for _ in range(pool.workers)]
+    pool._request_queue = queue.Queue()
+    pool._result_queue = queue.Queue()
+    pool._reader = threading.Thread(target=pool._read_results, daemon=True)
+    pool._reader.start()
+    yield pool
+    pool._result_queue.put(_STOP)
+    pool._reader.join(2.0)
+
+
+async def submit(pool: DecisionWorkerPool, *symbols):
+    tasks = [asyncio.ensure_future(pool.make_decision(make_context(symbol))) for symbol in symbols]
+    await asyncio.sleep(0.05)
+    request_ids = {}
+    while not pool._request_queue.empty():
+        request_id, context, _ = pool._request_queue.get_nowait()
+        request_ids[context.symbol] = request_id
+    return tasks, request_ids
+
+
+def test_dead_worker_fails_only_its_requests_at_once(pool):
+    async def run():
+        (a, b), ids = await submit(pool, "A", "B")
+        pool._result_queue.put(("taken", ids["A"], 0))
+        pool._result_queue.put(("taken", ids["B"], 1))
+        pool._result_queue.put(("exited", 0, -9))
+
+        started = time.perf_counter()
+        decision = await asyncio.wait_for(a, 1.0)
+        elapsed = time.perf_counter() - started
+        assert not b.done()
+
+        pool._result_queue.put(("ok", ids["B"], 1, "decision-B"))
+        return decision, elapsed, await asyncio.wait_for(b, 1.0)
+
+    decision, elapsed, other = asyncio.run(run())
+    assert elapsed < 0.5
+    assert ClaudeGeminiHybridEngine.is_safe_decision(decision)
+    assert "워커 0 종료" in decision.metadata['error']
+    assert other == "decision-B"
+    assert pool.failed == {0: "프로세스 종료 (exitcode -9)"}
+    assert pool._broken is None
+
+
+def test_results_sent_before_exit_are_kept(pool):
+    async def run():
+        (a,), ids = await submit(pool, "A")
+        pool._result_queue.put(("taken", ids["A"], 0))
+        pool._result_queue.put(("ok", ids["A"], 0, "decision-A"))
+        pool._result_queue.put(("exited", 0, 0))
+        return await asyncio.wait_for(a, 1.0)
+
+    assert asyncio.run(run()) == "decision-A"
+
+
+def test_all_workers_failed_breaks_pool(pool):
+    async def run():
+        (a,), _ = await submit(pool, "A")  # 아직 어느 워커도 수령하지 않음
+        pool._result_queue.put(("failed", 0, "ImportError: x"))
+        pool._result_queue.put(("exited", 1, 1))
+        pending = await asyncio.wait_for(a, 1.0)
+        later = await pool.make_decision(make_context("B"))
+        return pending, later
+
+    pending, later = asyncio.run(run())
+    assert "사용 가능한 결정 워커 없음" in pending.metadata['error']
+    assert ClaudeGeminiHybridEngine.is_safe_decision(later)
+    assert pool.stats['errors'] == 2
+    assert pool._request_queue.empty()
+
+
+def test_watcher_reports_exit_immediately(monkeypatch, tmp_path):
+    install_ai_manager(monkeypatch, tmp_path)
+    pool = DecisionWorkerPool(workers=1, warm_up=False)
+    process = mp.get_context('spawn').Process(target=os._exit, args=(3,), daemon=True)
+    process.start()
+    pool._processes = [process]
+    pool._result_queue = queue.Queue()
+
+    watcher = threading.Thread(target=pool._watch_workers, daemon=True)
+    watcher.start()
+    assert pool._result_queue.get(timeout=10) == ("exited", 0, 3)
+    watcher.join(2.0)
+    assert not watcher.is_alive()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+작은 파일 묶음 검증
+- BundleBuilder: 색인 오프셋으로 구성원 바이트 범위만 읽어 원본 복원, 변경 없는 디렉토리 재사용
+"""
+
+import os
+import sys
+import gzip
+import json
+import hashlib
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.drive_bundler import BundleBuilder, INDEX_NAME, BUNDLE_STAGING_DIR, split_small_files
+
+
+def make_files(root, contents):
+    files = []
+    for relative, data in contents.items():
+        path = os.path.join(root, *relative.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        files.append((path, relative))
+    return files
+
+
+def test_bundle_offsets_restore_members(tmp_path):
+    contents = {
+        "data/5min/a.csv": b"a" * 1000,
+        "data/5min/b.csv": os.urandom(3000),
+        "data/10min/c.csv": b"",
+        "top.txt": "한글 내용".encode('utf-8'),
+    }
+    files = make_files(str(tmp_path / "src"), contents)
+    staging = str(tmp_path / "bundles")
+
+    index = BundleBuilder(staging_dir=staging, target_size=2048).build(files)
+    assert set(index['files']) == set(contents)
+    assert len([n for n, b in index['bundles'].items() if b['dir'] == "data/5min"]) == 2  # 목표 크기 초과 분할
+
+    for key, data in contents.items():
+        name = index['files'][key]
+        offset, length, size, md5, _ = index['bundles'][name]['members'][key]
+        with open(os.path.join(staging, name), 'rb') as f:
+            f.seek(offset)
+            restored = gzip.decompress(f.read(length))
+        assert restored == data
+        assert (size, md5) == (len(data), hashlib.md5(data).hexdigest())
+
+    with open(os.path.join(staging, INDEX_NAME), 'r', encoding='utf-8') as f:
+        assert json.load(f) == index
+
+
+def test_bundle_rebuild_is_deterministic_and_reuses_unchanged(tmp_path):
+    files = make_files(str(tmp_path / "src"), {"x/a.txt": b"1", "y/b.txt": b"2"})
+    staging = str(tmp_path / "bundles")
+    first = BundleBuilder(staging_dir=staging).build(files)
+    with open(os.path.join(staging, INDEX_NAME), 'rb') as f:
+        first_bytes = f.read()
+
+    builder = BundleBuilder(staging_dir=staging)
+    assert builder.build(files) == first
+    assert builder.stats["rebuilt_directories"] == 0
+    with open(os.path.join(staging, INDEX_NAME), 'rb') as f:
+        assert f.read() == first_bytes
+
+
+def test_split_small_files(tmp_path):
+    files = make_files(str(tmp_path), {"s.txt": b"x" * 10, "l.bin": b"x" * 100})
+    small, large = split_small_files(files, small_file_size=50)
+    assert [f[1] for f in small] == ["s.txt"]
+    assert [f[1] for f in large] == ["l.bin"]
+
+
+def test_staging_dir_is_anchored_to_project_root():
+    # 업로더/상태 점검 스크립트를 어느 위치에서 실행해도 같은 색인을 사용
+    assert Path(BUNDLE_STAGING_DIR) == PROJECT_ROOT.resolve() / "logs" / "drive_backup" / "bundles"
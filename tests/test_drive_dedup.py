@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+내용 기준 중복 제거 검증 (가짜 Drive 서비스 + 원격 인덱스)
+- 원격에 같은 내용이 있으면 업로드 대신 참조로 기록
+- 같은 실행의 동일 내용 신규 파일은 원본 1회 업로드 후 참조
+- 관리 객체(_bundles/, _objects/, content_map.json)는 참조 원본으로 쓰지 않음
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support.drive_sync_engine import (
+    DriveSyncEngine, BackupManifest, MANAGED_PREFIXES,
+    BUNDLE_FOLDER_NAME, OBJECTS_FOLDER_NAME, CONTENT_MAP_NAME, ACTION_NEW, ACTION_DEDUPED
+)
+from support.drive_remote_index import DriveRemoteIndex
+from drive_fakes import FakeDrive, ROOT_ID
+
+
+def make_source(root: Path, contents):
+    for relative, data in contents.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return [(os.path.join(root, relative), relative) for relative in contents]
+
+
+def make_engine(drive, source, tmp_path) -> DriveSyncEngine:
+    index = DriveRemoteIndex(drive, ROOT_ID, str(tmp_path / "state")).load()
+    return DriveSyncEngine(drive, ROOT_ID, str(source),
+                           manifest=BackupManifest(ROOT_ID, str(source), str(tmp_path / "state")),
+                           remote_index=index, dedup=True)
+
+
+def test_existing_remote_content_is_referenced(tmp_path):
+    drive = FakeDrive()
+    archive = drive.add_folder("archive")
+    remote_id = drive.add("old.csv", archive, b"same content")
+    source = tmp_path / "src"
+    files = make_source(source, {"data/new.csv": b"same content", "data/other.csv": b"other"})
+    engine = make_engine(drive, source, tmp_path)
+
+    plan = engine.plan(files)
+    assert plan.counts[ACTION_NEW] == 1 and plan.counts[ACTION_DEDUPED] == 1
+    stats = engine.sync(plan)
+
+    assert stats[ACTION_NEW] == 1
+    assert drive.calls['create'] == 2  # data 폴더 + other.csv (new.csv는 업로드 없음)
+    entry = engine.manifest.files["data/new.csv"]
+    assert entry['ref'] and entry['file_id'] == remote_id
+    assert remote_id in engine.referenced_ids
+
+
+def test_duplicates_in_same_run_upload_once(tmp_path):
+    drive = FakeDrive()
+    source = tmp_path / "src"
+    files = make_source(source, {"a.txt": b"dup", "b/a.txt": b"dup"})
+    engine = make_engine(drive, source, tmp_path)
+
+    stats = engine.sync(engine.plan(files))
+    assert stats[ACTION_NEW] == 1 and stats[ACTION_DEDUPED] == 1
+    assert drive.paths() == ["a.txt"]
+    assert engine.manifest.files["b/a.txt"]['file_id'] == engine.manifest.files["a.txt"]['file_id']
+
+
+def test_management_objects_are_never_sources(tmp_path):
+    drive = FakeDrive()
+    drive.add("0001.bin.gz", drive.add_folder(BUNDLE_FOLDER_NAME), b"bundle")
+    drive.add("d41d8cd98f00b204e9800998ecf8427e", drive.add_folder(OBJECTS_FOLDER_NAME), b"object")
+    drive.add(CONTENT_MAP_NAME, ROOT_ID, b"map")
+    source = tmp_path / "src"
+    files = make_source(source, {"x.bin": b"bundle", "y.bin": b"object", "z.json": b"map"})
+    engine = make_engine(drive, source, tmp_path)
+
+    managed = {remote.id for path, remote in engine.remote_index.files.items() if path.startswith(MANAGED_PREFIXES)}
+    assert len(managed) == 3
+
+    plan = engine.plan(files)
+    assert plan.counts[ACTION_DEDUPED] == 0
+    assert not managed & set(engine.content_objects.values())
+
+    stats = engine.sync(plan)
+    assert stats[ACTION_NEW] == 3
+    assert not managed & {entry['file_id'] for entry in engine.manifest.files.values()}
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 ↔ Drive 비교 검증
+- 같은 이름 파일이 여러 폴더에 있어도 경로 기준 분류
+- 묶음 구성원은 묶음 파일이 원격에 있을 때만 identical
+- 중복 제거 참조는 참조 대상이 원격에 있을 때만 identical
+- skip_prefixes 항목은 extra에서 제외
+"""
+
+import os
+import sys
+import hashlib
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.drive_diff import DriveDiff, STATUS_MISSING, STATUS_CHANGED, STATUS_EXTRA, STATUS_IDENTICAL
+from support.drive_remote_index import RemoteFile
+
+
+def md5(data):
+    return hashlib.md5(data).hexdigest()
+
+
+def remote(file_id, data):
+    return RemoteFile(file_id, md5(data), len(data), "")
+
+
+def make_files(root, contents):
+    files = []
+    for relative, data in contents.items():
+        path = os.path.join(root, *relative.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        files.append((path, relative))
+    return files
+
+
+def run(diff, files):
+    return {record.path: record for record in diff.run(files)}
+
+
+def test_classifies_by_path_and_md5(tmp_path):
+    files = make_files(str(tmp_path), {"5min/a.csv": b"one", "10min/a.csv": b"two", "new.txt": b"n"})
+    index = SimpleNamespace(files={
+        "5min/a.csv": remote("r1", b"one"),
+        "10min/a.csv": remote("r2", b"TWO"),  # 같은 크기, 다른 내용
+        "gone.txt": remote("r3", b"g"),
+        "_bundles/x.tar": remote("r4", b"t"),
+        "content_map.json": remote("r5", b"{}"),
+    })
+    diff = DriveDiff(index, skip_prefixes=("_bundles/", "content_map.json"))
+    records = run(diff, files)
+
+    assert records["5min/a.csv"].status == STATUS_IDENTICAL
+    assert records["10min/a.csv"].status == STATUS_CHANGED
+    assert records["new.txt"].status == STATUS_MISSING
+    assert records["gone.txt"].status == STATUS_EXTRA
+    assert "_bundles/x.tar" not in records and "content_map.json" not in records
+    assert diff.counts == {STATUS_MISSING: 1, STATUS_CHANGED: 1, STATUS_EXTRA: 1, STATUS_IDENTICAL: 1}
+
+
+def test_bundle_members_require_remote_bundle(tmp_path):
+    files = make_files(str(tmp_path), {"d/a.txt": b"aa", "e/b.txt": b"bb"})
+    bundle_index = {
+        'bundles': {
+            "d__000.tar": {'dir': "d", 'members': {"d/a.txt": [512, 20, 2, md5(b"aa"), 0]}},
+            "e__000.tar": {'dir': "e", 'members': {"e/b.txt": [512, 20, 2, md5(b"bb"), 0]}},
+        },
+        'files': {"d/a.txt": "d__000.tar", "e/b.txt": "e__000.tar"},
+    }
+    index = SimpleNamespace(files={"_bundles/d__000.tar": remote("r1", b"tar")})  # e 묶음은 업로드 실패
+    records = run(DriveDiff(index, bundle_index=bundle_index, skip_prefixes=("_bundles/",)), files)
+
+    assert (records["d/a.txt"].status, records["d/a.txt"].location) == (STATUS_IDENTICAL, "bundle")
+    assert records["e/b.txt"].status == STATUS_MISSING
+
+
+def test_dedup_references_require_remote_target(tmp_path):
+    files = make_files(str(tmp_path), {"a/x.csv": b"same", "b/x.csv": b"same"})
+    entry = {'size': 4, 'mtime_ns': 0, 'md5': md5(b"same"), 'ref': True}
+    manifest = SimpleNamespace(files={"a/x.csv": dict(entry, file_id="r1"), "b/x.csv": dict(entry, file_id="gone")})
+    index = SimpleNamespace(files={"_objects/blob": remote("r1", b"same")})
+    records = run(DriveDiff(index, manifest, skip_prefixes=("_objects/",)), files)
+
+    assert (records["a/x.csv"].status, records["a/x.csv"].location) == (STATUS_IDENTICAL, "dedup")
+    assert records["b/x.csv"].status == STATUS_MISSING
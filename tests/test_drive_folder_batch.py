@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원격 폴더 트리 일괄 확보 검증 (가짜 Drive 서비스)
+- 깊이 단계마다 검색 배치 1회 + 생성 배치 1회, 기존 폴더는 재사용
+- 원격 인덱스가 있으면 검색 배치 없이 생성만
+- 배치 전송 실패시 남은 폴더는 업로드 단계에서 개별 확보 (이미 생성된 폴더 중복 생성 없음)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support.drive_sync_engine import DriveSyncEngine, BackupManifest, ACTION_NEW
+from support.drive_remote_index import DriveRemoteIndex
+from drive_fakes import FakeDrive, ROOT_ID
+
+FILES = ("a/b/c.txt", "a/d.txt", "x/y/z/w.txt", "top.txt")
+FOLDERS = ["a", "a/b", "x", "x/y", "x/y/z"]
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "src"
+    for relative in FILES:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative, encoding='utf-8')
+    return root
+
+
+def make_engine(drive, source, tmp_path, remote_index=None) -> DriveSyncEngine:
+    return DriveSyncEngine(drive, ROOT_ID, str(source),
+                           manifest=BackupManifest(ROOT_ID, str(source), str(tmp_path / "state")),
+                           remote_index=remote_index)
+
+
+def plan(engine, source):
+    return engine.plan([(os.path.join(source, relative), relative) for relative in FILES])
+
+
+def test_folders_are_created_level_by_level(source, tmp_path):
+    drive = FakeDrive()
+    drive.add_folder("a")  # 기존 폴더는 검색으로 재사용
+    engine = make_engine(drive, source, tmp_path)
+
+    created = engine.prepare_folders(plan(engine, source).pending)
+
+    assert created == len(FOLDERS) - 1
+    assert engine.folder_requests == drive.calls['batch'] == 6  # 깊이 3단계 x (검색 + 생성)
+    assert drive.paths(folders=True) == FOLDERS
+    assert sorted(engine.manifest.folders) == FOLDERS
+
+    stats = engine.sync(plan(engine, source))
+    assert stats[ACTION_NEW] == len(FILES)
+    assert drive.paths() == sorted(FILES)
+    assert engine.folder_requests == 6  # 업로드 단계 추가 요청 없음
+
+
+def test_remote_index_skips_search_batches(source, tmp_path):
+    drive = FakeDrive()
+    drive.add_folder("x")
+    index = DriveRemoteIndex(drive, ROOT_ID, str(tmp_path / "state")).load()
+    engine = make_engine(drive, source, tmp_path, remote_index=index)
+
+    engine.prepare_folders(plan(engine, source).pending)
+    assert drive.calls['batch'] == 3  # 단계별 생성 배치만
+    assert drive.calls.get('list', 0) == 1  # 인덱스 구성용 전체 조회
+    assert drive.paths(folders=True) == FOLDERS
+
+
+def test_failed_batch_falls_back_without_duplicates(source, tmp_path):
+    drive = FakeDrive()
+    drive.failing_batches = {4}  # 2단계 생성 배치: 서버에는 생성됐지만 응답 유실
+    engine = make_engine(drive, source, tmp_path)
+
+    pending = plan(engine, source)
+    engine.prepare_folders(pending.pending)
+    assert sorted(engine.manifest.folders) == ["a", "x"]
+
+    stats = engine.sync(pending)
+    assert stats[ACTION_NEW] == len(FILES)
+    assert drive.paths(folders=True) == FOLDERS  # 개별 확보는 검색 후 생성
+    assert drive.paths() == sorted(FILES)
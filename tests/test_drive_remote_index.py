@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원격 인덱스 검증 (가짜 Drive 서비스)
+- 전체 목록 페이지 조회: 백업 루트 이하 파일/폴더만, 같은 경로 중복은 최근 수정본
+- 캐시 + changes.list 차분: 신규/이동 반영, removed·trashed 항목 제거, 여러 페이지, 토큰 갱신
+- 변경 토큰 만료시 전체 재조회
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support import drive_remote_index
+from support.drive_remote_index import DriveRemoteIndex
+from drive_fakes import FakeDrive, ROOT_ID
+
+
+@pytest.fixture
+def drive():
+    drive = FakeDrive()
+    data = drive.add_folder("data")
+    drive.add("a.csv", data, b"a")
+    drive.add("b.csv", data, b"b")
+    drive.add("top.txt", ROOT_ID, b"top")
+    drive.add("elsewhere.txt", "OTHER_FOLDER", b"x")
+    return drive
+
+
+def load(drive, tmp_path) -> DriveRemoteIndex:
+    return DriveRemoteIndex(drive, ROOT_ID, str(tmp_path)).load()
+
+
+def test_build_pages_through_listing(monkeypatch, drive, tmp_path):
+    monkeypatch.setattr(drive_remote_index, "PAGE_SIZE", 2)
+    index = load(drive, tmp_path)
+
+    assert sorted(index.files) == ["data/a.csv", "data/b.csv", "top.txt"]
+    assert index.folders == {"data": index.folder_id("data")}
+    assert index.lookup("data/a.csv").md5 == drive.store[index.lookup("data/a.csv").id]['md5Checksum']
+    assert drive.calls['list'] == 3  # 노드 6개 (루트/외부 포함) / 페이지당 2개
+    assert Path(index.cache_path).exists()
+
+
+def test_duplicate_paths_keep_latest(drive, tmp_path):
+    newer = drive.add("top.txt", ROOT_ID, b"newer", modified="2026-06-01T00:00:00")
+    index = load(drive, tmp_path)
+    assert index.lookup("top.txt").id == newer
+    assert index.duplicates == ["top.txt"]
+
+
+def test_changes_are_applied_from_cache(drive, tmp_path):
+    first = load(drive, tmp_path)
+    listed = drive.calls['list']
+
+    data = first.folder_id("data")
+    drive.changes_page_size = 2
+    drive.add("c.csv", data, b"c")
+    drive.delete(first.lookup("data/a.csv").id)
+    drive.trash(first.lookup("data/b.csv").id)
+    sub = drive.add_folder("sub", data)
+    drive.add("d.csv", sub, b"d")
+
+    index = load(drive, tmp_path)
+    assert drive.calls['list'] == listed  # 전체 재조회 없음
+    assert drive.calls['changes'] == 3  # 변경 5건 / 페이지 2건
+    assert sorted(index.files) == ["data/c.csv", "data/sub/d.csv", "top.txt"]
+    assert "data/sub" in index.folders
+    assert index.change_token == str(len(drive.changelog))
+
+    assert sorted(DriveRemoteIndex(drive, ROOT_ID, str(tmp_path)).load(refresh=False).files) == sorted(index.files)
+
+
+def test_moved_folder_updates_paths(drive, tmp_path):
+    index = load(drive, tmp_path)
+    data = index.folder_id("data")
+    archive = drive.add_folder("archive")
+    drive.store[data]['parents'] = [archive]
+    drive.changelog.append(data)
+
+    index = load(drive, tmp_path)
+    assert sorted(index.files) == ["archive/data/a.csv", "archive/data/b.csv", "top.txt"]
+
+
+def test_expired_token_rebuilds(drive, tmp_path):
+    load(drive, tmp_path)
+    drive.add("new.txt", ROOT_ID, b"n")
+    drive.expired_tokens = True
+
+    index = load(drive, tmp_path)
+    assert "new.txt" in index.files
+    assert drive.calls['list'] == 2
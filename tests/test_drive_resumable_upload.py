@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+resumable 업로드 이어받기 검증 (가짜 Drive 서비스)
+- 재시작시 전송 전에 세션 상태를 조회해 서버 수신 지점부터 전송 (저널 오프셋보다 서버가 앞서도)
+- 이전 실행에서 이미 완료된 세션은 전송 없이 완료 응답 사용
+- 세션 만료(404)면 처음부터 새 세션
+- resumed_bytes는 이전 실행분만 집계
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support import drive_sync_engine
+from support.drive_sync_engine import DriveSyncEngine, BackupManifest, ACTION_NEW, ACTION_FAILED
+from drive_fakes import FakeDrive, ROOT_ID
+
+CHUNK = 1024
+CONTENT = bytes(range(256)) * 20  # 5 청크
+NAME = "big.bin"
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(drive_sync_engine, "RESUMABLE_THRESHOLD", CHUNK)
+    monkeypatch.setattr(drive_sync_engine, "UPLOAD_CHUNK_SIZE", CHUNK)
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "src"
+    root.mkdir()
+    (root / NAME).write_bytes(CONTENT)
+    return root
+
+
+def run(drive, source, tmp_path):
+    engine = DriveSyncEngine(drive, ROOT_ID, str(source),
+                             manifest=BackupManifest(ROOT_ID, str(source), str(tmp_path / "state")))
+    stats = engine.sync(engine.plan([(os.path.join(source, NAME), NAME)]))
+    return engine, stats
+
+
+def interrupted(source, tmp_path, after_chunk: int) -> FakeDrive:
+    """after_chunk번째 청크가 서버에 반영된 뒤 응답 유실로 중단된 상태"""
+    drive = FakeDrive()
+    drive.lose_response_after = after_chunk
+    _, stats = run(drive, source, tmp_path)
+    assert stats[ACTION_FAILED] == 1
+    drive.lose_response_after = 0
+    drive.calls.clear()
+    drive.sent_bytes = 0
+    return drive
+
+
+def uploaded(drive) -> bytes:
+    file_id = next(i for i, record in drive.store.items() if record['name'] == NAME)
+    return drive.content[file_id]
+
+
+def test_resume_starts_at_server_offset(source, tmp_path):
+    drive = interrupted(source, tmp_path, after_chunk=2)  # 저널 오프셋은 1청크, 서버는 2청크 수신
+
+    engine, stats = run(drive, source, tmp_path)
+    assert stats[ACTION_NEW] == 1
+    assert drive.calls['status'] == 1  # 전송 전 상태 조회
+    assert engine.resumed_bytes == 2 * CHUNK
+    assert drive.sent_bytes == len(CONTENT) - 2 * CHUNK
+    assert uploaded(drive) == CONTENT
+    assert drive.calls['create'] == 1 and not engine.journal.sessions
+
+
+def test_completed_session_is_not_resent(source, tmp_path):
+    drive = interrupted(source, tmp_path, after_chunk=5)  # 마지막 청크까지 반영, 응답만 유실
+
+    engine, stats = run(drive, source, tmp_path)
+    assert stats[ACTION_NEW] == 1
+    assert drive.calls.get('chunk', 0) == 0 and drive.sent_bytes == 0
+    assert engine.resumed_bytes == len(CONTENT)
+    assert engine.manifest.files[NAME]['md5'] == drive.store[engine.manifest.files[NAME]['file_id']]['md5Checksum']
+
+
+def test_expired_session_restarts(source, tmp_path):
+    drive = interrupted(source, tmp_path, after_chunk=2)
+    drive.sessions.clear()
+
+    engine, stats = run(drive, source, tmp_path)
+    assert stats[ACTION_NEW] == 1
+    assert engine.resumed_bytes == 0
+    assert drive.sent_bytes == len(CONTENT)
+    assert uploaded(drive) == CONTENT
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+업로드 저널 검증
+- 재생: 세션/완료/폐기 기록 순서대로 상태 복원, 잘린 마지막 줄 무시
+- 압축: 완료 기록 제거, 진행 중 세션만 유지 (세션 없으면 파일 삭제)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.drive_upload_journal import UploadJournal
+
+ENTRY = {'size': 10, 'mtime_ns': 1, 'md5': 'aa', 'file_id': 'f1', 'uploaded_at': '2026-01-01T00:00:00'}
+
+
+def reopen(journal):
+    journal.close()
+    return UploadJournal("ROOT", os.path.dirname(journal.path))
+
+
+def test_replay_sessions_and_completions(tmp_path):
+    journal = UploadJournal("ROOT", str(tmp_path))
+    journal.checkpoint("a.bin", "https://up/1", 256, 1024, 5, "m1")
+    journal.checkpoint("a.bin", "https://up/1", 512, 1024, 5, "m1")
+    journal.checkpoint("b.bin", "https://up/2", 256, 2048, 6, "m2")
+    journal.checkpoint("c.bin", "https://up/3", 256, 2048, 7, "m3")
+    journal.complete("b.bin", ENTRY)
+    journal.discard("c.bin")
+
+    replayed = reopen(journal)
+    assert set(replayed.sessions) == {"a.bin"}
+    assert replayed.sessions["a.bin"]["offset"] == 512
+    assert replayed.completed == {"b.bin": ENTRY}
+
+
+def test_session_for_requires_same_file(tmp_path):
+    journal = UploadJournal("ROOT", str(tmp_path))
+    journal.checkpoint("a.bin", "https://up/1", 256, 1024, 5, "m1")
+    assert journal.session_for("a.bin", 1024, 5, "m1")["uri"] == "https://up/1"
+    assert journal.session_for("a.bin", 1024, 6, "m1") is None
+    assert journal.session_for("a.bin", 1024, 5, "other") is None
+    assert journal.session_for("b.bin", 1024, 5, "m1") is None
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    journal = UploadJournal("ROOT", str(tmp_path))
+    journal.complete("a.bin", ENTRY)
+    journal.close()
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"state":"done","path":"b.bin","ent')
+
+    replayed = UploadJournal("ROOT", str(tmp_path))
+    assert replayed.completed == {"a.bin": ENTRY}
+
+
+def test_compact_keeps_only_open_sessions(tmp_path):
+    journal = UploadJournal("ROOT", str(tmp_path))
+    journal.checkpoint("a.bin", "https://up/1", 256, 1024, 5, "m1")
+    journal.checkpoint("b.bin", "https://up/2", 256, 1024, 5, "m2")
+    journal.complete("b.bin", ENTRY)
+    journal.compact()
+
+    assert journal.completed == {}
+    with open(journal.path, 'r', encoding='utf-8') as f:
+        assert len(f.readlines()) == 1
+    replayed = reopen(journal)
+    assert set(replayed.sessions) == {"a.bin"}
+    assert replayed.completed == {}
+
+    # 압축 후에도 계속 기록 가능
+    replayed.checkpoint("a.bin", "https://up/1", 768, 1024, 5, "m1")
+    assert reopen(replayed).sessions["a.bin"]["offset"] == 768
+
+
+def test_compact_without_sessions_removes_file(tmp_path):
+    journal = UploadJournal("ROOT", str(tmp_path))
+    journal.complete("a.bin", ENTRY)
+    assert os.path.exists(journal.path)
+    journal.compact()
+    assert not os.path.exists(journal.path)
+    assert reopen(journal).completed == {}
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+적응형 동시 업로드 스케줄러 검증 (업로드는 가짜 엔진으로 대체)
+- 구간 처리량이 늘면 동시성 +1, 줄면 방향 전환, 경계에서 반대쪽 탐색
+- 요청 한도 초과시 동시성 절반, 재시도 후 완료
+- 큰 파일 슬롯은 동시성 절반까지, 동시 업로드 수는 한도 이내
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support import drive_upload_scheduler
+from support.drive_upload_scheduler import AdaptiveUploadScheduler, ADJUST_INTERVAL
+from support.drive_sync_engine import SyncItem, RateLimitError, ACTION_NEW, ACTION_FAILED
+
+MB = 1024 * 1024
+
+
+def item(name: str, size: int) -> SyncItem:
+    return SyncItem(local_path=name, relative_path=name, size=size, mtime_ns=0, action=ACTION_NEW)
+
+
+class FakeEngine:
+    """DriveSyncEngine 대체 (동시 업로드 수 기록, 지정 파일은 요청 한도 초과 후 성공)"""
+
+    def __init__(self, rate_limited=(), delay: float = 0.01):
+        self.rate_limited = set(rate_limited)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.started = []
+        self.prepared = None
+        self.saved = 0
+        self._lock = threading.Lock()
+
+    def prepare_folders(self, items):
+        self.prepared = list(items)
+
+    def save(self):
+        self.saved += 1
+
+    def sync_file(self, sync_item: SyncItem) -> str:
+        with self._lock:
+            if sync_item.relative_path in self.rate_limited:
+                self.rate_limited.discard(sync_item.relative_path)
+                raise RateLimitError("429")
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.started.append(sync_item.relative_path)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return ACTION_NEW
+
+
+def adjust(scheduler: AdaptiveUploadScheduler, window_bytes: int):
+    """측정 구간 1회 경과 처리"""
+    with scheduler._cond:
+        scheduler._window_start = time.time() - ADJUST_INTERVAL
+        scheduler._window_bytes = window_bytes
+        scheduler._maybe_adjust()
+
+
+def test_throughput_climbs_then_reverses():
+    scheduler = AdaptiveUploadScheduler(FakeEngine(), min_workers=1, max_workers=8, initial_workers=3)
+    adjust(scheduler, 100 * MB)
+    adjust(scheduler, 200 * MB)
+    assert scheduler.limit == 5
+
+    adjust(scheduler, 100 * MB)  # 처리량 감소 → 방향 전환
+    assert scheduler.limit == 4
+    adjust(scheduler, 98 * MB)  # 허용 오차 이내 감소는 같은 방향 유지
+    assert scheduler.limit == 3
+    assert scheduler.limit_history == [4, 5, 4, 3]  # 시작값은 run()에서 기록
+
+
+def test_limit_bounces_off_bounds():
+    scheduler = AdaptiveUploadScheduler(FakeEngine(), min_workers=1, max_workers=2, initial_workers=1)
+    adjust(scheduler, 10 * MB)
+    assert scheduler.limit == 2
+    adjust(scheduler, 20 * MB)  # 최대에서는 줄이는 방향으로 탐색
+    assert scheduler.limit == 1
+
+
+def test_rate_limit_halves_concurrency():
+    scheduler = AdaptiveUploadScheduler(FakeEngine(), initial_workers=6)
+    scheduler._on_rate_limited()
+    assert scheduler.limit == 3
+    scheduler._on_rate_limited()
+    scheduler._on_rate_limited()
+    assert scheduler.limit == 1  # 최소 동시성 유지
+    assert scheduler.rate_limited == 3
+
+
+def test_large_files_use_half_the_slots():
+    scheduler = AdaptiveUploadScheduler(FakeEngine(), initial_workers=4, large_file_size=MB)
+    scheduler._large.extend([item("L1", 3 * MB), item("L2", 2 * MB)])
+    scheduler._small.extend([item("s1", 10)])
+    scheduler._active_large = 2  # 큰 파일 슬롯 2개 사용 중
+
+    assert scheduler._next_item().relative_path == "s1"
+    assert scheduler._next_item().relative_path == "L1"  # 작은 파일이 없으면 큰 파일
+
+
+def test_run_uploads_everything_within_limit(monkeypatch):
+    monkeypatch.setattr(drive_upload_scheduler, "rate_limit_backoff", lambda attempt: 0.0)
+    engine = FakeEngine(rate_limited={"small2"})
+    items = [item(f"small{n}", 100 + n) for n in range(10)] + [item("big", 6 * MB), item("bigger", 9 * MB)]
+    scheduler = AdaptiveUploadScheduler(engine, max_workers=4, initial_workers=4)
+    progress = []
+
+    stats = scheduler.run(items, progress=lambda i, action: progress.append(i.relative_path))
+
+    assert stats[ACTION_NEW] == len(items) and stats[ACTION_FAILED] == 0
+    assert sorted(progress) == sorted(i.relative_path for i in items)
+    assert engine.prepared == items and engine.saved == 1
+    assert engine.started[0] == "bigger"  # 큰 파일(큰 것부터) 먼저 시작
+    assert scheduler.rate_limited == 1 and scheduler.limit_history[:2] == [4, 2]
+    assert engine.peak <= 4
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이벤트 루프별 엔진 레지스트리 검증
+- 같은 루프는 같은 엔진, 다른 루프(스레드)는 서로 다른 엔진
+- close_hybrid_engine: 현재 루프 엔진 종료 및 등록 해제 (다음 호출시 새 엔진)
+- 프로세스 레지스트리 재사용
+"""
+
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support import engine_registry
+from ai_engine_fakes import install_ai_manager
+
+
+@pytest.fixture
+def registry(monkeypatch, tmp_path):
+    install_ai_manager(monkeypatch, tmp_path)
+    monkeypatch.setattr(engine_registry, "DECISION_LOG_DIR", tmp_path / "decisions")
+    monkeypatch.setattr(engine_registry, "_registry", None)
+    registry = engine_registry.get_engine_registry()
+    yield registry
+    registry.decision_log.close()
+
+
+def test_same_loop_shares_engine(registry):
+    async def run():
+        first = engine_registry.get_hybrid_engine()
+        second = await asyncio.ensure_future(asyncio.sleep(0, engine_registry.get_hybrid_engine()))
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert first.decision_log is registry.decision_log
+    assert engine_registry.get_engine_registry() is registry
+
+
+def test_each_loop_gets_its_own_engine(registry):
+    engines = {}
+    barrier = threading.Barrier(2)
+
+    def worker(name):
+        async def run():
+            engine = engine_registry.get_hybrid_engine()
+            barrier.wait(2.0)  # 두 루프가 동시에 살아 있는 상태에서 조회
+            engines[name] = (engine, registry.get_report()['engines'])
+            barrier.wait(2.0)
+        asyncio.run(run())
+
+    threads = [threading.Thread(target=worker, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert engines["a"][0] is not engines["b"][0]
+    assert engines["a"][1] == engines["b"][1] == 2
+
+
+def test_close_hybrid_engine_unregisters(registry):
+    async def run():
+        engine = engine_registry.get_hybrid_engine()
+        await engine_registry.close_hybrid_engine()
+        assert registry.get_report()['engines'] == 0
+        replacement = engine_registry.get_hybrid_engine()
+        await engine_registry.close_hybrid_engine()
+        return engine, replacement
+
+    engine, replacement = asyncio.run(run())
+    assert engine is not replacement
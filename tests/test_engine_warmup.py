@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+하이브리드 엔진 연결 예열 검증 (HTTP 요청은 FakeSession으로 대체)
+- 공용 세션: 같은 루프에서 재사용, close()시 종료
+- warm_up: HEAD 연결 + (선택) 모델 조회 탐침, 제공자별 준비 상태/단계별 지연
+- 탐침 비정상 응답/연결 실패는 해당 제공자만 준비 실패로 보고
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support.claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine
+from support.decision_log import DecisionLog
+from ai_engine_fakes import install_ai_manager, FakeResponse, FakeSession, use_session
+
+BASE_URL = "http://127.0.0.1:9"  # IP 주소라 DNS 조회가 네트워크 없이 끝남
+
+
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    install_ai_manager(monkeypatch, tmp_path, claude_base_url=BASE_URL, gemini_base_url=BASE_URL,
+                       claude_model='claude-test', gemini_model='gemini-test')
+    engine = ClaudeGeminiHybridEngine(decision_log=DecisionLog(tmp_path / "decisions"))
+    yield engine
+    engine.decision_log.close()
+
+
+def test_session_is_shared_until_close(engine):
+    async def run():
+        session = engine._get_session()
+        assert engine._get_session() is session
+        await engine.close()
+        return session
+
+    assert asyncio.run(run()).closed
+    assert engine._session is None
+
+
+def test_warm_up_with_probe(engine):
+    session = FakeSession(lambda method, url, kwargs: FakeResponse(status=404 if method == "HEAD" else 200))
+    use_session(engine, session)
+
+    readiness = asyncio.run(engine.warm_up(probe=True))
+
+    for provider in ('claude', 'gemini'):
+        status = readiness[provider]
+        assert status['ready'] and status['error'] is None
+        assert status['probe_status'] == 200
+        assert None not in (status['dns_seconds'], status['connect_seconds'], status['probe_seconds'])
+    probes = sorted(url for method, url, _ in session.requests if method == "GET")
+    assert probes == [f"{BASE_URL}/v1/models/claude-test", f"{BASE_URL}/v1beta/models/gemini-test"]
+    assert engine.get_engine_info()['readiness'] == readiness
+
+
+def test_warm_up_without_probe_only_connects(engine):
+    session = FakeSession(lambda method, url, kwargs: FakeResponse())
+    use_session(engine, session)
+
+    readiness = asyncio.run(engine.warm_up(probe=False))
+    assert all(status['ready'] and status['probe_seconds'] is None for status in readiness.values())
+    assert [method for method, _, _ in session.requests] == ["HEAD", "HEAD"]
+
+
+def test_failed_probe_and_connection_are_reported(engine):
+    use_session(engine, FakeSession(lambda method, url, kwargs: FakeResponse(status=401 if method == "GET" else 200)))
+
+    readiness = asyncio.run(engine.warm_up(probe=True))
+    assert not readiness['claude']['ready']
+    assert "401" in readiness['claude']['error']
+    assert readiness['claude']['connect_seconds'] is not None
+
+    def refuse(method, url, kwargs):
+        raise ConnectionError("연결 거부")
+
+    use_session(engine, FakeSession(refuse))
+    readiness = asyncio.run(engine.warm_up(probe=False))
+    assert not readiness['gemini']['ready']
+    assert readiness['gemini']['error'] == "연결 거부"
+    assert readiness['gemini']['connect_seconds'] is None
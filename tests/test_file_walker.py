@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+백업 파일 탐색 / 제외 규칙 검증
+- IgnoreRules: gitignore 형식 매칭 (이름, 디렉토리 전용, 루트 기준, **, 예외 규칙)
+- FileWalker: 제외 디렉토리 미탐색, .backupignore, 백업 상태 폴더 제외
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.file_walker import IgnoreRules, FileWalker, FileEntry, IGNORE_FILE_NAME, entry_info
+
+
+@pytest.mark.parametrize("path, is_dir, expected", [
+    ("a.pyc", False, True),
+    ("src/deep/a.pyc", False, True),
+    ("a.py", False, False),
+    (".git", True, True),
+    ("src/.env", False, True),
+    ("node_modules", True, True),
+    ("src/node_modules", True, True),
+    ("node_modules", False, False),  # 디렉토리 전용 규칙
+    ("__pycache__", True, True),
+    ("logs/drive_backup", True, True),
+    ("data/logs/drive_backup", True, False),  # 루트 기준 규칙
+    ("logs/app.log", False, False),
+])
+def test_default_rules(path, is_dir, expected):
+    assert IgnoreRules().ignored(path, is_dir) is expected
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("data/raw", True),
+    ("x/data/raw", False),
+    ("docs/a.tmp", True),
+    ("docs/x/y/a.tmp", True),
+    ("other/a.tmp", False),
+    ("file?.txt", False),
+    ("file1.txt", True),
+    ("fileA.txt", False),
+])
+def test_anchored_and_glob_rules(path, expected):
+    rules = IgnoreRules(["/data/raw", "docs/**/*.tmp", "file[0-9].txt"])
+    assert rules.ignored(path, False) is expected
+
+
+def test_negation_last_match_wins():
+    rules = IgnoreRules(["*.log", "!keep.log", "# 주석", "", "logs/keep.log"])
+    assert rules.ignored("a.log", False)
+    assert not rules.ignored("keep.log", False)
+    assert rules.ignored("logs/keep.log", False)
+
+
+def test_combined_matches_sequential():
+    patterns = ["*.pyc", "build/", "/data/raw", "docs/**/*.tmp"]
+    combined = IgnoreRules(patterns)
+    sequential = IgnoreRules(patterns + ["!never-matches-anything"])
+    assert combined._combined is not None and sequential._combined is None
+    for path in ("a.pyc", "x/build", "data/raw", "x/data/raw", "docs/a/b.tmp", "a.py"):
+        for is_dir in (False, True):
+            assert combined.ignored(path, is_dir) == sequential.ignored(path, is_dir), (path, is_dir)
+
+
+def write(root, relative, content="x"):
+    path = os.path.join(root, *relative.split('/'))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def test_walker_skips_ignored_and_counts(tmp_path):
+    root = str(tmp_path)
+    for relative in ("b.py", "a/c.py", "a/c.pyc", "node_modules/m.js", ".git/HEAD",
+                     "logs/drive_backup/manifest_x.json", "logs/run.log"):
+        write(root, relative, "12345")
+
+    walker = FileWalker(root)
+    entries = list(walker)
+    assert sorted(e.relative_path for e in entries) == [os.path.join("a", "c.py"), "b.py", os.path.join("logs", "run.log")]
+    assert walker.files == 3
+    assert walker.bytes == 15
+    assert walker.ignored == 4  # c.pyc, node_modules, .git, drive_backup (하위 미탐색)
+    assert all(isinstance(e, FileEntry) and e.size == 5 for e in entries)
+
+
+def test_walker_reads_backupignore(tmp_path):
+    root = str(tmp_path)
+    write(root, "keep.csv")
+    write(root, "drop.csv")
+    write(root, IGNORE_FILE_NAME, "drop.csv\n")
+    assert [e.relative_path for e in FileWalker(root)] == ["keep.csv"]
+
+
+def test_walker_progress_callback(tmp_path):
+    root = str(tmp_path)
+    for i in range(5):
+        write(root, f"f{i}.txt")
+    calls = []
+    list(FileWalker(root, rules=[], progress=lambda w: calls.append(w.files), progress_every=2))
+    assert calls == [2, 4, 5]
+
+
+def test_entry_info_accepts_tuples(tmp_path):
+    root = str(tmp_path)
+    write(root, "a.txt", "abc")
+    path = os.path.join(root, "a.txt")
+    assert entry_info((path, "a.txt"))[:3] == (path, "a.txt", 3)
+    with pytest.raises(OSError):
+        entry_info((os.path.join(root, "missing"), "missing"))
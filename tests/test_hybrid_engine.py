@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+하이브리드 엔진 결정 경로 검증 (제공자 호출은 FakeProvider로 대체)
+- 결정 지연 예산: 초과시 완료된 분석만으로 부분 융합, 미완료 호출 취소
+- 실패/외부 취소시 진행 중 제공자 호출 취소
+- 서킷 브레이커: OPEN 제공자는 호출하지 않고 부분 융합, 모두 OPEN이면 안전 모드
+- 결정 히스토리: 최근 N건 링버퍼 + 결정 로그 기록
+- 제공자 호출 계측: 시도/토큰/지연, 취소된 호출
+- SSE 스트리밍: 결정/신뢰도/점수 도착 즉시 반환, reasoning은 백그라운드 수신, close()시 취소
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support.claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine, DECISION_HISTORY_SIZE
+from support.decision_log import DecisionLog
+from ai_engine_fakes import (
+    install_ai_manager, make_context, analysis, FakeProvider,
+    FakeResponse, FakeSession, use_session, claude_sse, gemini_sse
+)
+
+BUDGET = 0.3
+
+
+def make_engine(monkeypatch, tmp_path, **config):
+    install_ai_manager(monkeypatch, tmp_path, **config)
+    return ClaudeGeminiHybridEngine(decision_log=DecisionLog(tmp_path / "decisions"))
+
+
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    engine = make_engine(monkeypatch, tmp_path, decision_budget=str(BUDGET))
+    yield engine
+    asyncio.run(engine.close())
+    engine.decision_log.close()
+
+
+@pytest.fixture
+def streaming_engine(monkeypatch, tmp_path):
+    engine = make_engine(monkeypatch, tmp_path, streaming_mode='true', decision_budget='5', max_retries='1')
+    yield engine
+    engine.decision_log.close()
+
+
+def use_providers(engine, claude: FakeProvider, gemini: FakeProvider):
+    engine._analyze_with_claude = claude
+    engine._analyze_with_gemini = gemini
+
+
+def test_both_providers_are_fused(engine):
+    use_providers(engine, FakeProvider(analysis("BUY", 0.8, fundamental_score=0.7)),
+                  FakeProvider(analysis("BUY", 0.6, technical_score=0.6)))
+    decision = asyncio.run(engine.make_decision(make_context()))
+
+    assert decision.decision == "BUY"
+    assert not decision.metadata.get('partial_fusion')
+    assert decision.metadata['decision_budget'] == BUDGET
+    assert len(engine.get_decision_history()) == 1
+
+
+def test_budget_exceeded_fuses_partial_and_cancels_slow_provider(engine):
+    gemini = FakeProvider(analysis("SELL", 0.9), delay=5.0)
+    use_providers(engine, FakeProvider(analysis("BUY", 0.8, fundamental_score=0.7)), gemini)
+
+    started = time.perf_counter()
+    decision = asyncio.run(engine.make_decision(make_context()))
+
+    assert time.perf_counter() - started < BUDGET + 1.0
+    assert gemini.cancelled
+    assert decision.decision == "BUY"
+    assert decision.confidence == pytest.approx(0.8 * engine.hybrid_config['partial_confidence_factor'])
+    assert decision.metadata['partial_reason'] == 'deadline'
+    assert decision.metadata['missing_provider'] == 'gemini'
+    assert engine.get_decision_history()[0]['partial_fusion'] is True
+
+
+def test_nothing_within_budget_is_safe_hold(engine):
+    claude, gemini = FakeProvider(analysis("BUY", 0.8), delay=5.0), FakeProvider(analysis("BUY", 0.8), delay=5.0)
+    use_providers(engine, claude, gemini)
+    decision = asyncio.run(engine.make_decision(make_context()))
+
+    assert (decision.decision, decision.confidence) == ("HOLD", 0.0)
+    assert decision.metadata['engine'] == "Safe Mode"
+    assert claude.cancelled and gemini.cancelled
+    assert engine.get_decision_history() == []
+
+
+def test_provider_failure_cancels_the_other_call(engine):
+    gemini = FakeProvider(analysis("BUY", 0.8), delay=5.0)
+    use_providers(engine, FakeProvider(error=RuntimeError("boom")), gemini)
+
+    started = time.perf_counter()
+    decision = asyncio.run(engine.make_decision(make_context()))
+
+    assert time.perf_counter() - started < BUDGET
+    assert decision.metadata['engine'] == "Safe Mode"
+    assert gemini.cancelled
+
+
+def test_outer_cancellation_cancels_provider_calls(engine):
+    claude, gemini = FakeProvider(analysis("BUY", 0.8), delay=5.0), FakeProvider(analysis("BUY", 0.8), delay=5.0)
+    use_providers(engine, claude, gemini)
+
+    async def run():
+        task = asyncio.ensure_future(engine.make_decision(make_context()))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert claude.cancelled and gemini.cancelled
+
+
+def open_breaker(engine, provider: str):
+    breaker = engine.circuit_breakers[provider]
+    for _ in range(breaker.min_calls):
+        breaker.record_result(False, 0.1)
+
+
+def test_open_breaker_skips_provider(engine):
+    gemini = FakeProvider(analysis("BUY", 0.6))
+    use_providers(engine, FakeProvider(analysis("BUY", 0.8)), gemini)
+    open_breaker(engine, 'gemini')
+
+    decision = asyncio.run(engine.make_decision(make_context()))
+    assert gemini.calls == 0
+    assert decision.metadata['partial_reason'] == 'circuit_open'
+    assert decision.metadata['circuit_blocked'] == ['gemini']
+
+
+def test_all_breakers_open_is_safe_hold(engine):
+    claude, gemini = FakeProvider(analysis("BUY", 0.8)), FakeProvider(analysis("BUY", 0.6))
+    use_providers(engine, claude, gemini)
+    open_breaker(engine, 'claude')
+    open_breaker(engine, 'gemini')
+
+    decision = asyncio.run(engine.make_decision(make_context()))
+    assert decision.metadata['engine'] == "Safe Mode"
+    assert claude.calls == gemini.calls == 0
+
+
+def test_provider_failures_open_breaker(engine):
+    use_providers(engine, FakeProvider(error=RuntimeError("down")), FakeProvider(analysis("BUY", 0.6)))
+
+    async def run():
+        for _ in range(engine.circuit_breakers['claude'].min_calls):
+            await engine.make_decision(make_context())
+
+    asyncio.run(run())
+    assert not engine.circuit_breakers['claude'].allow_request()
+    assert engine.get_engine_info()['circuit_breakers']['claude']['state'] == "OPEN"
+
+
+def test_history_ring_buffer_and_log(engine):
+    use_providers(engine, FakeProvider(analysis("BUY", 0.8, reasoning="c")),
+                  FakeProvider(analysis("HOLD", 0.6, reasoning="g")))
+
+    async def run():
+        for i in range(DECISION_HISTORY_SIZE + 5):
+            await engine.make_decision(make_context(symbol=f"{i:06d}"))
+
+    asyncio.run(run())
+    history = engine.get_decision_history()
+    assert len(history) == DECISION_HISTORY_SIZE
+    assert history[0]['symbol'] == f"{5:06d}"
+    assert engine.total_decisions == DECISION_HISTORY_SIZE + 5
+
+    records = list(engine.decision_log.iter_records())
+    assert len(records) == DECISION_HISTORY_SIZE + 5
+    assert (records[0]['claude_reasoning'], records[0]['gemini_reasoning']) == ("c", "g")
+
+
+def test_provider_call_metrics(engine):
+    body = {'content': [{'text': '{"decision":"BUY","confidence":0.8}'}],
+            'usage': {'input_tokens': 321, 'output_tokens': 45}}
+    use_session(engine, FakeSession(lambda method, url, kwargs: FakeResponse(body=body)))
+    gemini = FakeProvider(analysis("BUY", 0.6), delay=5.0)
+    engine._analyze_with_gemini = gemini
+
+    asyncio.run(engine.make_decision(make_context()))
+
+    providers = engine.metrics.snapshot()['providers']
+    claude = providers['claude']
+    assert (claude['calls'], claude['successes'], claude['attempts']) == (1, 1, 1)
+    assert (claude['prompt_tokens'], claude['response_tokens']) == (321, 45)
+    assert claude['prompt']['count'] == 1 and claude['latency']['samples'] == 1
+    assert providers['gemini']['cancelled'] == 1
+    assert engine.metrics.snapshot()['decisions']['successes'] == 1
+
+
+def stream_responder(claude_lines, gemini_lines):
+    def respond(method, url, kwargs):
+        return FakeResponse(lines=claude_lines if url.endswith("/v1/messages") else gemini_lines)
+    return respond
+
+
+def test_stream_returns_before_reasoning_arrives(streaming_engine):
+    async def run():
+        rest = asyncio.Event()
+        use_session(streaming_engine, FakeSession(stream_responder(
+            claude_sse('{"decision":"BUY","confidence":0.8,', '"fundamental_score":0.7,', rest,
+                       '"reasoning":"실적 개선"}'), [])))
+
+        result = await streaming_engine._analyze_with_claude(make_context())
+        assert (result['decision'], result['fundamental_score']) == ("BUY", 0.7)
+        assert 'reasoning' not in result
+        # 분석 결과(선계산 캐시에 보관)에는 작업 객체를 담지 않음
+        assert not any(isinstance(value, asyncio.Future) for value in result.values())
+
+        rest.set()
+        await asyncio.gather(*streaming_engine._stream_tasks.values())
+        assert result['reasoning'] == "실적 개선"
+        assert streaming_engine._stream_tasks == {}
+
+    asyncio.run(run())
+
+
+def test_stream_waits_for_provider_score(streaming_engine):
+    async def run():
+        score = asyncio.Event()
+        use_session(streaming_engine, FakeSession(stream_responder(
+            [], gemini_sse('{"decision":"SELL","confidence":0.7,', score, '"technical_score":0.2}'))))
+
+        task = asyncio.ensure_future(streaming_engine._analyze_with_gemini(make_context()))
+        await asyncio.sleep(0.05)
+        assert not task.done()  # decision/confidence만으로는 확정하지 않음
+
+        score.set()
+        result = await task
+        assert (result['decision'], result['technical_score']) == ("SELL", 0.2)
+
+    asyncio.run(run())
+
+
+def test_close_cancels_background_streams_before_closing(streaming_engine, tmp_path):
+    async def run():
+        never = asyncio.Event()
+        session = FakeSession(stream_responder(
+            claude_sse('{"decision":"BUY","confidence":0.8,"fundamental_score":0.7,', never, '"reasoning":"x"}'),
+            gemini_sse('{"decision":"BUY","confidence":0.6,"technical_score":0.6,', never, '"reasoning":"y"}')))
+        use_session(streaming_engine, session)
+
+        decision = await streaming_engine.make_decision(make_context())
+        assert decision.decision == "BUY"
+        assert len(streaming_engine._stream_tasks) == 2
+        assert list(streaming_engine.decision_log.iter_records()) == []  # reasoning 수신 대기 중
+
+        await streaming_engine.close()
+        assert streaming_engine._stream_tasks == {}
+        assert session.closed
+
+    asyncio.run(run())
+    records = list(DecisionLog(tmp_path / "decisions").iter_records())
+    assert len(records) == 1
+    assert records[0]['claude_reasoning'] is None
+
+
+def malformed_claude(method, url, kwargs):
+    return FakeResponse(body={'content': [{'text': "분석 불가"}], 'usage': {}})
+
+
+def test_parse_failure_fails_fast_without_transport_error(engine):
+    session = FakeSession(malformed_claude)
+    use_session(engine, session)
+    engine._analyze_with_gemini = FakeProvider(analysis("BUY", 0.6), delay=5.0)
+
+    started = time.perf_counter()
+    decision = asyncio.run(engine.make_decision(make_context()))
+
+    assert time.perf_counter() - started < BUDGET
+    assert decision.metadata['safe_reason'] == 'error'
+    assert len(session.requests) == 1
+    claude = engine.metrics.snapshot()['providers']['claude']
+    assert (claude['attempts'], claude['parse']['failed'], claude['errors']) == (1, 1, 0)
+
+
+def test_parse_retries_are_configurable(monkeypatch, tmp_path):
+    engine = make_engine(monkeypatch, tmp_path, decision_budget='5', parse_retries='1')
+    session = FakeSession(malformed_claude)
+    use_session(engine, session)
+    engine._analyze_with_gemini = FakeProvider(analysis("BUY", 0.6))
+
+    asyncio.run(engine.make_decision(make_context()))
+    engine.decision_log.close()
+
+    assert len(session.requests) == 2
+    assert engine.metrics.snapshot()['providers']['claude']['parse']['failed'] == 2
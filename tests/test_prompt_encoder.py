@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+압축 프롬프트 인코더 검증
+- 토큰 추정 (한글/ASCII/기타 문자), 수치 반올림, 축약 키
+- 최대 프롬프트 크기 초과시 선택 항목 축소/제거, 필수 항목만으로 초과시 ValueError
+- 엔진 _build_prompt: verbose 모드 크기 초과시 압축 프롬프트로 대체, 프롬프트 크기 계측
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support.prompt_encoder import CompactPromptEncoder, estimate_tokens, compact_number, compact_value
+from support.claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine
+from support.decision_log import DecisionLog
+from ai_engine_fakes import install_ai_manager, make_context
+
+
+def payload_of(prompt: str) -> dict:
+    return json.loads(prompt.split("입력:", 1)[1].split("\n", 1)[0])
+
+
+def test_estimate_tokens_by_script():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("가나다") == 3
+    assert estimate_tokens("ab가") == 2  # 0.5 + 1 반올림
+
+
+def test_compact_numbers_and_keys():
+    assert compact_number(70000.0) == 70000
+    assert compact_number(123.456) == 123
+    assert compact_number(1.23456) == 1.23
+    assert compact_number(0.123456) == 0.123
+    assert compact_value({"trend": "UP", "items": list(range(10)), "note": "x" * 100}) == {
+        "tr": "UP", "items": [0, 1, 2, 3, 4], "note": "x" * 80 + "…"}
+
+
+def test_compact_prompts_carry_context():
+    encoder = CompactPromptEncoder()
+    context = make_context(price_change_pct=3.14159, risk_factors=["공시"])
+
+    claude, claude_tokens = encoder.encode_claude(context)
+    assert payload_of(claude) == {"s": "005930", "p": 70000, "chg": 3.14, "ns": [0.5, 0.4, 0.1],
+                                  "mc": {"tr": "NEUTRAL", "vt": "MEDIUM"}, "rf": ["공시"]}
+    assert claude_tokens == estimate_tokens(claude)
+
+    gemini, _ = encoder.encode_gemini(context)
+    assert payload_of(gemini)["ti"] == {"RSI": 55, "MACD": 0.4}
+    assert payload_of(gemini)["vol"] == 1000000
+
+
+def test_trimming_drops_optional_sections_first():
+    context = make_context(technical_indicators={f"ind{i}": float(i) for i in range(40)})
+    untrimmed, full_tokens = CompactPromptEncoder().encode_gemini(context)
+    indicators = json.dumps(payload_of(untrimmed)["ti"], separators=(',', ':'))
+    base_tokens = estimate_tokens(untrimmed.replace(indicators, "{}"))
+
+    encoder = CompactPromptEncoder(max_prompt_tokens=base_tokens + 20)
+    prompt, tokens = encoder.encode_gemini(context)
+    assert tokens <= encoder.max_prompt_tokens < full_tokens
+    assert 0 < len(payload_of(prompt)["ti"]) < 40
+    assert encoder.trimmed_prompts == 1
+
+    with pytest.raises(ValueError):
+        CompactPromptEncoder(max_prompt_tokens=10).encode_gemini(context)
+
+
+def test_verbose_prompt_falls_back_to_compact_when_too_large(monkeypatch, tmp_path):
+    install_ai_manager(monkeypatch, tmp_path, prompt_mode='verbose', max_prompt_tokens='0')
+    engine = ClaudeGeminiHybridEngine(decision_log=DecisionLog(tmp_path / "decisions"))
+    verbose = engine._build_prompt('claude', make_context())
+    assert "입력:" not in verbose
+
+    engine.hybrid_config = {**engine.hybrid_config, 'max_prompt_tokens': estimate_tokens(verbose) - 1}
+    compact = engine._build_prompt('claude', make_context())
+    assert payload_of(compact)["s"] == "005930"
+
+    prompts = engine.metrics.snapshot()['providers']['claude']['prompt']
+    assert prompts['count'] == 2
+    assert prompts['max_estimated_tokens'] == estimate_tokens(verbose)
+    engine.decision_log.close()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다음 사이클 결정 선계산 검증 (제공자 호출은 FakeProvider로 대체)
+- 대상 예측: 보유 종목 우선, 급등 상위 N개, 중복 제거
+- prefetch_mode 비활성/유휴 시간 부족시 건너뜀
+- AIDecisionGate.prefetch_next_cycle: 불확실 구간 종목만 선계산, 다음 resolve에서 캐시 사용
+- 가격 변동이 허용 범위를 넘으면 stale로 폐기하고 다시 계산
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from support.ai_decision_gate import AIDecisionGate
+from support.speculative_prefetcher import SpeculativePrefetcher
+from support.claude_gemini_hybrid_engine import ClaudeGeminiHybridEngine
+from support.decision_log import DecisionLog
+from ai_engine_fakes import install_ai_manager, make_context, analysis, FakeProvider
+
+
+class RuleByCode:
+    """NewDayTradingAlgorithm 대체 (종목별 규칙 신뢰도 고정)"""
+
+    def __init__(self, confidences):
+        self.confidences = confidences
+
+    def _analyze_surge_stock_realtime(self, stock_data, stock_code):
+        return {'signal': "BUY", 'confidence': self.confidences[stock_code], 'reason': "규칙", 'details': {}}
+
+
+def make_engine(monkeypatch, tmp_path, **config):
+    install_ai_manager(monkeypatch, tmp_path, decision_budget='1', prefetch_safety_margin='0', **config)
+    return ClaudeGeminiHybridEngine(decision_log=DecisionLog(tmp_path / "decisions"))
+
+
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    engine = make_engine(monkeypatch, tmp_path, prefetch_mode='true', prefetch_top_n='2')
+    yield engine
+    asyncio.run(engine.close())
+    engine.decision_log.close()
+
+
+def stock(price: float):
+    return {'current_price': price, 'open_price': 10000, 'high_price': 11000, 'change_rate': 5.0, 'volume': 1000}
+
+
+def test_predict_symbols_orders_held_first(engine):
+    prefetcher = SpeculativePrefetcher(engine)
+    ranked = ["000660", {'symbol': "005930"}, {'stock_code': "035720"}, "068270"]
+    assert prefetcher.predict_symbols(["005930", "005930"], ranked) == ["005930", "000660", "035720"]
+
+
+def test_disabled_or_no_idle_time_skips(monkeypatch, tmp_path, engine):
+    prefetcher = SpeculativePrefetcher(engine, safety_margin_seconds=10)
+    result = asyncio.run(prefetcher.run_idle_gap([], ["005930"], lambda code: make_context(code), 5))
+    assert result['skipped'] == "no_idle_time"
+
+    disabled = make_engine(monkeypatch, tmp_path / "off")
+    result = asyncio.run(SpeculativePrefetcher(disabled).run_idle_gap([], ["005930"], make_context, 60))
+    assert result['skipped'] == "prefetch_disabled"
+    disabled.decision_log.close()
+
+
+def test_gate_prefetch_is_used_by_next_resolve(engine):
+    claude, gemini = FakeProvider(analysis("SELL", 0.8)), FakeProvider(analysis("SELL", 0.7))
+    engine._analyze_with_claude, engine._analyze_with_gemini = claude, gemini
+    gate = AIDecisionGate(RuleByCode({"005930": 0.6, "000660": 0.9}), engine)
+    latest = {"005930": stock(10500), "000660": stock(20000)}
+
+    async def run():
+        summary = await gate.prefetch_next_cycle([], ["005930", "000660"], latest, idle_seconds=5)
+        gate.begin_cycle()
+        return summary, await gate.resolve("005930", stock(10510))
+
+    summary, signal = asyncio.run(run())
+    assert summary['symbols'] == ["005930"]  # 규칙으로 확정되는 000660은 선계산하지 않음
+    assert (signal['tier'], signal['signal']) == ('ai', "SELL")
+    assert signal['details']['ai_metadata']['prefetched'] is True
+    assert claude.calls == gemini.calls == 1
+    assert engine.metrics.snapshot()['cache']['hits'] == 1
+
+
+def test_stale_prefetch_is_dropped(engine):
+    claude, gemini = FakeProvider(analysis("SELL", 0.8)), FakeProvider(analysis("SELL", 0.7))
+    engine._analyze_with_claude, engine._analyze_with_gemini = claude, gemini
+    gate = AIDecisionGate(RuleByCode({"005930": 0.6}), engine)
+
+    async def run():
+        await gate.prefetch_next_cycle(["005930"], [], {"005930": stock(10000)}, idle_seconds=5)
+        return await gate.resolve("005930", stock(10500))  # 5% 변동 > 허용 0.5%
+
+    signal = asyncio.run(run())
+    assert not signal['details']['ai_metadata'].get('prefetched')
+    assert claude.calls == 2
+    assert engine.stale_prefetches == 1
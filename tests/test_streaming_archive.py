@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 ZIP 검증
+- crc32_combine: zlib.crc32 연결 결과와 일치
+- StreamingZipArchive: 청크 병렬 압축 결과가 zipfile로 검증/해제 가능
+"""
+
+import io
+import os
+import sys
+import zlib
+import zipfile
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from support.streaming_archive import StreamingZipArchive, crc32_combine
+
+
+def make_files(root, contents):
+    files = []
+    for relative, data in contents.items():
+        path = os.path.join(root, *relative.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        files.append((path, relative))
+    return files
+
+
+@pytest.mark.parametrize("split", [0, 1, 1000, 4095, 4096])
+def test_crc32_combine(split):
+    data = os.urandom(4096)
+    a, b = data[:split], data[split:]
+    assert crc32_combine(zlib.crc32(a), zlib.crc32(b), len(b)) == zlib.crc32(data)
+
+
+def test_streaming_zip_is_valid(tmp_path):
+    contents = {
+        "a.txt": b"hello " * 1000,
+        "dir/b.bin": os.urandom(10000),
+        "dir/empty": b"",
+        "c.txt": b"abc" * 5000,
+    }
+    files = make_files(str(tmp_path), contents)
+    archive = StreamingZipArchive(files, workers=2, chunk_size=4096).start()
+    out = io.BytesIO()
+    while True:
+        block = archive.read_block()
+        if block is None:
+            break
+        out.write(block)
+    archive.join()
+
+    assert archive.offset == out.tell()
+    with zipfile.ZipFile(out) as zf:
+        assert zf.testzip() is None
+        assert {name: zf.read(name) for name in zf.namelist()} == contents